@@ -55,6 +55,30 @@ modules = [
     'regression/test_input_output/test_xml_read_write.py',
     'regression/test_input_output/test_freemind_write.py',
     'regression/test_variable_cruise_distance.py',
+    'regression/test_mission_jacobian.py',
+    'regression/test_mission_batch.py',
+    'regression/test_parallel_missions.py',
+    'regression/test_state_vector.py',
+    'regression/test_data_clone.py',
+    'regression/test_data_access.py',
+    'regression/test_data_templates.py',
+    'regression/test_discretization.py',
+    'regression/test_adaptive_control_points.py',
+    'regression/test_vortex_lattice.py',
+    'regression/test_surrogate.py',
+    'regression/test_avl_workers.py',
+    'regression/test_avl_cache.py',
+    'regression/test_parasite_drag_components.py',
+    'regression/test_drag_polar.py',
+    'regression/test_compressibility_drag_supersonic.py',
+    'regression/test_aero_derivatives.py',
+    'regression/test_complex_step.py',
+    'regression/test_orientation_transforms.py',
+    'regression/test_engine_deck.py',
+    'regression/test_compiled_turbofan.py',
+    'regression/test_propeller_bemt.py',
+    'regression/test_motor_propeller.py',
+    'regression/test_propeller_map.py',
     
     # tutorials
     'tutorials/tut_mission_B737.py',
@@ -0,0 +1,82 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+import test_mission_jacobian
+
+import SUAVE
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, chebyshev_coefficients, chebyshev_resample
+from SUAVE.Methods.Missions.Segments import Refinement
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # coefficients and resampling are exact for polynomials
+    x,D,I = chebyshev_data(8)
+    x = x[:,None]
+    f = np.hstack([ x**5., 1.+x ])
+    a = chebyshev_coefficients(f)
+    assert np.max( np.abs(a[6:,:]) ) < 1e-12
+
+    y,D,I = chebyshev_data(15)
+    y = y[:,None]
+    g = chebyshev_resample(f,15)
+    assert np.max( np.abs( g - np.hstack([ y**5., 1.+y ]) ) ) < 1e-12
+
+    # the mission, fixed and adaptive
+    vehicle  = test_mission_B737.vehicle_setup()
+    configs  = test_mission_B737.configs_setup(vehicle)
+    analyses = test_mission_B737.analyses_setup(configs)
+    configs.finalize()
+    analyses.finalize()
+
+    landing = {}
+    for name,N,adaptive in [ ( 'fixed 32'   , 32 , False ) ,
+                             ( 'fixed 6'    , 6  , False ) ,
+                             ( 'adaptive 6' , 6  , True  ) ]:
+        mission = test_mission_jacobian.mission_setup(analyses)
+        mission.state.numerics.solver_jacobian = 'sparse'
+        mission.state.numerics.adaptive_control_points = adaptive
+        for segment in mission.segments:
+            segment.state.numerics.number_control_points = N
+            segment.state.numerics.solver_jacobian = 'sparse'
+
+        results, count = test_mission_jacobian.evaluate_counted(mission)
+
+        points = [ s.numerics.number_control_points for s in results.segments ]
+        errors = [ Refinement.truncation_error(s) for s in results.segments ]
+        landing[name] = results.segments[-1].conditions.weights.total_mass[-1,0]
+
+        print '%s : landing mass %.6f, %i residual evaluations' % (name,landing[name],count)
+        print '  control points :', points
+        print '  truncation     :', ' '.join([ '%.1e' % e for e in errors ])
+
+        if adaptive:
+            tolerance = mission.state.numerics.tolerance_control_points
+            assert max(errors) <= tolerance
+            # only some segments needed more points
+            assert min(points) == N and max(points) > N
+
+    reference = landing['fixed 32']
+    err_fixed    = np.abs( landing['fixed 6']    - reference ) / reference
+    err_adaptive = np.abs( landing['adaptive 6'] - reference ) / reference
+    print 'landing mass error, fixed 6: %.4e, adaptive 6: %.4e' % (err_fixed,err_adaptive)
+    assert err_adaptive < 1e-9
+    assert err_adaptive < err_fixed
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
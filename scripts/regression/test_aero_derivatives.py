@@ -0,0 +1,147 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from test_mission_B737 import vehicle_setup
+
+import SUAVE
+from SUAVE.Core import Data, Units
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    for wing in vehicle.wings:
+        wing.areas.wetted   = 2.0 * wing.areas.reference
+        wing.areas.exposed  = 0.8 * wing.areas.wetted
+        wing.areas.affected = 0.6 * wing.areas.wetted
+
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+
+    n = 12
+    mach  = np.linspace(0.2,0.85,n)[:,None]
+    alpha = np.linspace(-3.,9.,n)[:,None] * Units.deg
+
+    # without derivatives, nothing is added
+    state = evaluate(aerodynamics,mach,alpha)
+    reference = aerodynamics.evaluate(state)
+    assert not reference.has_key('derivatives')
+    assert not state.conditions.aerodynamics.has_key('derivatives')
+
+    # with derivatives, the same results
+    aerodynamics.settings.derivatives = True
+    state   = evaluate(aerodynamics,mach,alpha)
+    results = aerodynamics.evaluate(state)
+
+    assert np.all( results.lift.total == reference.lift.total )
+    assert np.all( results.drag.total == reference.drag.total )
+
+    derivatives = state.conditions.aerodynamics.derivatives
+
+    # against central differences, conditions path and derivatives path
+    paths = [ (['lift_coefficient']                                                  , ['lift_coefficient']) ,
+              (['lift_breakdown','compressible_wings']                               , ['lift_breakdown','compressible_wings']) ,
+              (['drag_breakdown','induced','total']                                  , ['drag_breakdown','induced']) ,
+              (['drag_breakdown','compressible','total']                             , ['drag_breakdown','compressible','total']) ,
+              (['drag_breakdown','parasite','main_wing','parasite_drag_coefficient'] , ['drag_breakdown','parasite','main_wing']) ,
+              (['drag_breakdown','parasite','fuselage','parasite_drag_coefficient']  , ['drag_breakdown','parasite','fuselage']) ,
+              (['drag_breakdown','parasite','turbo_fan','parasite_drag_coefficient'] , ['drag_breakdown','parasite','turbo_fan']) ,
+              (['drag_breakdown','parasite','total']                                 , ['drag_breakdown','parasite','total']) ,
+              (['drag_coefficient']                                                  , ['drag_coefficient']) ]
+
+    h = 1e-6
+    tic = time()
+    for j,(d_alpha,d_mach) in enumerate([(h,0.),(0.,h)]):
+        plus  = evaluate(aerodynamics,mach+d_mach,alpha+d_alpha)
+        aerodynamics.evaluate(plus)
+        minus = evaluate(aerodynamics,mach-d_mach,alpha-d_alpha)
+        aerodynamics.evaluate(minus)
+
+        for value,derivative in paths:
+            fd = ( plus.conditions.aerodynamics.deep_get(value) - minus.conditions.aerodynamics.deep_get(value) ) / (2.*h)
+            an = derivatives.deep_get(derivative)[:,j,None]
+            # parasite drag does not change with angle of attack
+            error = np.max( np.abs(fd-an) ) / ( np.max( np.abs(fd) ) or 1. )
+            print '%-15s %-40s %.4e' % (['angle_of_attack','mach_number'][j],'.'.join(derivative),error)
+            assert error < 1e-6
+    print 'finite differences : %.4f s' % (time()-tic)
+
+    # the results, split by input
+    for key in ['lift_coefficient','drag_coefficient']:
+        assert np.all( results.derivatives[key].angle_of_attack == derivatives[key][:,0,None] )
+        assert np.all( results.derivatives[key].mach_number     == derivatives[key][:,1,None] )
+
+    # the lift curve slope of the wings is positive
+    assert np.all( results.derivatives.lift_coefficient.angle_of_attack > 0. )
+
+    tic = time()
+    aerodynamics.evaluate(evaluate(aerodynamics,mach,alpha))
+    print 'derivatives        : %.4f s' % (time()-tic)
+
+    # the gridded lattice surrogate, inside the cells
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.settings.derivatives = True
+    lattice = aerodynamics.process.compute.lift.inviscid_wings
+    lattice.gridded = True
+    lattice.training.angle_of_attack = np.linspace(-10.,10.,8) * Units.deg
+    lattice.training.mach_number     = np.array([0.,1.])
+    aerodynamics.initialize()
+
+    state = evaluate(aerodynamics,mach,alpha)
+    aerodynamics.evaluate(state)
+    derivatives = state.conditions.aerodynamics.derivatives
+
+    for j,(d_alpha,d_mach) in enumerate([(h,0.),(0.,h)]):
+        plus  = evaluate(aerodynamics,mach+d_mach,alpha+d_alpha)
+        aerodynamics.evaluate(plus)
+        minus = evaluate(aerodynamics,mach-d_mach,alpha-d_alpha)
+        aerodynamics.evaluate(minus)
+
+        fd = ( plus.conditions.aerodynamics.lift_coefficient - minus.conditions.aerodynamics.lift_coefficient ) / (2.*h)
+        an = derivatives.lift_coefficient[:,j,None]
+        error = np.max( np.abs(fd-an) ) / np.max( np.abs(fd) )
+        print 'gridded %-15s %.4e' % (['angle_of_attack','mach_number'][j],error)
+        assert error < 1e-6
+
+    return
+
+
+def evaluate(aerodynamics,mach,angle_of_attack):
+
+    n = len(mach)
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    atmo_data = SUAVE.Analyses.Atmospheric.US_Standard_1976().compute_values(np.linspace(0.,11.,n)[:,None]*Units.km)
+
+    freestream = state.conditions.freestream
+    freestream.mach_number       = mach
+    freestream.density           = atmo_data.density
+    freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    freestream.temperature       = atmo_data.temperature
+    freestream.pressure          = atmo_data.pressure
+
+    state.conditions.aerodynamics.angle_of_attack = angle_of_attack
+
+    return state
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -86,6 +86,43 @@ def main():
     assert( T_err   < 1e-5 )
     assert( rho_err < 1e-5 )
     assert( a_err   < 1e-5 )    
+    
+    # ------------------------------------------------------------------
+    #   Hot Day, ISA+15
+    # ------------------------------------------------------------------    
+    
+    hot = atm.compute_values(z,temperature_deviation=15.)
+    
+    # same pressure, warmer and thinner air
+    assert np.all( hot.pressure == p )
+    assert np.max( np.abs( hot.temperature - (T+15.) ) ) < 1e-10
+    assert np.max( np.abs( hot.density - p/(atm.fluid_properties.gas_specific_constant*(T+15.)) ) ) < 1e-10
+    
+    # as a setting of the atmosphere
+    atm_hot = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atm_hot.settings.temperature_deviation = 15.
+    atm_hot.finalize()
+    assert np.all( atm_hot.compute_values(z).temperature == hot.temperature )
+    
+    # ------------------------------------------------------------------
+    #   Break Point Table
+    # ------------------------------------------------------------------
+    
+    # rebuilt when the breaks or the planet change after it was built
+    atm_breaks = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atm_breaks.finalize()
+    atm_breaks.breaks.pressure = atm_breaks.breaks.pressure * 1.1
+    assert np.max( np.abs( atm_breaks.compute_values(z).pressure / p - 1.1 ) ) < 1e-10
+    
+    atm_breaks.planet.sea_level_gravity = atm.planet.sea_level_gravity * 1.1
+    p_breaks = atm_breaks.compute_values(z).pressure
+    assert np.any( p_breaks != 1.1 * p )
+    
+    # the same as an atmosphere built with them
+    atm_fresh = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atm_fresh.breaks.pressure = atm_breaks.breaks.pressure
+    atm_fresh.planet.sea_level_gravity = atm_breaks.planet.sea_level_gravity
+    assert np.all( atm_fresh.compute_values(z).pressure == p_breaks )
  
     return
 
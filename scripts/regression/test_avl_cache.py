@@ -0,0 +1,114 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+from test_avl_workers import write_avl_stub, stub_lift
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Aerodynamics import AVL
+from SUAVE.Methods.Aerodynamics.AVL.results_cache import evict
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+
+import numpy as np
+
+import os
+import shutil
+import tempfile
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    folder = tempfile.mkdtemp()
+    try:
+        avl_bin = write_avl_stub(folder)
+        cache   = os.path.join(folder,'avl_cache')
+
+        vehicle = test_mission_B737.vehicle_setup()
+
+        def run(alphas,avl_bin_name,tag):
+            avl = AVL()
+            avl.features = vehicle
+            avl.keep_files = True
+            avl.settings.filenames.avl_bin_name = avl_bin_name
+            avl.settings.filenames.run_folder   = os.path.join(folder,'avl_files_' + tag)
+            avl.settings.cache.folder           = cache
+            avl.finalize()
+
+            tic = time()
+            results = avl.evaluate_conditions(conditions_setup(vehicle,alphas))
+            print '%s: %.4f s' % (tag,time()-tic)
+
+            return avl,results
+
+        alphas = np.linspace(-4.,10.,8) * Units.deg
+
+        # the first run fills the cache
+        avl,first = run(alphas,avl_bin,'first')
+        assert len(cached_files(cache)) == len(alphas)
+
+        # the second run must not call avl at all
+        avl,second = run(alphas,os.path.join(folder,'no_avl'),'second')
+        for key in ['aerodynamics.lift_coefficient','aerodynamics.pitch_moment_coefficient',
+                    'aerodynamics.drag_breakdown.induced.total','aerodynamics.neutral_point']:
+            assert np.all( first.deep_get(key) == second.deep_get(key) ) , key
+
+        CL = second.aerodynamics.lift_coefficient[:,0]
+        assert np.max( np.abs( CL - stub_lift(alphas) ) ) < 1e-4
+
+        # a partial hit only runs the new cases
+        more = np.hstack([ alphas[:4] , np.array([12.,14.]) * Units.deg ])
+        avl,third = run(more,avl_bin,'third')
+        batch = os.path.join(avl.settings.filenames.run_folder,avl.current_status.batch_file)
+        with open(batch,'r') as batch_file:
+            n_run = batch_file.read().count('Run case')
+        assert n_run == 2
+
+        CL = third.aerodynamics.lift_coefficient[:,0]
+        assert np.max( np.abs( CL - stub_lift(more) ) ) < 1e-4
+        assert len(cached_files(cache)) == len(alphas) + 2
+
+        # least recently used results are purged past the size limit
+        files = sorted(cached_files(cache))
+        for i,filename in enumerate(files):
+            os.utime(filename,(1000.+i,1000.+i))
+        evict(cache,3 * os.path.getsize(files[0]))
+        assert sorted(cached_files(cache)) == files[-3:]
+
+    finally:
+        shutil.rmtree(folder)
+
+    return
+
+
+def conditions_setup(vehicle,alphas):
+
+    conditions = Aerodynamics()
+    ones_1col  = conditions.ones_row(1)
+    conditions.weights.total_mass     = ones_1col * vehicle.mass_properties.max_takeoff
+    conditions.freestream.mach_number = ones_1col * 0.3
+    conditions.freestream.velocity    = ones_1col * 150 * Units.knots
+    conditions.freestream.density     = ones_1col * 1.225
+    conditions.freestream.gravity     = ones_1col * 9.81
+    conditions.expand_rows(len(alphas))
+    conditions.aerodynamics.angle_of_attack = alphas[:,None]
+
+    return conditions
+
+
+def cached_files(cache):
+    return [ os.path.join(cache,name) for name in os.listdir(cache) if name.endswith('.bin') ]
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
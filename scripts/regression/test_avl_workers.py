@@ -0,0 +1,189 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Aerodynamics import AVL
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+
+import numpy as np
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    folder = tempfile.mkdtemp()
+    try:
+        avl_bin = write_avl_stub(folder)
+
+        vehicle = test_mission_B737.vehicle_setup()
+
+        # a grid of cases
+        alphas = np.linspace(-4.,10.,15) * Units.deg
+        conditions = Aerodynamics()
+        ones_1col  = conditions.ones_row(1)
+        conditions.weights.total_mass     = ones_1col * vehicle.mass_properties.max_takeoff
+        conditions.freestream.mach_number = ones_1col * 0.3
+        conditions.freestream.velocity    = ones_1col * 150 * Units.knots
+        conditions.freestream.density     = ones_1col * 1.225
+        conditions.freestream.gravity     = ones_1col * 9.81
+        conditions.expand_rows(len(alphas))
+        conditions.aerodynamics.angle_of_attack = alphas[:,None]
+
+        outputs = {}
+        for n_workers in [1,4]:
+            avl = AVL()
+            avl.features = vehicle
+            avl.keep_files = True
+            avl.settings.filenames.avl_bin_name = avl_bin
+            avl.settings.filenames.run_folder   = os.path.join(folder,'avl_files_%i' % n_workers)
+            avl.settings.number_of_workers      = n_workers
+            avl.finalize()
+
+            tic = time()
+            results = avl.evaluate_conditions(conditions)
+            print '%i workers: %.4f s' % (n_workers,time()-tic)
+
+            outputs[n_workers] = results
+
+            # each worker in its own folder
+            if n_workers > 1:
+                for i in range(n_workers):
+                    worker = avl.settings.filenames.worker_template.format(i)
+                    assert os.path.exists(os.path.join(avl.settings.filenames.run_folder,worker))
+
+        # the same conditions, in the same order
+        for key in ['aerodynamics.lift_coefficient','aerodynamics.pitch_moment_coefficient',
+                    'aerodynamics.drag_breakdown.induced.total','aerodynamics.angle_of_attack']:
+            a = outputs[1].deep_get(key)
+            b = outputs[4].deep_get(key)
+            assert a.shape == b.shape == (len(alphas),1)
+            assert np.all( a == b ) , key
+
+        CL = outputs[4].aerodynamics.lift_coefficient[:,0]
+        assert np.max( np.abs( CL - stub_lift(alphas) ) ) < 1e-4
+
+        # a worker that fails, and workers that do not finish
+        for name,stub,timeout,expected in [['crash',crash_stub,None,['status 3','avl stub crashed']],
+                                           ['hang',hang_stub,0.5,['still running']]]:
+            avl = AVL()
+            avl.features = vehicle
+            avl.settings.filenames.avl_bin_name = write_avl_stub(folder,stub,'avl_' + name)
+            avl.settings.filenames.run_folder   = os.path.join(folder,'avl_files_' + name)
+            avl.settings.number_of_workers      = 4
+            avl.settings.worker_timeout         = timeout
+            avl.finalize()
+
+            tic = time()
+            try:
+                avl.evaluate_conditions(conditions)
+            except RuntimeError as error:
+                message = str(error)
+            else:
+                raise AssertionError , 'avl %s not raised' % name
+            print '%s: %s' % (name,message.splitlines()[0])
+            assert avl.settings.filenames.worker_template.format(0) in message
+            for text in expected:
+                assert text in message , text
+            assert time() - tic < 10.
+
+    finally:
+        shutil.rmtree(folder)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  AVL Stand-In
+# ----------------------------------------------------------------------
+
+def stub_lift(alpha):
+    return 0.2 + 5.5 * alpha
+
+avl_stub = r'''
+import sys, time, math
+
+# avl geometry.avl < deck
+geometry = sys.argv[1]
+commands = []
+for line in iter(sys.stdin.readline,''):
+    commands.append(line.strip())
+    if commands[-1] == 'QUIT': break
+
+# alpha of each case in the batch file
+batch  = commands[0].split()[1]
+alphas = [ float(line.split('=')[1]) for line in open(batch)
+           if line.strip().startswith('alpha') and '->' in line ]
+
+# OPER, then index / x / st / filename for each case
+i = 2
+while i+3 < len(commands) and commands[i]:
+    index    = int(commands[i])
+    filename = commands[i+3]
+    i += 4
+
+    time.sleep(0.05)
+
+    alpha = alphas[index-1] * math.pi / 180.
+    CL  = 0.2 + 5.5 * alpha
+    CDi = CL**2 / (math.pi * 9.)
+    Cm  = 0.05 - 0.5 * CL
+
+    lines = [ [' ']*80 for k in range(60) ]
+    def put(row,start,width,value):
+        text = ('%' + str(width) + '.5f') % value
+        lines[row][start:start+width] = list(text)
+    put(19,32,10,0.)
+    put(20,32,10,Cm)
+    put(21,32,10,0.)
+    put(23,10,10,CL)
+    put(25,32,10,CDi)
+    put(27,32,10,0.95)
+    for row in range(36,41):
+        put(row,25,10,0.)
+        put(row,44,11,0.)
+    put(50,22,11,15.)
+
+    with open(filename,'w') as results:
+        results.write( '\n'.join([ ''.join(line) for line in lines ]) + '\n' )
+'''
+
+crash_stub = r'''
+import sys
+sys.stderr.write('avl stub crashed\\n')
+sys.exit(3)
+'''
+
+hang_stub = r'''
+import time
+time.sleep(60.)
+'''
+
+def write_avl_stub(folder,source=avl_stub,name='avl_stub'):
+    filename = os.path.join(folder,name)
+    with open(filename,'w') as stub:
+        stub.write('#!' + sys.executable + '\n')
+        stub.write(source)
+    os.chmod(filename, os.stat(filename).st_mode | stat.S_IEXEC)
+    return filename
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+import test_engine_deck
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Propulsion import engine_deck
+
+import numpy as np
+import copy
+import pickle
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = test_mission_B737.vehicle_setup()
+    turbofan = vehicle.propulsors['turbo_fan']
+
+    compiled = copy.deepcopy(turbofan)
+    compiled.compiled = True
+    compiled.finalize()
+
+    # the chain, against the component by component evaluation
+    state = test_engine_deck.flight_state(100)
+    state_compiled = copy.deepcopy(state)
+
+    results          = turbofan.evaluate_thrust(state)
+    results_compiled = compiled.evaluate_thrust(state_compiled)
+
+    for key in ['thrust_force_vector','vehicle_mass_rate','core_mass_flow_rate','specific_impulse']:
+        error = np.max( np.abs( results_compiled[key] - results[key] ) ) / np.max( np.abs(results[key]) )
+        print '%-25s error: %.4e' % (key,error)
+        assert error < 1e-12
+
+    for key in ['stagnation_temperature','stagnation_pressure','speed_of_sound']:
+        a = state_compiled.conditions.freestream[key]
+        b = state.conditions.freestream[key]
+        error = np.max( np.abs(a-b) / np.abs(b) )
+        print '%-25s error: %.4e' % (key,error)
+        assert error < 1e-12
+
+    # the buffers are reused, and kept out of copies
+    compiled.evaluate_thrust(state_compiled)
+    assert len(compiled.chain.buffers) == 1
+    assert len(pickle.loads(pickle.dumps(compiled.chain)).buffers) == 0
+
+    # sizing
+    sized = {}
+    for name in ['components','compiled']:
+        sized[name] = copy.deepcopy(turbofan)
+        sized[name].compiled = (name == 'compiled')
+        sized[name].thrust.design_thrust = turbofan.design_thrust
+        sized[name].size(sizing_state())
+
+    for key in ['mass_flow_rate_design','compressor_nondimensional_massflow']:
+        a = sized['compiled'].thrust[key]
+        b = sized['components'].thrust[key]
+        error = np.max( np.abs(a-b) / np.abs(b) )
+        print '%-25s error: %.4e' % (key,error)
+        assert error < 1e-12
+
+    # complex step through the chain
+    h = 1e-30
+    e = 1e-6
+    for key in ['mach_number','temperature']:
+        state_cs = copy.deepcopy(state)
+        state_cs.conditions.freestream[key] = state_cs.conditions.freestream[key] + 1j*h
+        state_cs.conditions.freestream.velocity = state_cs.conditions.freestream.mach_number \
+                                                * state_cs.conditions.freestream.speed_of_sound
+        cs = np.imag( compiled.evaluate_thrust(state_cs).thrust_force_vector[:,0] ) / h
+
+        F = []
+        for step in [e,-e]:
+            state_fd = copy.deepcopy(state)
+            state_fd.conditions.freestream[key] = state_fd.conditions.freestream[key] + step
+            state_fd.conditions.freestream.velocity = state_fd.conditions.freestream.mach_number \
+                                                    * state_fd.conditions.freestream.speed_of_sound
+            F.append( turbofan.evaluate_thrust(state_fd).thrust_force_vector[:,0] )
+        fd = (F[0]-F[1])/(2.*e)
+
+        error = np.max( np.abs(cs-fd) ) / np.max( np.abs(fd) )
+        print 'd thrust / d %-12s complex step error: %.4e' % (key,error)
+        assert error < 1e-6
+
+    assert len(compiled.chain.buffers) == 2
+
+    # an engine deck of the compiled chain
+    mach_number = np.linspace(0.2,0.8,4)
+    altitude    = np.linspace(0.,10.,3) * Units.km
+    throttle    = np.linspace(0.5,1.,2)
+    deck          = engine_deck(turbofan,mach_number,altitude,throttle)
+    deck_compiled = engine_deck(compiled,mach_number,altitude,throttle)
+    error = np.max( np.abs(deck_compiled.table - deck.table) / np.abs(deck.table) )
+    print 'engine deck error: %.4e' % error
+    assert error < 1e-12
+    assert np.all( deck_compiled.table[...,2] > 10. )
+
+    # the cost of an evaluation
+    for n in [16,64,256]:
+        state = test_engine_deck.flight_state(n)
+        repeats = 200
+
+        tic = time()
+        for i in range(repeats):
+            turbofan.evaluate_thrust(state)
+        t_components = (time()-tic)/repeats*1e3
+
+        tic = time()
+        for i in range(repeats):
+            compiled.evaluate_thrust(state)
+        t_compiled = (time()-tic)/repeats*1e3
+
+        print 'N = %3i, components: %.4f ms, compiled: %.4f ms' % (n,t_components,t_compiled)
+
+    # the mission, with the compiled chain
+    landing = {}
+    for name in ['components','compiled']:
+        vehicle = test_mission_B737.vehicle_setup()
+        vehicle.propulsors['turbo_fan'].compiled = (name == 'compiled')
+
+        configs  = test_mission_B737.configs_setup(vehicle)
+        analyses = test_mission_B737.analyses_setup(configs)
+        configs.finalize()
+        analyses.finalize()
+
+        mission = test_mission_B737.mission_setup(analyses)
+
+        tic = time()
+        results = mission.evaluate()
+        t_mission = time()-tic
+
+        landing[name] = results.segments[-1].conditions.weights.total_mass[-1,0]
+        print '%-10s landing mass: %.4f, mission: %.4f s' % (name,landing[name],t_mission)
+
+    error = np.abs( landing['compiled'] - landing['components'] ) / landing['components']
+    print 'landing mass error: %.4e' % error
+    assert error < 1e-10
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def sizing_state():
+    """ the design point of the B737 turbofan, as in vehicle_setup() """
+
+    altitude = 35000.0*Units.ft
+    mach_number = 0.78
+
+    atmo_data = SUAVE.Analyses.Atmospheric.US_Standard_1976().compute_values(altitude)
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.freestream.altitude          = np.atleast_1d(altitude)
+    conditions.freestream.mach_number       = np.atleast_1d(mach_number)
+    conditions.freestream.pressure          = np.atleast_1d(atmo_data.pressure)
+    conditions.freestream.temperature       = np.atleast_1d(atmo_data.temperature)
+    conditions.freestream.density           = np.atleast_1d(atmo_data.density)
+    conditions.freestream.dynamic_viscosity = np.atleast_1d(atmo_data.dynamic_viscosity)
+    conditions.freestream.gravity           = np.atleast_1d(9.81)
+    conditions.freestream.speed_of_sound    = np.atleast_1d(atmo_data.speed_of_sound)
+    conditions.freestream.velocity          = conditions.freestream.mach_number * conditions.freestream.speed_of_sound
+    conditions.propulsion.throttle          = np.atleast_1d(1.0)
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.numerics = SUAVE.Analyses.Mission.Segments.Conditions.Numerics()
+    state.conditions = conditions
+
+    return state
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
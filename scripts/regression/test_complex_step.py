@@ -0,0 +1,202 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+import test_mission_jacobian
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Missions.Segments import Complex_Step, Jacobian
+from SUAVE.Methods.Missions.Segments.Cruise.Common import residual_total_forces_along_track
+from SUAVE.Methods.Utilities.complex_step import cs_abs, cs_arctan2, cs_maximum, cs_minimum, cs_amax, cs_amin
+
+import numpy as np
+import warnings
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    functions()
+
+    vehicle  = test_mission_B737.vehicle_setup()
+    configs  = test_mission_B737.configs_setup(vehicle)
+    analyses = test_mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # the atmosphere, through the layers and the clamps
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    z = np.linspace(-1.,85.,40)[:,None] * Units.km
+    check_function(lambda z: atmosphere.compute_values(z),z,['pressure','temperature','density','speed_of_sound','dynamic_viscosity'])
+
+    # the supersonic aerodynamics, through the mach regimes
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Supersonic_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+    mach = np.linspace(0.3,2.2,20)[:,None]
+    check_function(lambda m: evaluate_aerodynamics(aerodynamics,m),mach,['lift_coefficient','drag_coefficient'])
+
+    # every step of every segment, the cruise with the horizontal force
+    # along the track, the magnitude has no derivative at the solution
+    mission = test_mission_B737.mission_setup(analyses)
+    mission.append_segment( throttle_climb(analyses) )
+    mission.segments['cruise'].process.iterate.residuals.total_forces = residual_total_forces_along_track
+    results = mission.evaluate()
+
+    for tag,segment in mission.segments.items():
+        checks = Complex_Step.check_steps(segment,results.segments[tag])
+        for path,check in checks.items():
+            if path == 'safe': continue
+            if check.failed or check.message:
+                print '%s.%s: %s %s' % (tag,path,check.failed,check.message)
+        print '%-10s complex safe: %s' % (tag,checks.safe)
+        assert checks.safe
+
+    # the complex jacobian against central differences
+    segment = mission.segments['cruise']
+    state   = results.segments['cruise']
+    unknowns = state.unknowns.pack_vector()
+
+    # the mass couples every control point, one column per color
+    unknowns_index  = Jacobian.pack_index(state,'unknowns')
+    residuals_index = Jacobian.pack_index(state,'residuals')
+    pattern = Jacobian.sparsity_pattern(residuals_index,unknowns_index)
+    colors  = Jacobian.color_columns(pattern)
+    assert np.all(pattern) and colors.max()+1 == len(unknowns)
+
+    J = Jacobian.complex_step(np.zeros(pattern.shape),unknowns,segment,state,pattern,colors)
+
+    J_fd = np.zeros(pattern.shape)
+    for j in range(len(unknowns)):
+        h = 1e-6 * max(abs(unknowns[j]),1.)
+        plus  = unknowns.copy(); plus[j]  += h
+        minus = unknowns.copy(); minus[j] -= h
+        J_fd[:,j] = ( Jacobian.iterate(plus,segment,state) - Jacobian.iterate(minus,segment,state) ) / (2.*h)
+    Jacobian.iterate(unknowns,segment,state)
+
+    error = np.max( np.abs(J-J_fd) ) / np.max( np.abs(J_fd) )
+    print 'complex jacobian error: %.4e' % error
+    assert error < 1e-6
+    assert not np.iscomplexobj( state.conditions.frames.inertial.velocity_vector )
+
+    # the mission, with complex step and with finite difference jacobians
+    landing = {}
+    for method in ['sparse','complex']:
+        mission = test_mission_jacobian.mission_setup(analyses)
+        mission.state.numerics.solver_jacobian = method
+        results, count = test_mission_jacobian.evaluate_counted(mission)
+        landing[method] = results.segments[-1].conditions.weights.total_mass[-1,0]
+        print '%-7s landing mass: %.6f, residual evaluations: %i' % (method,landing[method],count)
+
+    assert np.abs( landing['complex'] - landing['sparse'] ) / landing['sparse'] < 1e-6
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def functions():
+
+    x = np.array([-2.,-0.5,0.,1.5])
+    y = np.array([0.3,-1.2,0.7,2.])
+
+    # same as numpy for real inputs
+    assert np.all( cs_abs(x) == np.abs(x) )
+    assert np.all( cs_arctan2(y,x) == np.arctan2(y,x) )
+    assert np.all( cs_maximum(x,y) == np.maximum(x,y) )
+    assert np.all( cs_minimum(x,y) == np.minimum(x,y) )
+    assert cs_amax(x) == np.amax(x) and cs_amin(x) == np.amin(x)
+
+    # derivatives
+    h = 1e-30
+    assert np.all( np.imag(cs_abs(x+1j*h))/h == np.sign(x) + (x==0) )
+    assert np.max( np.abs( np.imag(cs_arctan2(y+1j*h,x))/h - x/(x**2+y**2) ) ) < 1e-15
+    assert np.max( np.abs( np.imag(cs_arctan2(y,x+1j*h))/h + y/(x**2+y**2) ) ) < 1e-15
+    assert np.all( np.imag(cs_maximum(x+1j*h,y))/h == (x >= y) )
+    assert np.all( np.imag(cs_minimum(x,y+1j*h))/h == (y < x) )
+
+    A = np.array([[1.,5.],[3.,2.]]) + 1j*np.array([[1.,2.],[3.,4.]])
+    assert np.all( cs_amax(A,axis=0) == A[[1,0],[0,1]] )
+    assert np.all( cs_amin(A,axis=1) == A[[0,1],[0,1]] )
+
+    return
+
+
+def check_function(function,x,keys):
+    """ complex step against central differences of a function of x
+    """
+
+    h = 1e-30
+    e = 1e-6 * np.maximum(np.abs(x),1.)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error',np.ComplexWarning)
+        values = function(x+1j*h)
+
+    plus  = function(x+e)
+    minus = function(x-e)
+
+    for key in keys:
+        cs = np.imag(values[key]) / h
+        fd = ( plus[key] - minus[key] ) / (2.*e)
+        error = np.max( np.abs(cs-fd) ) / np.max( np.abs(fd) )
+        print '%-20s complex step error: %.4e' % (key,error)
+        assert error < 1e-6
+
+    return
+
+
+def evaluate_aerodynamics(aerodynamics,mach):
+
+    n = len(mach)
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    freestream = state.conditions.freestream
+    freestream.mach_number       = mach
+    freestream.density           = np.linspace(0.3,1.2,n)[:,None]
+    freestream.dynamic_viscosity = np.linspace(1.4e-5,1.8e-5,n)[:,None]
+    freestream.temperature       = np.linspace(220.,288.,n)[:,None]
+    freestream.pressure          = np.linspace(2e4,1e5,n)[:,None]
+
+    state.conditions.aerodynamics.angle_of_attack = np.linspace(-3.,8.,n)[:,None] * Units.deg
+
+    aerodynamics.evaluate(state)
+
+    return state.conditions.aerodynamics
+
+
+def throttle_climb(analyses):
+
+    # the altitude, and with it the atmosphere and mach number, follow the unknowns
+    segment = SUAVE.Analyses.Mission.Segments.Climb.Constant_Throttle_Constant_Speed()
+    segment.tag = 'throttle_climb'
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 3.0   * Units.km
+    segment.throttle       = 0.9
+    segment.air_speed      = 140.0 * Units['m/s']
+
+    return segment
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from test_mission_B737 import vehicle_setup
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Aerodynamics.Supersonic_Zero import Drag
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    for wing in vehicle.wings:
+        wing.areas.wetted   = 2.0 * wing.areas.reference
+        wing.areas.exposed  = 0.8 * wing.areas.wetted
+        wing.areas.affected = 0.6 * wing.areas.wetted
+
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Supersonic_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+
+    settings = aerodynamics.settings
+    main_wing = vehicle.wings['main_wing']
+
+    # supersonic, against the wave drag methods
+    mach = np.linspace(1.05,2.2,30)
+    state = evaluate(aerodynamics,mach)
+
+    compressible = state.conditions.aerodynamics.drag_breakdown.compressible
+
+    Sref = main_wing.areas.reference
+    body = Drag.wave_drag_body_of_rev(vehicle.fuselages['fuselage'].lengths.total,vehicle.fuselages['fuselage'].effective_diameter/2.,Sref) \
+         + Drag.wave_drag_body_of_rev(vehicle.propulsors[0].engine_length,vehicle.propulsors[0].nacelle_diameter/2.,Sref) \
+         * vehicle.propulsors[0].number_of_engines
+
+    for wing in vehicle.wings:
+        expected = Drag.wave_drag_lift(state.conditions,settings,wing) + Drag.wave_drag_volume(state.conditions,settings,wing)
+        if wing.tag == 'main_wing':
+            expected = expected + body * 1.15
+        else:
+            expected = expected * wing.areas.reference / Sref
+        error = np.max( np.abs( compressible[wing.tag].compressibility_drag - expected ) / expected )
+        print '%s wave drag error: %.4e' % (wing.tag,error)
+        assert error < 1e-12
+
+    # continuous through the transonic interpolation, at one angle of attack
+    eps = 1e-9
+    state = evaluate(aerodynamics,np.array([0.99,0.99+eps,1.05-eps,1.05]),2.*Units.deg)
+    cd_c = state.conditions.aerodynamics.drag_breakdown.compressible.total[:,0]
+    assert np.abs( cd_c[1] - cd_c[0] ) / cd_c[0] < 1e-6
+    assert np.abs( cd_c[3] - cd_c[2] ) / cd_c[3] < 1e-6
+
+    # wings designed for high subsonic cruise, a geometry change needs initialize()
+    mach = np.linspace(0.3,0.99,30)
+    main_wing.high_mach = True
+    aerodynamics.initialize()
+    state = evaluate(aerodynamics,mach)
+    main_wing.high_mach = False
+    aerodynamics.initialize()
+
+    results = state.conditions.aerodynamics.drag_breakdown.compressible.main_wing
+    assert np.all( results.crest_critical == 0.93 )
+    assert np.all( results.divergence_mach == 0.95 )
+    assert np.max( np.abs( results.compressibility_drag[:,0] - 0.0019*(mach/0.93)**14.641 ) ) < 1e-15
+
+    # the analysis, with the geometry table kept, and the method
+    mach = np.linspace(0.3,2.2,200)
+    state = evaluate(aerodynamics,mach)
+    analysis = aerodynamics.process.compute.drag.compressibility.total
+    assert isinstance(analysis,SUAVE.Analyses.Aerodynamics.Compressibility_Drag_Components)
+
+    reference = state.conditions.aerodynamics.drag_breakdown.compressible
+
+    tic = time()
+    for i in range(100):
+        Drag.compressibility_drag_total(state,settings,vehicle)
+    print 'compressibility_drag_total : %.4f ms' % ((time()-tic)/100*1e3)
+
+    tic = time()
+    for i in range(100):
+        total = analysis(state,settings,vehicle)
+    print 'analysis                   : %.4f ms' % ((time()-tic)/100*1e3)
+
+    compressible = state.conditions.aerodynamics.drag_breakdown.compressible
+    assert np.all( total == reference.total )
+    for wing in vehicle.wings:
+        for key in ['compressibility_drag','crest_critical','divergence_mach']:
+            assert np.all( compressible[wing.tag][key] == reference[wing.tag][key] )
+
+    return
+
+
+def evaluate(aerodynamics,mach,angle_of_attack=None):
+
+    n = len(mach)
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    freestream = state.conditions.freestream
+    freestream.mach_number       = mach[:,None]
+    freestream.density           = np.linspace(0.3,1.2,n)[:,None]
+    freestream.dynamic_viscosity = np.linspace(1.4e-5,1.8e-5,n)[:,None]
+    freestream.temperature       = np.linspace(220.,288.,n)[:,None]
+    freestream.pressure          = np.linspace(2e4,1e5,n)[:,None]
+
+    if angle_of_attack is None:
+        angle_of_attack = np.linspace(-3.,8.,n)[:,None] * Units.deg
+    state.conditions.aerodynamics.angle_of_attack = angle_of_attack + np.zeros([n,1])
+
+    aerodynamics.evaluate(state)
+
+    return state
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
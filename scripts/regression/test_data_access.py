@@ -0,0 +1,110 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+
+import numpy as np
+
+import pickle
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    conditions = Aerodynamics()
+    conditions.expand_rows(16)
+    freestream = conditions.freestream
+
+    # attribute and item access agree
+    freestream.velocity = np.ones([16,1]) * 200.
+    assert freestream['velocity'] is freestream.velocity
+    freestream['mach_number'] = np.ones([16,1]) * 0.8
+    assert freestream.mach_number[0,0] == 0.8
+
+    # ordering and integer indexing
+    keys = freestream.keys()
+    assert keys[0] == 'velocity'
+    assert freestream[0] is freestream.velocity
+    assert freestream[-1] is freestream[keys[-1]]
+    assert freestream.values()[1] is freestream[keys[1]]
+    assert [ k for k,v in freestream.iteritems() ] == keys
+    freestream[1] = 2.
+    assert freestream[keys[1]] == 2.
+    try:
+        freestream[len(keys)]
+        raise AssertionError , 'index past the end'
+    except IndexError:
+        pass
+
+    # new keys go to the end, class attributes are not keys
+    freestream.new_key = 1.
+    assert freestream.keys()[-1] == 'new_key'
+    freestream._size = 16
+    assert not '_size' in freestream.keys()
+
+    # missing keys
+    try:
+        freestream['missing']
+        raise AssertionError , 'found a missing key'
+    except AttributeError:
+        pass
+
+    # pack and unpack
+    vector = conditions.pack_array('vector')
+    conditions.unpack_array(vector*2.)
+    assert freestream.velocity[0,0] == 400.
+
+    # pickling
+    other = pickle.loads( pickle.dumps(conditions) )
+    assert other.freestream.keys() == freestream.keys()
+    assert np.all( other.freestream.velocity == freestream.velocity )
+
+    # timing against a plain object
+    class Plain(object):
+        pass
+    plain = Plain()
+    plain.freestream = Plain()
+    plain.freestream.velocity = freestream.velocity
+
+    n = 100000
+    tic = time()
+    for i in xrange(n):
+        v = plain.freestream.velocity
+    t_plain = time() - tic
+
+    tic = time()
+    for i in xrange(n):
+        v = conditions.freestream.velocity
+    t_attribute = time() - tic
+
+    tic = time()
+    for i in xrange(n):
+        v = conditions['freestream']['velocity']
+    t_item = time() - tic
+
+    tic = time()
+    for i in xrange(n):
+        conditions.freestream.velocity = v
+    t_set = time() - tic
+
+    print 'plain object  : %.1f ns' % (t_plain/n*1e9)
+    print 'attribute     : %.1f ns' % (t_attribute/n*1e9)
+    print 'item          : %.1f ns' % (t_item/n*1e9)
+    print 'set attribute : %.1f ns' % (t_set/n*1e9)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Analyses.Mission.Segments.Conditions import State, Aerodynamics
+
+import numpy as np
+
+from copy import deepcopy
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    state = State()
+    state.conditions = Aerodynamics()
+    state.conditions.frames.inertial.velocity_vector = np.ones([1,3])
+    state.conditions.freestream.velocity = np.ones([1,1]) * 200.
+    state.unknowns.throttle = np.ones([1,1]) * 0.5
+    state.expand_rows(16)
+
+    # the same object twice stays one object
+    state.initials = state.conditions
+
+    other = state.clone()
+
+    assert type(other) is type(state)
+    assert type(other.conditions.frames) is type(state.conditions.frames)
+    assert other.keys() == state.keys()
+    assert other.conditions.keys() == state.conditions.keys()
+    assert other.initials is other.conditions
+    assert other.conditions._size == 16
+
+    # independent arrays
+    other.conditions.freestream.velocity[:,0] = 100.
+    assert np.all( state.conditions.freestream.velocity == 200. )
+
+    # independent keys
+    other.conditions.new_key = 1.
+    assert not 'new_key' in state.conditions
+
+    # shared arrays are read only
+    shared = state.clone(share_arrays=True)
+    assert np.may_share_memory( shared.unknowns.throttle, state.unknowns.throttle )
+    try:
+        shared.unknowns.throttle[0,0] = 1.
+        raise AssertionError , 'shared array was writeable'
+    except ValueError:
+        pass
+    shared.unknowns.throttle = np.zeros([16,1])
+    assert np.all( state.unknowns.throttle == 0.5 )
+
+    # timing against deepcopy
+    n = 200
+    tic = time()
+    for i in range(n):
+        deepcopy(state)
+    t_deepcopy = time() - tic
+
+    tic = time()
+    for i in range(n):
+        state.clone()
+    t_clone = time() - tic
+
+    print 'deepcopy : %.2f us' % (t_deepcopy/n*1e6)
+    print 'clone    : %.2f us' % (t_clone/n*1e6)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+
+import SUAVE
+from SUAVE.Core import Data, Results
+from SUAVE.Plugins.VyPy.data import DataBunch
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics, Conditions, State
+
+import numpy as np
+import sys
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # instances from the template don't share values
+    a = Aerodynamics()
+    a.freestream.test_key = np.ones([1,1])
+    a.frames.inertial.position_vector[0,0] = 5.
+    a.new_key = 1.
+    b = Aerodynamics()
+    assert not 'test_key' in b.freestream and not 'new_key' in b
+    assert b.frames.inertial.position_vector[0,0] == 0.
+    assert b.keys() == [ k for k in a.keys() if k != 'new_key' ]
+    assert type(b.frames.inertial) is type(a.frames.inertial)
+
+    # inputs still update the defaults
+    r = Results(x=1.)
+    assert r.x == 1.
+
+    # only the classes that set it keep a template, not their subclasses
+    class Other(Conditions):
+        def __defaults__(self):
+            self.x = np.ones([1,1])
+    Other()
+    Data()
+    templates = sys.modules[DataBunch.__module__]._templates
+    assert Aerodynamics in templates and not Other in templates and not Data in templates
+
+    # results and energy components fill in their defaults once
+    from SUAVE.Components.Energy.Energy_Component import Energy_Component
+    get_bases = DataBunch.get_bases
+    for klass in [Results,SUAVE.Analyses.Results,Energy_Component]:
+        filled = [0]
+        def counted_bases(self):
+            filled[0] += type(self) is klass
+            return get_bases(self)
+        DataBunch.get_bases = counted_bases
+        try:
+            instances = [ klass() for i in range(10) ]
+        finally:
+            DataBunch.get_bases = get_bases
+        print '%s: %i of 10 constructions filled in the defaults' % (klass.__name__,filled[0])
+        assert klass in templates and filled[0] <= 1
+        assert type(instances[-1]) is klass
+
+    energy = Energy_Component()
+    energy.outputs.power = 1.
+    assert not 'power' in Energy_Component().outputs
+
+    # the classes that keep one
+    cached = [ k for k in templates.keys() if k.__dict__.get('_cache_defaults',False) ]
+
+    # mission solve, counting construction time
+    vehicle  = test_mission_B737.vehicle_setup()
+    configs  = test_mission_B737.configs_setup(vehicle)
+    analyses = test_mission_B737.analyses_setup(configs)
+    configs.finalize()
+    analyses.finalize()
+    mission = test_mission_B737.mission_setup(analyses)
+
+    new = DataBunch.__new__
+    timer = [0,0.,0]
+    def timed_new(cls,*args,**kwarg):
+        tic = time()
+        self = new(cls,*args,**kwarg)
+        timer[1] += time() - tic
+        timer[0] += 1
+        timer[2] += issubclass(cls,Results)
+        return self
+
+    outputs = []
+    DataBunch.__new__ = staticmethod(timed_new)
+    try:
+        for cache_defaults in [False,True]:
+            for klass in cached:
+                klass._cache_defaults = cache_defaults
+            timer[:] = [0,0.,0]
+            tic = time()
+            results = mission.evaluate()
+            t_solve = time() - tic
+            print 'cached defaults: %s' % cache_defaults
+            print '  %i constructions, %i of them results, %.4f s of %.4f s solve' % (timer[0],timer[2],timer[1],t_solve)
+            outputs.append( results.segments[-1].conditions.weights.total_mass[-1,0] )
+    finally:
+        DataBunch.__new__ = staticmethod(new)
+        for klass in cached:
+            klass._cache_defaults = True
+
+    # same answer
+    err = np.abs(outputs[1]-outputs[0]) / outputs[0]
+    print 'landing mass error: %.4e' % err
+    assert err < 1e-10
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+import test_mission_jacobian
+
+import SUAVE
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data
+from SUAVE.Methods.Utilities import legendre_gauss_lobatto_data, finite_difference_data
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # operators
+    for method,N,tolerance in [ ( chebyshev_data              , 16  , 1e-6 ) ,
+                                ( legendre_gauss_lobatto_data , 16  , 1e-6 ) ,
+                                ( finite_difference_data      , 128 , 1e-3 ) ]:
+
+        x,D,I = method(N)
+
+        f = np.sin(3.*x)
+        err_D = np.max( np.abs( np.dot(D,f) - 3.*np.cos(3.*x) ) )
+        err_I = np.max( np.abs( np.dot(I,f) - (1.-np.cos(3.*x))/3. ) )
+
+        print '%s N=%i derivative error: %.4e integral error: %.4e' % (method.__name__,N,err_D,err_I)
+        assert err_D < tolerance and err_I < tolerance
+
+        # shared and read only
+        assert method(N)[1] is D
+        assert not D.flags.writeable
+
+    # no integration operator
+    assert chebyshev_data(16,integration=False)[2] is None
+
+    # setup cost on repeated calls
+    chebyshev_data(128)
+    n = 100
+    tic = time()
+    for i in range(n):
+        chebyshev_data(128)
+    print 'chebyshev_data(128) : %.2f us' % ((time()-tic)/n*1e6)
+
+    # the mission, with each discretization
+    vehicle  = test_mission_B737.vehicle_setup()
+    configs  = test_mission_B737.configs_setup(vehicle)
+    analyses = test_mission_B737.analyses_setup(configs)
+    configs.finalize()
+    analyses.finalize()
+
+    landing = {}
+    for method,N in [ ( chebyshev_data              , 16 ) ,
+                      ( legendre_gauss_lobatto_data , 16 ) ,
+                      ( finite_difference_data      , 48 ) ]:
+        mission = test_mission_jacobian.mission_setup(analyses)
+        mission.state.numerics.solver_jacobian = 'sparse'
+        for segment in mission.segments:
+            segment.state.numerics.discretization_method = method
+            segment.state.numerics.number_control_points = N
+            segment.state.numerics.solver_jacobian = 'sparse'
+        tic = time()
+        results = mission.evaluate()
+        landing[method.__name__] = results.segments[-1].conditions.weights.total_mass[-1,0]
+        print '%s landing mass: %.4f, %.4f s' % (method.__name__,landing[method.__name__],time()-tic)
+
+    reference = landing['chebyshev_data']
+    assert np.abs( landing['legendre_gauss_lobatto_data'] - reference ) / reference < 1e-6
+    assert np.abs( landing['finite_difference_data']      - reference ) / reference < 1e-4
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+import test_mission_jacobian
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Aerodynamics.Surrogates import Drag_Polar
+
+import numpy as np
+
+import shutil
+import tempfile
+import warnings
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = test_mission_B737.vehicle_setup()
+
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+
+    folder = tempfile.mkdtemp()
+    try:
+        # the table, kept in the cache
+        polar = Drag_Polar()
+        polar.model = aerodynamics
+        polar.training_cache = folder
+
+        tic = time()
+        with warnings.catch_warnings():
+            warnings.simplefilter('error',RuntimeWarning)
+            polar.finalize()
+        print 'table build : %.4f s' % (time()-tic)
+
+        accuracy = polar.accuracy
+        print 'lift error %.4e, drag error %.4e (%.2f%%)' % (accuracy.lift_coefficient,accuracy.drag_coefficient,
+                                                             accuracy.drag_relative*100.)
+        assert accuracy.lift_coefficient < polar.settings.tolerance.lift_coefficient
+        assert accuracy.drag_coefficient < polar.settings.tolerance.drag_coefficient
+
+        for path in [('results','lift','total'),('results','drag','total'),
+                     ('conditions','aerodynamics','drag_breakdown','induced','total'),
+                     ('conditions','aerodynamics','drag_breakdown','compressible','total')]:
+            assert path in polar.outputs , path
+
+        # the model at the nodes of the grid
+        training = polar.training
+        nodes = [ training.mach_number[[2,20]] , training.angle_of_attack[[3,15]] , training.altitude[[0,5]] ]
+
+        state   = polar.grid_state(*nodes)
+        results = polar.evaluate(state)
+        table   = Data()
+        table.results    = results
+        table.conditions = state.conditions
+
+        state   = polar.grid_state(*nodes)
+        results = aerodynamics.evaluate(state)
+        model   = Data()
+        model.results    = results
+        model.conditions = state.conditions
+
+        for path in polar.outputs:
+            a = table.deep_get(list(path))
+            b = model.deep_get(list(path))
+            assert np.shape(a) == np.shape(b) , path
+            assert np.all( np.abs(a-b) <= 1e-10 * (1. + np.abs(b)) ) , path
+
+        # a second table of the same model shares the cache
+        other = Drag_Polar()
+        other.model = aerodynamics
+        other.training_cache = folder
+
+        tic = time()
+        other.finalize()
+        print 'table load  : %.4f s' % (time()-tic)
+
+        assert isinstance(other.training.table,np.memmap)
+        assert np.all( np.asarray(other.training.table) == np.asarray(polar.training.table) )
+
+        # not a model with another process step, or the table in another atmosphere
+        key = other.training_key()
+        steps = aerodynamics.process.compute.lift
+        inviscid_wings = steps.inviscid_wings
+        steps.inviscid_wings = SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift.weissinger_vortex_lattice
+        assert other.training_key() != key
+        steps.inviscid_wings = inviscid_wings
+        assert other.training_key() == key
+
+        other.atmosphere.settings.temperature_deviation = 10.
+        assert other.training_key() != key
+
+    finally:
+        shutil.rmtree(folder)
+
+    # the mission, with the model and with its table, without the stability
+    # analysis, which would take most of the time of each iteration
+    configs  = test_mission_B737.configs_setup(vehicle)
+    analyses = test_mission_B737.analyses_setup(configs)
+    configs.finalize()
+    analyses.finalize()
+
+    for config in analyses.values():
+        config.stability = None
+
+    landing = {}
+    solve   = {}
+    count   = {}
+    for method in ['model','table']:
+
+        if method == 'table':
+            for config in analyses.values():
+                polar = Drag_Polar()
+                polar.tag   = 'aerodynamics'
+                polar.model = config.aerodynamics
+                polar.finalize()
+                config.aerodynamics = polar
+
+        # the faster of two solves
+        solve[method] = np.inf
+        for i in range(2):
+            mission = test_mission_jacobian.mission_setup(analyses)
+
+            tic = time()
+            results, count[method] = test_mission_jacobian.evaluate_counted(mission)
+            solve[method] = min( solve[method] , time() - tic )
+
+        landing[method] = results.segments[-1].conditions.weights.total_mass[-1,0]
+        print '%s landing mass: %.4f, %.4f s, %i residual evaluations' % (method,landing[method],solve[method],count[method])
+
+    assert np.abs( landing['table'] - landing['model'] ) / landing['model'] < 1e-3
+
+    # no more solver work, and less time
+    assert count['table'] <= count['model']
+    assert solve['table'] < solve['model']
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Propulsion import engine_deck, load_engine_deck
+
+import numpy as np
+import os
+import shutil
+import tempfile
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = test_mission_B737.vehicle_setup()
+    turbofan = vehicle.propulsors['turbo_fan']
+
+    # the deck, kept in a file
+    folder = tempfile.mkdtemp()
+    try:
+        network = SUAVE.Components.Energy.Networks.Turbofan_Deck()
+        network.tag = 'turbo_fan'
+        network.deck_file = os.path.join(folder,'turbofan.npy')
+
+        tic = time()
+        network.build(turbofan)
+        print 'deck build : %.4f s' % (time()-tic)
+
+        assert isinstance(network.deck.table,np.memmap)
+        assert network.number_of_engines == turbofan.number_of_engines
+        assert network.nacelle_diameter  == turbofan.nacelle_diameter
+
+        # same as the network at the grid points
+        deck = engine_deck(turbofan,network.deck.mach_number,network.deck.altitude,network.deck.throttle)
+        assert np.all( deck.table == network.deck.table )
+
+        loaded = SUAVE.Components.Energy.Networks.Turbofan_Deck()
+        loaded.load(network.deck_file)
+        assert np.all( loaded.deck.table == network.deck.table )
+        assert np.all( loaded.deck.altitude == network.deck.altitude )
+
+        # a deck saved over the file leaves the loaded one as it was
+        table = np.array(loaded.deck.table)
+        other = SUAVE.Components.Energy.Networks.Turbofan_Deck()
+        other.deck.mach_number = network.deck.mach_number
+        other.deck.altitude    = network.deck.altitude
+        other.deck.throttle    = network.deck.throttle * 0.5
+        other.deck_file        = network.deck_file
+        other.build(turbofan)
+        assert np.any( other.deck.table != table )
+        assert np.all( loaded.deck.table == table )
+        network.build(turbofan)
+
+        # against the network between the grid points
+        state = flight_state(200)
+        results_deck = network.evaluate_thrust(state)
+        results      = turbofan.evaluate_thrust(state)
+
+        for key in ['thrust_force_vector','vehicle_mass_rate']:
+            error = np.max( np.abs( results_deck[key] - results[key] ) / np.max( np.abs(results[key]) ) )
+            print '%-20s deck error: %.4e' % (key,error)
+            assert error < 5e-3
+
+        # the cost of an evaluation
+        for n in [16,64]:
+            state = flight_state(n)
+            repeats = 100
+
+            tic = time()
+            for i in range(repeats):
+                turbofan.evaluate_thrust(state)
+            t_network = (time()-tic)/repeats*1e3
+
+            tic = time()
+            for i in range(repeats):
+                network.evaluate_thrust(state)
+            t_deck = (time()-tic)/repeats*1e3
+
+            print 'N = %2i, network: %.4f ms, deck: %.4f ms' % (n,t_network,t_deck)
+
+        # the mission, with the deck in place of the network
+        landing = {}
+        for name in ['network','deck']:
+            vehicle = test_mission_B737.vehicle_setup()
+            if name == 'deck':
+                del vehicle.propulsors['turbo_fan']
+                vehicle.propulsors.append(network)
+
+            configs  = test_mission_B737.configs_setup(vehicle)
+            analyses = test_mission_B737.analyses_setup(configs)
+            configs.finalize()
+            analyses.finalize()
+
+            mission = test_mission_B737.mission_setup(analyses)
+            results = mission.evaluate()
+
+            landing[name] = results.segments[-1].conditions.weights.total_mass[-1,0]
+            print '%-7s landing mass: %.4f' % (name,landing[name])
+
+        error = np.abs( landing['deck'] - landing['network'] ) / landing['network']
+        print 'landing mass error: %.4e' % error
+        assert error < 1e-3
+
+    finally:
+        shutil.rmtree(folder)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def flight_state(n):
+
+    random = np.random.RandomState(n)
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    conditions = state.conditions
+    freestream = conditions.freestream
+
+    freestream.mach_number = random.uniform(0.2,0.85,[n,1])
+    freestream.altitude    = random.uniform(0.,12.,[n,1]) * Units.km
+
+    atmo_data = SUAVE.Analyses.Atmospheric.US_Standard_1976().compute_values(freestream.altitude)
+    freestream.pressure          = atmo_data.pressure
+    freestream.temperature       = atmo_data.temperature
+    freestream.density           = atmo_data.density
+    freestream.speed_of_sound    = atmo_data.speed_of_sound
+    freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    freestream.velocity          = freestream.mach_number * freestream.speed_of_sound
+    freestream.gravity           = freestream.altitude * 0. + 9.80665
+
+    conditions.propulsion.throttle = random.uniform(0.3,1.,[n,1])
+
+    return state
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
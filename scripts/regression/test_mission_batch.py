@@ -0,0 +1,84 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+from test_mission_Embraer_E190_constThr import full_setup
+
+from SUAVE.Methods.Performance import size_mission_range_given_weights
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    configs.finalize()
+    analyses.finalize()
+
+    vehicle = configs.base
+    mission = analyses.missions
+
+    weights = mission.segments[0].analyses.weights
+    takeoff_reference = weights.vehicle.mass_properties.takeoff
+
+    takeoff_weights = [ 51800. , 46000. , 40800. ]
+
+    # one mission at a time
+    tic = time()
+    landing_sequential = []
+    for takeoff_weight in takeoff_weights:
+        weights.vehicle.mass_properties.takeoff = takeoff_weight
+        results = mission.evaluate()
+        landing_sequential.append( results.segments[-1].conditions.weights.total_mass[-1,0] )
+    print 'sequential time: %.4f s' % (time()-tic)
+
+    weights.vehicle.mass_properties.takeoff = takeoff_reference
+
+    # the same missions as one batch
+    batch = SUAVE.Analyses.Mission.Batch()
+    for takeoff_weight in takeoff_weights:
+        batch.append_case(mission,takeoff_weight=takeoff_weight)
+
+    tic = time()
+    results = batch.evaluate()
+    print 'batch time: %.4f s' % (time()-tic)
+
+    # the base mission is left alone
+    assert weights.vehicle.mass_properties.takeoff == takeoff_reference
+
+    for i,case in enumerate(results.segments.values()):
+        landing_batch = case.segments[-1].conditions.weights.total_mass[-1,0]
+        err = np.abs( landing_batch - landing_sequential[i] ) / landing_sequential[i]
+        print '%s landing mass error: %.4e' % (batch.segments[i].tag,err)
+        assert err < 1e-6 , 'Batch check failed: %s' % batch.segments[i].tag
+
+    # range sweep, more fuel flies further
+    payload = [ 11792. , 9868. ]
+    tow     = [ 51800. , 48000. ]
+    distance,fuel = size_mission_range_given_weights(vehicle,mission,'cruise',payload,tow)
+
+    print 'range : ', distance / Units.nautical_mile
+    print 'fuel  : ', fuel
+
+    assert fuel[0] > fuel[1]
+    assert distance[0] > distance[1] > 0.
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
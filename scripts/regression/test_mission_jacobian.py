@@ -0,0 +1,283 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import scipy.optimize
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = test_mission_B737.vehicle_setup()
+    configs  = test_mission_B737.configs_setup(vehicle)
+    analyses = test_mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # solve with the root finder's own finite differences
+    mission = mission_setup(analyses)
+    results_none, count_none = evaluate_counted(mission)
+
+    # solve with the colored sparse jacobian, checked entry by entry against
+    # one column at a time in the first root find, the segments are chained
+    # through their initials so every column has its own color
+    mission = mission_setup(analyses)
+    mission.state.numerics.solver_jacobian = 'sparse'
+    checks = check_jacobian(mission)
+    results_sparse, count_sparse = evaluate_counted(mission)
+
+    n_unknowns, n_colors = checks[0]
+    count_sparse -= 2*n_unknowns + 3
+
+    print 'mission unknowns: %i, colors: %i' % (n_unknowns,n_colors)
+    assert n_colors == n_unknowns
+
+    print 'residual evaluations, none   : %i' % count_none
+    print 'residual evaluations, sparse : %i' % count_sparse
+
+    # same answer
+    for tag in results_none.segments.keys():
+        a = results_none.segments[tag].conditions
+        b = results_sparse.segments[tag].conditions
+        for key in ['weights.total_mass','aerodynamics.angle_of_attack','propulsion.throttle']:
+            v_a = a.deep_get(key)
+            v_b = b.deep_get(key)
+            err = np.max( np.abs(v_a-v_b) / np.maximum(np.abs(v_a),1.) )
+            print '%s.%s error: %.4e' % (tag,key,err)
+            assert err < 1e-5 , 'Jacobian check failed: %s.%s' % (tag,key)
+
+    # independent cases share colors, one per unknown of a case
+    batch = SUAVE.Analyses.Mission.Batch()
+    for takeoff_weight in [ 79000. , 72000. , 65000. ]:
+        batch.append_case(mission_setup(analyses),takeoff_weight=takeoff_weight)
+    checks = check_jacobian(batch)
+    batch.evaluate()
+
+    n_unknowns, n_colors = checks[0]
+    print 'batch unknowns: %i, colors: %i' % (n_unknowns,n_colors)
+    assert n_colors * 3 == n_unknowns
+
+    # published partials
+    analytic_segment()
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def evaluate_counted(mission):
+
+    counter = [0]
+    def count_residuals(segment,state):
+        counter[0] += 1
+
+    mission.process.iterate.count_residuals = count_residuals
+
+    tic = time()
+    results = mission.evaluate()
+    print 'solve time: %.4f s' % (time()-tic)
+
+    return results, counter[0]
+
+
+def check_jacobian(mission):
+    """ checks = check_jacobian(mission)
+        the first root find of the mission compares its jacobian entry by
+        entry against forward differences of every column, the check costs
+        2*n_unknowns+3 residual evaluations
+    """
+
+    checks = []
+
+    def root_finder(func,x0,args,fprime,xtol):
+        if not checks:
+            checks.append( compare_jacobian(func,x0,args,fprime) )
+        return scipy.optimize.fsolve(func,x0,args=args,fprime=fprime,xtol=xtol)
+
+    mission.settings.root_finder = root_finder
+
+    return checks
+
+
+def compare_jacobian(func,x0,args,fprime):
+
+    Jacobian = SUAVE.Methods.Missions.Segments.Jacobian
+
+    segment,state = args
+
+    # the initials only link the segments during the solve
+    unknowns_index  = Jacobian.pack_index(state,'unknowns')
+    residuals_index = Jacobian.pack_index(state,'residuals')
+    pattern = Jacobian.sparsity_pattern(residuals_index,unknowns_index)
+    colors  = Jacobian.color_columns(pattern)
+
+    J = fprime(x0,args)
+
+    # the same steps as Jacobian.finite_difference()
+    residuals = func(x0,args)
+    step = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x0),1.)
+
+    J_dense = np.zeros(J.shape)
+    for j in range(len(x0)):
+        x = x0.copy()
+        x[j] += step[j]
+        J_dense[:,j] = ( func(x,args) - residuals ) / step[j]
+    func(x0,args)
+
+    scale = np.max(np.abs(J_dense))
+
+    outside = np.max( np.abs(J_dense[~pattern]) ) / scale if np.any(~pattern) else 0.
+    error   = np.max( np.abs(J - J_dense) ) / scale
+    print 'jacobian outside the pattern: %.4e, error: %.4e' % (outside,error)
+    assert outside == 0.
+    assert error < 1e-10
+
+    return len(x0), colors.max()+1
+
+
+def analytic_segment():
+
+    Methods  = SUAVE.Methods.Missions.Segments
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    segment = Segments.Segment()
+    segment.tag = 'analytic'
+
+    state = segment.state
+    state.numerics.number_control_points = 8
+    state.numerics.solver_jacobian = 'analytic'
+    state.unknowns.x  = state.ones_row(1) * 1.0
+    state.residuals.r = state.ones_row(2) * 0.0
+
+    counter = [0]
+
+    def residuals(segment,state):
+        counter[0] += 1
+        x = state.unknowns.x
+        c = np.arange(1.,x.shape[0]+1.)[:,None]
+        state.residuals.r[:,0] = (x**2. - c)[:,0]
+        state.residuals.r[:,1] = (x**2. - c)[:,0] * 3.
+
+        dr_dx = np.zeros([x.shape[0],2,1])
+        dr_dx[:,0,0] = 2. * x[:,0]
+        dr_dx[:,1,0] = 6. * x[:,0]
+        Methods.Jacobian.publish_partial(state,'r','x',dr_dx)
+
+    segment.process.initialize.expand_state = Methods.expand_state
+    segment.process.converge.converge_root  = Methods.converge_root
+    segment.process.iterate.residuals       = residuals
+
+    def root_finder(func,x0,args,fprime,xtol):
+        # plain newton, least squares on the overdetermined residual
+        x = x0
+        for i in range(20):
+            x = x - np.linalg.lstsq(fprime(x,args),func(x,args))[0]
+        return x
+
+    segment.settings.root_finder = root_finder
+
+    state = segment.evaluate()
+
+    x = state.unknowns.x[:,0]
+    err = np.max( np.abs( x - np.sqrt(np.arange(1.,9.)) ) )
+    print 'analytic jacobian error: %.4e' % err
+    assert err < 1e-10
+
+    # one residual per newton step and per jacobian, no finite differences,
+    # plus the last pass through segment.process.iterate
+    assert counter[0] == 2*20 + 1
+
+    return
+
+
+def mission_setup(analyses):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = SUAVE.Analyses.Mission.All_At_Once()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # ------------------------------------------------------------------
+    #   Climb Segments: constant speed, constant rate
+    # ------------------------------------------------------------------
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.tag = "climb_1"
+
+    segment.analyses.extend( analyses.takeoff )
+
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 3.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.tag = "climb_2"
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.altitude_end   = 8.0   * Units.km
+    segment.air_speed      = 190.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: constant speed, constant altitude
+    # ------------------------------------------------------------------
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude()
+    segment.tag = "cruise"
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.air_speed  = 230.412 * Units['m/s']
+    segment.distance   = 2000.00 * Units.km
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Descent Segment: consant speed, constant segment rate
+    # ------------------------------------------------------------------
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate()
+    segment.tag = "descent"
+
+    segment.analyses.extend( analyses.landing )
+
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    return mission
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
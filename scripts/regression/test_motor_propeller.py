@@ -0,0 +1,233 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Propulsion import propeller_design, motor_propeller_operating_point
+from SUAVE.Components.Energy.Converters.Propeller import \
+     blade_element_inputs, blade_element_flow, circulation_residual_derivative
+
+import numpy as np
+import copy
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    motor, prop = motor_propeller_setup()
+    conditions = operating_conditions(20)
+    motor.inputs.voltage = voltage(20)
+
+    # the exact derivative of the circulation residual
+    prop.inputs.omega = prop.prop_attributes.angular_velocity * np.ones([20,1])
+    prop.spin(conditions)
+    for shift in [0.,0.2]:
+        psi = prop.inflow_angle + shift
+        h   = 1e-30
+        cs  = np.imag( circulation_residual(prop,conditions,psi+1j*h) ) / h
+        dR  = circulation_residual_derivative(psi,*derivative_inputs(prop,conditions))
+        error = np.max( np.abs(dR/cs - 1.) )
+        print 'circulation residual derivative error: %.4e' % error
+        assert error < 1e-10
+
+    # the operating point, against the loop of the motor and a tight propeller solve
+    motor, prop = motor_propeller_setup()
+    motor.inputs.voltage = voltage(20)
+
+    reference_motor, reference_prop = copy.deepcopy(motor), copy.deepcopy(prop)
+    reference_prop.tolerance = 1e-12
+    reference_prop.maximum_iterations = 1000
+    F_reference, Q_reference, P_reference, Cp_reference, evaluations = fixed_point(reference_motor,reference_prop,conditions,1e-12)
+
+    F, Q, P, Cp, iterations = motor_propeller_operating_point(motor,prop,conditions,tolerance=1e-12)
+
+    for name,a,b in [['thrust',F,F_reference],['power',P,P_reference],['rpm',motor.outputs.omega,reference_motor.outputs.omega]]:
+        error = np.max( np.abs(a-b) / np.abs(b) )
+        print '%-6s error to the tight loop: %.4e' % (name,error)
+        assert error < 1e-6
+
+    assert np.max( np.abs(Cp - motor.propeller_Cp) ) < 1e-12
+
+    # the torques balance
+    motor.current(conditions)
+    G   = motor.gear_ratio
+    Kv  = motor.speed_constant/G
+    io  = motor.no_load_current + motor.expected_current*(1-motor.gearbox_efficiency)
+    Q_motor = ((motor.inputs.voltage - motor.outputs.omega/Kv)/motor.resistance - io)/Kv
+    error = np.max( np.abs(Q_motor - Q) / np.abs(Q) )
+    print 'torque balance error: %.4e' % error
+    assert error < 1e-4
+
+    # what the loop of the motor and the propeller takes
+    loop_motor, loop_prop = motor_propeller_setup()
+    loop_motor.inputs.voltage = voltage(20)
+    evaluations_loop = fixed_point(loop_motor,loop_prop,conditions)[4]
+    motor, prop = motor_propeller_setup()
+    motor.inputs.voltage = voltage(20)
+    F, Q, P, Cp, iterations = motor_propeller_operating_point(motor,prop,conditions)
+    print 'station evaluations, loop: %i, operating point: %i in %i iterations' % (evaluations_loop,iterations.evaluations,iterations.operating_point)
+    assert iterations.evaluations < evaluations_loop / 2
+
+    # again at the same point, from the last one
+    prop.warm_start = True
+    F_warm = motor_propeller_operating_point(motor,prop,conditions)[0]
+    assert prop.outputs.iterations == 1
+    assert np.max( np.abs(F_warm-F) / np.abs(F) ) < 1e-8
+
+    # complex step through the operating point
+    motor, prop = motor_propeller_setup()
+    motor.inputs.voltage = voltage(20)
+    motor_propeller_operating_point(motor,prop,conditions)
+
+    for key in ['velocity','density']:
+        direction = conditions.freestream[key] * 1e-3
+        cs = np.imag( perturbed_thrust(motor,prop,conditions,key,1e-30j*direction) ) / 1e-30
+        fd = ( perturbed_thrust(motor,prop,conditions,key,1e-6*direction)
+             - perturbed_thrust(motor,prop,conditions,key,-1e-6*direction) ) / 2e-6
+        error = np.max( np.abs(cs-fd) ) / np.max( np.abs(fd) )
+        print 'd thrust / d %-8s complex step error: %.4e' % (key,error)
+        assert error < 1e-5
+
+    # the solar network, with its operating point
+    for n in [16,64,256]:
+        conditions = operating_conditions(n)
+        repeats = 3
+
+        motor, prop = motor_propeller_setup()
+        motor.inputs.voltage = voltage(n)
+        tic = time()
+        for i in range(repeats):
+            fixed_point(motor,prop,conditions)
+        t_loop = (time()-tic)/repeats*1e3
+
+        motor, prop = motor_propeller_setup()
+        motor.inputs.voltage = voltage(n)
+        tic = time()
+        for i in range(repeats):
+            motor_propeller_operating_point(motor,prop,conditions)
+        t_joint = (time()-tic)/repeats*1e3
+
+        print 'N = %3i, loop: %.3f ms, operating point: %.3f ms' % (n,t_loop,t_joint)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def motor_propeller_setup():
+    """ the motor and propeller of test_solar_network """
+
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 10.0
+    prop_attributes.angular_velocity    = 5887*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = .4064
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7500.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    prop = SUAVE.Components.Energy.Converters.Propeller()
+    prop.prop_attributes = prop_attributes
+
+    motor = SUAVE.Components.Energy.Converters.Motor()
+    motor.resistance           = 0.01
+    motor.no_load_current      = 8.0
+    motor.speed_constant       = 140.*(2.*np.pi/60.)
+    motor.propeller_radius     = prop.prop_attributes.tip_radius
+    motor.propeller_Cp         = prop.prop_attributes.Cp
+    motor.gear_ratio           = 1.
+    motor.gearbox_efficiency   = 1.
+    motor.expected_current     = 260.
+
+    return motor, prop
+
+
+def operating_conditions(n):
+
+    random = np.random.RandomState(n)
+
+    altitude = random.uniform(0.,15.,[n,1]) * Units.km
+    atmosphere_conditions = SUAVE.Analyses.Atmospheric.US_Standard_1976().compute_values(altitude)
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.propulsion = Data()
+    conditions.freestream.update(atmosphere_conditions)
+    conditions.freestream.velocity = random.uniform(5.,30.,[n,1])
+    conditions.propulsion.throttle = np.ones([n,1])
+
+    return conditions
+
+
+def voltage(n):
+    return np.random.RandomState(n+1).uniform(30.,50.,[n,1])
+
+
+def fixed_point(motor,prop,conditions,tolerance=1e-6):
+    """ the loop of Networks.Solar as it was, the motor run at the power
+        coefficient of the propeller until they agree
+    """
+
+    motor.omega(conditions)
+    prop.inputs.omega = motor.outputs.omega
+    F, Q, P, Cplast = prop.spin(conditions)
+    evaluations = prop.outputs.evaluations
+
+    diff = abs(Cplast-motor.propeller_Cp)
+    while (np.any(diff>tolerance)):
+        motor.propeller_Cp = Cplast
+        motor.omega(conditions)
+        prop.inputs.omega = motor.outputs.omega
+        F, Q, P, Cplast = prop.spin(conditions)
+        evaluations += prop.outputs.evaluations
+        diff = abs(Cplast-motor.propeller_Cp)
+
+    motor.propeller_Cp = np.real(motor.propeller_Cp)
+
+    return F, Q, P, Cplast, evaluations
+
+
+def derivative_inputs(prop,conditions):
+
+    pa  = prop.prop_attributes
+    fs  = conditions.freestream
+    Ua, Ut, U, r = blade_element_inputs(pa,prop.inputs.omega,fs.velocity)
+
+    return Ua, Ut, U, r, pa.chord_distribution, pa.twist_distribution, fs.speed_of_sound, pa.number_blades, pa.tip_radius
+
+
+def circulation_residual(prop,conditions,psi):
+
+    Ua, Ut, U, r, c, beta, a, B, R = derivative_inputs(prop,conditions)
+    nu = conditions.freestream.dynamic_viscosity/conditions.freestream.density
+    Wa, Wt, W, Gamma, Cl, Re, Ma = blade_element_flow(psi,Ua,Ut,U,r,c,beta,nu,a,B,R)
+
+    return Gamma - 0.5*W*c*Cl
+
+
+def perturbed_thrust(motor,prop,conditions,key,step):
+
+    motor, prop = copy.deepcopy(motor), copy.deepcopy(prop)
+    conditions = copy.deepcopy(conditions)
+    conditions.freestream[key] = conditions.freestream[key] + step
+
+    return motor_propeller_operating_point(motor,prop,conditions,tolerance=1e-12)[0]
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Geometry.Three_Dimensional import \
+     angles_to_dcms, orientation_product, orientation_transpose, \
+     body_to_inertial, wind_to_inertial, inertial_to_body, forces_to_inertial
+from SUAVE.Methods.Missions.Segments.Common.Frames import update_orientations, update_forces
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n = 40
+    rotations, wind_rotations, V, L, D, T, W = inputs(n)
+
+    # the transforms, against the euler angle products
+    T_body2inertial = orientation_transpose( angles_to_dcms(rotations,(2,1,0)) )
+    T_wind2inertial = orientation_product( angles_to_dcms(wind_rotations,(2,1,0)) , T_body2inertial )
+
+    error = np.max( np.abs( body_to_inertial(rotations) - T_body2inertial ) )
+    print 'body to inertial error : %.4e' % error
+    assert error < 1e-14
+
+    error = np.max( np.abs( wind_to_inertial(wind_rotations,T_body2inertial) - T_wind2inertial ) )
+    print 'wind to inertial error : %.4e' % error
+    assert error < 1e-14
+
+    error = np.max( np.abs( inertial_to_body(T_body2inertial,V) - orientation_product(orientation_transpose(T_body2inertial),V) ) )
+    assert error < 1e-12
+
+    F = orientation_product(T_wind2inertial,L) + orientation_product(T_wind2inertial,D) \
+      + orientation_product(T_body2inertial,T) + W
+    error = np.max( np.abs( forces_to_inertial(T_wind2inertial,L+D,T_body2inertial,T,W) - F ) ) / np.max( np.abs(F) )
+    print 'forces error           : %.4e' % error
+    assert error < 1e-14
+
+    # written in place, unless the buffer can not take the result
+    out = np.zeros([n,3,3])
+    assert body_to_inertial(rotations,out) is out
+    assert not body_to_inertial(rotations+0j,out) is out
+    assert not body_to_inertial(rotations,np.zeros([n+1,3,3])) is out
+    out = np.zeros([n,3])
+    assert forces_to_inertial(T_wind2inertial,L+D,T_body2inertial,T,W,out) is out
+
+    # complex step through the transforms
+    h = 1e-30
+    e = 1e-6
+    direction = np.random.RandomState(1).uniform(-1.,1.,rotations.shape)
+    cs = np.imag( body_to_inertial(rotations+1j*h*direction) ) / h
+    fd = ( body_to_inertial(rotations+e*direction) - body_to_inertial(rotations-e*direction) ) / (2.*e)
+    error = np.max( np.abs(cs-fd) )
+    print 'complex step error     : %.4e' % error
+    assert error < 1e-8
+
+    # the segment steps, against the steps they replace
+    state = frames_state(rotations,V,L,D,T,W)
+    reference = frames_state(rotations,V,L,D,T,W)
+
+    for i in range(2):
+        update_orientations(None,state)
+        update_forces(None,state)
+    update_orientations_reference(reference)
+    update_forces_reference(reference)
+
+    for key in ['aerodynamics.angle_of_attack','aerodynamics.side_slip_angle','frames.wind.body_rotations',
+                'frames.body.transform_to_inertial','frames.wind.transform_to_inertial',
+                'frames.inertial.total_force_vector']:
+        a = state.conditions.deep_get(key)
+        b = reference.conditions.deep_get(key)
+        error = np.max( np.abs(a-b) ) / max( np.max(np.abs(b)) , 1. )
+        print '%-35s error: %.4e' % (key,error)
+        assert error < 1e-14
+
+    # the benchmark
+    for n in [16,64,256,1024]:
+        rotations, wind_rotations, V, L, D, T, W = inputs(n)
+        state = frames_state(rotations,V,L,D,T,W)
+        reference = frames_state(rotations,V,L,D,T,W)
+        repeats = 200
+
+        tic = time()
+        for i in range(repeats):
+            update_orientations_reference(reference)
+            update_forces_reference(reference)
+        t_reference = (time()-tic)/repeats*1e3
+
+        tic = time()
+        for i in range(repeats):
+            update_orientations(None,state)
+            update_forces(None,state)
+        t_fused = (time()-tic)/repeats*1e3
+
+        print 'N = %4i, euler products: %.4f ms, fused: %.4f ms' % (n,t_reference,t_fused)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def inputs(n):
+
+    random = np.random.RandomState(n)
+
+    rotations      = random.uniform(-1.,1.,[n,3]) * np.array([30.,20.,180.]) * Units.deg
+    wind_rotations = random.uniform(-1.,1.,[n,3]) * np.array([10.,15.,10.]) * Units.deg
+
+    V = np.array([[200.,0.,-10.]]) + random.uniform(-10.,10.,[n,3])
+    L = np.array([[0.,0.,-5e5]])   * random.uniform(0.5,1.,[n,1])
+    D = np.array([[-3e4,0.,0.]])   * random.uniform(0.5,1.,[n,1])
+    T = np.array([[4e4,0.,0.]])    * random.uniform(0.5,1.,[n,1])
+    W = np.array([[0.,0.,5e5]])    * random.uniform(0.9,1.,[n,1])
+
+    return rotations, wind_rotations, V, L, D, T, W
+
+
+def frames_state(rotations,V,L,D,T,W):
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(len(rotations))
+
+    frames = state.conditions.frames
+    frames.body.inertial_rotations[:,:]      = rotations
+    frames.inertial.velocity_vector[:,:]     = V
+    frames.wind.lift_force_vector[:,:]       = L
+    frames.wind.drag_force_vector[:,:]       = D
+    frames.body.thrust_force_vector[:,:]     = T
+    frames.inertial.gravity_force_vector[:,:] = W
+
+    return state
+
+
+def update_orientations_reference(state):
+    """ update_orientations as it was, with the euler angle products """
+
+    conditions = state.conditions
+    V_inertial = conditions.frames.inertial.velocity_vector
+    body_inertial_rotations = conditions.frames.body.inertial_rotations
+
+    T_inertial2body = angles_to_dcms(body_inertial_rotations,(2,1,0))
+    T_body2inertial = orientation_transpose(T_inertial2body)
+
+    V_body = orientation_product(T_inertial2body,V_inertial)
+    V_stability = V_body
+    V_stability[:,1] = 0
+    V_stability_magnitude = np.sqrt( np.sum(V_stability**2,axis=1) )[:,None]
+
+    alpha = np.arctan2(V_stability[:,2],V_stability[:,0])[:,None]
+    beta  = np.arctan2(V_body[:,1],V_stability_magnitude[:,0])[:,None]
+
+    conditions.aerodynamics.angle_of_attack[:,0] = alpha[:,0]
+    conditions.aerodynamics.side_slip_angle[:,0] = beta[:,0]
+    conditions.aerodynamics.roll_angle[:,0]      = body_inertial_rotations[:,0]
+    conditions.frames.body.transform_to_inertial = T_body2inertial
+
+    wind_body_rotations = body_inertial_rotations * 0.
+    wind_body_rotations[:,1] = alpha[:,0]
+    wind_body_rotations[:,2] = beta[:,0]
+
+    T_wind2body = angles_to_dcms(wind_body_rotations,(2,1,0))
+    T_wind2inertial = orientation_product(T_wind2body,T_body2inertial)
+
+    conditions.frames.wind.body_rotations = wind_body_rotations
+    conditions.frames.wind.transform_to_inertial = T_wind2inertial
+
+    return
+
+
+def update_forces_reference(state):
+    """ update_forces as it was, with the euler angle products """
+
+    frames = state.conditions.frames
+
+    L = orientation_product(frames.wind.transform_to_inertial,frames.wind.lift_force_vector)
+    D = orientation_product(frames.wind.transform_to_inertial,frames.wind.drag_force_vector)
+    T = orientation_product(frames.body.transform_to_inertial,frames.body.thrust_force_vector)
+    W = frames.inertial.gravity_force_vector
+
+    frames.inertial.total_force_vector[:,:] = L + D + T + W
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
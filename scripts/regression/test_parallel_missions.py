@@ -0,0 +1,73 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+import test_mission_jacobian
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = test_mission_B737.vehicle_setup()
+    configs  = test_mission_B737.configs_setup(vehicle)
+    analyses = test_mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # independent missions
+    missions = SUAVE.Analyses.Mission.Mission.Container()
+
+    for i,distance in enumerate([1000.,2000.,3000.]):
+        mission = test_mission_jacobian.mission_setup(analyses)
+        mission.tag = 'mission_%i' % i
+        mission.state.numerics.solver_jacobian = 'sparse'
+        mission.segments['cruise'].distance = distance * Units.km
+        missions.append(mission)
+
+    # one at a time
+    tic = time()
+    results_serial = missions.evaluate()
+    print 'serial time: %.4f s' % (time()-tic)
+
+    # on worker processes
+    Container = missions.__class__
+    Container.parallel = 3
+    try:
+        tic = time()
+        results_parallel = missions.evaluate()
+        print 'parallel time: %.4f s' % (time()-tic)
+    finally:
+        Container.parallel = 0
+
+    assert results_parallel.keys() == results_serial.keys()
+
+    # same answer
+    for tag in results_serial.keys():
+        a = results_serial[tag].segments[-1].conditions
+        b = results_parallel[tag].segments[-1].conditions
+        for key in ['weights.total_mass','frames.inertial.position_vector']:
+            err = np.max( np.abs( a.deep_get(key) - b.deep_get(key) ) )
+            print '%s.%s error: %.4e' % (tag,key,err)
+            assert err < 1e-8 , 'Parallel check failed: %s.%s' % (tag,key)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero import Drag
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = test_mission_B737.vehicle_setup()
+
+    # one set of conditions per altitude and mach number
+    n = 40
+    altitude = np.linspace(0.,11.,n)[:,None] * Units.km
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude)
+
+    conditions = Aerodynamics()
+    conditions.expand_rows(n)
+    conditions.freestream.mach_number       = np.linspace(0.2,0.85,n)[:,None]
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.freestream.temperature       = atmo_data.temperature
+    conditions.freestream.pressure          = atmo_data.pressure
+
+    settings = SUAVE.Analyses.Aerodynamics.Fidelity_Zero().settings
+
+    # one component at a time
+    state = Data()
+    state.conditions = conditions
+
+    tic = time()
+    for i in range(20):
+        for wing in vehicle.wings:
+            Drag.parasite_drag_wing(state,settings,wing)
+        for fuselage in vehicle.fuselages:
+            Drag.parasite_drag_fuselage(state,settings,fuselage)
+        for propulsor in vehicle.propulsors:
+            Drag.parasite_drag_propulsor(state,settings,propulsor)
+    print 'components : %.4f ms' % ((time()-tic)/20*1e3)
+
+    reference = conditions.aerodynamics.drag_breakdown.parasite
+    conditions.aerodynamics.drag_breakdown.parasite = Data()
+
+    # all components at once
+    table = Drag.parasite_drag_geometry(vehicle)
+
+    tic = time()
+    for i in range(20):
+        results = Drag.parasite_drag_components(state,settings,table)
+    print 'vectorized : %.4f ms' % ((time()-tic)/20*1e3)
+
+    breakdown = conditions.aerodynamics.drag_breakdown.parasite
+
+    tags = table.wings.tags + table.fuselages.tags + table.propulsors.tags
+    assert sorted(tags) == sorted(reference.keys())
+
+    for tag in tags:
+        for key in ['wetted_area','reference_area','parasite_drag_coefficient','skin_friction_coefficient',
+                    'compressibility_factor','reynolds_factor','form_factor']:
+            a = reference[tag][key]
+            b = breakdown[tag][key]
+            assert np.all( np.abs( a - b ) <= 1e-12 * np.abs(a) ) , (tag,key)
+
+    for wing in vehicle.wings:
+        assert np.all( results.wings[wing.tag] == breakdown[wing.tag].parasite_drag_coefficient )
+
+    # the same total drag through the analysis
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+
+    conditions.freestream.velocity         = conditions.freestream.mach_number * atmo_data.speed_of_sound
+    conditions.freestream.dynamic_pressure = 0.5 * atmo_data.density * conditions.freestream.velocity**2.
+    conditions.aerodynamics.angle_of_attack = np.linspace(-2.,8.,n)[:,None] * Units.deg
+
+    aerodynamics.evaluate(state)
+    parasite_total = conditions.aerodynamics.drag_breakdown.parasite.total
+
+    swet_tot = np.sum([ reference[tag].wetted_area * 1. for tag in table.wings.tags + table.fuselages.tags ])
+    for propulsor in vehicle.propulsors:
+        swet_tot += reference[propulsor.tag].wetted_area * propulsor.number_of_engines
+    assert np.abs( table.total_wetted_area - swet_tot ) < 1e-9
+
+    expected = 0.
+    for tag in table.wings.tags + table.fuselages.tags:
+        expected += reference[tag].parasite_drag_coefficient * reference[tag].reference_area / vehicle.reference_area
+    for propulsor in vehicle.propulsors:
+        expected += 1.2 * reference[propulsor.tag].parasite_drag_coefficient \
+                  * reference[propulsor.tag].reference_area / vehicle.reference_area * propulsor.number_of_engines
+
+    assert np.max( np.abs( parasite_total - expected ) / expected ) < 1e-12
+
+    # a missing wetted area is added to the areas of a propulsor
+    vehicle = test_mission_B737.vehicle_setup()
+    propulsor = vehicle.propulsors[0]
+    propulsor.areas = Data()
+    propulsor.areas.maximum = 2.
+    table = Drag.parasite_drag_geometry(vehicle)
+    assert propulsor.areas.maximum == 2.
+    assert propulsor.areas.wetted == table.propulsors.wetted_area[0]
+
+    # only missing attributes are defaults, other errors surface
+    propulsor.A7 = 1.
+    propulsor.Ao = 1.
+    propulsor.D  = None
+    try:
+        Drag.parasite_drag_geometry(vehicle)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError , 'error in the intake geometry hidden'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
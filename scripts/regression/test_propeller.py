@@ -59,10 +59,10 @@ def main():
     F, Q, P, Cplast = prop.spin(conditions)
     
     # Truth values
-    F_truth      = 166.41590262
-    Q_truth      = 45.21732911
-    P_truth      = 9470.2952633 # Over 9000!
-    Cplast_truth = 0.00085898
+    F_truth      = 166.08259765
+    Q_truth      = 45.12753667
+    P_truth      = 9451.4891777 # Over 9000!
+    Cplast_truth = 0.00085728
     
     error = Data()
     error.Thrust  = np.max(np.abs(F-F_truth))
@@ -0,0 +1,174 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Propulsion import propeller_design
+
+import numpy as np
+import copy
+import warnings
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    prop = propeller_setup()
+
+    conditions, omega = operating_conditions(prop,20)
+
+    assert not prop.warm_start
+    prop.inputs.omega = omega
+    F, Q, P, Cp = prop.spin(conditions)
+    assert np.all(prop.outputs.converged)
+
+    # by default a spin does not depend on the one before
+    prop.inputs.omega = omega * 1.05
+    prop.spin(conditions)
+    prop.inputs.omega = omega
+    assert np.all( prop.spin(conditions)[0] == F )
+
+    for i in [0,7,19]:
+        conditions_i, omega_i = operating_conditions(prop,20)
+        for key in ['velocity','density','dynamic_viscosity','speed_of_sound','temperature']:
+            conditions_i.freestream[key] = conditions_i.freestream[key][i:i+1]
+        conditions_i.propulsion.throttle = conditions_i.propulsion.throttle[i:i+1]
+        prop.inputs.omega = omega[i:i+1]
+        F_i, Q_i, P_i, Cp_i = prop.spin(conditions_i)
+        assert np.abs( F_i[0,0] - F[i,0] ) < 1e-6 * np.abs(F[i,0])
+        assert np.abs( P_i[0,0] - P[i,0] ) < 1e-6 * np.abs(P[i,0])
+
+    # the warm start, from the last solution
+    prop.warm_start   = True
+    prop.inflow_angle = None
+    F_cold, Q_cold, P_cold, Cp_cold = prop.spin(conditions)
+    iterations_cold = prop.outputs.iterations
+
+    F_warm, Q_warm, P_warm, Cp_warm = prop.spin(conditions)
+    print 'iterations, cold: %i, warm at the same point: %i' % (iterations_cold,prop.outputs.iterations)
+    assert prop.outputs.iterations == 1
+    assert np.all( F_warm == F_cold )
+    assert np.all( P_warm == P_cold )
+
+    prop.inputs.omega = omega * 1.01
+    F_warm, Q_warm, P_warm, Cp_warm = prop.spin(conditions)
+    iterations_warm = prop.outputs.iterations
+
+    prop.inflow_angle = None
+    F_cold, Q_cold, P_cold, Cp_cold = prop.spin(conditions)
+    print 'iterations, cold: %i, warm at a nearby point: %i' % (prop.outputs.iterations,iterations_warm)
+    # the cold start, without induced velocities, is about as close
+    assert iterations_warm <= prop.outputs.iterations
+
+    # both within the accuracy of the iteration, against a tight solve
+    tight = copy.deepcopy(prop)
+    tight.inflow_angle       = None
+    tight.tolerance          = 1e-12
+    tight.maximum_iterations = 1000
+    F_tight = tight.spin(conditions)[0]
+    assert np.all(tight.outputs.converged)
+
+    for name,F in [['cold',F_cold],['warm',F_warm]]:
+        error = np.max( np.abs(F-F_tight) / np.abs(F_tight) )
+        print 'thrust error, %s start: %.4e' % (name,error)
+        assert error < 1e-2
+
+    # the cap on the iterations
+    capped = copy.deepcopy(prop)
+    capped.inflow_angle = None
+    capped.maximum_iterations = 1
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        capped.spin(conditions)
+    assert any( 'did not converge' in str(w.message) for w in caught )
+    assert not np.any(capped.outputs.converged)
+    assert capped.outputs.iterations == 1
+
+    # a complex step does not leak into the warm start
+    conditions_cs = copy.deepcopy(conditions)
+    conditions_cs.freestream.velocity = conditions_cs.freestream.velocity + 1e-30j
+    F_cs = prop.spin(conditions_cs)[0]
+    assert np.any( np.imag(F_cs) != 0. )
+    assert not np.iscomplexobj(prop.inflow_angle)
+
+    # the cost of a solve
+    for n in [16,64,256]:
+        conditions, omega = operating_conditions(prop,n)
+        prop.inputs.omega = omega
+        repeats = 10
+
+        prop.warm_start = False
+        tic = time()
+        for i in range(repeats):
+            prop.spin(conditions)
+        t_cold = (time()-tic)/repeats*1e3
+
+        # as in a converging mission, the conditions move a little each call
+        prop.warm_start = True
+        prop.spin(conditions)
+        tic = time()
+        for i in range(repeats):
+            prop.inputs.omega = omega * (1. + 1e-4*(i+1))
+            prop.spin(conditions)
+        t_warm = (time()-tic)/repeats*1e3
+
+        print 'N = %3i, cold: %.3f ms, warm: %.3f ms' % (n,t_cold,t_warm)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def propeller_setup():
+
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 50.0
+    prop_attributes.angular_velocity    = 2000.*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = 1.5
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7000.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    prop = SUAVE.Components.Energy.Converters.Propeller()
+    prop.prop_attributes = prop_attributes
+
+    return prop
+
+
+def operating_conditions(prop,n):
+
+    random = np.random.RandomState(n)
+
+    altitude = random.uniform(0.,10.,[n,1]) * Units.km
+    atmosphere_conditions = SUAVE.Analyses.Atmospheric.US_Standard_1976().compute_values(altitude)
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.propulsion = Data()
+    conditions.freestream.update(atmosphere_conditions)
+    conditions.freestream.velocity = random.uniform(35.,60.,[n,1])
+    conditions.propulsion.throttle = np.ones([n,1])
+
+    omega = prop.prop_attributes.angular_velocity * random.uniform(0.85,1.15,[n,1])
+
+    return conditions, omega
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
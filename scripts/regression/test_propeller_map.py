@@ -0,0 +1,169 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_motor_propeller
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Propulsion import propeller_map, load_propeller_map, motor_propeller_operating_point
+
+import numpy as np
+import copy
+import os
+import shutil
+import tempfile
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    motor, prop = test_motor_propeller.motor_propeller_setup()
+
+    # the map of the solar network propeller, kept in a file
+    folder = tempfile.mkdtemp()
+    try:
+        prop_map = map_setup(prop)
+        prop_map.map_file = os.path.join(folder,'propeller.npy')
+
+        tic = time()
+        prop_map.build()
+        print 'map build : %.4f s' % (time()-tic)
+
+        assert isinstance(prop_map.map.table,np.memmap)
+        assert np.all(np.isfinite(prop_map.map.table))
+
+        # a second build of the same propeller loads the file
+        loaded = map_setup(prop)
+        loaded.map_file = prop_map.map_file
+        tic = time()
+        loaded.build()
+        print 'map load  : %.4f s' % (time()-tic)
+        assert isinstance(loaded.map.table,np.memmap)
+        assert np.all( loaded.map.table == prop_map.map.table )
+        assert loaded.map.geometry_hash == prop_map.map.geometry_hash
+
+        # another geometry is not taken from the file
+        other = copy.deepcopy(prop)
+        other.prop_attributes.chord_distribution = other.prop_attributes.chord_distribution * 1.1
+        try:
+            load_propeller_map(prop_map.map_file,other.prop_attributes)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError , 'map of another geometry loaded'
+
+        # a build of it replaces the file, the earlier map stays as it was
+        table = np.array(prop_map.map.table)
+        other_map = map_setup(other)
+        other_map.map_file = prop_map.map_file
+        other_map.build()
+        assert other_map.map.geometry_hash != prop_map.map.geometry_hash
+        assert np.any( other_map.map.table != table )
+        assert np.all( prop_map.map.table == table )
+        load_propeller_map(prop_map.map_file,other.prop_attributes)
+
+    finally:
+        shutil.rmtree(folder)
+
+    prop_map = map_setup(prop)
+    prop_map.build()
+    grid = prop_map.map
+
+    # exact in the Reynolds number, on the grid of the other inputs
+    J  = grid.advance_ratio[::4]
+    Mt = grid.tip_mach_number[::4]
+    Re = np.array([2e4,3e5,4e6,5e7])
+    check = propeller_map(prop.prop_attributes,J,Mt,Re)
+    values = prop_map.interpolate(J[:,None,None],Mt[None,:,None],Re[None,None,:])
+    error = np.max( np.abs(values[...,0:2] - check.table[...,0:2]) )
+    print 'reynolds number interpolation error: %.4e' % error
+    assert error < 1e-8
+
+    # against the blade element analysis, between the grid points
+    conditions = test_motor_propeller.operating_conditions(200)
+    omega = prop.prop_attributes.angular_velocity * np.random.RandomState(3).uniform(0.7,1.1,[200,1])
+
+    prop.inputs.omega     = omega
+    prop_map.inputs.omega = omega
+    F, Q, P, Cp = prop.spin(conditions)
+    etap = conditions.propulsion.etap
+    F_map, Q_map, P_map, Cp_map = prop_map.spin(conditions)
+    etap_map = conditions.propulsion.etap
+
+    for name,a,b in [['thrust',F_map,F],['torque',Q_map,Q],['power',P_map,P],['Cp',Cp_map,Cp],['etap',etap_map,etap]]:
+        error = np.max( np.abs(a-b) ) / np.max( np.abs(b) )
+        print '%-6s map error: %.4e' % (name,error)
+        assert error < 5e-3
+
+    # in place of the propeller, at the operating point of the motor
+    motor_map = copy.deepcopy(motor)
+    motor.inputs.voltage     = test_motor_propeller.voltage(200)
+    motor_map.inputs.voltage = test_motor_propeller.voltage(200)
+
+    F, Q, P, Cp, iterations = motor_propeller_operating_point(motor,prop,conditions)
+    F_map, Q_map, P_map, Cp_map, iterations_map = motor_propeller_operating_point(motor_map,prop_map,conditions)
+    print 'operating point iterations, propeller: %i, map: %i' % (iterations.operating_point,iterations_map.operating_point)
+
+    for name,a,b in [['thrust',F_map,F],['power',P_map,P],['rpm',motor_map.outputs.omega,motor.outputs.omega]]:
+        error = np.max( np.abs(a-b) / np.abs(b) )
+        print '%-6s operating point map error: %.4e' % (name,error)
+        assert error < 5e-3
+
+    # the throttle, as Propeller.spin
+    conditions.propulsion.throttle[::2] = 0.
+    F_map, Q_map, P_map, Cp_map = prop_map.spin(conditions)
+    assert np.all( F_map[::2] == 0. ) and np.all( P_map[::2] == 0. )
+    assert np.all( Cp_map[::2] > 0. )
+
+    # the cost of an evaluation
+    for n in [16,64,256]:
+        conditions = test_motor_propeller.operating_conditions(n)
+        omega = prop.prop_attributes.angular_velocity * np.ones([n,1])
+        prop.inputs.omega     = omega
+        prop_map.inputs.omega = omega
+        repeats = 20
+
+        prop.warm_start = False
+        tic = time()
+        for i in range(repeats):
+            prop.spin(conditions)
+        t_propeller = (time()-tic)/repeats*1e3
+
+        tic = time()
+        for i in range(repeats):
+            prop_map.spin(conditions)
+        t_map = (time()-tic)/repeats*1e3
+
+        print 'N = %3i, propeller: %.4f ms, map: %.4f ms' % (n,t_propeller,t_map)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def map_setup(prop):
+    """ a map of a propeller, over the conditions of operating_conditions() """
+
+    prop_map = SUAVE.Components.Energy.Converters.Propeller_Map()
+    prop_map.prop_attributes = prop.prop_attributes
+
+    prop_map.map.advance_ratio   = np.linspace(0.,0.6,25)
+    prop_map.map.tip_mach_number = np.linspace(0.3,1.0,29)
+
+    return prop_map
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
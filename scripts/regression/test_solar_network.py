@@ -156,10 +156,10 @@ def main():
     F       = results.thrust_force_vector
     
     # Truth results
-    truth_F   = [[ 522.40448791],[ 522.40448791]]
-    truth_i   = [[ 314.90485916],[ 314.90485916]]
-    truth_rpm = [[ 6581.17653732],[ 6581.17653732]]
-    truth_bat = [[ 36000000.    ],[ 35984254.75704217]]
+    truth_F   = [[ 522.37329921],[ 522.37329921]]
+    truth_i   = [[ 314.87794935],[ 314.87794935]]
+    truth_rpm = [[ 6581.21232736],[ 6581.21232736]]
+    truth_bat = [[ 36000000.    ],[ 35984256.10253243]]
     
     error = Data()
     error.Thrust = np.max(np.abs(F[:,0]-truth_F))
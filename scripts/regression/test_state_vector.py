@@ -0,0 +1,99 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Analyses.Mission.Segments.Conditions import State, Unknowns
+
+import numpy as np
+
+from copy import deepcopy
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    state = State()
+    state.unknowns.throttle   = np.ones([1,1]) * 0.5
+    state.unknowns.body_angle = np.ones([1,1]) * 2.0
+    state.unknowns.distance   = 1000.0
+    state.unknowns.sub = Unknowns()
+    state.unknowns.sub.velocity = np.ones([1,3])
+
+    state.expand_rows(8)
+
+    unknowns = state.unknowns
+
+    # same order as pack_array
+    reference = unknowns.pack_array()
+    vector    = unknowns.allocate_vector()
+    assert np.all( vector == reference )
+    assert np.all( unknowns.pack_vector() == reference )
+
+    # arrays are views into the vector
+    vector[0] = 3.
+    assert unknowns.throttle[0,0] == 3.
+    assert unknowns.sub.velocity.base is not None
+
+    # unpack
+    x = np.arange(len(reference)) * 1.
+    unknowns.unpack_vector(x)
+    assert np.all( unknowns.pack_vector() == x )
+    assert np.all( unknowns.pack_array() == x )
+    assert unknowns.distance == x[16]
+    assert np.all( unknowns.sub.velocity[:,1] == x[25:33] )
+
+    # in place updates and rebinding are both packed
+    unknowns.throttle[:,0] = -1.
+    unknowns.body_angle = np.zeros([8,1])
+    packed = unknowns.pack_vector()
+    assert np.all( packed[0:8] == -1. ) and np.all( packed[8:16] == 0. )
+    assert unknowns.body_angle is unknowns._vector[2][1][4]
+
+    # expanding again keeps the views
+    throttle = unknowns.throttle
+    state.expand_rows(8)
+    assert unknowns.throttle is throttle
+
+    # copies allocate their own vector
+    other = deepcopy(state)
+    other.unknowns.unpack_vector(x*2.)
+    assert np.all( unknowns.pack_vector() == packed )
+    assert np.all( other.unknowns.pack_array() == x*2. )
+    
+    # as do clones, which share the private attributes
+    other = state.clone()
+    other.unknowns.unpack_vector(x*3.)
+    assert np.all( unknowns.pack_vector() == packed )
+    assert np.all( other.unknowns.pack_array() == x*3. )
+
+    # timing against the recursive packing
+    n = 2000
+    tic = time()
+    for i in range(n):
+        unknowns.unpack_array(x)
+        unknowns.pack_array()
+    t_array = time() - tic
+
+    tic = time()
+    for i in range(n):
+        unknowns.unpack_vector(x)
+        unknowns.pack_vector()
+    t_vector = time() - tic
+
+    print 'pack_array  : %.2f us' % (t_array/n*1e6)
+    print 'pack_vector : %.2f us' % (t_vector/n*1e6)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Surrogate import fit_model, Gridded_Model, Scattered_Model, hash_data
+from SUAVE.Analyses.Aerodynamics import Vortex_Lattice
+
+import numpy as np
+
+import hashlib
+import shutil
+import tempfile
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # gridded training, exact for multilinear functions, inside and outside the grid
+    AoA  = np.array([-10.,-2.,0.,4.,10.]) * Units.deg
+    Mach = np.array([0.1,0.5,0.8])
+    Re   = np.array([1e6,1e7])
+
+    def function(a,m,r):
+        return 0.1 + 5.*a + 0.3*m - 2.*a*m + 1e-8*r*a
+
+    grid   = np.meshgrid(AoA,Mach,Re,indexing='ij')
+    values = function(*grid)
+
+    model = fit_model([AoA,Mach,Re],values)
+    assert isinstance(model,Gridded_Model)
+
+    a = np.linspace(-15.,15.,1000)[:,None] * Units.deg
+    m = np.linspace(0.,0.9,1000)[:,None]
+    r = np.ones_like(a) * 3e6
+    tic = time()
+    result = model(a,m,r)
+    print 'gridded, 1000 points: %.4f ms' % ((time()-tic)*1000)
+    assert result.shape == a.shape
+    assert np.max( np.abs( result - function(a,m,r) ) ) < 1e-12
+
+    # inputs with a single grid point are held
+    model = fit_model([AoA,np.array([0.])],np.reshape(5.*AoA,[-1,1]))
+    assert np.max( np.abs( model(a,m) - 5.*a ) ) < 1e-12
+
+    # scattered training
+    np.random.seed(0)
+    points = [ np.random.uniform(-10.,10.,40)*Units.deg , np.random.uniform(0.1,0.8,40) ]
+    values = function(points[0],points[1],0.)
+    model  = fit_model(points,values)
+    assert isinstance(model,Scattered_Model)
+    assert np.max( np.abs( model(*points) - values ) ) < 1e-8
+    err = np.max( np.abs( model(0.,0.4) - function(0.,0.4,0.) ) )
+    print 'scattered, error at a test point: %.4e' % err
+    assert err < 0.01
+
+    # training cache, keyed by geometry
+    vehicle = test_mission_B737.vehicle_setup()
+    cache = tempfile.mkdtemp()
+    try:
+        counter = [0]
+        sample_training = Vortex_Lattice.sample_training
+        def counted(self):
+            counter[0] += 1
+            sample_training(self)
+        Vortex_Lattice.sample_training = counted
+
+        try:
+            lift = []
+            for i in range(3):
+                aerodynamics = Vortex_Lattice()
+                aerodynamics.geometry = vehicle
+                aerodynamics.training_cache = cache
+                aerodynamics.initialize()
+                lift.append( aerodynamics.surrogates.lift_coefficient(2.*Units.deg) )
+            assert counter[0] == 1
+            assert lift[0] == lift[1] == lift[2]
+
+            # changed geometry samples again
+            vehicle.wings.main_wing.spans.projected *= 1.1
+            aerodynamics = Vortex_Lattice()
+            aerodynamics.geometry = vehicle
+            aerodynamics.training_cache = cache
+            aerodynamics.initialize()
+            assert counter[0] == 2
+            assert aerodynamics.surrogates.lift_coefficient(2.*Units.deg) != lift[0]
+
+            # so do changed settings
+            aerodynamics = Vortex_Lattice()
+            aerodynamics.geometry = vehicle
+            aerodynamics.training_cache = cache
+            aerodynamics.settings.number_panels_spanwise = 20
+            aerodynamics.initialize()
+            assert counter[0] == 3
+
+        finally:
+            Vortex_Lattice.sample_training = sample_training
+
+    finally:
+        shutil.rmtree(cache)
+
+    # the key is repeatable for the same data
+    vehicle_a = test_mission_B737.vehicle_setup()
+    vehicle_b = test_mission_B737.vehicle_setup()
+    keys = []
+    for vehicle in [vehicle_a,vehicle_b]:
+        aerodynamics = Vortex_Lattice()
+        aerodynamics.geometry = vehicle
+        keys.append(aerodynamics.training_key())
+    assert keys[0] == keys[1]
+
+    # other objects are keyed by their attributes
+    class Thing(object):
+        pass
+    things = []
+    for value in [1.,1.,2.]:
+        thing = Thing()
+        thing.value = value
+        thing.self  = thing
+        things.append(thing)
+    keys = [ key_of(thing) for thing in things ]
+    assert keys[0] == keys[1] != keys[2]
+    assert key_of(np.sin) != key_of(np.cos)
+
+    # and what it cannot see into is not keyed by its type alone
+    try:
+        key_of(object())
+    except TypeError:
+        pass
+    else:
+        raise AssertionError , 'object hashed by its type'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def key_of(value):
+    h = hashlib.sha1()
+    hash_data(value,h)
+    return h.hexdigest()
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import test_mission_B737
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Analyses.Aerodynamics import Vortex_Lattice
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+
+import numpy as np
+
+from time import time
+
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = test_mission_B737.vehicle_setup()
+    wing    = vehicle.wings.main_wing
+
+    settings = Data()
+    settings.number_panels_spanwise  = 5
+    settings.number_panels_chordwise = 1
+
+    conditions = Data()
+    conditions.aerodynamics = Data()
+
+    # scalar angle of attack, against the loop over panels
+    conditions.aerodynamics.angle_of_attack = 3. * Units.deg
+    Cl, Cd = weissinger_vortex_lattice(conditions,settings,wing)
+    print 'Cl: %.8f, Cd: %.8f' % (Cl,Cd)
+    assert np.abs( Cl - 0.5684120438590987  ) < 1e-10
+    assert np.abs( Cd - 0.004723691045054446) < 1e-10
+
+    # all angles at once, against one at a time
+    AoA = np.array([[-10.],[-2.],[0.],[3.],[10.]]) * Units.deg
+    conditions.aerodynamics.angle_of_attack = AoA
+    Cl_all, Cd_all = weissinger_vortex_lattice(conditions,settings,wing)
+    assert Cl_all.shape == AoA.shape
+    for i in range(len(AoA)):
+        conditions.aerodynamics.angle_of_attack = AoA[i,0]
+        Cl, Cd = weissinger_vortex_lattice(conditions,settings,wing)
+        assert np.abs( Cl - Cl_all[i,0] ) < 1e-12
+        assert np.abs( Cd - Cd_all[i,0] ) < 1e-12
+
+    # vertical wings carry no lift
+    conditions.aerodynamics.angle_of_attack = AoA
+    Cl, Cd = weissinger_vortex_lattice(conditions,settings,vehicle.wings.vertical_stabilizer)
+    assert Cl.shape == AoA.shape and np.all( Cl == 0. )
+
+    # finer lattices converge
+    conditions.aerodynamics.angle_of_attack = 3. * Units.deg
+    lift = {}
+    for n,nn in [ (50,1), (50,4), (100,4) ]:
+        settings.number_panels_spanwise  = n
+        settings.number_panels_chordwise = nn
+        tic = time()
+        Cl, Cd = weissinger_vortex_lattice(conditions,settings,wing)
+        lift[(n,nn)] = Cl
+        print '%i x %i panels, Cl: %.6f, %.4f s' % (n,nn,Cl,time()-tic)
+    assert np.abs( lift[(100,4)] - lift[(50,4)] ) < 0.005
+    assert np.abs( lift[(50,4)]  - lift[(50,1)] ) < 0.05
+
+    # surrogate training, every angle and every wing
+    aerodynamics = Vortex_Lattice()
+    aerodynamics.geometry = vehicle
+    aerodynamics.settings.number_panels_spanwise  = 50
+    aerodynamics.settings.number_panels_chordwise = 4
+    tic = time()
+    aerodynamics.initialize()
+    print 'surrogate training, 50 x 4 panels: %.4f s' % (time()-tic)
+
+    CL = aerodynamics.training.lift_coefficient[:,0,0]
+    assert CL.shape == aerodynamics.training.angle_of_attack.shape
+    assert np.all( np.diff(CL) > 0. )
+
+    # gridded on angle of attack, mach and reynolds number, through Fidelity_Zero
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+    line = aerodynamics.process.compute.lift.inviscid_wings
+
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+    lattice = aerodynamics.process.compute.lift.inviscid_wings
+    lattice.gridded = True
+    lattice.training.angle_of_attack = np.linspace(-10.,10.,9) * Units.deg
+    lattice.training.mach_number     = np.array([0.2,0.8])
+    lattice.training.reynolds_number = np.array([1e6,1e8])
+    aerodynamics.initialize()
+
+    # the lattice is inviscid and incompressible
+    CL = lattice.training.lift_coefficient
+    assert CL.shape == (9,2,2)
+    assert np.all( CL == CL[:,:1,:1] )
+
+    n = 20
+    conditions = Aerodynamics()
+    conditions.expand_rows(n)
+    atmo_data = SUAVE.Analyses.Atmospheric.US_Standard_1976().compute_values(np.linspace(0.,10.,n)[:,None]*Units.km)
+    conditions.freestream.mach_number       = np.linspace(0.3,0.8,n)[:,None]
+    conditions.freestream.velocity          = conditions.freestream.mach_number * atmo_data.speed_of_sound
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.aerodynamics.angle_of_attack = np.linspace(-8.,8.,n)[:,None] * Units.deg
+
+    state = Data()
+    state.conditions = conditions
+    CL_grid = lattice(state,lattice.settings,vehicle)
+    CL_line = line(state,line.settings,vehicle)
+    err = np.max( np.abs(CL_grid-CL_line) )
+    print 'gridded against linear lift: %.4e' % err
+    assert CL_grid.shape == (n,1)
+    assert err < 0.01
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
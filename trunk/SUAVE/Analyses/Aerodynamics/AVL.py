@@ -22,9 +22,10 @@ from SUAVE.Analyses.Mission.Segments.Conditions.Conditions   import Conditions
 from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
-from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis, run_workers
 from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
+from SUAVE.Methods.Aerodynamics.AVL.results_cache    import case_keys, load_result, save_result, evict
 from SUAVE.Methods.Aerodynamics.AVL.Data.Results     import Results
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
@@ -103,6 +104,9 @@ class AVL(Aero_Analysis):
                 case data on moment coefficients and control derivatives
 
             Assumptions:
+                with settings.cache.folder set, cases with the same geometry
+                file and run case text are loaded from the cache, and only
+                the others are run, see Methods.Aerodynamics.AVL.results_cache
 
         """
         
@@ -111,6 +115,9 @@ class AVL(Aero_Analysis):
         output_template = self.settings.filenames.output_template
         batch_template  = self.settings.filenames.batch_template
         deck_template   = self.settings.filenames.deck_template
+        cache_folder    = self.settings.cache.folder
+        if cache_folder:
+            cache_folder = os.path.abspath(cache_folder)
         
         # update current status
         self.current_status.batch_index += 1
@@ -129,11 +136,46 @@ class AVL(Aero_Analysis):
         # write the input files
         with redirect.folder(run_folder,force=False):
             write_geometry(self)
-            write_run_cases(self)
-            write_input_deck(self)
-
+            
+            # cached results
+            keys    = [None] * len(cases)
+            results = [None] * len(cases)
+            if cache_folder:
+                keys    = case_keys(self)
+                results = [ load_result(cache_folder,key) for key in keys ]
+            
+            # only the cases that are not cached
+            missing = Run_Case.Container()
+            for case,case_res in zip(cases,results):
+                if case_res is None:
+                    missing.append_case(case.clone())
+            self.current_status.cases = missing
+            
             # RUN AVL!
-            results_avl = run_analysis(self)
+            if len(missing) == 0:
+                results_run = []
+            elif self.settings.number_of_workers > 1 and len(missing) > 1:
+                results_run = run_workers(self)
+            else:
+                write_run_cases(self)
+                write_input_deck(self)
+                results_run = run_analysis(self)
+            
+            self.current_status.cases = cases
+            
+        # merge in the order of the cases
+        results_avl = Data()
+        results_run = iter(results_run)
+        for case,key,case_res in zip(cases,keys,results):
+            if case_res is None:
+                case_res = results_run.next()
+                if cache_folder:
+                    save_result(cache_folder,key,case_res)
+            case_res.tag = case.tag
+            results_avl.append(case_res)
+        
+        if cache_folder:
+            evict(cache_folder,self.settings.cache.maximum_size)
 
         # translate results
         results = translate_results_to_conditions(cases,results_avl)
@@ -0,0 +1,30 @@
+# Compressibility_Drag_Components.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag import wave_drag_geometry, compressibility_drag_components
+
+from Drag_Components import Drag_Components
+
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class Compressibility_Drag_Components(Drag_Components):
+    """ SUAVE.Analyses.Aerodynamics.Compressibility_Drag_Components
+        compressibility and wave drag of all wings in one step, in place of
+        compressibility_drag_total() in Supersonic_Zero, see
+        wave_drag_geometry() and compressibility_drag_components()
+    """
+
+    def __defaults__(self):
+
+        self.tag = 'compressibility_drag_components'
+
+        self.geometry_function   = wave_drag_geometry
+        self.components_function = compressibility_drag_components
@@ -0,0 +1,46 @@
+# Drag_Components.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+from Aerodynamics import Aerodynamics
+
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class Drag_Components(Aerodynamics):
+    """ SUAVE.Analyses.Aerodynamics.Drag_Components
+        drag of all components in one step, from a table of their geometry
+
+        initialize() builds the table with geometry_function(geometry)
+        once, evaluate() only computes the condition dependent terms with
+        components_function(state,settings,table)
+    """
+
+    def __defaults__(self):
+
+        self.tag = 'drag_components'
+
+        self.geometry = Data()
+        self.settings = Data()
+
+        self.geometry_function   = None
+        self.components_function = None
+
+        self.table = None
+
+    def initialize(self):
+        self.table = self.geometry_function(self.geometry)
+
+    def evaluate(self,state,settings,geometry):
+        if self.table is None:
+            self.geometry = geometry
+            self.initialize()
+        return self.components_function(state,settings,self.table)
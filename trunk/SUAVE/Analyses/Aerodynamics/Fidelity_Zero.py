@@ -15,6 +15,7 @@ from Results import Results
 from SUAVE.Methods.Aerodynamics import Fidelity_Zero as Methods
 from Process_Geometry import Process_Geometry
 from Vortex_Lattice import Vortex_Lattice
+from Parasite_Drag_Components import Parasite_Drag_Components
 
 # ----------------------------------------------------------------------
 #  Analysis
@@ -43,6 +44,9 @@ class Fidelity_Zero(Markup):
         settings.drag_coefficient_increment         = 0.0000
         settings.wing_span_efficiency               = 0.90
         
+        # derivatives with respect to angle of attack and mach number, see Markup
+        settings.derivatives                        = False
+        
         # vortex lattice configurations
         settings.number_panels_spanwise  = 5
         settings.number_panels_chordwise = 1
@@ -69,12 +73,7 @@ class Fidelity_Zero(Markup):
         
         compute.drag = Process()
         compute.drag.parasite                      = Process()
-        compute.drag.parasite.wings                = Process_Geometry('wings')
-        compute.drag.parasite.wings.wing           = Methods.Drag.parasite_drag_wing 
-        compute.drag.parasite.fuselages            = Process_Geometry('fuselages')
-        compute.drag.parasite.fuselages.fuselage   = Methods.Drag.parasite_drag_fuselage
-        compute.drag.parasite.propulsors           = Process_Geometry('propulsors')
-        compute.drag.parasite.propulsors.propulsor = Methods.Drag.parasite_drag_propulsor
+        compute.drag.parasite.components           = Parasite_Drag_Components()
         compute.drag.parasite.pylons               = Methods.Drag.parasite_drag_pylon
         compute.drag.parasite.total                = Methods.Drag.parasite_total
         compute.drag.induced                       = Methods.Drag.induced_drag_aircraft
@@ -92,4 +91,8 @@ class Fidelity_Zero(Markup):
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
         self.process.compute.lift.inviscid_wings.initialize()
         
+        # geometry terms of the parasite drag
+        self.process.compute.drag.parasite.components.geometry = self.geometry
+        self.process.compute.drag.parasite.components.initialize()
+        
     finalize = initialize
\ No newline at end of file
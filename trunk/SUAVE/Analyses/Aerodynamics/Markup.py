@@ -15,6 +15,14 @@ from Results import Results
 
 class Markup(Aerodynamics):
     """ SUAVE.Analyses.Aerodynamics.Markup()
+    
+        with settings.derivatives, the process steps also propagate the
+        derivatives of their outputs with respect to angle of attack and
+        mach number, as [N,2] arrays of [d/dalpha, d/dmach] in
+        conditions.aerodynamics.derivatives, at the same path as the output.
+        for example derivatives.drag_breakdown.induced holds those of
+        drag_breakdown.induced.total.  evaluate() returns the ones of the
+        totals in results.derivatives, see Fidelity_Zero
     """
     def __defaults__(self):
         
@@ -33,12 +41,44 @@ class Markup(Aerodynamics):
         settings = self.settings
         geometry = self.geometry
         
+        # the steps fill in the derivatives of their outputs
+        if settings.get('derivatives',False):
+            derivatives = Data()
+            derivatives.lift_breakdown = Data()
+            derivatives.drag_breakdown = Data()
+            derivatives.drag_breakdown.parasite     = Data()
+            derivatives.drag_breakdown.compressible = Data()
+            state.conditions.aerodynamics.derivatives = derivatives
+        
         results = self.process.compute(state,settings,geometry)
         
+        if settings.get('derivatives',False):
+            results.derivatives = split_derivatives(state.conditions.aerodynamics.derivatives)
+        
         return results
         
     def initialize(self):
         self.process.initialize(self)
     
+    
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def split_derivatives(derivatives):
+    """ results.lift_coefficient and results.drag_coefficient, each with
+        angle_of_attack and mach_number columns of the [N,2] derivatives
+    """
+    
+    results = Data()
+    
+    for key in ['lift_coefficient','drag_coefficient']:
+        result = Data()
+        result.angle_of_attack = derivatives[key][:,0,None]
+        result.mach_number     = derivatives[key][:,1,None]
+        results[key] = result
+        
+    return results
+    
         
         
\ No newline at end of file
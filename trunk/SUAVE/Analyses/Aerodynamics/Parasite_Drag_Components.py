@@ -0,0 +1,30 @@
+# Parasite_Drag_Components.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag import parasite_drag_geometry, parasite_drag_components
+
+from Drag_Components import Drag_Components
+
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class Parasite_Drag_Components(Drag_Components):
+    """ SUAVE.Analyses.Aerodynamics.Parasite_Drag_Components
+        parasite drag of all wings, fuselages and propulsors in one step,
+        in place of a Process_Geometry() for each of them, see
+        parasite_drag_geometry() and parasite_drag_components()
+    """
+
+    def __defaults__(self):
+
+        self.tag = 'parasite_drag_components'
+
+        self.geometry_function   = parasite_drag_geometry
+        self.components_function = parasite_drag_components
@@ -20,6 +20,7 @@ from Results import Results
 
 from Vortex_Lattice import Vortex_Lattice
 from Process_Geometry import Process_Geometry
+from Compressibility_Drag_Components import Compressibility_Drag_Components
 from SUAVE.Methods.Aerodynamics import Supersonic_Zero as Methods
 
 #from SUAVE.Attributes.Aerodynamics.Aerodynamics_1d_Surrogate import Aerodynamics_1d_Surrogate
@@ -100,7 +101,7 @@ class Supersonic_Zero(Markup):
         compute.drag.parasite.total                = Methods.Drag.parasite_total
         compute.drag.induced                       = Methods.Drag.induced_drag_aircraft
         compute.drag.compressibility               = Process()
-        compute.drag.compressibility.total         = Methods.Drag.compressibility_drag_total
+        compute.drag.compressibility.total         = Compressibility_Drag_Components()
         compute.drag.miscellaneous                 = Methods.Drag.miscellaneous_drag_aircraft
         compute.drag.untrimmed                     = Methods.Drag.untrimmed
         compute.drag.trim                          = Methods.Drag.trim
@@ -111,4 +112,8 @@ class Supersonic_Zero(Markup):
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
         self.process.compute.lift.inviscid_wings.initialize()
         
+        # geometry terms of the compressibility drag
+        self.process.compute.drag.compressibility.total.geometry = self.geometry
+        self.process.compute.drag.compressibility.total.initialize()
+        
     finalize = initialize        
@@ -25,15 +25,32 @@ class AVL(Aerodynamics,Surrogate):
     ''' This class only builds and evaluates an avl surrogate of aerodynamics
         It must be patched into a markup analysis if more fidelity is needed.
         The surrogate models lift coefficient, induced drag coefficient, and
-        pitching moment coefficient versus angle of attack.
+        pitching moment coefficient versus angle of attack, as polynomials
+        fit at the first training mach and reynolds number.  With gridded
+        set, it interpolates them versus angle of attack, mach number and
+        reynolds number (per unit length) instead, on the grid of
+        training.angle_of_attack, training.mach_number and
+        training.reynolds_number.  AVL is inviscid, so it is run once for
+        every angle of attack and mach number, and its coefficients are the
+        same along the reynolds number.
     '''
     def __defaults__(self):
         
         self.training = Data()
         self.training.angle_of_attack  = np.array([-10.,0.,10.]) * Units.deg
+        self.training.mach_number      = np.array([0.0])
+        self.training.reynolds_number  = np.array([1e7]) # 1/m
         self.training.lift_coefficient = None
-        self.training.drag_coefficient = None
+        self.training.induced_drag_coefficient = None
         self.training.pitch_moment_coefficient = None
+        
+        # training grid, and a folder to keep the training data in, see Surrogate
+        self.training_inputs = ['angle_of_attack','mach_number','reynolds_number']
+        self.training_cache  = None
+        
+        # interpolate on the training grid instead of fitting polynomials,
+        # the grid needs more angles of attack then
+        self.gridded = False
 
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
@@ -59,8 +76,7 @@ class AVL(Aerodynamics,Surrogate):
             
             self.avl_callable.features = self.geometry
             self.avl_callable.finalize()
-            self.sample_training()
-            self.build_surrogate()
+            Surrogate.finalize(self)
         
             self.finalized = True
             
@@ -70,42 +86,53 @@ class AVL(Aerodynamics,Surrogate):
 
     initialize = finalize
     
+    def training_key(self):
+        # the avl discretization changes the training data too
+        return Surrogate.training_key(self,self.avl_callable.settings)
+    
     def sample_training(self):
 
         # define conditions for run cases
         run_conditions = Aero_Conditions()
         ones_1col      = run_conditions.ones_row(1)
         run_conditions.weights.total_mass     = ones_1col*self.geometry.mass_properties.max_takeoff
-        run_conditions.freestream.mach_number = ones_1col * 0.0
         run_conditions.freestream.velocity    = ones_1col * 150 * Units.knots
         run_conditions.freestream.density     = ones_1col * 1.225
         run_conditions.freestream.gravity     = ones_1col * 9.81
         
-        # set up run cases
+        # set up run cases, one for each angle of attack and mach number
         alphas_1d = self.training.angle_of_attack
-        alphas    = alphas_1d.reshape([alphas_1d.shape[0],1])
-        run_conditions.expand_rows(alphas.shape[0])
-        run_conditions.aerodynamics.angle_of_attack = alphas
-
-        # run avl
+        machs_1d  = self.training.mach_number
+        shape     = [alphas_1d.shape[0],machs_1d.shape[0],1]
+        alphas, machs = np.meshgrid(alphas_1d,machs_1d,indexing='ij')
+        run_conditions.expand_rows(alphas.size)
+        run_conditions.aerodynamics.angle_of_attack = alphas.reshape([-1,1])
+        run_conditions.freestream.mach_number       = machs.reshape([-1,1])
+
+        # run avl, the same along the reynolds number
         results = self.avl_callable.evaluate_conditions(run_conditions)
-        self.training.lift_coefficient = results.aerodynamics.lift_coefficient.reshape(alphas_1d.shape)
+        reynolds = np.ones([1,1,len(self.training.reynolds_number)])
+        self.training.lift_coefficient = results.aerodynamics.lift_coefficient.reshape(shape) * reynolds
         self.training.induced_drag_coefficient = \
-            results.aerodynamics.drag_breakdown.induced.total.reshape(alphas_1d.shape)
+            results.aerodynamics.drag_breakdown.induced.total.reshape(shape) * reynolds
         self.training.pitch_moment_coefficient = \
-            results.aerodynamics.pitch_moment_coefficient.reshape(alphas_1d.shape)
+            results.aerodynamics.pitch_moment_coefficient.reshape(shape) * reynolds
 
         return
 
 
     def build_surrogate(self):
         
-        # unpack
+        if self.gridded:
+            Surrogate.build_surrogate(self)
+            return
+        
+        # unpack, at the first mach and reynolds number
         training_data = self.training
         AoA_data = training_data.angle_of_attack
-        CL_data  = training_data.lift_coefficient
-        CDi_data = training_data.induced_drag_coefficient
-        Cm_data  = training_data.pitch_moment_coefficient
+        CL_data  = training_data.lift_coefficient[:,0,0]
+        CDi_data = training_data.induced_drag_coefficient[:,0,0]
+        Cm_data  = training_data.pitch_moment_coefficient[:,0,0]
 
         # pack for surrogate
         X_data = np.reshape(AoA_data,-1)
@@ -123,16 +150,26 @@ class AVL(Aerodynamics,Surrogate):
         return
 
 
+    def surrogate_inputs(self,state):
+        # the polynomials are of angle of attack only
+        inputs = [state.conditions.aerodynamics.angle_of_attack]
+        if self.gridded:
+            freestream = state.conditions.freestream
+            reynolds   = freestream.density * freestream.velocity / freestream.dynamic_viscosity
+            inputs.extend([ freestream.mach_number , reynolds ])
+        return inputs
+
+
     def evaluate(self,state,settings=None,geometry=None):
         
         # unpack
-        aoa           = state.conditions.aerodynamics.angle_of_attack
+        inputs        = self.surrogate_inputs(state)
         Sref          = self.geometry.reference_area
 
         # evaluate surrogates
-        CL  = self.surrogates.lift_coefficient(aoa)
-        CDi = self.surrogates.induced_drag_coefficient(aoa)
-        Cm  = self.surrogates.pitch_moment_coefficient(aoa)
+        CL  = self.surrogates.lift_coefficient(*inputs)
+        CDi = self.surrogates.induced_drag_coefficient(*inputs)
+        Cm  = self.surrogates.pitch_moment_coefficient(*inputs)
 
         # pack conditions
         state.conditions.aerodynamics.lift_coefficient = CL
@@ -154,11 +191,11 @@ class AVL(Aerodynamics,Surrogate):
     def evaluate_lift(self,state):
         
         # unpack
-        aoa   = state.conditions.aerodynamics.freestream.angle_of_attack
-        Sref  = self.geometry.reference_area
+        inputs = self.surrogate_inputs(state)
+        Sref   = self.geometry.reference_area
 
         # evaluate surrogates
-        CL  = self.surrogates.lift_coefficient(aoa)
+        CL  = self.surrogates.lift_coefficient(*inputs)
 
         # pack conditions
         state.conditions.aerodynamics.lift_coefficient = CL
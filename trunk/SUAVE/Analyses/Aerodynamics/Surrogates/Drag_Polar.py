@@ -0,0 +1,383 @@
+# Drag_Polar.py
+#
+# Created:  Oct 2026
+
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import copy
+import numpy as np
+from warnings import warn
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Aerodynamics.Aerodynamics import Aerodynamics
+from SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics\
+     import Aerodynamics as Aero_Conditions
+
+from SUAVE.Analyses import Surrogate
+
+
+# ----------------------------------------------------------------------
+#  Analysis
+# ----------------------------------------------------------------------
+
+class Drag_Polar(Aerodynamics,Surrogate):
+    ''' SUAVE.Analyses.Aerodynamics.Surrogates.Drag_Polar
+        tabulates another aerodynamics analysis, such as Fidelity_Zero or
+        Supersonic_Zero, on a grid of mach number, angle of attack and
+        altitude, and evaluates it by multilinear interpolation.
+
+        evaluate() gives the same results as the model, lift.total,
+        drag.total and every other output of its process, and sets the
+        same lift_breakdown and drag_breakdown conditions.  outputs that
+        do not change with the conditions are copied from the model.
+
+        with training_cache set to a folder, the table is kept there and
+        memory mapped, so analyses of the same geometry and settings
+        share it, see Surrogate.
+
+        check_accuracy() compares the table to the model, by default at
+        the centers of the grid cells, where the interpolation error is
+        largest.  finalize() runs it, and warns past settings.tolerance.
+    '''
+
+    def __defaults__(self):
+
+        self.tag = 'drag_polar'
+
+        self.geometry = Data()
+        self.settings = Data()
+
+        # the aerodynamics analysis to tabulate
+        self.model = None
+
+        # the atmosphere of the table, the mission should use the same
+        self.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+        # largest accepted table error in lift and drag coefficient, see check_accuracy()
+        self.settings.tolerance = Data()
+        self.settings.tolerance.lift_coefficient = 5e-3
+        self.settings.tolerance.drag_coefficient = 2e-3
+
+        # training grid, finer in mach number where compressibility drag starts
+        self.training = Data()
+        self.training.mach_number     = np.hstack([ np.linspace(0.05,0.6,12) , np.linspace(0.625,0.85,19) ])
+        self.training.angle_of_attack = np.linspace(-6.,14.,41) * Units.deg
+        self.training.altitude        = np.linspace(0.,14.,8) * Units.km
+        self.training.table           = None
+
+        # training grid, and a folder to keep the table in, see Surrogate
+        self.training_inputs = ['mach_number','angle_of_attack','altitude']
+        self.training_cache  = None
+
+        self.surrogates = Data()
+        self.surrogates.table = None
+
+        # layout of the model outputs, see probe_outputs()
+        self.outputs   = []
+        self.results   = None
+        self.columns   = []
+        self.nodes     = []
+        self.breakdown = []
+
+        self.accuracy = Data()
+
+        return
+
+
+    def finalize(self):
+
+        model = self.model
+        model.finalize()
+        self.geometry = model.geometry
+
+        self.probe_outputs()
+        Surrogate.finalize(self)
+        self.check_accuracy()
+
+        return
+
+    initialize = finalize
+
+
+    def evaluate(self,state,settings=None,geometry=None):
+        """ results = Drag_Polar.evaluate(state)
+            the model results, interpolated from the table at
+            freestream.mach_number, aerodynamics.angle_of_attack
+            and freestream.altitude
+
+            Assumptions:
+                the results are the same tree on every call, laid out by
+                probe_outputs(), only the tabulated columns are rewritten.
+                the breakdowns are added to the conditions on the first call.
+        """
+
+        conditions = state.conditions
+
+        mach     = conditions.freestream.mach_number
+        aoa      = conditions.aerodynamics.angle_of_attack
+        altitude = conditions.freestream.altitude
+
+        # all outputs at once, in the last dimension
+        values = self.surrogates.table(mach,aoa,altitude)
+
+        for node,key,i in self.columns:
+            node[key] = values[...,i]
+
+        # the breakdowns, kept in the conditions between calls
+        nodes = []
+        for parent,key,kind,constants in self.nodes:
+            parent = nodes[parent] if parent >= 0 else conditions.aerodynamics
+            if not parent.has_key(key):
+                parent[key] = kind()
+            node = parent[key]
+            for k,value in constants:
+                if not node.has_key(k):
+                    node[k] = copy.copy(value)
+            nodes.append(node)
+
+        for node,key,i in self.breakdown:
+            nodes[node][key] = values[...,i]
+
+        return self.results
+
+
+    def check_accuracy(self,state=None):
+        """ accuracy = Drag_Polar.check_accuracy(state=None)
+            largest error of the table in lift.total and drag.total,
+            against the model, at the conditions of state, or by default
+            at the centers of the grid cells
+
+            Outputs:
+                accuracy.lift_coefficient - largest absolute error
+                accuracy.drag_coefficient - largest absolute error
+                accuracy.drag_relative    - largest relative drag error
+
+            Assumptions:
+                warns if the error is past settings.tolerance
+        """
+
+        if state is None:
+            centers = [ 0.5 * (x[1:] + x[:-1]) if len(x) > 1 else x
+                        for x in [ self.training[k] for k in self.training_inputs ] ]
+            state = self.grid_state(*centers)
+
+        results  = self.evaluate(state)
+        CL_table = results.lift.total
+        CD_table = results.drag.total
+
+        results  = self.model.evaluate(state)
+        CL_model = results.lift.total
+        CD_model = results.drag.total
+
+        accuracy = Data()
+        accuracy.lift_coefficient = np.max( np.abs( CL_table - CL_model ) )
+        accuracy.drag_coefficient = np.max( np.abs( CD_table - CD_model ) )
+        accuracy.drag_relative    = np.max( np.abs( CD_table - CD_model ) / np.abs(CD_model) )
+
+        tolerance = self.settings.tolerance
+        for key in ['lift_coefficient','drag_coefficient']:
+            if accuracy[key] > tolerance[key]:
+                warn('Drag_Polar %s error %.4e is past the tolerance %.4e, refine the training grid' % (key,accuracy[key],tolerance[key]),RuntimeWarning)
+
+        self.accuracy = accuracy
+
+        return accuracy
+
+
+    # ------------------------------------------------------------------
+    #  Training
+    # ------------------------------------------------------------------
+
+    def grid_state(self,mach,aoa,altitude):
+        """ state = Drag_Polar.grid_state(mach,aoa,altitude)
+            a state with one row per point of the grid of the three
+            input vectors, in the atmosphere of the table
+        """
+
+        mach, aoa, altitude = np.meshgrid(mach,aoa,altitude,indexing='ij')
+
+        conditions = Aero_Conditions()
+        conditions.expand_rows(mach.size)
+
+        freestream = conditions.freestream
+        freestream.mach_number = mach.reshape([-1,1])
+        freestream.altitude    = altitude.reshape([-1,1])
+
+        atmo_data = self.atmosphere.compute_values(freestream.altitude)
+        freestream.pressure          = atmo_data.pressure
+        freestream.temperature       = atmo_data.temperature
+        freestream.density           = atmo_data.density
+        freestream.speed_of_sound    = atmo_data.speed_of_sound
+        freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+
+        freestream.velocity         = freestream.mach_number * freestream.speed_of_sound
+        freestream.dynamic_pressure = 0.5 * freestream.density * freestream.velocity**2.
+        freestream.reynolds_number  = freestream.density * freestream.velocity / freestream.dynamic_viscosity
+        freestream.gravity          = freestream.altitude * 0. + 9.81
+
+        conditions.aerodynamics.angle_of_attack = aoa.reshape([-1,1])
+
+        state = Data()
+        state.conditions = conditions
+
+        return state
+
+    def probe_outputs(self):
+        """ evaluates the model at a few points, to find its outputs,
+            and lays out the data that evaluate() fills in
+
+            Outputs:
+                self.outputs   - paths of the column outputs, tabulated
+                self.results   - the results of evaluate(), with the outputs
+                                 that do not change with the conditions
+                self.columns   - (data,key,column) of the outputs in self.results
+                self.nodes     - (parent,key,type,constants) of the data in the
+                                 lift and drag breakdowns, parents before
+                                 children.  parent is the number of the parent
+                                 node, -1 for conditions.aerodynamics, and
+                                 constants are (key,value) of the outputs
+                                 that do not change with the conditions
+                self.breakdown - (node,key,column) of the outputs in the breakdowns
+        """
+
+        x = [ self.training[k][[0,-1]] for k in self.training_inputs ]
+        state = self.grid_state(*x)
+        N = state.conditions._size
+
+        results    = self.model.evaluate(state)
+        conditions = state.conditions
+
+        def is_column(value):
+            return isinstance(value,np.ndarray) and value.shape == (N,1)
+
+        outputs = []
+        columns = []
+
+        # a results tree of the same types, holding the constants
+        layout = { ('results',) : type(results)() }
+        for path,value in tree_items(results,('results',)):
+            parent = layout[path[:-1]]
+            if isinstance(value,dict):
+                layout[path] = parent[path[-1]] = type(value)()
+            elif is_column(value):
+                columns.append( (parent,path[-1],len(outputs)) )
+                outputs.append(path)
+            else:
+                parent[path[-1]] = copy.copy(value)
+
+        # the breakdowns, numbered
+        nodes     = []
+        breakdown = []
+        numbers   = { ('conditions','aerodynamics') : -1 }
+        for key in ['lift_breakdown','drag_breakdown']:
+            root = ('conditions','aerodynamics',key)
+            data = conditions.aerodynamics[key]
+            numbers[root] = len(nodes)
+            nodes.append( (-1,key,type(data),[]) )
+            for path,value in tree_items(data,root):
+                parent = numbers[path[:-1]]
+                if isinstance(value,dict):
+                    numbers[path] = len(nodes)
+                    nodes.append( (parent,path[-1],type(value),[]) )
+                elif is_column(value):
+                    breakdown.append( (parent,path[-1],len(outputs)) )
+                    outputs.append(path)
+                else:
+                    nodes[parent][3].append( (path[-1],value) )
+
+        self.outputs   = outputs
+        self.results   = layout[('results',)]
+        self.columns   = columns
+        self.nodes     = nodes
+        self.breakdown = breakdown
+
+        return
+
+    def sample_training(self):
+
+        x = [ self.training[k] for k in self.training_inputs ]
+        shape = [ len(v) for v in x ]
+
+        state = self.grid_state(*x)
+
+        results = self.model.evaluate(state)
+        data = Data()
+        data.results    = results
+        data.conditions = state.conditions
+
+        table = np.zeros([state.conditions._size,len(self.outputs)])
+        for i,path in enumerate(self.outputs):
+            table[:,i] = data.deep_get(list(path))[:,0]
+
+        self.training.table = table.reshape( shape + [len(self.outputs)] )
+
+        return
+
+    def training_key(self):
+        # the table depends on the model, its settings and the functions
+        # of its process steps, and on the atmosphere of the grid, without
+        # the break point table the atmosphere builds when it is first used
+        atmosphere = [ (k,v) for k,v in self.atmosphere.items() if k != 'table' ]
+        return Surrogate.training_key(self,type(self.model).__name__,self.model.settings,
+                                      self.model.process,type(self.atmosphere).__name__,atmosphere)
+
+    def training_filename(self):
+        filename = '%s_%s.npy' % (type(self).__name__,self.training_key())
+        return os.path.join(self.training_cache,filename)
+
+    def load_training(self):
+        """ memory maps the table from the cache,
+            returns False if caching is off or there is no match
+        """
+
+        if self.training_cache is None:
+            return False
+
+        filename = self.training_filename()
+        if not os.path.exists(filename):
+            return False
+
+        table = np.load(filename,mmap_mode='r')
+        if table.shape[-1] != len(self.outputs):
+            return False
+
+        self.training.table = table
+
+        return True
+
+    def save_training(self):
+        """ saves the table to the cache, and memory maps it
+        """
+
+        if self.training_cache is None:
+            return
+
+        if not os.path.exists(self.training_cache):
+            os.makedirs(self.training_cache)
+
+        filename = self.training_filename()
+        np.save(filename,self.training.table)
+        self.training.table = np.load(filename,mmap_mode='r')
+
+        return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def tree_items(data,prefix=()):
+    """ yields (path,value) for everything in data, recursively,
+        parents before their children.  paths are tuples of keys
+    """
+    for key,value in data.items():
+        path = prefix + (key,)
+        yield path,value
+        if isinstance(value,dict):
+            for item in tree_items(value,path):
+                yield item
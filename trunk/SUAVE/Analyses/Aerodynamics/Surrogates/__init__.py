@@ -1,2 +1,3 @@
 
 from AVL import AVL
+from Drag_Polar import Drag_Polar
@@ -21,6 +21,7 @@ from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag import compute_aircraft_drag
 
 # local imports
 from Aerodynamics import Aerodynamics
+from SUAVE.Analyses.Surrogate import Surrogate
 from Results      import Results
 
 # python imports
@@ -37,12 +38,18 @@ import scipy as sp
 #  Class
 # ----------------------------------------------------------------------
 
-class Vortex_Lattice(Aerodynamics):
+class Vortex_Lattice(Aerodynamics,Surrogate):
     """ SUAVE.Analyses.Aerodynamics.Fidelity_Zero
         aerodynamic model that builds a surrogate model for clean wing
         lift, using vortex lattice, and various handbook methods
         for everything else
 
+        the lattice is sampled on the grid of training.angle_of_attack,
+        training.mach_number and training.reynolds_number (per unit length),
+        and the surrogate is a line in angle of attack, fit at the first
+        mach and reynolds number.  with gridded set, it interpolates on the
+        whole grid instead, see Surrogate.Gridded_Model.
+
         this class is callable, see self.__call__
 
     """
@@ -69,17 +76,29 @@ class Vortex_Lattice(Aerodynamics):
         # conditions table, used for surrogate model training
         self.training = Data()        
         self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
+        self.training.mach_number      = np.array([0.0])
+        self.training.reynolds_number  = np.array([1e7]) # 1/m
         self.training.lift_coefficient = None
         
         # surrogoate models
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
+        
+        # training grid, and a folder to keep the training data in, see Surrogate
+        self.training_inputs = ['angle_of_attack','mach_number','reynolds_number']
+        self.training_cache  = None
+        
+        # interpolate on the training grid instead of fitting a line,
+        # the grid needs more angles of attack then
+        self.gridded = False
  
         
     def initialize(self):
                    
-        # sample training data
-        self.sample_training()
+        # sample training data, unless it is in the training cache
+        if not self.load_training():
+            self.sample_training()
+            self.save_training()
                     
         # build surrogate
         self.build_surrogate()
@@ -96,9 +115,9 @@ class Vortex_Lattice(Aerodynamics):
                 CD - array of drag coefficients, same size as alpha
 
             Assumptions:
-                linear intperolation surrogate model on Mach, Angle of Attack
-                    and Reynolds number
-                locations outside the surrogate's table are held to nearest data
+                linear surrogate model in angle of attack, or with gridded
+                    set, linear interpolation on angle of attack, mach number
+                    and reynolds number, extrapolated from the edge cells
                 no changes to initial geometry or settings
         """
 
@@ -117,11 +136,26 @@ class Vortex_Lattice(Aerodynamics):
         
         wings_lift_model = surrogates.lift_coefficient
         
+        inputs = self.surrogate_inputs(conditions)
+        
         # inviscid lift of wings only
-        inviscid_wings_lift = wings_lift_model(AoA)
+        inviscid_wings_lift = wings_lift_model(*inputs)
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift = inviscid_wings_lift
         state.conditions.aerodynamics.lift_coefficient = inviscid_wings_lift
 
+        # derivatives, [d/dalpha, d/dmach], see Markup
+        if settings.get('derivatives',False):
+            derivatives = conditions.aerodynamics.derivatives
+            if self.gridded:
+                AoA, mach, reynolds = inputs
+                h = 1e-6
+                d_lift = np.hstack([ wings_lift_model(AoA+h,mach,reynolds) - wings_lift_model(AoA-h,mach,reynolds) ,
+                                     wings_lift_model(AoA,mach+h,reynolds) - wings_lift_model(AoA,mach-h,reynolds) ]) / (2.*h)
+            else:
+                d_lift = wings_lift_model.deriv()(AoA) * np.array([[1.,0.]])
+            derivatives.lift_breakdown.inviscid_wings_lift = d_lift
+            derivatives.lift_coefficient = d_lift
+
 
         return inviscid_wings_lift
 
@@ -133,33 +167,35 @@ class Vortex_Lattice(Aerodynamics):
         settings = self.settings
         training = self.training
         
-        AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
+        AoA, mach, reynolds = np.meshgrid(training.angle_of_attack,training.mach_number,
+                                          training.reynolds_number,indexing='ij')
 
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
+        konditions.freestream   = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i] = calculate_lift_vortex_lattice(konditions, settings, geometry)
+        # calculate aerodynamics for table, all points of the grid in one solve
+        konditions.aerodynamics.angle_of_attack = AoA.reshape([-1,1])
+        konditions.freestream.mach_number       = mach.reshape([-1,1])
+        konditions.freestream.reynolds_number   = reynolds.reshape([-1,1])
+        CL = calculate_lift_vortex_lattice(konditions, settings, geometry)
 
         # store training data
-        training.lift_coefficient = CL
+        training.lift_coefficient = np.reshape(CL,AoA.shape)
 
         return
 
     def build_surrogate(self):
+        
+        if self.gridded:
+            Surrogate.build_surrogate(self)
+            return
 
-        # unpack data
+        # unpack data, at the first mach and reynolds number
         training = self.training
         AoA_data = training.angle_of_attack
-        CL_data  = training.lift_coefficient
+        CL_data  = training.lift_coefficient[:,0,0]
 
         # pack for surrogate model
         X_data = np.array([AoA_data]).T
@@ -172,6 +208,16 @@ class Vortex_Lattice(Aerodynamics):
         self.surrogates.lift_coefficient = cl_surrogate
 
         return
+    
+    
+    def surrogate_inputs(self,conditions):
+        # the line is of angle of attack only
+        inputs = [conditions.aerodynamics.angle_of_attack]
+        if self.gridded:
+            freestream = conditions.freestream
+            reynolds   = freestream.density * freestream.velocity / freestream.dynamic_viscosity
+            inputs.extend([ freestream.mach_number , reynolds ])
+        return inputs
 
 
 
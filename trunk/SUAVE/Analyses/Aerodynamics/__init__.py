@@ -8,6 +8,9 @@ from Markup           import Markup
 from Fidelity_Zero    import Fidelity_Zero
 from Linear_Lift      import Linear_Lift
 from Vortex_Lattice   import Vortex_Lattice
+from Drag_Components  import Drag_Components
+from Parasite_Drag_Components import Parasite_Drag_Components
+from Compressibility_Drag_Components import Compressibility_Drag_Components
 from Supersonic_Zero  import Supersonic_Zero
 
 import Surrogates
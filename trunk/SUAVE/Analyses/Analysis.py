@@ -7,6 +7,7 @@
 from SUAVE.Core import Data, Data_Exception, Data_Warning
 from SUAVE.Core import Container as ContainerBase
 from Results import Results
+import Parallel
 
 
 # ----------------------------------------------------------------------
@@ -55,6 +56,9 @@ class Container(ContainerBase):
     """ SUAVE.Analyses.Analysis.Container()
     """
     
+    # number of worker processes for evaluate(), see Parallel.evaluate()
+    parallel = 0
+    
     def compile(self,*args,**kwarg):
         for tag,analysis in self.items():
             if hasattr(analysis,'compile'):
@@ -66,6 +70,8 @@ class Container(ContainerBase):
                 analysis.initialize(*args,**kwarg)
     
     def evaluate(self,*args,**kwarg):
+        if self.parallel:
+            return Parallel.evaluate(self,*args,**kwarg)
         results = Results()
         for tag,analysis in self.items(): 
             if hasattr(analysis,'evaluate'):
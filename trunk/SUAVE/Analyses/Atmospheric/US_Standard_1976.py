@@ -38,15 +38,83 @@ class US_Standard_1976(Atmospheric):
     def __defaults__(self):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
-        self.update(atmo_data)        
+        self.update(atmo_data)
+        
+        # temperature offset from the standard day, ISA+dT (K)
+        self.settings.temperature_deviation = 0.0
+        
+        # break point table, built by finalize(), and rebuilt when 
+        # what it depends on changes, see table_key()
+        self.table = None
+        
+    def finalize(self):
+        """ checks the fluid and planet properties, and tabulates 
+            the break points for compute_values()
+        """
+        
+        # check properties
+        if not self.fluid_properties == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not self.planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')
+        
+        # unpack
+        grav  = self.planet.sea_level_gravity
+        gamma = self.fluid_properties.gas_specific_constant
+        
+        z_breaks = np.array( self.breaks.altitude    , dtype=float )
+        T_breaks = np.array( self.breaks.temperature , dtype=float )
+        p_breaks = np.array( self.breaks.pressure    , dtype=float )
+        
+        # lapse rate of each layer
+        alpha = -np.diff(T_breaks) / np.diff(z_breaks)
+        
+        # pressure exponents, so that each layer is 
+        # p = p0 * (1-alpha*dz/T0)**exponent * exp(isothermal*dz)
+        # where one of the two factors is exactly one
+        i_isoth = (alpha == 0.)
+        i_adiab = (alpha != 0.)
+        exponent   = np.zeros_like(alpha)
+        isothermal = np.zeros_like(alpha)
+        exponent[i_adiab]   = 1.*grav/(alpha[i_adiab]*gamma)
+        isothermal[i_isoth] = -1.*grav/(gamma*T_breaks[:-1][i_isoth])
+        
+        table = Data()
+        table.key         = self.table_key()
+        table.altitude    = z_breaks
+        table.temperature = T_breaks[:-1]
+        table.pressure    = p_breaks[:-1]
+        table.lapse_rate  = alpha
+        table.exponent    = exponent
+        table.isothermal  = isothermal
+        
+        self.table = table
+        
+        return
+    
+    def table_key(self):
+        """ the values the break point table is built from, the 
+            breaks, the sea level gravity and the gas constant
+        """
+        
+        breaks = self.breaks
+        
+        return ( float(self.planet.sea_level_gravity) ,
+                 float(self.fluid_properties.gas_specific_constant) ,
+                 np.asarray(breaks.altitude    , dtype=float).tostring() ,
+                 np.asarray(breaks.temperature , dtype=float).tostring() ,
+                 np.asarray(breaks.pressure    , dtype=float).tostring() )
     
-    def compute_values(self,altitude):
+    def compute_values(self,altitude,temperature_deviation=None):
 
         """ Computes values from the International Standard Atmosphere
 
         Inputs:
             altitude     : geometric altitude (elevation) (m)
                            can be a float, list or 1D array of floats
+            temperature_deviation : offset of the temperature from the 
+                           standard day (K), ISA+dT, defaults to 
+                           settings.temperature_deviation
          
         Outputs:
             list of conditions -
@@ -56,74 +124,62 @@ class US_Standard_1976(Atmospheric):
                 speed_of_sound : speed of sound (m/s)
                 dynamic_viscosity      : dynamic_viscosity (kg/m-s)
             
+        Assumptions:
+            the offset changes temperature, and with it density, speed of 
+            sound and viscosity, at the standard pressure of each altitude
+            
         Example:
             atmosphere = SUAVE.Attributes.Atmospheres.Earth.USStandard1976()
             atmosphere.ComputeValues(1000).pressure
           
         """
+        
+        if self.table is None or self.table.key != self.table_key():
+            self.finalize()
 
         # unpack
-        zs   = altitude
+        zs     = altitude
         gas    = self.fluid_properties
-        planet = self.planet
-        grav   = self.planet.sea_level_gravity        
         Rad    = self.planet.mean_radius
-        gamma  = gas.gas_specific_constant
+        table  = self.table
         
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
+        if temperature_deviation is None:
+            temperature_deviation = self.settings.temperature_deviation
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = table.altitude[0]
+        zmax = table.altitude[-1]   
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
         
-        # check ranges
-        if np.amin(zs) < zmin:
+        # check ranges, on the real part for a complex step
+        zs_real = np.real(zs)
+        if np.amin(zs_real) < zmin:
             print "Warning: altitude requested below minimum for this atmospheric model; returning values for h = -2.0 km"
-            zs[zs < zmin] = zmin
-        if np.amax(zs) > zmax:
+            zs = np.where(zs_real < zmin,zmin,zs)
+        if np.amax(zs_real) > zmax:
             print "Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km"   
-            zs[zs > zmax] = zmax        
-
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mew   = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
+            zs = np.where(zs_real > zmax,zmax,zs)
+        
+        # find the layer of each altitude
+        # values on a break go to the layer above, values at the top to the last layer
+        i_layer = np.searchsorted(table.altitude,np.real(zs),side='right') - 1
+        i_layer = np.minimum(i_layer,len(table.lapse_rate)-1)
+        
+        z0    = table.altitude[i_layer]
+        T0    = table.temperature[i_layer]
+        p0    = table.pressure[i_layer]
+        alpha = table.lapse_rate[i_layer]
+        
+        # interpolate the layer
         dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(gamma*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*gamma)) )
+        p  = p0 * (1.-alpha*dz/T0)**table.exponent[i_layer] * np.exp(table.isothermal[i_layer]*dz)
         
-        T   = T0 - dz*alpha
+        T   = T0 - dz*alpha + temperature_deviation
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T)
         mew = gas.compute_absolute_viscosity(T)
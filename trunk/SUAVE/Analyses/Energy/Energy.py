@@ -23,4 +23,9 @@ class Energy(Analysis):
         results = network.evaluate_thrust(state) 
         
         return results
+    
+    def finalize(self,*args,**kwarg):
+        network = self.network
+        if hasattr(network,'finalize'):
+            network.finalize()
     
\ No newline at end of file
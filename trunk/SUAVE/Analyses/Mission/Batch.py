@@ -0,0 +1,129 @@
+""" Batch.py: solves several copies of a mission at once """
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Data_Exception
+from SUAVE.Core import Container as ContainerBase
+
+from SUAVE.Methods import Missions as Methods
+
+from Mission import Mission
+from Sequential_Segments import Sequential_Segments
+
+from copy import copy, deepcopy
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+class Batch(Mission):
+    """ Solves a batch of independent mission cases together.
+
+        Each case is a copy of a base mission's segments, see append_case(),
+        with its own takeoff weight or segment settings. The cases are
+        solved one segment at a time, as in Sequential_Segments, but the
+        n-th segment of every case goes through a single root find. The
+        cases do not share unknowns, so the sparse jacobian is block
+        diagonal over the cases and costs about as many residual
+        evaluations as one case.
+    """
+
+    def __defaults__(self):
+
+        self.tag = 'batch'
+
+        # the cases share no unknowns, difference them together
+        self.state.numerics.solver_jacobian = 'sparse'
+
+        # --------------------------------------------------------------
+        #   The Solving Process
+        # --------------------------------------------------------------
+
+        # --------------------------------------------------------------
+        #   Initialize
+        # --------------------------------------------------------------
+        self.process.initialize = Methods.Segments.Common.Sub_Segments.expand_independent_sub_segments
+
+        # --------------------------------------------------------------
+        #   Converge
+        # --------------------------------------------------------------
+        self.process.converge = Methods.Segments.Common.Sub_Segments.batch_sub_segments
+
+        # --------------------------------------------------------------
+        #   Iterate
+        # --------------------------------------------------------------
+        del self.process.iterate
+
+        # --------------------------------------------------------------
+        #   Finalize
+        # --------------------------------------------------------------
+        self.process.finalize.sub_segments = Methods.Segments.Common.Sub_Segments.finalize_independent_sub_segments
+
+        return
+
+    def append_case(self,mission,tag=None,takeoff_weight=None):
+        """ case = Batch.append_case(mission,tag=None,takeoff_weight=None)
+            adds a copy of mission's segments to the batch
+
+            Inputs:
+                mission        - the base mission, its segments are copied,
+                                 their analyses are shared
+                tag            - tag of the case, defaults to 'case_<n>'
+                takeoff_weight - optional takeoff mass of the case [kg],
+                                 the vehicle of the first segment is copied
+                                 so that the base mission is left alone
+
+            Outputs:
+                case - a Sequential_Segments mission, change the settings
+                       of case.segments to vary the case, results are in
+                       results.segments[case.tag]
+        """
+
+        case = Sequential_Segments()
+        if tag is None:
+            tag = 'case_%i' % len(self.segments)
+        case.tag = tag
+
+        for segment in mission.segments.values():
+            segment = copy(segment)
+            segment.state = segment.state.clone()
+            case.append_segment(segment)
+
+        if not takeoff_weight is None:
+            set_takeoff_weight(case.segments[0],takeoff_weight)
+
+        self.append_segment(case)
+
+        return case
+
+    def finalize(self):
+        pass
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def set_takeoff_weight(segment,takeoff_weight):
+    """ points the segment to a copy of its weights analysis
+        with the new takeoff mass, for Common.Weights.initialize_weights()
+    """
+
+    analyses = copy(segment.analyses)
+    weights  = copy(analyses.weights)
+    vehicle  = copy(weights.vehicle)
+
+    vehicle.mass_properties = deepcopy(vehicle.mass_properties)
+    vehicle.mass_properties.takeoff = takeoff_weight
+    weights.vehicle = vehicle
+
+    if weights.has_key('mass_properties'):
+        weights.mass_properties = vehicle.mass_properties
+
+    analyses.weights  = weights
+    segment.analyses  = analyses
+
+    return
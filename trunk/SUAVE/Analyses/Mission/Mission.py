@@ -35,7 +35,13 @@ class Mission(Segments.Simple.Container):
 
 class Container(ContainerBase):
     
+    # number of worker processes for evaluate(), see Analyses.Parallel
+    parallel = 0
+    
     def evaluate(self,state=None):
+        if self.parallel:
+            return SUAVE.Analyses.Parallel.evaluate(self,state)
+        
         results = SUAVE.Analyses.Results()
         
         for key,mission in self.items():
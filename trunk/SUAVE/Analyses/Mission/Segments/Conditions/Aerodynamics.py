@@ -17,6 +17,8 @@ from Conditions import Conditions
 
 class Aerodynamics(Basic):
     
+    _cache_defaults = True
+    
     def __defaults__(self):
         self.tag = 'aerodynamic_conditions'
         
@@ -15,6 +15,8 @@ from Conditions import Conditions
 
 class Basic(Conditions):
     
+    _cache_defaults = True
+    
     def __defaults__(self):
         self.tag = 'basic_conditions'
         
@@ -11,6 +11,8 @@ from copy import deepcopy
 from SUAVE.Core                    import Data, Data_Exception
 from SUAVE.Methods.Utilities            import atleast_2d_col
 
+from SUAVE.Plugins.VyPy.tools import array_type, matrix_type
+
 
 # ----------------------------------------------------------------------
 #  Conditions
@@ -20,6 +22,13 @@ class Conditions(Data):
 
     _size = 1
     
+    # new conditions are copied from a template of the defaults, on 
+    # the subclasses checked to have fixed defaults, see DataBunch
+    _cache_defaults = True
+    
+    # flat vector behind the arrays, see allocate_vector()
+    _vector = None
+    
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns """
         return np.ones([self._size,cols])
@@ -36,13 +45,133 @@ class Conditions(Data):
             # recursion
             if isinstance(v,Conditions):
                 v.expand_rows(rows)
-            # need arrays here
-            elif np.rank(v) == 2:
+            # need arrays here, keep arrays that already fit
+            elif np.rank(v) == 2 and v.shape[0] != rows:
                 self[k] = np.resize(v,[rows,v.shape[1]])
             #: if type
         #: for each key,value
         
         return
+    
+    def allocate_vector(self):
+        """ vector = Conditions.allocate_vector()
+            moves the arrays of the data into one contiguous vector, 
+            in the order of pack_array('vector'), and replaces them 
+            with views into the vector. pack_vector() and unpack_vector()
+            then hand over the vector without walking the data.
+            
+            Assumptions:
+                the vector is complex if any array is, otherwise real.
+                the keys of the data don't change until the next allocate_vector().
+                arrays rebound to a new array of the same size are copied 
+                back into the vector and replaced by their view.
+                scalars and matrices are copied, not viewed.
+        """
+        
+        valid_types = ( int, float, array_type, matrix_type )
+        
+        entries = []
+        size = [0]
+        
+        def do_allocate(D):
+            for k,v in D.iteritems():
+                if isinstance(v,Data):
+                    do_allocate(v) # recursion!
+                    continue
+                elif not isinstance(v,valid_types): continue
+                elif np.rank(v) > 2: continue
+                
+                n = np.size(v)
+                entries.append( (D,k,slice(size[0],size[0]+n),np.shape(v)) )
+                size[0] += n
+                
+        do_allocate(self)
+        
+        # complex if any entry is, see Methods.Missions.Segments.Complex_Step
+        dtype = float
+        for D,k,index,shape in entries:
+            if np.iscomplexobj(D[k]):
+                dtype = complex
+                break
+        
+        vector = np.zeros(size[0],dtype=dtype)
+        
+        views = []
+        for D,k,index,shape in entries:
+            v = D[k]
+            vector[index] = np.ravel(v,order='F')
+            
+            # views for arrays
+            if isinstance(v,array_type) and not isinstance(v,matrix_type) and shape:
+                view = vector[index].reshape(shape,order='F')
+                D[k] = view
+            else:
+                view = None
+            
+            views.append( (D,k,index,shape,view) )
+        
+        # owner, so that copies sharing the attribute allocate their own
+        self._vector = (self,vector,views)
+        
+        return vector
+    
+    def pack_vector(self):
+        """ vector = Conditions.pack_vector()
+            same as pack_array('vector'), copied from the vector of allocate_vector()
+        """
+        
+        if self._vector is None or not self._vector[0] is self:
+            self.allocate_vector()
+        
+        owner,vector,views = self._vector
+        
+        for D,k,index,shape,view in views:
+            v = D[k]
+            if v is view: continue
+            
+            # structure or type changed
+            if np.size(v) != index.stop - index.start:
+                return self.allocate_vector().copy()
+            if np.iscomplexobj(v) and not np.iscomplexobj(vector):
+                return self.allocate_vector().copy()
+            
+            vector[index] = np.ravel(v,order='F')
+            if not view is None:
+                D[k] = view
+        
+        return vector.copy()
+    
+    def unpack_vector(self,vector):
+        """ Conditions.unpack_vector(vector)
+            same as unpack_array(vector), copied into the vector of allocate_vector()
+        """
+        
+        if self._vector is None or not self._vector[0] is self:
+            self.allocate_vector()
+        
+        owner,this_vector,views = self._vector
+        
+        this_vector[:] = vector
+        
+        for D,k,index,shape,view in views:
+            if view is None:
+                v = D[k]
+                if isinstance(v,matrix_type):
+                    D[k] = np.asmatrix( this_vector[index].reshape(shape,order='F') )
+                elif shape:
+                    D[k] = this_vector[index].reshape(shape,order='F').copy()
+                else:
+                    D[k] = this_vector[index.start]
+            elif not D[k] is view:
+                D[k] = view
+        
+        return self
+    
+    def __reduce__(self):
+        """ the vector is not copied or pickled, copies allocate their own """
+        reconstructor, args, inst_dict = Data.__reduce__(self)
+        inst_dict.pop('_vector',None)
+        return reconstructor, args, inst_dict
 
     def compile(self):
         self.expand_rows()
\ No newline at end of file
@@ -15,13 +15,19 @@ import numpy as np
 
 class Numerics(Conditions):
     
+    _cache_defaults = True
+    
     def __defaults__(self):
         self.tag = 'numerics'
         
         self.number_control_points = 16
-        self.discretization_method = chebyshev_data
+        self.discretization_method = chebyshev_data # or SUAVE.Methods.Utilities.legendre_gauss_lobatto_data, finite_difference_data
+        
+        self.adaptive_control_points  = False # see Methods.Missions.Segments.Refinement
+        self.tolerance_control_points = 1e-6
+        self.maximum_control_points   = 64
         
-        self.solver_jacobian                  = "none"
+        self.solver_jacobian                  = "none" # "none", "sparse", "analytic" or "complex", see Methods.Missions.Segments.Jacobian
         self.tolerance_solution               = 1e-8
         self.tolerance_boundary_conditions    = 1e-8        
         
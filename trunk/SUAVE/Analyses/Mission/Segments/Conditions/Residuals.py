@@ -11,5 +11,7 @@ from Conditions import Conditions
 
 class Residuals(Conditions):
     
+    _cache_defaults = True
+    
     def __defaults__(self):
         self.tag = 'residuals'
\ No newline at end of file
@@ -25,6 +25,8 @@ array_type = SUAVE.Plugins.VyPy.tools.arrays.array_type
 
 class State(Conditions):
     
+    _cache_defaults = True
+    
     def __defaults__(self):
         
         self.unknowns   = Unknowns()
@@ -52,8 +54,8 @@ class State(Conditions):
             # recursion
             elif isinstance(v,Conditions):
                 v.expand_rows(rows)
-            # need arrays here
-            elif np.rank(v) == 2:
+            # need arrays here, keep arrays that already fit
+            elif np.rank(v) == 2 and v.shape[0] != rows:
                 self[k] = np.resize(v,[rows,v.shape[1]])
             #: if type
         #: for each key,value        
@@ -61,6 +63,9 @@ class State(Conditions):
         
         
 class Container(State):
+    
+    _cache_defaults = True
+    
     def __defaults__(self):
         self.segments = Conditions()
         
@@ -11,5 +11,7 @@ from Conditions import Conditions
 
 class Unknowns(Conditions):
     
+    _cache_defaults = True
+    
     def __defaults__(self):
         self.tag = 'unknowns'
\ No newline at end of file
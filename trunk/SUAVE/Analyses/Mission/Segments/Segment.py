@@ -5,7 +5,6 @@
 
 # python imports
 import numpy as np
-from copy import deepcopy
 
 # SUAVE imports
 from SUAVE.Core import Data, Data_Exception
@@ -60,7 +59,7 @@ class Segment(Analysis):
                         
     def evaluate(self,state=None):
         if state is None:
-            state = deepcopy(self.state)
+            state = self.state.clone()
         self.process(self,state)
         return state
     
@@ -61,7 +61,13 @@ class Sequential_Segments(Mission):
 
 class Container(ContainerBase):
     
+    # number of worker processes for evaluate(), see Analyses.Parallel
+    parallel = 0
+    
     def evaluate(self,state=None):
+        if self.parallel:
+            return SUAVE.Analyses.Parallel.evaluate(self,state)
+        
         results = SUAVE.Analyses.Results()
         
         for key,mission in self.items():
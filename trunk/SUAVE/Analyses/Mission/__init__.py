@@ -7,6 +7,8 @@ from All_At_Once import All_At_Once
 
 import Vary_Cruise
 
+from Batch import Batch
+
 # packages
 import Segments
 
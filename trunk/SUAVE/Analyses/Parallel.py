@@ -0,0 +1,84 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import multiprocessing as mp
+
+from Results import Results
+
+
+# ----------------------------------------------------------------------
+#  Evaluate
+# ----------------------------------------------------------------------
+
+def evaluate(container,*args,**kwarg):
+    """ results = SUAVE.Analyses.Parallel.evaluate(container,*args,**kwarg)
+        evaluates the items of a container on a pool of worker processes
+
+        Inputs:
+            container - an Analysis.Container or Mission.Container, with
+                        container.parallel - number of worker processes,
+                                             negative counts back from the
+                                             number of cpus, as in VyPy MultiTask
+            args,kwarg - passed to each item's evaluate()
+
+        Outputs:
+            results - Results() with the result of each item, in order
+
+        Assumptions:
+            items are independent, each item is pickled to a worker
+            together with the inputs, and its result is pickled back.
+            changes an item makes to itself while evaluating stay in the worker.
+    """
+
+    from SUAVE.Plugins.VyPy.parallel import MultiTask, Task
+
+    items = container.items()
+
+    copies = container.parallel
+    if copies < 0: copies = max(mp.cpu_count()+(copies+1),1)
+    copies = min(copies,len(items))
+
+    results = Results()
+    if not items: return results
+
+    workers = MultiTask(evaluate_item,copies=copies)
+
+    # submit
+    for i,(tag,item) in enumerate(items):
+        workers.put( Task( inputs=(i,item,args,kwarg) ) )
+
+    # wait for all items
+    workers.inbox.join()
+
+    outputs = [None] * len(items)
+    while not workers.outbox.empty():
+        task = workers.outbox.get()
+        if isinstance(task.outputs,Exception):
+            raise task.outputs
+        i,result = task.outputs
+        outputs[i] = result
+
+    # stop the workers
+    del workers
+
+    for (tag,item),result in zip(items,outputs):
+        results[tag] = result
+
+    return results
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def evaluate_item(inputs):
+
+    i,item,args,kwarg = inputs
+
+    if hasattr(item,'evaluate'):
+        result = item.evaluate(*args,**kwarg)
+    else:
+        result = item(*args,**kwarg)
+
+    return i,result
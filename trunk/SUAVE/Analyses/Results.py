@@ -2,4 +2,5 @@
 from SUAVE.Core import Results as Base_Results
 
 class Results(Base_Results):
-    pass
+    
+    _cache_defaults = True
@@ -9,8 +9,15 @@
 
 # imports
 import numpy as np
+import scipy.interpolate
+
+import os
+import types
+import hashlib
+import itertools
 
 from SUAVE.Core import Data, Units
+from SUAVE.Plugins.VyPy.data import load as load_data, save as save_data
 from Analysis import Analysis
 
 
@@ -20,15 +27,30 @@ from Analysis import Analysis
 
 class Surrogate(Analysis):
     ''' Surrogate Base Class
+
+        training data is sampled over the inputs named in training_inputs,
+        either on a grid, with one vector per input and outputs shaped
+        [len(input_1),len(input_2),...], or scattered, with one vector per
+        input and outputs of the same length.  build_surrogate() fits one
+        model for every key in surrogates, from the training output of
+        the same name, see fit_model().
+
+        with training_cache set to a folder, the training outputs are
+        kept on disk by training_key(), and later analyses of the same
+        geometry, settings and inputs load them instead of sampling.
     '''
-    
+
     def __defaults__(self):
         self.training = Data()
         self.surrogates = Data()
+        self.training_inputs = []   # names of the training inputs, in order
+        self.training_cache  = None # folder for training data, or None
         return
 
     def finalize(self):
-        self.sample_training()
+        if not self.load_training():
+            self.sample_training()
+            self.save_training()
         self.build_surrogate()
         return
 
@@ -36,6 +58,11 @@ class Surrogate(Analysis):
         return
 
     def build_surrogate(self):
+        if not self.training_inputs:
+            return
+        inputs = [ self.training[k] for k in self.training_inputs ]
+        for key in self.surrogates.keys():
+            self.surrogates[key] = fit_model(inputs,self.training[key])
         return
 
     def evaluate(self,state):
@@ -43,3 +70,233 @@ class Surrogate(Analysis):
         raise NotImplementedError
         return results
 
+    def training_key(self,*dependencies):
+        """ hash of what the training data depends on, the analysis type,
+            its geometry and settings, the training inputs, and any
+            other dependencies a subclass passes in
+        """
+
+        h = hashlib.sha1()
+        h.update(type(self).__name__)
+
+        hash_data(self.get('geometry',None),h)
+        hash_data(self.settings,h)
+        hash_data(dependencies,h)
+        for key in self.training_inputs:
+            hash_data(key,h)
+            hash_data(self.training[key],h)
+
+        return h.hexdigest()
+
+    def training_filename(self):
+        filename = '%s_%s.pkl' % (type(self).__name__,self.training_key())
+        return os.path.join(self.training_cache,filename)
+
+    def load_training(self):
+        """ loads the training outputs from the cache,
+            returns False if caching is off or there is no match
+        """
+
+        if self.training_cache is None:
+            return False
+
+        filename = self.training_filename()
+        if not os.path.exists(filename):
+            return False
+
+        outputs = load_data(filename,file_format='pickle')
+        for key in self.surrogates.keys():
+            self.training[key] = outputs[key]
+
+        return True
+
+    def save_training(self):
+        """ saves the training outputs to the cache
+        """
+
+        if self.training_cache is None:
+            return
+
+        if not os.path.exists(self.training_cache):
+            os.makedirs(self.training_cache)
+
+        outputs = Data()
+        for key in self.surrogates.keys():
+            outputs[key] = self.training[key]
+
+        save_data(outputs,self.training_filename(),file_format='pickle')
+
+        return
+
+
+# ----------------------------------------------------------------------
+#  Models
+# ----------------------------------------------------------------------
+
+def fit_model(inputs,values):
+    """ model = fit_model(inputs,values)
+        fits a Gridded_Model if the values are on the grid of the
+        input vectors, otherwise a Scattered_Model
+
+        the model is called with one array per input,
+            values = model(input_1,input_2,...)
+        and returns values of the broadcast shape of the inputs.
+        gridded values may have trailing dimensions after the grid,
+        for several outputs at once, which are appended to that shape.
+    """
+
+    inputs = [ np.ravel(x) for x in inputs ]
+    values = np.asarray(values,dtype=float)
+
+    grid_shape = tuple([ len(x) for x in inputs ])
+
+    if values.shape[:len(grid_shape)] == grid_shape or ( values.ndim == 1 and len(inputs) == 1 ):
+        return Gridded_Model(inputs,values)
+    else:
+        return Scattered_Model(inputs,values)
+
+
+class Gridded_Model(object):
+    """ model = Gridded_Model(grid,values)
+        multilinear interpolation on a tensor product grid,
+        linear extrapolation from the edge cells.  inputs with a single
+        grid point are held constant.  values of shape grid + trailing,
+        interpolate the trailing outputs together.
+    """
+
+    def __init__(self,grid,values):
+        self.grid   = [ np.array(x,dtype=float) for x in grid ]
+
+        grid_shape = tuple([ len(x) for x in self.grid ])
+        if np.shape(values)[:len(grid_shape)] != grid_shape:
+            values = np.reshape( values , grid_shape )
+        self.values = values
+
+    def __call__(self,*points):
+
+        points = np.broadcast_arrays( *[ np.asarray(x,dtype=float) for x in points ] )
+        shape  = points[0].shape
+
+        # cell and weight along each input
+        cells   = []
+        weights = []
+        for x,p in zip(self.grid,points):
+            p = np.ravel(p)
+            if len(x) == 1:
+                i = np.zeros(p.shape,dtype=int)
+                t = None
+            else:
+                i = np.clip( np.searchsorted(x,p) - 1 , 0 , len(x)-2 )
+                t = (p - x[i]) / (x[i+1] - x[i])
+            cells.append(i)
+            weights.append(t)
+
+        # sum over the corners of the cells
+        trailing = self.values.shape[len(self.grid):]
+        result = np.zeros( (points[0].size,) + trailing )
+        for corner in itertools.product([0,1],repeat=len(self.grid)):
+            w = 1.
+            index = []
+            for c,i,t in zip(corner,cells,weights):
+                if t is None:
+                    if c: break
+                    index.append(i)
+                else:
+                    w = w * ( t if c else 1.-t )
+                    index.append(i+c)
+            else:
+                w = np.reshape( w , np.shape(w) + (1,)*len(trailing) )
+                result += w * self.values[tuple(index)]
+
+        return np.reshape(result,shape+trailing)
+
+
+class Scattered_Model(object):
+    """ model = Scattered_Model(points,values)
+        radial basis function interpolation of scattered points,
+        inputs are scaled to a unit range first
+    """
+
+    def __init__(self,points,values):
+        points = [ np.array(x,dtype=float) for x in points ]
+
+        self.offset = [ np.min(x) for x in points ]
+        self.scale  = [ (np.max(x) - np.min(x)) or 1. for x in points ]
+
+        points = self.normalize(points)
+        self.model = scipy.interpolate.Rbf( *(points + [np.ravel(values)]) , function='linear' )
+
+    def normalize(self,points):
+        return [ (np.ravel(x)-o)/s for x,o,s in zip(points,self.offset,self.scale) ]
+
+    def __call__(self,*points):
+        points = np.broadcast_arrays( *[ np.asarray(x,dtype=float) for x in points ] )
+        shape  = points[0].shape
+        result = self.model( *self.normalize(points) )
+        return np.reshape(result,shape)
+
+
+# ----------------------------------------------------------------------
+#  Hashing
+# ----------------------------------------------------------------------
+
+def hash_data(value,h,memo=None):
+    """ hash_data(value,h)
+        updates the hashlib object h with a value, recursively through
+        Data, dicts, sequences and the attributes of other objects.
+        arrays are hashed by their contents, functions and classes by
+        their qualified names.  raises a TypeError for a value it cannot
+        see into
+    """
+
+    if memo is None:
+        memo = set()
+
+    if isinstance(value,(dict,list,tuple)):
+        # each container once, data trees may link back to themselves,
+        # also through the attributes of objects
+        if id(value) in memo:
+            h.update('<link>')
+            return
+        memo.add(id(value))
+
+    if isinstance(value,dict):
+        h.update('{')
+        keys = value.keys()
+        if not isinstance(value,Data):
+            keys = sorted(keys)
+        for k in keys:
+            hash_data(k,h,memo)
+            hash_data(value[k],h,memo)
+        h.update('}')
+    elif isinstance(value,(list,tuple)):
+        h.update('[')
+        for v in value:
+            hash_data(v,h,memo)
+        h.update(']')
+    elif isinstance(value,np.ndarray):
+        h.update(str(value.dtype) + str(value.shape))
+        h.update(np.ascontiguousarray(value).tostring())
+    elif isinstance(value,(basestring,bool,int,long,float,complex,np.number)) or value is None:
+        h.update(type(value).__name__ + repr(value))
+    elif isinstance(value,(types.FunctionType,types.BuiltinFunctionType,type,types.ClassType)):
+        h.update(qualified_name(value))
+    elif isinstance(value,np.ufunc):
+        h.update('numpy.' + value.__name__)
+    elif isinstance(value,types.MethodType):
+        # by what it runs, not by the object it is bound to
+        h.update(qualified_name(value.im_class) + '.' + value.__name__)
+    elif isinstance(value,types.ModuleType):
+        h.update(value.__name__)
+    elif hasattr(value,'__dict__'):
+        h.update(qualified_name(type(value)))
+        hash_data(vars(value),h,memo)
+    else:
+        raise TypeError , 'cannot hash a %s for a training key' % type(value).__name__
+
+    return
+
+
+def qualified_name(value):
+    """ the module and name of a function or class """
+    return '%s.%s' % (getattr(value,'__module__',None),value.__name__)
@@ -5,6 +5,8 @@ from Results   import Results
 from Process   import Process
 from Settings  import Settings
 
+import Parallel
+
 from Vehicle import Vehicle
      
 import Aerodynamics
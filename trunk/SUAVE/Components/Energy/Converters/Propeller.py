@@ -15,11 +15,16 @@ import numpy as np
 import scipy as sp
 from SUAVE.Core import Units
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
+from SUAVE.Methods.Utilities.complex_step import cs_arctan2
 from SUAVE.Core import (
 Data, Container, Data_Exception, Data_Warning,
 )
 from warnings import warn
 
+# the largest change of an inflow angle in a Newton step, a full step from
+# far off can jump past the solution near sonic tips
+maximum_inflow_angle_step = 0.2
+
 # ----------------------------------------------------------------------
 #  Propeller Class
 # ----------------------------------------------------------------------    
@@ -35,7 +40,13 @@ class Propeller(Energy_Component):
         self.prop_attributes.twist_distribution = 0.0
         self.prop_attributes.chord_distribution = 0.0
         
-    def spin(self,conditions):
+        # the inflow angle solve
+        self.tolerance          = 1e-5
+        self.maximum_iterations = 100
+        self.warm_start         = False
+        self.inflow_angle       = None
+        
+    def spin(self,conditions,inflow_angle=None):
         """ Analyzes a propeller given geometry and operating conditions
                  
                  Inputs:
@@ -48,20 +59,30 @@ class Propeller(Energy_Component):
                      chord distribution
                      twist distribution
                      airfoil data
+                     inflow_angle - optional, [control points,stations], the
+                                    start of the inflow angle solve
        
                  Outputs:
                      Power coefficient
                      Thrust coefficient
                      
+                     and in self.outputs, the number of Newton iterations,
+                     the number of station evaluations, and which control
+                     points converged
+                     
                  Assumptions:
                      Based on Qprop Theory document
+                     
+                     The inflow angle starts from that of the blade
+                     elements without induced velocities, or with
+                     warm_start on, from the solution of the last call with
+                     the same number of control points
        
            """
            
         #Unpack    
         B     = self.prop_attributes.number_blades
         R     = self.prop_attributes.tip_radius
-        Rh    = self.prop_attributes.hub_radius
         beta  = self.prop_attributes.twist_distribution
         c     = self.prop_attributes.chord_distribution
         omega = self.inputs.omega
@@ -72,112 +93,50 @@ class Propeller(Energy_Component):
         T     = conditions.freestream.temperature[:,0,None]
         
         nu    = mu/rho
-        tol   = 1e-5 # Convergence tolerance
+        tol   = self.tolerance # Convergence tolerance
            
         ######
         # Enter airfoil data in a better way, there is currently Re and Ma scaling from DAE51 data
         ######
 
         #Things that don't change with iteration
-        N       = len(c) #Number of stations
-        chi0    = Rh/R # Where the propeller blade actually starts
-        chi     = np.linspace(chi0,1,N+1) # Vector of nondimensional radii
-        chi     = chi[0:N]
-        lamda   = V/(omega*R)           # Speed ratio
-        r       = chi*R                 # Radial coordinate
-
-        x       = r*np.multiply(omega,1/V)             # Nondimensional distance
         n       = omega/(2.*np.pi)      # Cycles per second
-        J       = V/(2.*R*n)    
-    
-        sigma   = np.multiply(B*c,1./(2.*np.pi*r))   
+        
+        Ua, Ut, U, r = blade_element_inputs(self.prop_attributes,omega,V)
     
-        #I make the assumption that externally-induced velocity at the disk is zero
-        #This can be easily changed if needed in the future:
-        ua = 0.0
-        ut = 0.0
+        #Things that will change with iteration
         
-        omegar = np.outer(omega,r)
-        Ua = np.outer((V + ua),np.ones_like(r))
-        Ut = omegar - ut
-        U  = np.sqrt(Ua**2. + Ut**2.)
+        #Start from the given inflow angles, or the last solution at the same control points
+        psi = np.ones(Ua.shape,dtype=np.result_type(Ua,Ut,c,beta,nu,a,inflow_angle))
+        if not inflow_angle is None:
+            psi[:,:] = inflow_angle
+        elif self.warm_start and np.shape(self.inflow_angle) == psi.shape:
+            psi[:,:] = self.inflow_angle
+        else:
+            psi[:,:] = zero_induction_inflow_angle(Ua,Ut)
         
-        #Things that will change with iteration
+        #Newton iteration
+        psi, flow, iterations, evaluations, unconverged = solve_inflow_angle(psi,Ua,Ut,U,r,c,beta,nu,a,B,R,tol,self.maximum_iterations)
+        
+        if unconverged.size:
+            warn('Propeller inflow angle did not converge in %i iterations at %i control points.' % (iterations,unconverged.size), Warning)
+        
+        #The flow of the last iteration
+        Wa, Wt, W, Gamma, Cl, Re, Ma = flow
+        
+        if np.any(np.real(Ma)> 1.0):
+            warn('Propeller blade tips are supersonic.', Warning)
+        
+        # the warm start stays real, so a complex step does not leak into it
+        self.inflow_angle = np.real(psi)
+        
+        # diagnostics of the solve
+        self.outputs.iterations  = iterations
+        self.outputs.evaluations = evaluations
+        self.outputs.converged   = np.ones([psi.shape[0],1],dtype=bool)
+        self.outputs.converged[unconverged] = False
     
-        #Setup a Newton iteration
-        psi    = np.ones_like(c)
-        psiold = np.zeros_like(c)
-        diff   = np.ones_like(c)
-        
-        ii = 0
-        while (np.any(diff>tol)):
-            Wa    = 0.5*Ua + 0.5*U*np.sin(psi)
-            Wt    = 0.5*Ut + 0.5*U*np.cos(psi)           
-            #va    = Wa - Ua
-            vt    = Ut - Wt
-            alpha = beta - np.arctan2(Wa,Wt)
-            W     = np.sqrt(Wa**2. + Wt**2.)
-            Re    = (W*c)/nu
-            Ma    = (W)/a #a is the speed of sound
-            
-            if np.any(Ma> 1.0):
-                warn('Propeller blade tips are supersonic.', Warning)
-            
-            lamdaw = r*Wa/(R*Wt)
-            f      = (B/2.)*(1.-r/R)/lamdaw
-            piece  = np.exp(-f)
-            piece[piece>1] = 1.0
-            F      = 2.*np.arccos(piece)/np.pi
-            Gamma  = vt*(4.*np.pi*r/B)*F*np.sqrt(1.+(4.*lamdaw*R/(np.pi*B*r))**2.)
-            
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Clvals = 2.*np.pi*alpha
-            
-            Cl     = np.zeros_like(Clvals)
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Clvals[Ma[:,:]<1.]/(np.sqrt(1-Ma[Ma[:,:]<1.]**2)+((Ma[Ma[:,:]<1.]**2)/(1+np.sqrt(1-Ma[Ma[:,:]<1.]**2)))*Clvals[Ma<1.]/2)
-            
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Clvals[Ma[:,:]>=1.] 
-            
-            Rsquiggly = Gamma - 0.5*W*c*Cl   
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            dR_dpsi = ((4.*U*r*np.arccos(piece)*np.sin(psi)*((16.*(Ua + U*np.sin(psi))**2.)/(B**2.*np.pi**2.*(2*Wt)**2.) + 
-                      1.)**(0.5))/B - (np.pi*U*(Ua*np.cos(psi) - Ut*np.sin(psi))*(beta - np.arctan((2*Wa)/(2*Wt))))/(2.*((2*Wt)**2. +
-                      (2*Wa)**2.)**(0.5)) + (np.pi*U*((2*Wt)**2. +(2*Wa)**2.)**(0.5)*(U + Ut*np.cos(psi) + 
-                      Ua*np.sin(psi)))/(2.*((2*Wa)**2./(2*Wt)**2. + 1.)*(Ut + U*np.cos(psi))**2.) - (4.*U*piece*((16.*(Ua +
-                      U*np.sin(psi))**2.)/(B**2.*np.pi**2.*(2*Wt)**2.) + 1.)**(0.5)*(R - r)*(Ut/2. - (U*np.cos(psi))/2.)*(U + 
-                      Ut*np.cos(psi) + Ua*np.sin(psi)))/((2*Wa)**2.*(1. - np.exp(-(B*(2*Wt)*(R - r))/(r*(Ua + U*np.sin(psi)))))**(0.5)) + 
-                      (128.*U*r*np.arccos(piece)*(Ua + U*np.sin(psi))*(Ut/2. - (U*np.cos(psi))/2.)*(U + Ut*np.cos(psi) + 
-                      Ua*np.sin(psi)))/(B**3.*np.pi**2.*(Ut + U*np.cos(psi))**3.*((16.*(2*Wa)**2.)/(B**2.*np.pi**2.*(2*Wt)**2.) + 1.)**(0.5))) 
-                      
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = abs(psiold-psi)
-            psiold = psi
-            
-            ii += 1
-            #if ii>100:
-                #break
-    
-        #This is an atrocious fit of DAE51 data at RE=50k for Cd
-        #There is also RE scaling
-        Cdval = (0.108*(Cl**4)-0.2612*(Cl**3)+0.181*(Cl**2)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
-        
-        #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
-        Tw_Tinf = 1. + 1.78*(Ma**2)
-        Tp_Tinf = 1. + 0.035*(Ma**2) + 0.45*(Tw_Tinf-1.)
-        Tp      = (Tp_Tinf)*T
-        Rp_Rinf = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
-        
-        Cd = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
-        
-        epsilon  = Cd/Cl
-        deltar   = (r[1]-r[0])
-        thrust   = rho*B*(np.sum(Gamma*(Wt-epsilon*Wa)*deltar,axis=1)[:,None])
-        torque   = rho*B*np.sum(Gamma*(Wa+epsilon*Wt)*r*deltar,axis=1)[:,None]
+        thrust, torque = blade_element_loads(Wa,Wt,Gamma,Cl,Re,Ma,r,rho,T,B)
         power    = torque*omega       
        
         D        = 2*R
@@ -191,4 +150,229 @@ class Propeller(Energy_Component):
         conditions.propulsion.etap = etap
         
         return thrust, torque, power, Cp
-    
\ No newline at end of file
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def solve_inflow_angle(psi,Ua,Ut,U,r,c,beta,nu,a,B,R,tol,maximum_iterations):
+    """ psi, flow, iterations, evaluations, unconverged = solve_inflow_angle(psi,Ua,Ut,U,r,c,beta,nu,a,B,R,tol,maximum_iterations)
+        Newton iteration for the inflow angles of the stations, a row per
+        control point, from the initial guess psi, with the exact
+        derivative of circulation_residual_derivative() and steps limited
+        to maximum_inflow_angle_step, until no station moves by more than
+        tol
+        
+        Outputs:
+            psi         - [control points,stations], the inflow angles of the
+                          last residual evaluation
+            flow        - Wa, Wt, W, Gamma, Cl, Re, Ma at psi, see
+                          blade_element_flow()
+            iterations  - the number of iterations
+            evaluations - the number of station residual evaluations
+            unconverged - the control points still moving after
+                          maximum_iterations
+    """
+    
+    iterations = 0
+    moving     = np.ones(1,dtype=bool)
+    
+    while np.any(moving) and iterations < maximum_iterations:
+        
+        flow = blade_element_flow(psi,Ua,Ut,U,r,c,beta,nu,a,B,R)
+        Wa, Wt, W, Gamma, Cl, Re, Ma = flow
+        
+        Rsquiggly = Gamma - 0.5*W*c*Cl
+        dR_dpsi   = circulation_residual_derivative(psi,Ua,Ut,U,r,c,beta,a,B,R)
+        
+        dpsi = limit_inflow_angle_step(-Rsquiggly/dR_dpsi)
+        
+        # the flow is of psi, before the step
+        psi_last = psi
+        psi      = psi + dpsi
+        
+        iterations += 1
+        moving = np.any(np.abs(dpsi) > tol,axis=1)
+    
+    evaluations = iterations*psi.size
+    
+    return psi_last, flow, iterations, evaluations, np.nonzero(moving)[0]
+
+
+def limit_inflow_angle_step(dpsi):
+    """ dpsi limited to maximum_inflow_angle_step, a limited step of a
+        complex step evaluation is a constant
+    """
+    
+    dpsi    = np.array(dpsi)
+    limited = np.abs(np.real(dpsi)) > maximum_inflow_angle_step
+    dpsi[limited] = np.sign(np.real(dpsi[limited]))*maximum_inflow_angle_step
+    
+    return dpsi
+
+
+def zero_induction_inflow_angle(Ua,Ut):
+    """ the inflow angles of the blade elements without induced velocities,
+        the start of the Newton iteration.  the circulation residual
+        has no poles between them and the solution, which it can have
+        near sonic tips between psi = 1 and the solution.  at least 0.05,
+        without a freestream the elements have no axial velocity
+    """
+    
+    return np.maximum(np.arctan2(np.real(Ua),np.real(Ut)),0.05)
+
+
+def blade_element_inputs(prop_attributes,omega,V):
+    """ Ua, Ut, U, r = blade_element_inputs(prop_attributes,omega,V)
+        the axial, tangential and total velocities of the stations, a
+        row per control point, and the radii of the stations
+    """
+    
+    R     = prop_attributes.tip_radius
+    Rh    = prop_attributes.hub_radius
+    N     = len(prop_attributes.chord_distribution) #Number of stations
+    
+    chi0    = Rh/R # Where the propeller blade actually starts
+    chi     = np.linspace(chi0,1,N+1) # Vector of nondimensional radii
+    chi     = chi[0:N]
+    r       = chi*R                 # Radial coordinate
+    
+    #I make the assumption that externally-induced velocity at the disk is zero
+    #This can be easily changed if needed in the future:
+    ua = 0.0
+    ut = 0.0
+    
+    omegar = np.outer(omega,r)
+    Ua = np.outer((V + ua),np.ones_like(r))
+    Ut = omegar - ut
+    U  = np.sqrt(Ua**2. + Ut**2.)
+    
+    return Ua, Ut, U, r
+
+
+def blade_element_flow(psi,Ua,Ut,U,r,c,beta,nu,a,B,R):
+    """ Wa, Wt, W, Gamma, Cl, Re, Ma = blade_element_flow(psi,Ua,Ut,U,r,c,beta,nu,a,B,R)
+        the velocities, circulation and lift of the blade elements at
+        the inflow angles psi, the inputs broadcast together
+    """
+    
+    Wa    = 0.5*Ua + 0.5*U*np.sin(psi)
+    Wt    = 0.5*Ut + 0.5*U*np.cos(psi)           
+    #va    = Wa - Ua
+    vt    = Ut - Wt
+    alpha = beta - cs_arctan2(Wa,Wt)
+    W     = np.sqrt(Wa**2. + Wt**2.)
+    Re    = (W*c)/nu
+    Ma    = (W)/a #a is the speed of sound
+    
+    lamdaw = r*Wa/(R*Wt)
+    f      = (B/2.)*(1.-r/R)/lamdaw
+    piece  = np.exp(-f)
+    piece[np.real(piece)>1] = 1.0
+    F      = 2.*np.arccos(piece)/np.pi
+    Gamma  = vt*(4.*np.pi*r/B)*F*np.sqrt(1.+(4.*lamdaw*R/(np.pi*B*r))**2.)
+    
+    # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
+    Clvals = 2.*np.pi*alpha
+    
+    # Scale for Mach, this is Karmen_Tsien
+    Cl = Clvals.copy()
+    subsonic = np.real(Ma) < 1.
+    Ms = Ma[subsonic]
+    Cl[subsonic] = Clvals[subsonic]/(np.sqrt(1-Ms**2)+((Ms**2)/(1+np.sqrt(1-Ms**2)))*Clvals[subsonic]/2)
+    
+    # If the blade segments are supersonic, don't scale
+    
+    return Wa, Wt, W, Gamma, Cl, Re, Ma
+
+
+def circulation_residual_derivative(psi,Ua,Ut,U,r,c,beta,a,B,R):
+    """ the exact derivative of the circulation residual of
+        blade_element_flow(), Gamma - 0.5*W*c*Cl, with respect to psi,
+        by the chain rule through the same steps
+    """
+    
+    sin = np.sin(psi)
+    cos = np.cos(psi)
+    
+    Wa    = 0.5*Ua + 0.5*U*sin
+    Wt    = 0.5*Ut + 0.5*U*cos
+    dWa   = 0.5*U*cos
+    dWt   = -0.5*U*sin
+    vt    = Ut - Wt
+    dvt   = -dWt
+    W2    = Wa**2. + Wt**2.
+    W     = np.sqrt(W2)
+    dW    = (Wa*dWa + Wt*dWt)/W
+    alpha = beta - cs_arctan2(Wa,Wt)
+    dalpha = -(Wt*dWa - Wa*dWt)/W2
+    Ma    = W/a
+    dMa   = dW/a
+    
+    # the tip loss
+    lamdaw  = r*Wa/(R*Wt)
+    dlamdaw = r*(dWa*Wt - Wa*dWt)/(R*Wt**2.)
+    f       = (B/2.)*(1.-r/R)/lamdaw
+    df      = -f*dlamdaw/lamdaw
+    piece   = np.exp(-f)
+    dpiece  = -piece*df
+    clamped = np.real(piece) >= 1.
+    piece[clamped]  = 0.0
+    dpiece[clamped] = 0.0
+    F       = 2.*np.arccos(piece)/np.pi
+    dF      = -2.*dpiece/(np.pi*np.sqrt(1.-piece**2.))
+    F[clamped] = 0.0
+    
+    k      = 4.*R/(np.pi*B*r)
+    S      = np.sqrt(1.+(k*lamdaw)**2.)
+    dS     = k**2.*lamdaw*dlamdaw/S
+    
+    dGamma = (4.*np.pi*r/B)*(dvt*F*S + vt*dF*S + vt*F*dS)
+    
+    # the lift, with the Karman-Tsien scaling below sonic speed
+    Clvals  = 2.*np.pi*alpha
+    dClvals = 2.*np.pi*dalpha
+    
+    Cl  = Clvals.copy()
+    dCl = dClvals.copy()
+    
+    subsonic = np.real(Ma) < 1.
+    M   = Ma[subsonic]
+    dM  = dMa[subsonic]
+    C   = Clvals[subsonic]
+    dC  = dClvals[subsonic]
+    s   = np.sqrt(1-M**2)
+    ds  = -M*dM/s
+    D   = s + (M**2/(1+s))*C/2
+    dD  = ds + ((2.*M*dM*(1+s) - M**2*ds)/(1+s)**2)*C/2 + (M**2/(1+s))*dC/2
+    Cl[subsonic]  = C/D
+    dCl[subsonic] = (dC*D - C*dD)/D**2
+    
+    return dGamma - 0.5*c*(dW*Cl + W*dCl)
+
+
+def blade_element_loads(Wa,Wt,Gamma,Cl,Re,Ma,r,rho,T,B):
+    """ thrust, torque = blade_element_loads(Wa,Wt,Gamma,Cl,Re,Ma,r,rho,T,B)
+        the thrust and torque of the blades, [control points,1], from the
+        flow of blade_element_flow()
+    """
+    
+    #This is an atrocious fit of DAE51 data at RE=50k for Cd
+    #There is also RE scaling
+    Cdval = (0.108*(Cl**4)-0.2612*(Cl**3)+0.181*(Cl**2)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+    
+    #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
+    Tw_Tinf = 1. + 1.78*(Ma**2)
+    Tp_Tinf = 1. + 0.035*(Ma**2) + 0.45*(Tw_Tinf-1.)
+    Tp      = (Tp_Tinf)*T
+    Rp_Rinf = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
+    
+    Cd = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
+    
+    epsilon  = Cd/Cl
+    deltar   = (r[1]-r[0])
+    thrust   = rho*B*(np.sum(Gamma*(Wt-epsilon*Wa)*deltar,axis=1)[:,None])
+    torque   = rho*B*np.sum(Gamma*(Wa+epsilon*Wt)*r*deltar,axis=1)[:,None]
+    
+    return thrust, torque
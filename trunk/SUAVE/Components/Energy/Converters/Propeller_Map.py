@@ -0,0 +1,178 @@
+#Propeller_Map.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# suave imports
+import SUAVE
+
+# package imports
+import numpy as np
+import os
+from SUAVE.Components.Energy.Energy_Component import Energy_Component
+from SUAVE.Methods.Propulsion.propeller_map import propeller_map, save_propeller_map, \
+     load_propeller_map, propeller_geometry_hash
+from SUAVE.Methods.Utilities.gridded_table import gridded_surrogate
+from SUAVE.Core import (
+Data, Container, Data_Exception, Data_Warning,
+)
+
+# ----------------------------------------------------------------------
+#  Propeller Map Class
+# ----------------------------------------------------------------------
+
+class Propeller_Map(Energy_Component):
+    """ SUAVE.Components.Energy.Converters.Propeller_Map
+        a propeller evaluated from a map of its thrust and power
+        coefficients, by multilinear interpolation in advance ratio, tip
+        mach number and Reynolds number, instead of a blade element
+        analysis at every evaluation.  takes the place of a Propeller in
+        a network, with the same inputs and outputs of spin().
+
+        build() makes the map from prop_attributes, see
+        Methods.Propulsion.propeller_map.  with map_file set, the map is
+        saved there, and a later build() of the same geometry and grid
+        memory maps it back instead.
+    """
+
+    def __defaults__(self):
+
+        self.prop_attributes = Data()
+        self.prop_attributes.number_blades      = 0.0
+        self.prop_attributes.tip_radius         = 0.0
+        self.prop_attributes.hub_radius         = 0.0
+        self.prop_attributes.twist_distribution = 0.0
+        self.prop_attributes.chord_distribution = 0.0
+
+        # the grid of the map, the coefficients are linear in Re^-0.2
+        self.map = Data()
+        self.map.advance_ratio   = np.linspace(0.,1.,21)
+        self.map.tip_mach_number = np.linspace(0.1,1.0,19)
+        self.map.reynolds_number = np.array([1e5,1e7])
+        self.map.temperature     = 288.15
+        self.map.table           = None
+
+        # a .npy file to keep the map in
+        self.map_file = None
+
+        self.surrogate = None
+
+
+    def build(self):
+        """ Propeller_Map.build()
+            spins the propeller over the grid of the map.  with map_file
+            set, loads the map from it if it was made for the same
+            geometry on the same grid, otherwise saves the new one there
+        """
+
+        grid = self.map
+
+        if not self.map_file is None and os.path.exists(self.map_file):
+            prop_map = load_propeller_map(self.map_file)
+            if prop_map.geometry_hash == propeller_geometry_hash(self.prop_attributes) \
+               and same_grid(prop_map,grid):
+                self.map = prop_map
+                self.surrogate = None
+                return
+
+        prop_map = propeller_map(self.prop_attributes,grid.advance_ratio,grid.tip_mach_number,
+                                 grid.reynolds_number,grid.temperature)
+
+        if self.map_file is None:
+            self.map = prop_map
+            self.surrogate = None
+        else:
+            save_propeller_map(prop_map,self.map_file)
+            self.load()
+
+        return
+
+
+    def load(self,filename=None):
+        """ Propeller_Map.load(filename=None)
+            memory maps a map saved by build(), from map_file by default,
+            and checks it was made for prop_attributes
+        """
+
+        if not filename is None:
+            self.map_file = filename
+
+        self.map = load_propeller_map(self.map_file,self.prop_attributes)
+        self.surrogate = None
+
+        return
+
+
+    def spin(self,conditions):
+        """ Propeller_Map.spin(conditions)
+            the propeller outputs at the rotation rate inputs.omega,
+            interpolated from the map, see Propeller.spin()
+
+            Outputs:
+                thrust, torque, power - [N,1]
+                Cp                    - [N,1], power coefficient
+                conditions.propulsion.etap
+        """
+
+        R     = self.prop_attributes.tip_radius
+        omega = self.inputs.omega
+        rho   = conditions.freestream.density[:,0,None]
+        mu    = conditions.freestream.dynamic_viscosity[:,0,None]
+        V     = conditions.freestream.velocity[:,0,None]
+        a     = conditions.freestream.speed_of_sound[:,0,None]
+
+        n = omega/(2.*np.pi)
+        D = 2.*R
+
+        J  = V/(n*D)
+        Mt = omega*R/a
+        Re = rho*omega*R*R/mu
+
+        values = self.interpolate(J,Mt,Re)
+        CT = values[...,0]
+        Cp = values[...,1]
+
+        thrust = CT*rho*(n**2)*(D**4)
+        power  = Cp*rho*(n**3)*(D**5)
+        torque = power/omega
+
+        thrust[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
+        power[conditions.propulsion.throttle[:,0]  <=0.0]  = 0.0
+
+        etap     = V*thrust/(power)
+
+        conditions.propulsion.etap = etap
+
+        return thrust, torque, power, Cp
+
+
+    def interpolate(self,advance_ratio,tip_mach_number,reynolds_number):
+        """ values = Propeller_Map.interpolate(advance_ratio,tip_mach_number,reynolds_number)
+            the map outputs at the broadcast shape of the inputs, with
+            the outputs in a trailing dimension, see propeller_map()
+        """
+
+        # interpolated in -Re^-0.2, increasing, in which the coefficients are linear
+        prop_map = self.map
+        model = gridded_surrogate(self,[prop_map.advance_ratio,prop_map.tip_mach_number,
+                                        -prop_map.reynolds_number**-0.2],prop_map.table)
+
+        return model(advance_ratio,tip_mach_number,-np.asarray(reynolds_number,dtype=float)**-0.2)
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def same_grid(prop_map,grid):
+    """ True if a map is on the grid and at the temperature of another """
+
+    for key in ['advance_ratio','tip_mach_number','reynolds_number']:
+        if np.shape(prop_map[key]) != np.shape(grid[key]) or np.any(prop_map[key] != grid[key]):
+            return False
+
+    return prop_map.temperature == grid.temperature
@@ -10,6 +10,7 @@ from Motor import Motor
 from Motor_Lo_Fid import Motor_Lo_Fid
 from Propeller import Propeller
 from Propeller_Lo_Fid import Propeller_Lo_Fid
+from Propeller_Map import Propeller_Map
 from Ram import Ram
 from Solar_Panel import Solar_Panel
 from Turbine import Turbine
\ No newline at end of file
@@ -12,6 +12,9 @@ from SUAVE.Components import Physical_Component
 # ----------------------------------------------------------------------
 
 class Energy_Component(Physical_Component):
+    
+    _cache_defaults = True
+    
     def __defaults__(self):
         
         # function handles for input
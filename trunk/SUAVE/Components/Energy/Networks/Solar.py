@@ -17,6 +17,7 @@ import datetime
 import time
 from SUAVE.Core import Units
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
+from SUAVE.Methods.Propulsion.motor_propeller_operating_point import motor_propeller_operating_point
 
 from SUAVE.Core import (
 Data, Container, Data_Exception, Data_Warning,
@@ -76,26 +77,11 @@ class Solar(Propulsor):
         esc.voltageout(conditions)
         # link
         motor.inputs.voltage = esc.outputs.voltageout 
-        # step 5
-        motor.omega(conditions)
-        # link
-        propeller.inputs.omega =  motor.outputs.omega
-        # step 6
-        F, Q, P, Cplast = propeller.spin(conditions)
-       
-        # iterate the Cp here
-        diff = abs(Cplast-motor.propeller_Cp)
-        tol = 1e-6
-        ii = 0 
-        while (np.any(diff>tol)):
-            motor.propeller_Cp  = Cplast #Change the Cp
-            motor.omega(conditions) #Rerun the motor
-            propeller.inputs.omega =  motor.outputs.omega #Relink the motor
-            F, Q, P, Cplast = propeller.spin(conditions) #Run the motor again
-            diff = abs(Cplast-motor.propeller_Cp) #Check to see if it converged
-            ii += 1
-            #if ii>100:
-                #break            
+        # step 5 and 6, the motor and propeller together
+        F, Q, P, Cplast, iterations = motor_propeller_operating_point(motor,propeller,conditions)
+        
+        # the warm start for the next call stays real, so a complex step does not leak into it
+        motor.propeller_Cp = np.real(motor.propeller_Cp)
         
             
         # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
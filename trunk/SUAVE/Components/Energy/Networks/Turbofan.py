@@ -27,6 +27,7 @@ from SUAVE.Core import Data, Data_Exception, Data_Warning
 from SUAVE.Components import Component, Physical_Component, Lofted_Body
 from SUAVE.Components import Component_Exception
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
+from SUAVE.Methods.Propulsion.compiled_turbofan import compile_turbofan
 
 
 # ----------------------------------------------------------------------
@@ -42,10 +43,28 @@ class Turbofan(Propulsor):
         self.number_of_engines = 1.0
         self.nacelle_diameter  = 1.0
         self.engine_length     = 1.0
+        
+        # evaluate through the compiled component chain, see finalize()
+        self.compiled = False
+        self.chain    = None
     
     _component_root_map = None
         
     
+    def finalize(self):
+        """ compiles the component chain, if compiled is set, see
+            Methods.Propulsion.compiled_turbofan.  finalize again after
+            changing the components.
+        """
+        
+        if self.compiled:
+            self.chain = compile_turbofan(self)
+        else:
+            self.chain = None
+        
+        return
+        
+    
     # linking the different network components
     def evaluate_thrust(self,state):
 
@@ -55,6 +74,9 @@ class Turbofan(Propulsor):
         conditions = state.conditions
         numerics   = state.numerics
         
+        if self.compiled:
+            return self.evaluate_compiled(conditions)
+        
         ram                       = self.ram
         inlet_nozzle              = self.inlet_nozzle
         low_pressure_compressor   = self.low_pressure_compressor
@@ -206,13 +228,32 @@ class Turbofan(Propulsor):
         mdot         = thrust.outputs.fuel_flow_rate
         Isp          = thrust.outputs.specific_impulse
         output_power = thrust.outputs.power
-        F_vec        = conditions.ones_row(3) * 0.0
-        F_vec[:,0]   = F[:,0]
-        F            = F_vec
 
         results = Data()
         results.thrust_force_vector = F
         results.vehicle_mass_rate   = mdot
+        results.core_mass_flow_rate = thrust.outputs.core_mass_flow_rate
+        results.specific_impulse    = Isp
+        
+        return results
+    
+    
+    def evaluate_compiled(self,conditions):
+        """ results = Turbofan.evaluate_compiled(conditions)
+            same as evaluate_thrust(), through the compiled chain,
+            the component outputs are not updated
+        """
+        
+        if self.chain is None:
+            self.finalize()
+        
+        thrust, mdot, mdot_core, Isp = self.chain.evaluate(conditions)
+        
+        results = Data()
+        results.thrust_force_vector = thrust*[1,0,0]
+        results.vehicle_mass_rate   = mdot
+        results.core_mass_flow_rate = mdot_core
+        results.specific_impulse    = Isp
         
         return results
     
@@ -225,6 +266,16 @@ class Turbofan(Propulsor):
         conditions = state.conditions
         numerics   = state.numerics        
         
+        if self.compiled:
+            if self.chain is None:
+                self.finalize()
+            thrust = self.thrust
+            thrust.mass_flow_rate_design, thrust.compressor_nondimensional_massflow = \
+                self.chain.size(conditions,thrust.design_thrust)
+            # the chain holds the massflow
+            self.finalize()
+            return
+        
         ram                       = self.ram
         inlet_nozzle              = self.inlet_nozzle
         low_pressure_compressor   = self.low_pressure_compressor
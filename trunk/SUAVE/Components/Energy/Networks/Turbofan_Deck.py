@@ -0,0 +1,150 @@
+#Turbofan_Deck.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# suave imports
+import SUAVE
+
+# package imports
+import numpy as np
+from SUAVE.Core import Units
+
+from SUAVE.Core import Data
+from SUAVE.Components.Propulsors.Propulsor import Propulsor
+from SUAVE.Methods.Propulsion.engine_deck import engine_deck, save_engine_deck, load_engine_deck
+from SUAVE.Methods.Utilities.gridded_table import gridded_surrogate
+
+
+# ----------------------------------------------------------------------
+#  Turbofan Deck Network
+# ----------------------------------------------------------------------
+
+class Turbofan_Deck(Propulsor):
+    """ SUAVE.Components.Energy.Networks.Turbofan_Deck
+        a turbofan evaluated from an engine deck, by multilinear
+        interpolation in mach number, altitude and throttle, instead of
+        a cycle analysis at every evaluation.
+
+        build() makes the deck from a gas turbine network, such as
+        Networks.Turbofan, see Methods.Propulsion.engine_deck.  with
+        deck_file set, the deck is also saved there, and load() memory
+        maps it back in a later run.
+
+        the deck is made in the standard atmosphere, missions in another
+        atmosphere should set Turbofan_Deck.atmosphere before build().
+    """
+
+    def __defaults__(self):
+
+        #setting the default values
+        self.tag = 'Turbo_Fan_Deck'
+        self.number_of_engines = 1.0
+        self.nacelle_diameter  = 1.0
+        self.engine_length     = 1.0
+
+        # the grid of the deck, with a point at the tropopause
+        self.deck = Data()
+        self.deck.mach_number = np.linspace(0.05,0.95,19)
+        self.deck.altitude    = np.linspace(0.,14.,15) * Units.km
+        self.deck.throttle    = np.linspace(0.,1.,5)
+        self.deck.table       = None
+
+        # the atmosphere of the deck, and a .npy file to keep it in
+        self.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+        self.deck_file  = None
+
+        self.surrogate = None
+
+    _component_root_map = None
+
+
+    def build(self,network):
+        """ Turbofan_Deck.build(network)
+            tabulates a sized gas turbine network on the deck grid, and
+            takes its geometry for the aerodynamics.  saves the deck to
+            deck_file if it is set.
+        """
+
+        deck = engine_deck(network,self.deck.mach_number,self.deck.altitude,self.deck.throttle,self.atmosphere)
+
+        self.number_of_engines = network.number_of_engines
+        self.nacelle_diameter  = network.nacelle_diameter
+        self.engine_length     = network.engine_length
+
+        if self.deck_file is None:
+            self.deck = deck
+            self.surrogate = None
+        else:
+            save_engine_deck(deck,self.deck_file)
+            self.load()
+
+        return
+
+
+    def load(self,filename=None):
+        """ Turbofan_Deck.load(filename=None)
+            memory maps a deck saved by build(), from deck_file by default.
+            the file holds the performance only, the engine geometry is
+            set as for any other propulsor
+        """
+
+        if not filename is None:
+            self.deck_file = filename
+
+        self.deck = load_engine_deck(self.deck_file)
+        self.surrogate = None
+
+        return
+
+
+    def evaluate_thrust(self,state):
+        """ results = Turbofan_Deck.evaluate_thrust(state)
+            the network outputs, interpolated from the deck at
+            freestream.mach_number, freestream.altitude and
+            propulsion.throttle
+
+            Outputs:
+                results.thrust_force_vector - [N,3], body frame, N
+                results.vehicle_mass_rate   - [N,1], kg/s
+                results.core_mass_flow_rate - [N,1], of one engine, kg/s
+                results.specific_impulse    - [N,1], s
+        """
+
+        conditions = state.conditions
+
+        mach     = conditions.freestream.mach_number
+        altitude = conditions.freestream.altitude
+        throttle = conditions.propulsion.throttle
+
+        # all outputs at once, in the last dimension
+        values = self.interpolate(mach,altitude,throttle)
+
+        F = values[...,0] * [1,0,0]
+
+        results = Data()
+        results.thrust_force_vector = F
+        results.vehicle_mass_rate   = values[...,1]
+        results.core_mass_flow_rate = values[...,2]
+        results.specific_impulse    = values[...,3]
+
+        return results
+
+
+    def interpolate(self,mach,altitude,throttle):
+        """ values = Turbofan_Deck.interpolate(mach,altitude,throttle)
+            the deck outputs at the broadcast shape of the inputs, with
+            the outputs in a trailing dimension, see engine_deck()
+        """
+
+        deck  = self.deck
+        model = gridded_surrogate(self,[deck.mach_number,deck.altitude,deck.throttle],deck.table)
+
+        return model(mach,altitude,throttle)
+
+
+    __call__ = evaluate_thrust
@@ -3,4 +3,5 @@
 from Solar import Solar
 from Battery_Ducted_Fan import Battery_Ducted_Fan 
 from Turbofan import Turbofan
-from Solar_Low_Fidelity import Solar_Low_Fidelity
\ No newline at end of file
+from Solar_Low_Fidelity import Solar_Low_Fidelity
+from Turbofan_Deck import Turbofan_Deck
\ No newline at end of file
@@ -37,6 +37,11 @@ class Container(Physical_Component.Container):
             
         return results
 
+    def finalize(self):
+        for propulsor in self.values():
+            if hasattr(propulsor,'finalize'):
+                propulsor.finalize()
+
 # ----------------------------------------------------------------------
 #  Handle Linking
 # ----------------------------------------------------------------------
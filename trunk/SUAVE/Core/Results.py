@@ -2,4 +2,5 @@
 from Data import Data
 
 class Results(Data):
-    pass
\ No newline at end of file
+    
+    _cache_defaults = True
\ No newline at end of file
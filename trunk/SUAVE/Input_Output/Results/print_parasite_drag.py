@@ -87,14 +87,18 @@ def print_parasite_drag(ref_condition,vehicle,analyses,filename = 'parasite_drag
 ##    parasite_drag_aircraft(state,settings,vehicle)
     
     compute = analyses.configs.cruise.aerodynamics.process.compute.drag
-    for wing in vehicle.wings:
-        compute.parasite.wings.wing(state,settings,wing)
+    if compute.parasite.has_key('components'):
+        compute.parasite.components(state,settings,vehicle)
     
-    for fuselage in vehicle.fuselages:
-        compute.parasite.fuselages.fuselage(state,settings,fuselage)    
+    else:
+        for wing in vehicle.wings:
+            compute.parasite.wings.wing(state,settings,wing)
         
-    for propulsor in vehicle.propulsors:
-        compute.parasite.propulsors.propulsor(state,settings,propulsor) 
+        for fuselage in vehicle.fuselages:
+            compute.parasite.fuselages.fuselage(state,settings,fuselage)    
+            
+        for propulsor in vehicle.propulsors:
+            compute.parasite.propulsors.propulsor(state,settings,propulsor) 
       
     compute.parasite.pylons(state,settings,vehicle) 
     compute.miscellaneous(state,settings,vehicle)
@@ -19,8 +19,11 @@ class Settings(Data):
 		self.filenames = Data()
 		self.flow_symmetry = Data()
 		self.discretization = Data()
+		self.cache = Data()
 		
 		self.num_control_surfaces = 0
+		self.number_of_workers    = 1 # avl processes run at once, see Methods.Aerodynamics.AVL.run_analysis.run_workers
+		self.worker_timeout       = None # seconds to wait for the avl workers before they are stopped, None to wait until they finish
 		
 		self.discretization.defaults = Data()
 		self.discretization.surfaces = Data()
@@ -40,6 +43,10 @@ class Settings(Data):
 		self.filenames.case_template   = 'case_{0:03d}_{1:02d}'
 		self.filenames.log_filename    = 'avl_log.txt'
 		self.filenames.err_filename    = 'avl_err.txt'
+		self.filenames.worker_template = 'worker_{0:02d}'
+		
+		self.cache.folder       = None # folder for the results cache, or None for no cache. keep it outside of the run folder, see Methods.Aerodynamics.AVL.results_cache
+		self.cache.maximum_size = 1e7  # bytes, least recently used results are purged past this
 		
 		#------------------------------------------
 		# 1:  Symmetry about the plane
@@ -0,0 +1,135 @@
+# results_cache.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import numpy as np
+
+from .Data.Results    import Results
+from write_run_cases  import make_case_text
+from purge_files      import purge_files
+
+# the results kept for each case, in this order
+fields = [ 'aerodynamics.roll_moment_coefficient'                ,
+           'aerodynamics.pitch_moment_coefficient'               ,
+           'aerodynamics.yaw_moment_coefficient'                 ,
+           'aerodynamics.total_lift_coefficient'                 ,
+           'aerodynamics.induced_drag_coefficient'               ,
+           'aerodynamics.span_efficiency_factor'                 ,
+           'stability.alpha_derivatives.lift_curve_slope'        ,
+           'stability.alpha_derivatives.side_force_derivative'   ,
+           'stability.alpha_derivatives.roll_moment_derivative'  ,
+           'stability.alpha_derivatives.pitch_moment_derivative' ,
+           'stability.alpha_derivatives.yaw_moment_derivative'   ,
+           'stability.beta_derivatives.lift_coefficient_derivative',
+           'stability.beta_derivatives.side_force_derivative'    ,
+           'stability.beta_derivatives.roll_moment_derivative'   ,
+           'stability.beta_derivatives.pitch_moment_derivative'  ,
+           'stability.beta_derivatives.yaw_moment_derivative'    ,
+           'stability.neutral_point'                             ]
+
+
+# ----------------------------------------------------------------------
+#  Case Keys
+# ----------------------------------------------------------------------
+
+def case_keys(avl_object):
+    """ keys = case_keys(avl_object)
+        one key for each of the current cases, the sha1 of the geometry
+        file and of the case's run case text, without its index and tag
+
+        Assumptions:
+            called from the run folder, after write_geometry()
+    """
+
+    with open(avl_object.settings.filenames.features,'r') as geometry_file:
+        geometry = geometry_file.read()
+
+    keys = []
+    for case in avl_object.current_status.cases:
+        case = case.clone()
+        case.index = 0
+        case.tag   = ''
+
+        h = hashlib.sha1(geometry)
+        h.update( make_case_text(avl_object,case) )
+        keys.append( h.hexdigest() )
+
+    return keys
+
+
+# ----------------------------------------------------------------------
+#  Load and Save
+# ----------------------------------------------------------------------
+
+def load_result(folder,key):
+    """ case_res = load_result(folder,key)
+        the cached results of a case, or None
+    """
+
+    filename = os.path.join(folder,key+'.bin')
+    if not os.path.exists(filename):
+        return None
+
+    values = np.fromfile(filename,dtype=np.float64)
+    if len(values) != len(fields):
+        return None
+
+    # most recently used
+    os.utime(filename,None)
+
+    case_res = Results()
+    for field,value in zip(fields,values):
+        path,name = field.rsplit('.',1)
+        case_res.deep_get(path)[name] = float(value)
+
+    return case_res
+
+
+def save_result(folder,key,case_res):
+    """ save_result(folder,key,case_res)
+        keeps the results of a case as raw float64 values
+    """
+
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+    values = np.array([ case_res.deep_get(field) for field in fields ],dtype=np.float64)
+    values.tofile( os.path.join(folder,key+'.bin') )
+
+    return
+
+
+def evict(folder,maximum_size):
+    """ evict(folder,maximum_size)
+        purges the least recently used results until the cache
+        is no larger than maximum_size bytes
+    """
+
+    if not os.path.exists(folder):
+        return
+
+    entries = []
+    for name in os.listdir(folder):
+        if not name.endswith('.bin'): continue
+        filename = os.path.join(folder,name)
+        entries.append( (os.path.getmtime(filename),os.path.getsize(filename),filename) )
+
+    size = sum([ entry[1] for entry in entries ])
+    if size <= maximum_size:
+        return
+
+    purge = []
+    for used,entry_size,filename in sorted(entries):
+        if size <= maximum_size: break
+        purge.append(filename)
+        size -= entry_size
+
+    purge_files(purge)
+
+    return
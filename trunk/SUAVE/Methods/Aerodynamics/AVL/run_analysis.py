@@ -1,6 +1,8 @@
 # Tim Momose, October 2014
 
 import os
+import numpy as np
+from SUAVE.Core import Data
 from SUAVE.Methods.Aerodynamics.AVL.read_results import read_results
 from SUAVE.Methods.Aerodynamics.AVL.purge_files  import purge_files
 
@@ -50,6 +52,139 @@ def call_avl(avl_object):
     return exit_status
 
 
+def run_workers(avl_object):
+    """ results = run_workers(avl_object)
+        runs the current cases on a pool of avl processes,
+        see Settings.number_of_workers
+
+        Assumptions:
+            called from the run folder, after write_geometry().
+            the cases are split into one batch per worker, each worker
+            writes its batch and input deck in its own folder, and the deck
+            is streamed to avl's stdin.  results are read as each worker
+            finishes, and returned in the order of the cases.
+            a worker that exits with an error, or workers still running
+            after Settings.worker_timeout seconds, stop the others and
+            raise a RuntimeError.
+    """
+
+    import time
+    import SUAVE.Plugins.VyPy.tools.redirect as redirect
+    from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
+    from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
+    from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+
+    cases     = avl_object.current_status.cases
+    filenames = avl_object.settings.filenames
+    n_workers = min( avl_object.settings.number_of_workers , len(cases) )
+    geometry  = os.path.abspath(filenames.features)
+
+    # start the workers, each on a contiguous batch of cases
+    workers = []
+    for i,batch in enumerate( np.array_split(np.arange(len(cases)),n_workers) ):
+
+        worker = Data()
+        worker.folder   = os.path.abspath(filenames.worker_template.format(i))
+        worker.features = avl_object.features
+        worker.settings = avl_object.settings
+
+        status = Data()
+        status.batch_file = avl_object.current_status.batch_file
+        status.deck_file  = avl_object.current_status.deck_file
+        status.cases      = Run_Case.Container()
+        for j in batch:
+            status.cases.append_case( cases[j].clone() )
+        worker.current_status = status
+
+        with redirect.folder(worker.folder,force=False):
+            write_run_cases(worker)
+            write_input_deck(worker)
+            start_avl(worker,geometry)
+
+        workers.append(worker)
+
+    # gather results as the workers finish
+    timeout = avl_object.settings.worker_timeout
+    start   = time.time()
+    results = [None] * n_workers
+    running = range(n_workers)
+    while running:
+        for i in running[:]:
+            worker = workers[i]
+            if worker.process.poll() is None:
+                continue
+            for stream in worker.streams:
+                stream.close()
+            running.remove(i)
+            if worker.process.returncode != 0:
+                stop_workers([ workers[j] for j in running ])
+                raise RuntimeError , 'avl worker in %s exited with status %i, %s:\n%s' % \
+                      (worker.folder,worker.process.returncode,filenames.err_filename,read_log(worker))
+            with redirect.folder(worker.folder,force=False):
+                results[i] = read_results(worker)
+        if running and not timeout is None and time.time() - start > timeout:
+            stop_workers([ workers[j] for j in running ])
+            raise RuntimeError , 'avl workers in %s still running after %g s, stopped' % \
+                  (', '.join([ workers[j].folder for j in running ]),timeout)
+        if running:
+            time.sleep(0.01)
+
+    # in the order of the cases
+    results_avl = Data()
+    for worker_results in results:
+        for case_res in worker_results.values():
+            results_avl.append(case_res)
+
+    return results_avl
+
+
+def start_avl(worker,geometry):
+    """ starts avl in the current folder without waiting for it,
+        the deck is streamed to stdin from its file
+    """
+
+    import time
+    import subprocess
+
+    filenames = worker.settings.filenames
+    in_deck   = worker.current_status.deck_file
+
+    log = open(filenames.log_filename,'w')
+    err = open(filenames.err_filename,'w')
+    deck = open(in_deck,'r')
+
+    ctime = time.ctime() # Current date and time stamp
+    log.write("Log File of System stdout from AVL Run \n{}\n\n".format(ctime))
+    err.write("Log File of System stderr from AVL Run \n{}\n\n".format(ctime))
+    log.flush(); err.flush()
+
+    worker.process = subprocess.Popen([filenames.avl_bin_name,geometry],stdout=log,stderr=err,stdin=deck)
+    worker.streams = [log,err,deck]
+
+    return
+
+
+def stop_workers(workers):
+    """ kills the avl processes of workers and closes their files """
+
+    for worker in workers:
+        if worker.process.poll() is None:
+            worker.process.kill()
+        worker.process.wait()
+        for stream in worker.streams:
+            stream.close()
+
+    return
+
+
+def read_log(worker):
+    """ the err log of a worker, as written by avl """
+
+    filename = os.path.join(worker.folder,worker.settings.filenames.err_filename)
+    with open(filename,'r') as err:
+        return err.read()
+
+
 
 
 
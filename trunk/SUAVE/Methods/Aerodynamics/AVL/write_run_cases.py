@@ -9,11 +9,26 @@ from purge_files import purge_files
 
 def write_run_cases(avl_object):
 
+    # unpack avl_inputs
+    batch_filename = avl_object.current_status.batch_file
+
+    # Open the geometry file after purging if it already exists
+    purge_files([batch_filename])
+    with open(batch_filename,'w') as runcases:
+
+        for case in avl_object.current_status.cases:
+            case_text = make_case_text(avl_object,case)
+            runcases.write(case_text)
+
+    return
+
+
+def make_case_text(avl_object,case):
+
     # imports
     from SUAVE.Methods.Aerodynamics.AVL.write_run_cases import make_controls_case_text
 
     # unpack avl_inputs
-    batch_filename = avl_object.current_status.batch_file
     aircraft       = avl_object.features
 
     base_case_text = \
@@ -62,45 +77,39 @@ def write_run_cases(avl_object):
 
 '''#{4} is a set of control surface inputs that will vary depending on the control surface configuration
 
-    # Open the geometry file after purging if it already exists
-    purge_files([batch_filename])
-    with open(batch_filename,'w') as runcases:
-
-        x_cg = avl_object.features.mass_properties.center_of_gravity[0]
-        y_cg = avl_object.features.mass_properties.center_of_gravity[1]
-        z_cg = avl_object.features.mass_properties.center_of_gravity[2]
-        mass = 0 #avl_object.default_case.mass TODO: FIGURE OUT WHAT TO DEFAULT MASS TO, AND WHERE TO STORE IT BEFORE ANALYSIS.
-        moments_of_inertia = aircraft.mass_properties.moments_of_inertia.tensor
-        Ixx  = moments_of_inertia[0][0]
-        Iyy  = moments_of_inertia[1][1]
-        Izz  = moments_of_inertia[2][2]
-        Ixy  = moments_of_inertia[0][1]
-        Iyz  = moments_of_inertia[1][2]
-        Izx  = moments_of_inertia[2][0]
-
-        for case in avl_object.current_status.cases:
-            index = case.index
-            name  = case.tag
-            alpha = case.conditions.aerodynamics.angle_of_attack
-            beta  = case.conditions.aerodynamics.side_slip_angle
-            mach  = case.conditions.freestream.mach
-            v     = case.conditions.freestream.velocity
-            rho   = case.conditions.freestream.density
-            g     = case.conditions.freestream.gravitational_acceleration
-
-            # form controls text
-            controls = []
-            if case.stability_and_control.control_deflections:
-                for cs in case.stability_and_control.control_deflections:
-                    cs_text = make_controls_case_text(cs)
-                    controls.append(cs_text)
-            controls_text = ''.join(controls)
-            case_text = base_case_text.format(index,name,alpha,beta,controls_text,
-                                              mach,v,rho,g,x_cg,y_cg,z_cg,mass,
-                                              Ixx,Iyy,Izz,Ixy,Iyz,Izx)
-            runcases.write(case_text)
-
-    return
+    x_cg = avl_object.features.mass_properties.center_of_gravity[0]
+    y_cg = avl_object.features.mass_properties.center_of_gravity[1]
+    z_cg = avl_object.features.mass_properties.center_of_gravity[2]
+    mass = 0 #avl_object.default_case.mass TODO: FIGURE OUT WHAT TO DEFAULT MASS TO, AND WHERE TO STORE IT BEFORE ANALYSIS.
+    moments_of_inertia = aircraft.mass_properties.moments_of_inertia.tensor
+    Ixx  = moments_of_inertia[0][0]
+    Iyy  = moments_of_inertia[1][1]
+    Izz  = moments_of_inertia[2][2]
+    Ixy  = moments_of_inertia[0][1]
+    Iyz  = moments_of_inertia[1][2]
+    Izx  = moments_of_inertia[2][0]
+
+    index = case.index
+    name  = case.tag
+    alpha = case.conditions.aerodynamics.angle_of_attack
+    beta  = case.conditions.aerodynamics.side_slip_angle
+    mach  = case.conditions.freestream.mach
+    v     = case.conditions.freestream.velocity
+    rho   = case.conditions.freestream.density
+    g     = case.conditions.freestream.gravitational_acceleration
+
+    # form controls text
+    controls = []
+    if case.stability_and_control.control_deflections:
+        for cs in case.stability_and_control.control_deflections:
+            cs_text = make_controls_case_text(cs)
+            controls.append(cs_text)
+    controls_text = ''.join(controls)
+    case_text = base_case_text.format(index,name,alpha,beta,controls_text,
+                                      mach,v,rho,g,x_cg,y_cg,z_cg,mass,
+                                      Ixx,Iyy,Izz,Ixy,Iyz,Izx)
+
+    return case_text
 
 
 def make_controls_case_text(control_deflection):
@@ -4,6 +4,8 @@ from compute_aircraft_drag import compute_aircraft_drag
 from parasite_drag_propulsor import parasite_drag_propulsor
 from parasite_drag_wing import parasite_drag_wing
 from parasite_drag_fuselage import parasite_drag_fuselage
+from parasite_drag_geometry import parasite_drag_geometry
+from parasite_drag_components import parasite_drag_components
 from parasite_drag_aircraft import parasite_drag_aircraft
 from miscellaneous_drag_aircraft import miscellaneous_drag_aircraft
 from induced_drag_aircraft import induced_drag_aircraft
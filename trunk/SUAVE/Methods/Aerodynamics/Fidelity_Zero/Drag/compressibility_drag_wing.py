@@ -108,6 +108,22 @@ def compressibility_drag_wing(state,settings,geometry):
     )
     drag_breakdown.compressible[wing.tag] = wing_results
 
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives
+        
+        if wing.tag=='main_wing':
+            d_cl = derivatives.lift_breakdown.compressible_wings / (np.cos(sweep_w))**2
+        else:
+            d_cl = 0.
+        
+        d_mcc = ( - 0.304541067183461          \
+                  + 0.467317361111105*tc       \
+                  + 2.*0.087490431201549*cl ) * d_cl / np.cos(sweep_w)
+        d_mo_mc = np.array([[0.,1.]]) / mcc - mach / mcc**2 * d_mcc
+        
+        derivatives.drag_breakdown.compressible[wing.tag] = 0.0019*14.641*mo_mc**13.641 * d_mo_mc * (np.cos(sweep_w))**3
+
 
     # dump total comp drag
     #drag_breakdown.compressible.total = total_compressibility_drag
@@ -52,6 +52,11 @@ def compressibility_drag_wing_total(state,settings,geometry):
         
 
     conditions.aerodynamics.drag_breakdown.compressible.total  = total_compressibility_drag #0.0
+    
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives.drag_breakdown.compressible
+        derivatives.total = np.sum([ derivatives[wing.tag] for wing in wings.values() ],axis=0)
         
     ## dump to condtitions
     #state.conditions.aerodynamics.drag_breakdown.compressible.total = total_compressibility_drag
@@ -36,7 +36,8 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
             Re - Reynolds Number
             Ma - Mach number
             Tc - temperature
-            xt - turbulent transition point as a proportion of chord length
+            xt - turbulent transition point as a proportion of chord length,
+                 or a vector of them that broadcasts against the columns of Re
         
         Outputs:
             cf_comp - coefficient of friction
@@ -49,7 +50,7 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
             
     """    
     
-    if xt < 0.0 or xt > 1.0:
+    if np.any(xt < 0.0) or np.any(xt > 1.0):
         raise ValueError("Turbulent transition must be between 0 and 1")
     
     if np.any(Re > 10**9) or np.any(Re < 10**5):
@@ -57,7 +58,10 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
         pass
     
     Rex = Re*xt
-    if xt == 0.0:
+    if np.ndim(xt):
+        # one transition point per column
+        Rex = np.where(xt == 0.0, 0.0001, Rex)
+    elif xt == 0.0:
         if type(Rex) is float:
             Rex = 0.0001
         else:
@@ -69,7 +73,9 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
     
     cf_turb  = 0.455/np.power(np.log10(Rext),2.58)
     cf_lam   = 1.328/np.sqrt(Rex)
-    if xt > 0.0:
+    if np.ndim(xt):
+        cf_start = np.where(xt > 0.0, 0.455/np.power(np.log10(Re*np.where(xt > 0.0,xeff,1.)),2.58), 0.0)
+    elif xt > 0.0:
         cf_start = 0.455/np.power(np.log10(Re*xeff),2.58)
     else:
         cf_start = 0.0
@@ -63,6 +63,11 @@ def induced_drag_aircraft(state,settings,geometry):
         aspect_ratio      = ar                 ,
     )
     
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives
+        derivatives.drag_breakdown.induced = 2. * aircraft_lift * derivatives.lift_coefficient / (np.pi*ar*e)
+    
     # done!
 
     return total_induced_drag
\ No newline at end of file
@@ -9,6 +9,8 @@
 # Suave imports
 from SUAVE.Core import Results
 
+import numpy as np
+
 # ----------------------------------------------------------------------
 #  Computes the miscellaneous drag
 # ----------------------------------------------------------------------
@@ -64,4 +66,8 @@ def miscellaneous_drag_aircraft_ESDU(state,settings,geometry):
         reference_area            = Sref ,
         total                     = cd_excrescence *ones_1col, )
 
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        conditions.aerodynamics.derivatives.drag_breakdown.miscellaneous = ones_1col * np.zeros([1,2])
+
     return cd_excrescence *ones_1col
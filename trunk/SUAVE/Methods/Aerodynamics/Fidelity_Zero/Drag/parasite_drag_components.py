@@ -0,0 +1,279 @@
+# parasite_drag_components.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# local imports
+from compressible_turbulent_flat_plate import compressible_turbulent_flat_plate
+from compressible_mixed_flat_plate import compressible_mixed_flat_plate
+
+# suave imports
+from SUAVE.Attributes.Gases import Air # you should let the user pass this as input
+air = Air()
+compute_speed_of_sound = air.compute_speed_of_sound
+
+from SUAVE.Core import Results
+
+# package imports
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#   The Function
+# ----------------------------------------------------------------------
+
+def parasite_drag_components(state,settings,table):
+    """ results = SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag.parasite_drag_components(state,settings,table)
+        computes the parasite drag of all wings, fuselages and propulsors at once,
+        from the geometry table of parasite_drag_geometry()
+
+        Inputs:
+            state.conditions.freestream - mach_number, density, dynamic_viscosity,
+                temperature and pressure
+            settings - wing_parasite_drag_form_factor, fuselage_parasite_drag_form_factor,
+                propulsor_parasite_drag_form_factor (optional, 2.3)
+            table    - see parasite_drag_geometry()
+
+        Outputs:
+            results.wings, results.fuselages, results.propulsors - parasite drag coefficient
+                of each component, on its own reference area, by tag
+            the same breakdown as parasite_drag_wing(), parasite_drag_fuselage() and
+                parasite_drag_propulsor() in conditions.aerodynamics.drag_breakdown.parasite
+            with settings.derivatives, the derivatives of each coefficient in
+                conditions.aerodynamics.derivatives.drag_breakdown.parasite, see Markup
+
+        Assumptions:
+            the same as the component methods, one column per component
+            derivatives with respect to mach number are at constant freestream density,
+            viscosity, temperature and pressure, so the reynolds number goes with mach
+    """
+
+    # unpack inputs
+    conditions = state.conditions
+    freestream = conditions.freestream
+
+    # one row per condition, one column per component
+    shape = np.shape(freestream.mach_number)
+
+    Mc  = np.reshape( freestream.mach_number      , [-1,1] )
+    roc = np.reshape( freestream.density          , [-1,1] )
+    muc = np.reshape( freestream.dynamic_viscosity, [-1,1] )
+    Tc  = np.reshape( freestream.temperature      , [-1,1] )
+    pc  = np.reshape( freestream.pressure         , [-1,1] )
+
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    derivatives = settings.get('derivatives',False)
+
+    # reynolds number per unit length
+    V    = Mc * compute_speed_of_sound( Tc, pc )
+    Re_l = roc * V / muc
+
+    results = Results()
+
+    # --------------------------------------------------------
+    # wings
+    wings = table.wings
+    C     = settings.wing_parasite_drag_form_factor
+
+    Re_w = Re_l * wings.length
+
+    # skin friction coefficient, upper and lower
+    cf_w_u, k_comp_u, k_reyn_u = compressible_mixed_flat_plate(Re_w,Mc,Tc,wings.transition_x_upper)
+    cf_w_l, k_comp_l, k_reyn_l = compressible_mixed_flat_plate(Re_w,Mc,Tc,wings.transition_x_lower)
+
+    # correction for airfoils
+    cos2 = wings.cos_sweep_2
+    t_c  = wings.thickness_to_chord
+    k_w  = 1. + ( 2.* C * (t_c * cos2) ) / ( np.sqrt(1.- Mc**2. * cos2) )  \
+              + ( C**2. * cos2 * t_c**2. * (1. + 5.*cos2) ) / (2.*(1.-Mc**2.*cos2))
+
+    Swet = wings.wetted_area
+    Sref = wings.reference_area
+    wing_parasite_drag = k_w * cf_w_u * Swet / Sref /2. + k_w * cf_w_l * Swet / Sref /2.
+
+    results.wings = dump_components(conditions,wings,shape,
+                                    wing_parasite_drag,(cf_w_u+cf_w_l)/2.,k_comp_u,k_reyn_l,k_w)
+
+    if derivatives:
+        d_comp = compressibility_log_derivative(Mc,Tc)
+        d_cf_u = cf_w_u * ( mixed_log_derivative(Re_w,wings.transition_x_upper) / Mc + d_comp )
+        d_cf_l = cf_w_l * ( mixed_log_derivative(Re_w,wings.transition_x_lower) / Mc + d_comp )
+        d_k_w  = ( 2.* C * (t_c * cos2) ) * Mc * cos2 / ( 1.- Mc**2. * cos2 )**1.5 \
+               + ( C**2. * cos2 * t_c**2. * (1. + 5.*cos2) ) * Mc * cos2 / (1.-Mc**2.*cos2)**2.
+        d_wing_parasite_drag = ( d_k_w * (cf_w_u + cf_w_l) + k_w * (d_cf_u + d_cf_l) ) * Swet / Sref /2.
+        dump_derivatives(conditions,wings,d_wing_parasite_drag)
+
+    # --------------------------------------------------------
+    # fuselages
+    fuselages   = table.fuselages
+    form_factor = settings.fuselage_parasite_drag_form_factor
+
+    Re_fus = Re_l * fuselages.length
+
+    # skin friction coefficient
+    cf_fus, k_comp, k_reyn = compressible_turbulent_flat_plate(Re_fus,Mc,Tc)
+
+    # form factor for cylindrical bodies
+    k_fus = body_form_factor(Mc,fuselages.diameter_ratio,form_factor)
+
+    fuselage_parasite_drag = k_fus * cf_fus * fuselages.wetted_area / fuselages.reference_area
+
+    results.fuselages = dump_components(conditions,fuselages,shape,
+                                        fuselage_parasite_drag,cf_fus,k_comp,k_reyn,k_fus)
+
+    if derivatives:
+        d_cf_fus = cf_fus * ( turbulent_log_derivative(Re_fus) / Mc + d_comp )
+        d_k_fus  = body_form_factor_derivative(Mc,fuselages.diameter_ratio,form_factor)
+        d_fuselage_parasite_drag = ( d_k_fus * cf_fus + k_fus * d_cf_fus ) * fuselages.wetted_area / fuselages.reference_area
+        dump_derivatives(conditions,fuselages,d_fuselage_parasite_drag)
+
+    # --------------------------------------------------------
+    # propulsors
+    propulsors  = table.propulsors
+    form_factor = settings.get('propulsor_parasite_drag_form_factor',2.3)
+
+    Re_prop = Re_l * propulsors.length
+
+    # skin friction coefficient
+    cf_prop, k_comp, k_reyn = compressible_turbulent_flat_plate(Re_prop,Mc,Tc)
+
+    # form factor for bodies with an intake, otherwise according to the Raymer equation
+    intake = propulsors.intake
+    k_prop = Mc * 0. + propulsors.raymer_form_factor
+    if np.any(intake):
+        k_prop[:,intake] = body_form_factor(Mc,propulsors.diameter_ratio[intake],form_factor)
+
+    propulsor_parasite_drag = k_prop * cf_prop * propulsors.wetted_area / propulsors.reference_area
+
+    results.propulsors = dump_components(conditions,propulsors,shape,
+                                         propulsor_parasite_drag,cf_prop,k_comp,k_reyn,k_prop)
+
+    if derivatives:
+        d_cf_prop = cf_prop * ( turbulent_log_derivative(Re_prop) / Mc + d_comp )
+        d_k_prop  = Mc * 0. + np.zeros_like(propulsors.raymer_form_factor)
+        if np.any(intake):
+            d_k_prop[:,intake] = body_form_factor_derivative(Mc,propulsors.diameter_ratio[intake],form_factor)
+        d_propulsor_parasite_drag = ( d_k_prop * cf_prop + k_prop * d_cf_prop ) * propulsors.wetted_area / propulsors.reference_area
+        dump_derivatives(conditions,propulsors,d_propulsor_parasite_drag)
+
+    # done!
+    return results
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def body_form_factor(Mc,d_d,form_factor):
+    """ form factor of cylindrical bodies, for diameter to length ratios d_d
+    """
+
+    D        = np.sqrt(1 - (1-Mc**2) * d_d**2)
+    a        = 2 * (1-Mc**2) * (d_d**2) *(np.arctanh(D)-D) / (D**3)
+    du_max_u = a / ( (2-a) * (1-Mc**2)**0.5 )
+    k_body   = (1 + form_factor*du_max_u)**2
+
+    return k_body
+
+
+def body_form_factor_derivative(Mc,d_d,form_factor):
+    """ d k_body / dM, of body_form_factor()
+    """
+
+    s        = 1 - Mc**2
+    D        = np.sqrt(1 - s * d_d**2)
+    g        = np.arctanh(D) - D
+    a        = 2 * s * (d_d**2) * g / (D**3)
+    du_max_u = a / ( (2-a) * s**0.5 )
+
+    d_s  = -2 * Mc
+    d_D  = Mc * d_d**2 / D
+    d_g  = D**2 / (1-D**2) * d_D
+    d_a  = a * ( d_s/s + d_g/g - 3*d_D/D )
+    d_du = 2 * d_a / ( (2-a)**2 * s**0.5 ) - 0.5 * a / (2-a) * s**-1.5 * d_s
+
+    return 2 * (1 + form_factor*du_max_u) * form_factor * d_du
+
+
+def compressibility_log_derivative(Mc,Tc):
+    """ d ln(k_comp*k_reyn) / dM, of the flat plate compressibility and
+        reynolds number factors
+    """
+
+    Td   = Tc * (1. + 0.035*Mc**2. + 0.45*0.178*Mc**2.)
+    d_Td = Tc * (0.07 + 0.45*0.356) * Mc
+
+    return - d_Td/Td - 0.2 * ( 1.5/Td + 1./(Td+216.) ) * d_Td
+
+
+def turbulent_log_derivative(Re):
+    """ d ln(cf_inc) / d ln(Re), of compressible_turbulent_flat_plate()
+    """
+    return -2.58 / np.log(Re)
+
+
+def mixed_log_derivative(Re,xt):
+    """ d ln(cf_inc) / d ln(Re), of compressible_mixed_flat_plate()
+    """
+
+    Rex   = np.where(xt == 0.0, 0.0001, Re*xt)
+    theta = 0.671*xt/np.sqrt(Rex)
+    xeff  = (27.78*theta*Re**0.2)**1.25
+    Rext  = Re*(1-xt+xeff)
+    Rest  = Re*np.where(xt > 0.0,xeff,1.)
+
+    cf_turb  = 0.455/np.power(np.log10(Rext),2.58)
+    cf_lam   = 1.328/np.sqrt(Rex)
+    cf_start = np.where(xt > 0.0, 0.455/np.power(np.log10(Rest),2.58), 0.0)
+    cf_inc   = cf_lam*xt + cf_turb*(1-xt+xeff) - cf_start*xeff
+
+    # xeff goes with Re**-0.375
+    d_xeff     = -0.375*xeff
+    d_cf_turb  = -2.58*cf_turb/np.log(Rext) * (Rext + Re*d_xeff)/Rext
+    d_cf_start = -2.58*cf_start/np.log(Rest) * 0.625
+    d_cf_inc   = - 0.5*cf_lam*xt + d_cf_turb*(1-xt+xeff) + cf_turb*d_xeff \
+                 - d_cf_start*xeff - cf_start*d_xeff
+
+    return d_cf_inc / cf_inc
+
+
+def dump_derivatives(conditions,components,d_parasite_drag):
+    """ one column per component to conditions.aerodynamics.derivatives.drag_breakdown.parasite,
+        as [d/dalpha, d/dmach]
+    """
+
+    derivatives = conditions.aerodynamics.derivatives.drag_breakdown.parasite
+
+    for i,tag in enumerate(components.tags):
+        derivatives[tag] = d_parasite_drag[:,i,None] * np.array([[0.,1.]])
+
+    return
+
+
+def dump_components(conditions,components,shape,parasite_drag,cf,k_comp,k_reyn,k_form):
+    """ one column per component to conditions.aerodynamics.drag_breakdown.parasite,
+        in the shape of the freestream conditions
+    """
+
+    cf, k_comp, k_reyn, k_form = [ x + np.zeros(parasite_drag.shape) for x in [cf,k_comp,k_reyn,k_form] ]
+
+    results = Results()
+
+    for i,tag in enumerate(components.tags):
+        # set one by one, cheaper than Results(**kwarg) in the residual loop
+        result = Results()
+        result.wetted_area               = components.wetted_area[i]
+        result.reference_area            = components.reference_area[i]
+        result.parasite_drag_coefficient = np.reshape( parasite_drag[:,i] , shape )
+        result.skin_friction_coefficient = np.reshape( cf[:,i]            , shape )
+        result.compressibility_factor    = np.reshape( k_comp[:,i]        , shape )
+        result.reynolds_factor           = np.reshape( k_reyn[:,i]        , shape )
+        result.form_factor               = np.reshape( k_form[:,i]        , shape )
+
+        conditions.aerodynamics.drag_breakdown.parasite[tag] = result
+        results[tag] = result.parasite_drag_coefficient
+
+    return results
@@ -0,0 +1,143 @@
+# parasite_drag_geometry.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#  The Function
+# ----------------------------------------------------------------------
+
+def parasite_drag_geometry(geometry):
+    """ table = SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag.parasite_drag_geometry(geometry)
+        precomputes the geometry terms of parasite_drag_wing(), parasite_drag_fuselage()
+        and parasite_drag_propulsor(), as flat arrays with one entry per component
+
+        Inputs:
+            geometry - SUave type vehicle, with wings, fuselages and propulsors
+
+        Outputs:
+            table.wings      - tags, reference_area, wetted_area, length (mean aerodynamic chord),
+                               transition_x_upper, transition_x_lower, cos_sweep_2 (cos(sweep)**2),
+                               thickness_to_chord, area_ratio (to the vehicle reference area)
+            table.fuselages  - tags, reference_area, wetted_area, length (nose, cabin and tail),
+                               diameter_ratio (effective diameter to cabin length), area_ratio
+            table.propulsors - tags, reference_area, wetted_area, length, intake, diameter_ratio,
+                               raymer_form_factor, area_ratio (including number_of_engines)
+            table.total_wetted_area - of all the components, with number_of_engines
+
+        Assumptions:
+            missing wing and propulsor wetted areas are estimated, and stored on the
+            geometry, as the component methods do.
+            propulsors with A7, Ao and D have an intake, the others use the
+            form factor of Raymer.
+    """
+
+    Sref_vehicle = geometry.reference_area
+
+    table = Data()
+
+    # wings
+    wings = Data()
+    wings.tags = []
+    for key in ['reference_area','wetted_area','length','transition_x_upper','transition_x_lower',
+                'cos_sweep_2','thickness_to_chord','area_ratio']:
+        wings[key] = []
+
+    for wing in geometry.wings.values():
+        t_c_w = wing.thickness_to_chord
+
+        try:
+            Swet = wing.areas.wetted
+        except AttributeError:
+            Swet = 1. * (1.0+ 0.2*t_c_w) * wing.areas.exposed
+            wing.areas.wetted = Swet
+
+        wings.tags.append(wing.tag)
+        wings.reference_area.append(wing.areas.reference)
+        wings.wetted_area.append(Swet)
+        wings.length.append(wing.chords.mean_aerodynamic)
+        wings.transition_x_upper.append(wing.transition_x_upper)
+        wings.transition_x_lower.append(wing.transition_x_lower)
+        wings.cos_sweep_2.append(np.cos(wing.sweep)**2.)
+        wings.thickness_to_chord.append(t_c_w)
+        wings.area_ratio.append(wing.areas.reference / Sref_vehicle)
+
+    # fuselages
+    fuselages = Data()
+    fuselages.tags = []
+    for key in ['reference_area','wetted_area','length','diameter_ratio','area_ratio']:
+        fuselages[key] = []
+
+    for fuselage in geometry.fuselages.values():
+        l_fus = fuselage.lengths.cabin
+
+        fuselages.tags.append(fuselage.tag)
+        fuselages.reference_area.append(fuselage.areas.front_projected)
+        fuselages.wetted_area.append(fuselage.areas.wetted)
+        fuselages.length.append(l_fus + fuselage.lengths.nose + fuselage.lengths.tail)
+        fuselages.diameter_ratio.append(float(fuselage.effective_diameter)/float(l_fus))
+        fuselages.area_ratio.append(fuselage.areas.front_projected / Sref_vehicle)
+
+    # propulsors
+    propulsors = Data()
+    propulsors.tags = []
+    for key in ['reference_area','wetted_area','length','intake','diameter_ratio',
+                'raymer_form_factor','area_ratio']:
+        propulsors[key] = []
+
+    for propulsor in geometry.propulsors.values():
+        l_prop = propulsor.engine_length
+        d_prop = propulsor.nacelle_diameter
+        Sref   = d_prop**2 / 4 * np.pi
+
+        try:
+            Swet = propulsor.areas.wetted
+        except AttributeError:
+            if not 'areas' in propulsor:
+                propulsor.areas = Data()
+            propulsor.areas.wetted = 1.1 * d_prop * np.pi * l_prop
+            Swet = propulsor.areas.wetted
+
+        # check if propulsor has an intake
+        try:
+            A_max    = propulsor.nacelle_diameter
+            A_exit   = propulsor.A7
+            A_inflow = propulsor.Ao
+            d_d      = 1/((propulsor.engine_length + propulsor.D) / np.sqrt(4/np.pi*(A_max - (A_exit+A_inflow)/2)))
+            intake   = True
+        except AttributeError:
+            d_d      = 0.
+            intake   = False
+
+        propulsors.tags.append(propulsor.tag)
+        propulsors.reference_area.append(Sref)
+        propulsors.wetted_area.append(Swet)
+        propulsors.length.append(l_prop)
+        propulsors.intake.append(intake)
+        propulsors.diameter_ratio.append(d_d)
+        propulsors.raymer_form_factor.append(1 + 0.35 / (float(l_prop)/float(d_prop)))
+        propulsors.area_ratio.append(Sref / Sref_vehicle * propulsor.number_of_engines)
+
+    # flat arrays
+    for components in [wings,fuselages,propulsors]:
+        for key,value in components.items():
+            if key == 'tags': continue
+            components[key] = np.array(value,dtype=bool if key == 'intake' else float)
+
+    table.wings      = wings
+    table.fuselages  = fuselages
+    table.propulsors = propulsors
+
+    number_of_engines = np.array([ propulsor.number_of_engines for propulsor in geometry.propulsors.values() ],dtype=float)
+    table.total_wetted_area = np.sum(wings.wetted_area) + np.sum(fuselages.wetted_area) \
+                            + np.sum(propulsors.wetted_area * number_of_engines)
+
+    return table
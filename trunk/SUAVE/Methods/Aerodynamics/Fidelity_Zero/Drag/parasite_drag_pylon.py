@@ -73,6 +73,15 @@ def parasite_drag_pylon(state,settings,geometry):
         form_factor               = pylon_FF   ,
     )
     conditions.aerodynamics.drag_breakdown.parasite['pylon'] = pylon_result 
+    
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives.drag_breakdown.parasite
+        d_pylon = 0.
+        for propulsor in geometry.propulsors:
+            ref_area = propulsor.nacelle_diameter**2 / 4 * np.pi
+            d_pylon += pylon_factor * derivatives[propulsor.tag] * (ref_area/geometry.reference_area * propulsor.number_of_engines)
+        derivatives['pylon'] = d_pylon
  
     
 
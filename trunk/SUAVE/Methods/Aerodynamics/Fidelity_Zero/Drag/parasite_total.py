@@ -80,6 +80,25 @@ def parasite_total(state,settings,geometry):
     # dump to condtitions
     state.conditions.aerodynamics.drag_breakdown.parasite.total = total_parasite_drag
 
+    # derivatives, [d/dalpha, d/dmach], rescaled as the coefficients, see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives.drag_breakdown.parasite
+        
+        area_ratios = []
+        for wing in wings.values():
+            area_ratios.append( (wing.tag, wing.areas.reference/vehicle_reference_area) )
+        for fuselage in fuselages.values():
+            area_ratios.append( (fuselage.tag, fuselage.areas.front_projected/vehicle_reference_area) )
+        for propulsor in propulsors.values():
+            ref_area = propulsor.nacelle_diameter**2 / 4 * np.pi
+            area_ratios.append( (propulsor.tag, ref_area/vehicle_reference_area * propulsor.number_of_engines) )
+        
+        d_total = derivatives['pylon']
+        for tag,ratio in area_ratios:
+            derivatives[tag] = derivatives[tag] * ratio
+            d_total = d_total + derivatives[tag]
+        derivatives.total = d_total
+
 
 
     # done!
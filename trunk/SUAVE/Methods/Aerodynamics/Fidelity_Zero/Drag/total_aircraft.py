@@ -78,6 +78,12 @@ def total_aircraft(state,settings,geometry):
     conditions.aerodynamics.drag_breakdown.total     = aircraft_total_drag
     conditions.aerodynamics.drag_coefficient         = aircraft_total_drag
     
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives
+        derivatives.drag_breakdown.total = derivatives.drag_breakdown.trim_corrected_drag
+        derivatives.drag_coefficient     = derivatives.drag_breakdown.total
+    
     # done!
     return aircraft_total_drag
 
@@ -46,5 +46,10 @@ def trim(state,settings,geometry):
     
     conditions.aerodynamics.drag_breakdown.miscellaneous.trim_correction_factor = trim_correction_factor
 
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives.drag_breakdown
+        derivatives.trim_corrected_drag = trim_correction_factor * derivatives.untrimmed
+
 
     return aircraft_total_drag_trim_corrected
@@ -57,4 +57,12 @@ def untrimmed(state,settings,geometry):
     
     conditions.aerodynamics.drag_breakdown.untrimmed = aircraft_untrimmed
     
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = conditions.aerodynamics.derivatives.drag_breakdown
+        derivatives.untrimmed = derivatives.parasite.total     \
+                              + derivatives.induced            \
+                              + derivatives.compressible.total \
+                              + derivatives.miscellaneous
+    
     return aircraft_untrimmed
@@ -83,6 +83,11 @@ def fuselage_correction(state,settings,geometry):
     #conditions.aerodynamics.lift_breakdown.update( lift_results )    #update
     
     state.conditions.aerodynamics.lift_coefficient= aircraft_lift_total
+    
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = state.conditions.aerodynamics.derivatives
+        derivatives.lift_coefficient = derivatives.lift_coefficient * fus_correction
 
     return aircraft_lift_total
 
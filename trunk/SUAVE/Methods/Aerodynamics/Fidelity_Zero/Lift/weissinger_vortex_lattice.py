@@ -26,19 +26,24 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         Vortex lattice method to compute the lift coefficient and induced drag component
 
         Inputs:
+            conditions.aerodynamics.angle_of_attack - scalar or array, all
+                angles are solved together
+            configuration.number_panels_spanwise  - panels on each half span
+            configuration.number_panels_chordwise - panels along the chord
             wing - geometry dictionary with fields:
                 Sref - reference area
 
         Outputs:
+            Cl, Cd - lift and induced drag coefficients, same shape as
+                the angle of attack
 
         Assumptions:
+            the influence matrix is built in one pass over all panels, and
+            is factored once for every angle of attack
         
     """
 
     #unpack
-    
-    
-    
     span        = wing.spans.projected
     root_chord  = wing.chords.root
     tip_chord   = wing.chords.tip
@@ -56,6 +61,12 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
 
     # conditions
     aoa = conditions.aerodynamics.angle_of_attack
+    alpha = np.reshape(aoa,-1)
+    
+    if orientation:
+        Cl = np.zeros_like(alpha)
+        Cd = np.zeros_like(alpha)
+        return pack_coefficients(Cl,Cd,aoa)
     
     # chord difference
     dchord=(root_chord-tip_chord)
@@ -64,138 +75,62 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     deltax=span/n
 
 
-
-    if orientation == False :
-
-        section_length= np.empty(n)
-        area_section=np.empty(n)
-        sl=np.empty(n)
-    
-        xpos=np.empty(n)
-    
-        ya=np.empty(n)
-        yb=np.empty(n)
-        xa=np.empty(n)
-        yab=np.empty(n)
-        ybb=np.empty(n)
-        y2=np.empty(n)   
-    
-        x=np.empty(n)
-        y=np.empty(n)
-        twist_distri=np.empty(n)
-        xloc_leading=np.empty(n)
-        xloc_trailing=np.empty(n)  
-        RHS=np.empty([n,1])
-        w=np.empty([n,n])
-        wb=np.empty([n,n])
-        A=np.empty([n,n])
-        L=np.empty(n)
-        T=np.empty(n)
-    
-        A_v=np.empty([n,n])
-        v=np.empty(n)
-    
-        Lfi=np.empty(n)
-        Lfk=np.empty(n)
-    
-        Lft=np.empty(n)
-        Dg=np.empty(n)   
-        D=np.empty(n)    
-    
-    
-    
-    
-        #--discretizing the wing sections into panels--------------------------------
-        for i in range(0,n):
-    
-            section_length[i]= dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
-            area_section[i]=section_length[i]*deltax
-            sl[i]=section_length[i]
-            twist_distri[i]=twist_rc + i/float(n)*(twist_tc-twist_rc)
-            xpos[i]=(i)*deltax
-    
-            ya[i]=(i)*deltax
-            yb[i]=(i+1)*deltax
-            xa[i]=((i+1)*deltax-deltax/2)*np.tan(sweep)+ 0.25*sl[i]
-    
-            x[i]=((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*sl[i]
-            y[i]=((i+1)*deltax-deltax/2)
-            xloc_leading[i]=((i+1)*deltax)*np.tan(sweep)
-            xloc_trailing[i]=((i+1)*deltax)*np.tan(sweep)+sl[i]
-    
+    #--discretizing the wing sections into panels--------------------------------
     
-        #------Influence coefficient computation-----------------------
-        for i in range(0,n):
+    # spanwise strips
+    i = np.arange(n)
+    section_length = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
+    twist_distri   = twist_rc + i/float(n)*(twist_tc-twist_rc)
     
-            RHS[i,0]=np.sin(twist_distri[i]+aoa)  #)
-            #RHS[i,0]=Vinf*np.sin(twist_distri[i]+aoa)  #)
+    ya = i*deltax
+    yb = (i+1)*deltax
+    y  = ((i+1)*deltax-deltax/2)
+    x_leading = y*np.tan(sweep)
     
-            for j in range(0,n):
+    # chordwise panels in each strip, bound vortex at the quarter chord
+    # and collocation point at the three quarter chord of each panel
+    k = (np.arange(nn)[None,:] + 0.25) / nn
+    xa = ( x_leading[:,None] + k       * section_length[:,None] ).ravel()
+    x  = ( x_leading[:,None] + (k+0.5/nn) * section_length[:,None] ).ravel()
     
+    y  = np.repeat(y ,nn)
+    ya = np.repeat(ya,nn)
+    yb = np.repeat(yb,nn)
+    twist_distri = np.repeat(twist_distri,nn)
     
-                yad=y[i]-ya[j]
-                xd=x[i]-xa[j]
-                ybd=y[i]-yb[j]
     
-                yadd=y[i]-yab[j]
-                ybdd=y[i]-ybb[j]
+    #------Influence coefficient computation-----------------------
     
+    # collocation points down the rows, horseshoes across the columns
+    xi = x[:,None]
+    yi = y[:,None]
     
-                A[i,j]=whav(x[i],y[i],xa[j],ya[j])-whav(x[i],y[i],xa[j],yb[j])-whav(x[i],y[i],xa[j],-ya[j])+whav(x[i],y[i],xa[j],-yb[j])
-                A[i,j]=A[i,j]*0.25/np.pi
-    
-        #---------------Vortex strength computation by matrix inversion-----------
-        T=np.linalg.solve(A,RHS)
-        
-        #---Calculating the effective velocty--------------------------
-        for i in range(0,n):
-            v[i]=0.0      
-            for j in range(0,n):
-    
-                A_v[i,j]=whav(xa[i],y[i],xa[j],ya[j])-whav(xa[i],y[i],xa[j],yb[j])-whav(xa[i],y[i],xa[j],-ya[j])+whav(xa[i],y[i],xa[j],-yb[j])
-                A_v[i,j]=A[i,j]*0.25/np.pi*T[j]
-                v[i]=v[i]+A_v[i,j]
-    
-    
-            #Lfi[i]=-T[i]*(Vinf*np.sin(twist_tc)-v[i])
-            #Lfk[i]=T[i]*Vinf*np.cos(twist_tc)
-            
-            Lfi[i]=-T[i]*(np.sin(twist_tc)-v[i])
-            Lfk[i]=T[i]*np.cos(twist_tc)        
-    
-            Lft[i]=(-Lfi[i]*np.sin(twist_tc)+Lfk[i]*np.cos(twist_tc))
-            Dg[i]=(Lfi[i]*np.cos(twist_tc)+Lfk[i]*np.sin(twist_tc))
-    
-        #---------Lift computation from elements---------------------------------
-        LT=0.0
-        DT=0.0
-        arsec=0.0
-    
-        for i in range(0,n):
-    
-            L[i]=deltax*Lft[i]   #T(i)*v(i)*sin(alpha)
-            D[i]=deltax*Dg[i]    
-    
-            LT=LT+L[i]
-            DT=DT+D[i]
-    
-            arsec=arsec+area_section[i]
+    A = whav(xi,yi,xa,ya) - whav(xi,yi,xa,yb) - whav(xi,yi,xa,-ya) + whav(xi,yi,xa,-yb)
+    A = A*0.25/np.pi
     
+    RHS = np.sin( twist_distri[:,None] + alpha[None,:] )
+
+    #---------------Vortex strength computation, all angles at once-----------
+    T = np.linalg.solve(A,RHS)
     
-        # compute lift and drag coefficients
-        #Cl=2*LT/(0.5*roc*Vinf**2*Sref)
-        #Cd=2*DT/(0.5*roc*Vinf**2*Sref)       
+    #---Calculating the effective velocty--------------------------
+    v = np.dot(A*0.25/np.pi,T)
     
-        Cl=2*LT/(0.5*Sref)
-        Cd=2*DT/(0.5*Sref)     
+    Lfi = -T*(np.sin(twist_tc)-v)
+    Lfk =  T*np.cos(twist_tc)
     
-    else:
-        
-        Cl= 0.0
-        Cd= 0.0         
+    Lft = (-Lfi*np.sin(twist_tc)+Lfk*np.cos(twist_tc))
+    Dg  = ( Lfi*np.cos(twist_tc)+Lfk*np.sin(twist_tc))
+
+    #---------Lift computation from elements---------------------------------
+    LT = deltax*np.sum(Lft,axis=0)
+    DT = deltax*np.sum(Dg ,axis=0)
 
+    # compute lift and drag coefficients
+    Cl=2*LT/(0.5*Sref)
+    Cd=2*DT/(0.5*Sref)
 
-    return Cl , Cd
+    return pack_coefficients(Cl,Cd,aoa)
 
 
 
@@ -205,23 +140,37 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
 def whav(x1,y1,x2,y2):
     """ Helper function of vortex lattice method      
         Inputs:
-            x1,x2 -x coordinates of bound vortex
-            y1,y2 -y coordinates of bound vortex
+            x1,y1 - coordinates of the collocation points
+            x2,y2 - coordinates of the end of the bound vortex,
+                arrays broadcast against each other
 
-        Sref - reference area for non dimensionalization
         Outpus:
-            Cl_comp - lift coefficient
-            Cd_comp - drag  coefficient       
+            whv - downwash of the trailing leg and bound vortex,
+                without the 1/(4*pi) factor
 
         Assumptions:
-            if needed
+            planar horseshoes trailing to +x
 
     """  
 
+    dx = x1-x2
+    dy = y1-y2
+    
+    # no x offset, only the trailing leg
+    on_line = (dx == 0.)
+    dx = np.where(on_line,1.,dx)
+    
+    whv = 1/dy*(1+ (np.sqrt(dx**2+dy**2)/dx))
+    whv = np.where(on_line,1/dy,whv)
+
+    return whv
 
-    if x1==x2:
-        whv=1/(y1-y2)
-    else:  
-        whv=1/(y1-y2)*(1+ (np.sqrt((x1-x2)**2+(y1-y2)**2)/(x1-x2)))
 
-    return whv
\ No newline at end of file
+def pack_coefficients(Cl,Cd,aoa):
+    """ returns scalars for a scalar angle of attack, 
+        otherwise arrays of the same shape
+    """
+    if np.ndim(aoa) == 0:
+        return Cl[0], Cd[0]
+    else:
+        return np.reshape(Cl,np.shape(aoa)), np.reshape(Cd,np.shape(aoa))
@@ -80,6 +80,14 @@ def wing_compressibility_correction(state,settings,geometry):
     state.conditions.aerodynamics.lift_breakdown.compressible_wings = wings_lift_comp
     state.conditions.aerodynamics.lift_coefficient= wings_lift_comp
 
+    # derivatives, [d/dalpha, d/dmach], see Markup
+    if settings.get('derivatives',False):
+        derivatives = state.conditions.aerodynamics.derivatives
+        d_corr = Mc * compress_corr**3. * np.array([[0.,1.]])
+        d_lift = derivatives.lift_coefficient * compress_corr + wings_lift * d_corr
+        derivatives.lift_breakdown.compressible_wings = d_lift
+        derivatives.lift_coefficient = d_lift
+
 
     return wings_lift_comp
 
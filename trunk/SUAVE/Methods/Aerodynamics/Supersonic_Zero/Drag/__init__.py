@@ -12,6 +12,8 @@ from wave_drag_body_of_rev import wave_drag_body_of_rev
 from compressible_turbulent_flat_plate import compressible_turbulent_flat_plate
 from compressible_mixed_flat_plate import compressible_mixed_flat_plate
 from compressibility_drag_total import compressibility_drag_total
+from wave_drag_geometry import wave_drag_geometry
+from compressibility_drag_components import compressibility_drag_components
 
 from compute_aircraft_drag import compute_aircraft_drag
 
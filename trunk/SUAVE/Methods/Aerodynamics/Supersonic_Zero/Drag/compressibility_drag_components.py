@@ -0,0 +1,165 @@
+# compressibility_drag_components.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Results
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#  The Function
+# ----------------------------------------------------------------------
+
+def compressibility_drag_components(state,settings,table):
+    """ total = SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.compressibility_drag_components(state,settings,table)
+        computes the compressibility drag of all wings at once, from the
+        geometry table of wave_drag_geometry()
+
+        Inputs:
+            state.conditions.freestream.mach_number
+            state.conditions.aerodynamics.lift_breakdown.compressible_wings
+            state.conditions.aerodynamics.lift_coefficient
+            table - see wave_drag_geometry()
+
+        Outputs:
+            total compressibility drag coefficient
+            the same breakdown as compressibility_drag_total() in
+                conditions.aerodynamics.drag_breakdown.compressible
+
+        Assumptions:
+            each regime is only computed at its own points, one column per wing:
+            drag divergence correlations up to mach 0.99, wave drag from
+            mach 1.05, and a linear interpolation between them
+    """
+
+    # unpack inputs
+    conditions     = state.conditions
+    drag_breakdown = conditions.aerodynamics.drag_breakdown
+
+    # one row per condition, one column per wing
+    shape = np.shape(conditions.freestream.mach_number)
+
+    Mc = np.reshape( conditions.freestream.mach_number                      , [-1,1] )
+    cl = np.reshape( conditions.aerodynamics.lift_breakdown.compressible_wings , [-1,1] )
+    CL = np.reshape( conditions.aerodynamics.lift_coefficient               , [-1,1] )
+
+    n_points = Mc.shape[0]
+    n_wings  = len(table.tags)
+
+    # complex under a complex step
+    dtype = np.result_type(Mc,cl,CL)
+
+    cd_c = np.zeros([n_points,n_wings],dtype=dtype)
+    mcc  = np.zeros([n_points,n_wings],dtype=dtype)
+    MDiv = np.zeros([n_points,n_wings],dtype=dtype)
+
+    # regimes
+    mach  = np.real(Mc[:,0])
+    sub   = mach <= 0.99
+    trans = (mach > 0.99) & (mach < 1.05)
+    sup   = mach >= 1.05
+
+    # For subsonic mach numbers, use drag divergence correlations to find the drag
+    if np.any(sub):
+        cd_c[sub], mcc[sub], MDiv[sub] = drag_div(Mc[sub],cl[sub],table)
+
+    # For mach numbers close to 1, interpolate between the mach 0.99 and 1.05 anchors
+    if np.any(trans):
+        drag99  = drag_div(Mc[trans]*0. + 0.99,cl[trans],table)[0]
+        drag105 = wave_drag(CL[trans],table.lift_factor_105,table.volume_drag_105,table)
+        cd_c[trans] = drag99 + (drag105-drag99)*(Mc[trans]-0.99)/(1.05-0.99)
+
+    # Use wave drag equations at supersonic values
+    if np.any(sup):
+        x    = np.pi*table.length_AR/4
+        beta = np.sqrt(Mc[sup]**2-1)
+
+        lift_factor = x/4*(np.sqrt(1+(beta/x)**2)-1)
+        volume_drag = table.volume_factor*(beta**2+2*x**2)/(beta**2+x**2)**1.5
+
+        cd_c[sup] = wave_drag(CL[sup],lift_factor,volume_drag,table)
+
+    # Dump data to conditions
+    drag_breakdown.compressible = Results()
+
+    for i,tag in enumerate(table.tags):
+        # set one by one, cheaper than Results(**kwarg) in the residual loop
+        wing_results = Results()
+        wing_results.compressibility_drag = np.reshape( cd_c[:,i] , shape )
+        wing_results.crest_critical       = np.reshape( mcc[:,i]  , shape )
+        wing_results.divergence_mach      = np.reshape( MDiv[:,i] , shape )
+        drag_breakdown.compressible[tag] = wing_results
+
+    # Dump total comp drag
+    total_compressibility_drag = np.reshape( np.sum(cd_c,axis=1) , shape )
+    drag_breakdown.compressible.total = total_compressibility_drag
+
+    return total_compressibility_drag
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def drag_div(Mc,cl,table):
+    """ drag divergence correlations, for a column of mach numbers and
+        lift coefficients, one column per wing
+    """
+
+    cos_sweep = table.cos_sweep
+    high_mach = table.high_mach
+
+    # Other wings than the main wing are assumed to have no lift
+    cl_w = cl * table.main
+
+    # Get effective Cl and sweep
+    tc = table.thickness_to_chord / cos_sweep
+    cl = cl_w / cos_sweep**2
+
+    # Compressibility drag based on regressed fits from AA241
+    mcc_cos_ws = 0.922321524499352       \
+        - 1.153885166170620*tc    \
+        - 0.304541067183461*cl    \
+        + 0.332881324404729*tc**2 \
+        + 0.467317361111105*tc*cl \
+        + 0.087490431201549*cl**2
+
+    # Crest-critical mach number, corrected for wing sweep
+    mcc = mcc_cos_ws / cos_sweep
+
+    # Divergence mach number
+    MDiv = mcc * ( 1.02 + 0.08*(1 - cos_sweep) )
+
+    # Wings designed for high subsonic cruise use an arbitrary divergence point,
+    # as the correlation will not work
+    mcc  = np.where(high_mach,0.93,mcc)
+    MDiv = np.where(high_mach,0.95,MDiv)
+
+    # Divergence ratio
+    mo_mc = Mc/mcc
+
+    # Compressibility correlation, Shevell
+    dcdc_cos3g = 0.0019*mo_mc**14.641
+
+    # Sweep correlation cannot be used if the wing has a high mach design
+    cd_c = dcdc_cos3g * np.where(high_mach,1.,cos_sweep**3)
+
+    return cd_c, mcc, MDiv
+
+
+def wave_drag(CL,lift_factor,volume_drag,table):
+    """ wave drag due to lift and volume, on the main wing reference area,
+        with the fuselage and propulsor wave drag on the main wing
+    """
+
+    cd_c = CL**2*lift_factor + volume_drag
+
+    # Convert coefficient to full aircraft value
+    cd_c = cd_c*table.area_ratio + table.body_wave_drag*table.main
+
+    return cd_c
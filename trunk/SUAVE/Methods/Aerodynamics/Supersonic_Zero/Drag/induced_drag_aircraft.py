@@ -60,7 +60,7 @@ def induced_drag_aircraft(state,settings,geometry):
             #total_induced_drag = aircraft_lift**2 / (np.pi*ar)
             ##total_induced_drag = aircraft_lift * 0.0
             
-    total_induced_drag = np.array([[0.0]]*len(Mc))
+    total_induced_drag = Mc * 0.
     total_induced_drag[Mc < 1.0] = aircraft_lift[Mc < 1.0]**2 / (np.pi*ar*e)
     total_induced_drag[Mc >= 1.0] = aircraft_lift[Mc >= 1.0]**2 / (np.pi*ar*e)
         
@@ -81,10 +81,10 @@ def parasite_drag_fuselage(state,settings,geometry):
     
     # form factor for cylindrical bodies
     d_d = float(d_fus)/float(l_fus)
-    D = np.array([[0.0]] * len(Mc))
-    a = np.array([[0.0]] * len(Mc))
-    du_max_u = np.array([[0.0]] * len(Mc))
-    k_fus = np.array([[0.0]] * len(Mc))
+    D = Mc * 0.
+    a = Mc * 0.
+    du_max_u = Mc * 0.
+    k_fus = Mc * 0.
     
     D[Mc < 0.95] = np.sqrt(1 - (1-Mc[Mc < 0.95]**2) * d_d**2)
     a[Mc < 0.95] = 2 * (1-Mc[Mc < 0.95]**2) * (d_d**2) *(np.arctanh(D[Mc < 0.95])-D[Mc < 0.95]) / (D[Mc < 0.95]**3)
@@ -92,10 +92,10 @@ def parasite_drag_propulsor(state,settings,geometry):
         d_d = 1/((propulsor.engine_length + propulsor.D) / np.sqrt(4/np.pi*(A_max - (A_exit+A_inflow)/2)))
     except:
         d_d = float(d_prop)/float(l_prop)
-    D = np.array([[0.0]] * len(Mc))
-    a = np.array([[0.0]] * len(Mc))
-    du_max_u = np.array([[0.0]] * len(Mc))
-    k_prop = np.array([[0.0]] * len(Mc))
+    D = Mc * 0.
+    a = Mc * 0.
+    du_max_u = Mc * 0.
+    k_prop = Mc * 0.
     
     D[Mc < 0.95] = np.sqrt(1 - (1-Mc[Mc < 0.95]**2) * d_d**2)
     a[Mc < 0.95] = 2 * (1-Mc[Mc < 0.95]**2) * (d_d**2) *(np.arctanh(D[Mc < 0.95])-D[Mc < 0.95]) / (D[Mc < 0.95]**3)
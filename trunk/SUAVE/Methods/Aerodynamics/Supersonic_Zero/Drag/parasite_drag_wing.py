@@ -109,7 +109,7 @@ def parasite_drag_wing(state,settings,geometry):
 
     # correction for airfoils
 
-    k_w = np.array([[0.0]] * len(Mc))
+    k_w = Mc * 0.
 
     k_w[Mc < 0.95] = 1. + ( 2.* C * (t_c_w * (np.cos(sweep_w))**2.) ) / ( np.sqrt(1.- Mc[Mc < 0.95]**2. * ( np.cos(sweep_w))**2.) )  \
                      + ( C**2. * (np.cos(sweep_w))**2. * t_c_w**2. * (1. + 5.*(np.cos(sweep_w)**2.)) ) \
@@ -0,0 +1,87 @@
+# wave_drag_geometry.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from wave_drag_body_of_rev import wave_drag_body_of_rev
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#  The Function
+# ----------------------------------------------------------------------
+
+def wave_drag_geometry(geometry):
+    """ table = SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.wave_drag_geometry(geometry)
+        precomputes the geometry terms of compressibility_drag_total(), as flat
+        arrays with one entry per wing
+
+        Inputs:
+            geometry - SUave type vehicle, with wings, a fuselage tagged 'fuselage'
+                       and propulsors
+
+        Outputs:
+            table.tags               - wing tags, the first is the main wing
+            table.main               - True for the main wing, the only one with lift
+            table.high_mach          - wing.high_mach
+            table.cos_sweep          - cos(sweep)
+            table.thickness_to_chord - t/c
+            table.length_AR          - root chord**2 / reference area
+            table.volume_factor      - 1.15 * 4 * t/c**2, of wave_drag_volume()
+            table.area_ratio         - reference area to the main wing reference area
+            table.lift_factor_105    - wave drag due to lift at mach 1.05, per CL**2
+            table.volume_drag_105    - wave drag due to volume at mach 1.05
+            table.body_wave_drag     - wave drag of the main fuselage and the propulsors,
+                                       on the main wing reference area
+
+        Assumptions:
+            as compressibility_drag_total()
+    """
+
+    wings     = geometry.wings
+    fuselage  = geometry.fuselages['fuselage']
+    propulsor = geometry.propulsors[0]
+
+    Sref_main = wings[0].areas.reference
+
+    table = Data()
+    table.tags = []
+    for key in ['main','high_mach','cos_sweep','thickness_to_chord','length_AR','area_ratio']:
+        table[key] = []
+
+    for i_wing,wing in enumerate(wings.values()):
+        table.tags.append(wing.tag)
+        table.main.append(i_wing == 0)
+        table.high_mach.append(wing.high_mach is True)
+        table.cos_sweep.append(np.cos(wing.sweep))
+        table.thickness_to_chord.append(wing.thickness_to_chord)
+        table.length_AR.append(wing.chords.root**2/wing.areas.reference)
+        table.area_ratio.append(wing.areas.reference/Sref_main if i_wing != 0 else 1.)
+
+    # flat arrays
+    for key,value in table.items():
+        if key == 'tags': continue
+        table[key] = np.array(value,dtype=bool if key in ['main','high_mach'] else float)
+
+    # wave drag terms, see wave_drag_lift() and wave_drag_volume()
+    x = np.pi*table.length_AR/4
+    table.volume_factor = 1.15 * 4*table.thickness_to_chord**2
+
+    # the transonic interpolation anchor at mach 1.05
+    beta = np.sqrt(1.05**2-1)
+    table.lift_factor_105 = x/4*(np.sqrt(1+(beta/x)**2)-1)
+    table.volume_drag_105 = table.volume_factor*(beta**2+2*x**2)/(beta**2+x**2)**1.5
+
+    # fuselage and propulsor wave drag, carried by the main wing, with the
+    # correction for imperfect bodies
+    fuse_drag = wave_drag_body_of_rev(fuselage.lengths.total,fuselage.effective_diameter/2.0,Sref_main)*1.15
+    prop_drag = wave_drag_body_of_rev(propulsor.engine_length,propulsor.nacelle_diameter/2.0,Sref_main)*1.15*propulsor.number_of_engines
+    table.body_wave_drag = fuse_drag + prop_drag
+
+    return table
+
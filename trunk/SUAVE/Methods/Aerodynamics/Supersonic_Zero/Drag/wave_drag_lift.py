@@ -66,9 +66,9 @@ def wave_drag_lift(conditions,configuration,wing):
     
     # Computations
     x = np.pi*ARL/4
-    beta = np.array([[0.0]] * len(Mc))
+    beta = Mc * 0.
     beta[Mc >= 1.05] = np.sqrt(Mc[Mc >= 1.05]**2-1)
-    wave_drag_lift = np.array([[0.0]] * len(Mc))
+    wave_drag_lift = Mc * 0.
     wave_drag_lift[Mc >= 1.05] = CL[Mc >= 1.05]**2*x/4*(np.sqrt(1+(beta[Mc >= 1.05]/x)**2)-1)
     wave_drag_lift[0:len(Mc[Mc >= 1.05]),0] = wave_drag_lift[Mc >= 1.05]
 
@@ -60,8 +60,8 @@ def wave_drag_volume(conditions,configuration,wing):
     
     # Computations
     x = np.pi*ARL/4
-    beta = np.array([[0.0]] * len(Mc))
-    wave_drag_volume = np.array([[0.0]] * len(Mc))    
+    beta = Mc * 0.
+    wave_drag_volume = Mc * 0.    
     beta[Mc >= 1.05] = np.sqrt(Mc[Mc >= 1.05]**2-1)
     wave_drag_volume[Mc >= 1.05] = 4*t_c_w**2*(beta[Mc >= 1.05]**2+2*x**2)/(beta[Mc >= 1.05]**2+x**2)**1.5
     wave_drag_volume[0:len(Mc[Mc >= 1.05]),0] = wave_drag_volume[Mc >= 1.05]
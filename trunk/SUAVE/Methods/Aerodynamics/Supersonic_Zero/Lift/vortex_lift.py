@@ -45,7 +45,7 @@ def vortex_lift(state,settings,geometry):
     
     wings_lift = state.conditions.aerodynamics.lift_coefficient
 
-    vortex_cl = np.array([[0.0]] * len(Mc))
+    vortex_cl = AoA * 0.
     
     
 
@@ -75,11 +75,13 @@ def wing_compressibility(state,settings,geometry):
     
     wings_lift = state.conditions.aerodynamics.lift_coefficient
     
-    # compressibility correction
-    compress_corr = np.array([[0.0]] * len(Mc))
-    compress_corr[Mc < 0.95] = 1./(np.sqrt(1.-Mc[Mc < 0.95]**2.))
-    compress_corr[Mc >= 0.95] = 1./(np.sqrt(1.-0.95**2)) # Values for Mc > 1.05 are update after this assignment 
-    compress_corr[Mc > 1.05] = 1./(np.sqrt(Mc[Mc > 1.05]**2.-1.))
+    # compressibility correction, in the type of Mc for a complex step
+    compress_corr = Mc * 0.
+    sub = np.real(Mc) < 0.95
+    sup = np.real(Mc) > 1.05
+    compress_corr[sub] = 1./(np.sqrt(1.-Mc[sub]**2.))
+    compress_corr[~sub] = 1./(np.sqrt(1.-0.95**2)) # Values for Mc > 1.05 are update after this assignment 
+    compress_corr[sup] = 1./(np.sqrt(Mc[sup]**2.-1.))
     
     
     # correct lift
@@ -4,4 +4,5 @@ import NURBS
 from angle_to_dcm   import angle_to_dcm
 from angles_to_dcms import angles_to_dcms
 from orientation_product import orientation_product
-from orientation_transpose import orientation_transpose
\ No newline at end of file
+from orientation_transpose import orientation_transpose
+from orientation_transforms import body_to_inertial, wind_to_inertial, inertial_to_body, forces_to_inertial
@@ -0,0 +1,135 @@
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Body to Inertial
+# ----------------------------------------------------------------------
+
+def body_to_inertial(rotations,out=None):
+    """ T_body2inertial = body_to_inertial(rotations,out=None)
+        builds the body to inertial direction cosine matricies directly
+        from the euler angles
+
+        Inputs:
+            rotations = [phis thetas psis], column array of rotations
+            out       = optional [N,3,3] array to write into
+
+        Outputs:
+            T_body2inertial = 3-dimensional array with direction cosine
+                              matricies patterned along dimension zero,
+                              same as the transpose of
+                              angles_to_dcms(rotations,(2,1,0))
+    """
+
+    c_phi = np.cos(rotations[:,0])
+    s_phi = np.sin(rotations[:,0])
+    c_tht = np.cos(rotations[:,1])
+    s_tht = np.sin(rotations[:,1])
+    c_psi = np.cos(rotations[:,2])
+    s_psi = np.sin(rotations[:,2])
+
+    T = buffer(out,[len(rotations),3,3],rotations.dtype)
+
+    # columns are the rows of the inertial to body transform
+    T[:,0,0] = c_tht*c_psi
+    T[:,1,0] = c_tht*s_psi
+    T[:,2,0] = -s_tht
+
+    T[:,0,1] = s_phi*s_tht*c_psi - c_phi*s_psi
+    T[:,1,1] = s_phi*s_tht*s_psi + c_phi*c_psi
+    T[:,2,1] = s_phi*c_tht
+
+    T[:,0,2] = c_phi*s_tht*c_psi + s_phi*s_psi
+    T[:,1,2] = c_phi*s_tht*s_psi - s_phi*c_psi
+    T[:,2,2] = c_phi*c_tht
+
+    return T
+
+
+# ----------------------------------------------------------------------
+#  Wind to Inertial
+# ----------------------------------------------------------------------
+
+def wind_to_inertial(wind_rotations,T_body2inertial,out=None):
+    """ T_wind2inertial = wind_to_inertial(wind_rotations,T_body2inertial,out=None)
+        builds the wind to inertial direction cosine matricies from the
+        wind frame rotations and the body to inertial transform
+
+        Inputs:
+            wind_rotations  = [rolls alphas betas], column array of rotations
+            T_body2inertial = from body_to_inertial()
+            out             = optional [N,3,3] array to write into
+
+        Outputs:
+            T_wind2inertial = same as
+                orientation_product( angles_to_dcms(wind_rotations,(2,1,0)) , T_body2inertial )
+    """
+
+    # the wind euler transform, as a transpose
+    T_wind = body_to_inertial(wind_rotations)
+
+    dtype = np.result_type(T_wind,T_body2inertial)
+    T = buffer(out,T_body2inertial.shape,dtype)
+
+    return np.einsum('aji,ajk->aik',T_wind,T_body2inertial,out=T)
+
+
+# ----------------------------------------------------------------------
+#  Inertial to Body
+# ----------------------------------------------------------------------
+
+def inertial_to_body(T_body2inertial,vectors,out=None):
+    """ vectors_body = inertial_to_body(T_body2inertial,vectors,out=None)
+        rotates inertial vectors into the body frame, without
+        transposing the transform
+    """
+
+    dtype = np.result_type(T_body2inertial,vectors)
+    V = buffer(out,vectors.shape,dtype)
+
+    return np.einsum('aji,aj->ai',T_body2inertial,vectors,out=V)
+
+
+# ----------------------------------------------------------------------
+#  Forces to Inertial
+# ----------------------------------------------------------------------
+
+def forces_to_inertial(T_wind2inertial,wind_forces,T_body2inertial,body_forces,inertial_forces,out=None):
+    """ F = forces_to_inertial(T_wind2inertial,wind_forces,T_body2inertial,body_forces,inertial_forces,out=None)
+        sums wind, body and inertial frame forces in the inertial frame
+
+        Inputs:
+            T_wind2inertial, T_body2inertial - direction cosine matricies
+            wind_forces     - [N,3] sum of the wind frame forces
+            body_forces     - [N,3] sum of the body frame forces
+            inertial_forces - [N,3] sum of the inertial frame forces
+            out             - optional [N,3] array to write into
+
+        Outputs:
+            F - [N,3] total inertial force vectors
+    """
+
+    dtype = np.result_type(T_wind2inertial,wind_forces,T_body2inertial,body_forces,inertial_forces)
+    F = buffer(out,wind_forces.shape,dtype)
+
+    np.einsum('aij,aj->ai',T_wind2inertial,wind_forces,out=F)
+    F += np.einsum('aij,aj->ai',T_body2inertial,body_forces)
+    F += inertial_forces
+
+    return F
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def buffer(out,shape,dtype):
+    """ out if it can take an array of this shape and type,
+        otherwise a new array
+    """
+
+    shape = tuple(shape)
+
+    if isinstance(out,np.ndarray) and out.shape == shape and np.can_cast(dtype,out.dtype):
+        return out
+
+    return np.empty(shape,dtype=dtype)
@@ -155,12 +155,11 @@ def update_aerodynamics(segment,state):
     CL = results.lift.total
     CD = results.drag.total
     
-    # dimensionalize
-    L = state.ones_row(3) * 0.0
-    D = state.ones_row(3) * 0.0
+    # dimensionalize, in the type of the coefficients for a complex step
+    zeros = np.zeros_like( CL * q )
 
-    L[:,2] = ( -CL * q * Sref )[:,0]
-    D[:,0] = ( -CD * q * Sref )[:,0]
+    L = np.hstack([ zeros , zeros , -CL * q * Sref ])
+    D = np.hstack([ -CD * q * Sref , zeros , zeros ])
 
     results.lift_force_vector = L
     results.drag_force_vector = D    
@@ -5,9 +5,10 @@
 
 import numpy as np
 from SUAVE.Core import Units
+from SUAVE.Methods.Utilities.complex_step import cs_arctan2
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
-     import angles_to_dcms, orientation_product, orientation_transpose
+     import body_to_inertial, wind_to_inertial, inertial_to_body, forces_to_inertial
 
 # ----------------------------------------------------------------------
 #  Initialize Inertial Position
@@ -125,27 +126,23 @@ def update_orientations(segment,state):
 
     # body frame rotations
     phi   = body_inertial_rotations[:,0,None]
-    theta = body_inertial_rotations[:,1,None]
-    psi   = body_inertial_rotations[:,2,None]
 
-    # body frame tranformation matrices
-    T_inertial2body = angles_to_dcms(body_inertial_rotations,(2,1,0))
-    T_body2inertial = orientation_transpose(T_inertial2body)
+    # body frame tranformation matrices, into last iteration's arrays
+    T_body2inertial = body_to_inertial(body_inertial_rotations,conditions.frames.body.transform_to_inertial)
 
     # transform inertial velocity to body frame
-    V_body = orientation_product(T_inertial2body,V_inertial)
+    V_body = inertial_to_body(T_body2inertial,V_inertial)
 
     # project inertial velocity into body x-z plane
     V_stability = V_body
     V_stability[:,1] = 0
     V_stability_magnitude = np.sqrt( np.sum(V_stability**2,axis=1) )[:,None]
-    #V_stability_direction = V_stability / V_stability_magnitude
 
     # calculate angle of attack
-    alpha = np.arctan2(V_stability[:,2],V_stability[:,0])[:,None]
+    alpha = cs_arctan2(V_stability[:,2],V_stability[:,0])[:,None]
 
     # calculate side slip
-    beta = np.arctan2(V_body[:,1],V_stability_magnitude[:,0])[:,None]
+    beta = cs_arctan2(V_body[:,1],V_stability_magnitude[:,0])[:,None]
 
     # pack aerodynamics angles
     conditions.aerodynamics.angle_of_attack[:,0] = alpha[:,0]
@@ -167,9 +164,7 @@ def update_orientations(segment,state):
     wind_body_rotations[:,2] = beta[:,0]  # psi is side slip angle
 
     # wind frame tranformation matricies
-    T_wind2body = angles_to_dcms(wind_body_rotations,(2,1,0))
-    T_body2wind = orientation_transpose(T_wind2body)
-    T_wind2inertial = orientation_product(T_wind2body,T_body2inertial)
+    T_wind2inertial = wind_to_inertial(wind_body_rotations,T_body2inertial,conditions.frames.wind.transform_to_inertial)
 
     # pack wind rotations
     conditions.frames.wind.body_rotations = wind_body_rotations
@@ -194,23 +189,21 @@ def update_forces(segment,state):
     wind_drag_force_vector        = conditions.frames.wind.drag_force_vector
     body_thrust_force_vector      = conditions.frames.body.thrust_force_vector
     inertial_gravity_force_vector = conditions.frames.inertial.gravity_force_vector
+    inertial_total_force_vector   = conditions.frames.inertial.total_force_vector
 
     # unpack transformation matrices
     T_body2inertial = conditions.frames.body.transform_to_inertial
     T_wind2inertial = conditions.frames.wind.transform_to_inertial
 
-    # to inertial frame
-    L = orientation_product(T_wind2inertial,wind_lift_force_vector)
-    D = orientation_product(T_wind2inertial,wind_drag_force_vector)
-    T = orientation_product(T_body2inertial,body_thrust_force_vector)
-    W = inertial_gravity_force_vector
-
-    # sum of the forces
-    F = L + D + T + W
+    # sum of the forces, in the inertial frame
+    F = forces_to_inertial(T_wind2inertial, wind_lift_force_vector + wind_drag_force_vector,
+                           T_body2inertial, body_thrust_force_vector,
+                           inertial_gravity_force_vector, inertial_total_force_vector)
     # like a boss
 
-    # pack
-    conditions.frames.inertial.total_force_vector[:,:] = F[:,:]
+    # pack, if it could not be written in place
+    if not F is inertial_total_force_vector:
+        inertial_total_force_vector[:,:] = F[:,:]
 
     return
 
@@ -3,7 +3,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-from copy import deepcopy
 
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
@@ -20,7 +19,7 @@ def expand_sub_segments(segment,state):
         if Process.verbose:
             print 'segment start :' , tag
         
-        sub_state = deepcopy( sub_segment.state )
+        sub_state = sub_segment.state.clone()
         
         if last_tag:
             sub_state.initials = state.segments[last_tag]
@@ -39,6 +38,36 @@ def expand_sub_segments(segment,state):
 
         
 
+# ----------------------------------------------------------------------
+#  Expand Independent Sub Segments
+# ----------------------------------------------------------------------
+
+def expand_independent_sub_segments(segment,state):
+    """ expands each sub segment on its own state, without passing
+        the final conditions of one sub segment to the next, 
+        as for the cases of a Batch mission
+    """
+    
+    from SUAVE.Analyses import Process
+    
+    for tag,sub_segment in segment.segments.items():
+        
+        if Process.verbose:
+            print 'segment start :' , tag
+        
+        sub_state = sub_segment.state.clone()
+        
+        sub_segment.initialize(sub_state)
+        
+        state.segments[tag]     = sub_state
+        state.unknowns[tag]     = sub_state.unknowns
+        state.conditions[tag]   = sub_state.conditions
+        state.residuals[tag]    = sub_state.residuals
+        
+        if Process.verbose:
+            print 'segment end :' , tag
+
+
 # ----------------------------------------------------------------------
 #  Update Sub Segments
 # ----------------------------------------------------------------------        
@@ -51,6 +80,18 @@ def update_sub_segments(segment,state):
         
         
                     
+# ----------------------------------------------------------------------
+#  Update Independent Sub Segments
+# ----------------------------------------------------------------------        
+
+def update_independent_sub_segments(segment,state):
+    """ iterates each sub segment on its own state, the sub segments
+        keep what they set up in initialize, see expand_independent_sub_segments()
+    """
+    for tag,sub_segment in segment.segments.items():
+        sub_segment.iterate(state.segments[tag])
+        
+                    
 # ----------------------------------------------------------------------
 #  Finalize Sub Segments
 # ----------------------------------------------------------------------
@@ -64,6 +105,18 @@ def finalize_sub_segments(segment,state):
         state.segments[tag].initials = Conditions()
     
     
+# ----------------------------------------------------------------------
+#  Finalize Independent Sub Segments
+# ----------------------------------------------------------------------        
+
+def finalize_independent_sub_segments(segment,state):
+    """ runs the finalize process of each sub segment, 
+        the sub segments may be missions, whose finalize() is taken by the analyses
+    """
+    for tag,sub_segment in segment.segments.items():
+        sub_segment.process.finalize(sub_segment,state.segments[tag])
+
+
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
 # ----------------------------------------------------------------------
@@ -71,4 +124,58 @@ def finalize_sub_segments(segment,state):
 def sequential_sub_segments(segment,state):
     
     for tag,sub_segment in segment.segments.items():
-        sub_segment.evaluate(state.segments[tag])
\ No newline at end of file
+        sub_segment.evaluate(state.segments[tag])
+
+
+# ----------------------------------------------------------------------
+#  Batch Sub Segments
+# ----------------------------------------------------------------------
+
+def batch_sub_segments(segment,state):
+    """ solves the cases of a Batch mission one segment at a time,
+        the n-th segment of every case is converged in one root find
+        
+        Assumptions:
+            every case has the same number of segments,
+            solved in order as in sequential_sub_segments()
+    """
+    
+    from SUAVE.Analyses.Mission.Segments import Segment
+    from SUAVE.Analyses.Mission.Segments.Conditions import State
+    from SUAVE.Methods.Missions.Segments.converge_root import converge_root
+    
+    cases = segment.segments.items()
+    if not cases: return
+    
+    n_segments = len(cases[0][1].segments)
+    
+    for i_segment in range(n_segments):
+        
+        # the i-th segment of every case, as sub segments of one stage
+        stage = Segment.Container()
+        stage.tag = 'stage_%i' % i_segment
+        stage.settings = segment.settings
+        stage.process.iterate.sub_segments = update_independent_sub_segments
+        
+        stage_state = State.Container()
+        stage_state.numerics = state.numerics
+        
+        for tag,case in cases:
+            sub_segment = case.segments[i_segment]
+            sub_state   = state.segments[tag].segments[i_segment]
+            
+            # the previous segment of the case is converged now
+            sub_segment.initialize(sub_state)
+            
+            stage.segments[tag]        = sub_segment
+            stage_state.segments[tag]  = sub_state
+            stage_state.unknowns[tag]  = sub_state.unknowns
+            stage_state.residuals[tag] = sub_state.residuals
+            
+        converge_root(stage,stage_state)
+        
+        for tag,sub_segment in stage.segments.items():
+            sub_state = stage_state.segments[tag]
+            sub_segment.iterate(sub_state)
+            sub_segment.finalize(sub_state)
+
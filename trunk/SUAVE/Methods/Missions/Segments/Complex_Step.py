@@ -0,0 +1,272 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import os
+import sys
+import traceback
+import warnings
+
+from SUAVE.Core import Data
+
+
+# ----------------------------------------------------------------------
+#  Cast State
+# ----------------------------------------------------------------------
+
+def cast_state(state,dtype):
+    """ Complex_Step.cast_state(state,dtype)
+        moves the arrays of a segment state to complex, or back to real,
+        for a complex step through segment.process.iterate
+
+        Inputs:
+            state - the segment state, may hold sub segment states
+            dtype - complex, or float to keep only the real part
+
+        Outputs:
+            the conditions, unknowns and residuals arrays of state and its
+            sub segment states, cast in place.  the flat vectors behind the
+            unknowns and residuals follow, see Conditions.allocate_vector()
+
+        Assumptions:
+            steps that update arrays in place need complex arrays to keep
+            the imaginary part.  initials are left real, they are constant
+            during the solve.
+    """
+
+    for key in ['conditions','unknowns','residuals']:
+        cast_arrays(state[key],dtype)
+
+    if state.has_key('segments'):
+        for tag,sub_state in state.segments.items():
+            cast_state(sub_state,dtype)
+
+    state.unknowns.allocate_vector()
+    state.residuals.allocate_vector()
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Iterate
+# ----------------------------------------------------------------------
+
+def iterate(unknowns,segment,state):
+    """ residuals = Complex_Step.iterate(unknowns,segment,state)
+        segment.process.iterate at complex unknowns
+
+        Inputs:
+            unknowns - packed vector, complex
+            state    - cast to complex, see cast_state()
+
+        Outputs:
+            residuals - packed vector, complex
+
+        Assumptions:
+            a step that would drop an imaginary part, by writing a complex
+            value into a real array, raises numpy's ComplexWarning
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error',np.ComplexWarning)
+
+        state.unknowns.unpack_vector(unknowns)
+        segment.process.iterate(segment,state)
+        residuals = state.residuals.pack_vector()
+
+    return residuals
+
+
+# ----------------------------------------------------------------------
+#  Check Steps
+# ----------------------------------------------------------------------
+
+def check_steps(segment,state,step=1e-30,difference=1e-6,tolerance=1e-5,seed=0):
+    """ checks = Complex_Step.check_steps(segment,state)
+        checks that each step of segment.process.iterate is complex safe,
+        by comparing a complex step and a central difference of every
+        condition, along one random direction of the unknowns
+
+        Inputs:
+            segment, state - a segment and its state, initialized, and
+                             best converged so the point is realistic
+            step           - complex step size
+            difference     - central difference step, relative to the unknowns
+            tolerance      - largest accepted difference between the two,
+                             relative to the central difference
+            seed           - of the random direction
+
+        Outputs:
+            checks - Data() by step path, in process order, with
+                error   - largest relative error of the arrays set by the step
+                failed  - paths of the arrays that went wrong at this step
+                message - the error raised by the step, if any
+            checks.safe - True if every step passed
+
+        Assumptions:
+            an array is reported at the first step it goes wrong, arrays
+            computed from it further down fail too, so the first failing step
+            is the one to fix.  arrays whose central difference is in the
+            noise of their values are skipped.  the state is left at the
+            unknowns it came with.
+    """
+
+    steps = process_steps(segment.process.iterate)
+
+    unknowns = np.real( state.unknowns.pack_vector() )
+
+    direction = np.random.RandomState(seed).uniform(-1.,1.,len(unknowns))
+    direction = direction * np.maximum(np.abs(unknowns),1.)
+
+    # central differences, step by step
+    plus  = step_values(steps,unknowns,difference*direction,segment,state)[0]
+    minus = step_values(steps,unknowns,-difference*direction,segment,state)[0]
+
+    # the complex step, step by step
+    try:
+        values, messages = step_values(steps,unknowns,1j*step*direction,segment,state)
+    finally:
+        cast_state(state,float)
+        iterate_real(unknowns,segment,state)
+
+    checks = Data()
+    checks.safe = True
+    failed = set()
+
+    for i,(path,function) in enumerate(steps):
+
+        check = Data()
+        check.error   = 0.
+        check.failed  = []
+        check.message = messages[i]
+
+        for key,value in values[i].items():
+            if not check.message is None: break
+            if not key in plus[i] or not key in minus[i]: continue
+
+            fd = ( plus[i][key] - minus[i][key] ) / ( 2.*difference )
+            cs = np.imag(value) / step
+
+            # central difference noise
+            noise = 1e-8 * np.max( np.abs(np.real(value)) ) / difference
+            scale = np.max( np.abs(fd) )
+            if scale <= noise: continue
+
+            error = np.max( np.abs(cs-fd) ) / scale
+            check.error = max( check.error , error )
+
+            if error > tolerance and not key in failed:
+                check.failed.append(key)
+                failed.add(key)
+
+        checks['.'.join(path)] = check
+        checks.safe = checks.safe and not check.failed and check.message is None
+
+        # the rest of the process is not evaluated
+        if not check.message is None: break
+
+    return checks
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def cast_arrays(data,dtype):
+    """ casts the float and complex arrays in data, recursively
+    """
+    for key,value in data.items():
+        if isinstance(value,Data):
+            cast_arrays(value,dtype)
+        elif isinstance(value,np.ndarray) and value.dtype.kind in 'fc':
+            if dtype is complex:
+                data[key] = value.astype(complex)
+            else:
+                data[key] = np.real(value).copy()
+        elif isinstance(value,complex) and not dtype is complex:
+            data[key] = value.real
+
+    return
+
+
+def process_steps(process,prefix=()):
+    """ [(path,step)] of the leaf steps of a process, in order
+    """
+    # analyses import the methods
+    from SUAVE.Analyses.Process import Process
+
+    steps = []
+    for tag,step in process.items():
+        if isinstance(step,Process):
+            steps.extend( process_steps(step,prefix+(tag,)) )
+        else:
+            steps.append( (prefix+(tag,),step) )
+    return steps
+
+
+def step_values(steps,unknowns,perturbation,segment,state):
+    """ runs the steps one by one at the perturbed unknowns, and copies the
+        condition and residual arrays after each.  stops at the first step
+        that raises.
+
+        the whole process first runs at the base unknowns, so arrays that
+        are not set yet hold the same values in every run, and show no
+        derivative
+    """
+
+    complex_step = np.iscomplexobj(perturbation)
+
+    iterate_real(unknowns,segment,state)
+    if complex_step:
+        cast_state(state,complex)
+
+    values   = []
+    messages = []
+
+    with warnings.catch_warnings():
+        if complex_step:
+            warnings.simplefilter('error',np.ComplexWarning)
+
+        state.unknowns.unpack_vector(unknowns + perturbation)
+
+        for path,step in steps:
+            message = None
+            try:
+                if hasattr(step,'evaluate'):
+                    step.evaluate(segment,state)
+                else:
+                    step(segment,state)
+            except Exception as error:
+                filename,line = traceback.extract_tb(sys.exc_info()[2])[-1][:2]
+                message = '%s: %s (%s, line %i)' % (type(error).__name__,error,os.path.basename(filename),line)
+
+            snapshot = {}
+            for key in ['conditions','residuals']:
+                for name,value in leaf_arrays(state[key],key):
+                    snapshot[name] = np.array(value)
+
+            values.append(snapshot)
+            messages.append(message)
+
+            if not message is None: break
+
+    return values, messages
+
+
+def leaf_arrays(data,prefix):
+    """ yields (path,array) of the numeric arrays in data, recursively
+    """
+    for key,value in data.items():
+        path = prefix + '.' + key
+        if isinstance(value,Data):
+            for item in leaf_arrays(value,path):
+                yield item
+        elif isinstance(value,np.ndarray) and value.dtype.kind in 'fc' and value.size:
+            yield path, value
+
+
+def iterate_real(unknowns,segment,state):
+    state.unknowns.unpack_vector(unknowns)
+    segment.process.iterate(segment,state)
+    return state.residuals.pack_vector()
@@ -30,6 +30,34 @@ def residual_total_forces(segment,state):
     state.residuals.forces[:,1] = FT[:,2]
 
     return
+
+
+def residual_total_forces_along_track(segment,state):
+    """ residual_total_forces_along_track(segment,state)
+        the horizontal force along the track instead of its magnitude,
+        for a Newton or complex step Jacobian, the magnitude has no
+        derivative at the solution.  set it in place of
+        residual_total_forces in segment.process.iterate.residuals.
+        at no horizontal speed, the force along x.
+    """
+    
+    FT = state.conditions.frames.inertial.total_force_vector
+    V  = state.conditions.frames.inertial.velocity_vector
+    
+    # the direction of the track
+    V_horizontal = np.sqrt( V[:,0]**2. + V[:,1]**2. )
+    moving = np.real(V_horizontal) > 0.
+    ex = np.ones_like(V_horizontal)
+    ey = np.zeros_like(V_horizontal)
+    ex[moving] = V[moving,0] / V_horizontal[moving]
+    ey[moving] = V[moving,1] / V_horizontal[moving]
+    
+    # horizontal, along the track
+    state.residuals.forces[:,0] = FT[:,0]*ex + FT[:,1]*ey
+    # vertical
+    state.residuals.forces[:,1] = FT[:,2]
+
+    return
     
     
  
@@ -0,0 +1,431 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Plugins.VyPy.tools import array_type, matrix_type
+
+import Complex_Step
+
+
+# ----------------------------------------------------------------------
+#  Setup Jacobian
+# ----------------------------------------------------------------------
+
+def setup_jacobian(segment,state):
+    """ jacobian = Jacobian.setup_jacobian(segment,state)
+        builds the jacobian function handed to the root finder
+
+        Inputs:
+            state.numerics.solver_jacobian - one of
+                "none"     - no jacobian, the root finder differences every column
+                "sparse"   - block-sparse finite differences with column coloring
+                "analytic" - partials published by the iterate steps with
+                             publish_partial(), sparse finite differences for
+                             everything else. no iterate step of the segments in
+                             SUAVE publishes partials yet, so this is a hook for
+                             user defined steps and otherwise the same as "sparse"
+                "complex"  - as "sparse", with complex steps, exact to machine
+                             precision, see Complex_Step
+
+        Outputs:
+            jacobian - a function jacobian(unknowns,(segment,state)),
+                       or None for "none"
+
+        Assumptions:
+            the sparsity pattern follows the coupling of the segments, see
+            sparsity_pattern(). the differentiation and integration operators
+            couple every control point of a segment, and segments chained
+            through their initials see every unknown of the segments before
+            them, so only independent segments, e.g. the cases of a Batch
+            mission, share colors.
+    """
+
+    method = state.numerics.solver_jacobian
+
+    if method == 'none':
+        return None
+    elif not method in ('sparse','analytic','complex'):
+        raise ValueError , 'unknown solver_jacobian "%s"' % method
+
+    # structure is fixed during the solve
+    unknowns_index  = pack_index(state,'unknowns')
+    residuals_index = pack_index(state,'residuals')
+    pattern = sparsity_pattern(residuals_index,unknowns_index)
+
+    coloring = Data()
+    coloring.colors = None
+
+    def jacobian(unknowns,(segment,state)):
+
+        J = np.zeros(pattern.shape)
+        known = np.zeros(pattern.shape,dtype=bool)
+
+        # the real part of a complex step is the base point
+        if method == 'complex':
+            if coloring.colors is None:
+                coloring.colors = color_columns(pattern)
+            return complex_step(J,unknowns,segment,state,pattern,coloring.colors)
+
+        # evaluate at the base point, this publishes any partials
+        residuals = iterate(unknowns,segment,state)
+
+        if method == 'analytic':
+            known = assemble_partials(J,state,residuals_index,unknowns_index)
+
+        # color the remaining columns once
+        if coloring.colors is None:
+            coloring.colors = color_columns(pattern & ~known)
+
+        finite_difference(J,unknowns,residuals,segment,state,pattern & ~known,coloring.colors)
+
+        return J
+
+    return jacobian
+
+
+# ----------------------------------------------------------------------
+#  Pack Index
+# ----------------------------------------------------------------------
+
+def pack_index(state,key):
+    """ index = Jacobian.pack_index(state,key)
+        maps every entry of state[key].pack_array() to the segment state
+        it belongs to
+
+        Inputs:
+            state - the state being solved, may hold sub segment states
+            key   - 'unknowns' or 'residuals'
+
+        Outputs:
+            index - Data() with arrays of length pack_array().size
+                owner   - number of the owning state in index.states
+                drivers - boolean [size,n_states], True for each state whose
+                          unknowns the entry may depend on
+            index.states - list of states, outer states first
+            index.leaves - list of (owner state, key, slice, shape) for each array
+
+        Assumptions:
+            follows the same traversal as pack_array('vector').
+            a state depends on the unknowns of its own segment, of the
+            missions it lies in, of its sub segments, and of the state linked
+            as its initials, together with everything that state depends on.
+    """
+
+    # who owns which subtree
+    states  = []
+    parents = []
+    owners  = {}
+    numbers = {}
+    def find_owners(sub_state,parent):
+        owners[id(sub_state[key])] = len(states)
+        numbers[id(sub_state)] = len(states)
+        parents.append(parent)
+        states.append(sub_state)
+        this = len(states) - 1
+        if sub_state.has_key('segments'):
+            for tag,sub in sub_state.segments.items():
+                find_owners(sub,this)
+    find_owners(state,-1)
+
+    # each state's ancestors, including itself
+    n_states = len(states)
+    ancestry = np.zeros([n_states,n_states],dtype=bool)
+    for i in range(n_states):
+        j = i
+        while j >= 0:
+            ancestry[i,j] = True
+            j = parents[j]
+
+    # the state each one starts from, see expand_sub_segments()
+    initials = -np.ones(n_states,dtype=int)
+    for i,sub_state in enumerate(states):
+        if sub_state.has_key('initials'):
+            initials[i] = numbers.get(id(sub_state.initials),-1)
+
+    # ancestors and sub segments, then through the initials, which come
+    # earlier in the traversal than the states they start
+    drivers = ancestry | ancestry.T
+    for i in range(n_states):
+        for j in np.where(ancestry[i,:])[0]:
+            if initials[j] >= 0:
+                drivers[i,:] |= drivers[initials[j],:]
+
+    valid_types = ( int, float, array_type, matrix_type )
+
+    owner  = []
+    leaves = []
+
+    def do_index(D,this_owner):
+
+        this_owner = owners.get(id(D),this_owner)
+        sub_state  = states[this_owner]
+
+        for k,v in D.iteritems():
+            if isinstance(v,Data):
+                do_index(v,this_owner) # recursion!
+                continue
+            elif not isinstance(v,valid_types): continue
+            elif np.ndim(v) > 2: continue
+
+            shape = np.shape(v)
+            size  = int(np.prod(shape))
+            start = len(owner)
+
+            owner.extend( [this_owner] * size )
+            leaves.append( (sub_state,k,slice(start,start+size),shape) )
+
+    do_index(state[key],0)
+
+    index = Data()
+    index.owner   = np.array(owner,dtype=int)
+    index.drivers = drivers[index.owner,:]
+    index.states  = states
+    index.leaves  = leaves
+
+    return index
+
+
+# ----------------------------------------------------------------------
+#  Sparsity Pattern
+# ----------------------------------------------------------------------
+
+def sparsity_pattern(residuals_index,unknowns_index):
+    """ pattern = Jacobian.sparsity_pattern(residuals_index,unknowns_index)
+        boolean [n_residuals,n_unknowns] array of the expected nonzeros
+
+        Inputs:
+            residuals_index, unknowns_index - from pack_index()
+
+        Outputs:
+            pattern - True where the residual may depend on the unknown
+
+        Assumptions:
+            the residuals of a segment are dense over its unknowns, the
+            differentiation and integration matrices couple all of its control
+            points, e.g. the throttle at one point sets the mass at every point
+            after it. residuals also see the unknowns of the missions around the
+            segment (e.g. a cruise distance), of its sub segments, and of the
+            segments before it through the initials, see pack_index().
+    """
+
+    R = residuals_index
+    U = unknowns_index
+
+    pattern = R.drivers[:,U.owner]
+
+    return pattern
+
+
+# ----------------------------------------------------------------------
+#  Color Columns
+# ----------------------------------------------------------------------
+
+def color_columns(pattern):
+    """ colors = Jacobian.color_columns(pattern)
+        greedy column coloring, columns sharing a color have no nonzero
+        row in common and can be differenced together
+
+        Inputs:
+            pattern - boolean [n_residuals,n_unknowns] sparsity pattern
+
+        Outputs:
+            colors - integer color per column, -1 for empty columns
+    """
+
+    n_rows,n_cols = pattern.shape
+
+    colors = -np.ones(n_cols,dtype=int)
+    rows_used = []
+
+    for j in range(n_cols):
+        rows = pattern[:,j]
+        if not np.any(rows): continue
+
+        for c,used in enumerate(rows_used):
+            if not np.any(used & rows):
+                used |= rows
+                colors[j] = c
+                break
+        else:
+            colors[j] = len(rows_used)
+            rows_used.append(rows.copy())
+
+    return colors
+
+
+# ----------------------------------------------------------------------
+#  Finite Difference
+# ----------------------------------------------------------------------
+
+def finite_difference(J,unknowns,residuals,segment,state,pattern,colors):
+    """ Jacobian.finite_difference(J,unknowns,residuals,segment,state,pattern,colors)
+        fills the pattern entries of J with forward differences,
+        one residual evaluation per color
+
+        Inputs:
+            J         - [n_residuals,n_unknowns] jacobian, updated in place
+            unknowns  - base point
+            residuals - residuals at the base point
+            pattern   - entries to fill
+            colors    - from color_columns(pattern)
+    """
+
+    step = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+
+    for c in range(colors.max()+1):
+        columns = np.where(colors == c)[0]
+
+        perturbed = unknowns.copy()
+        perturbed[columns] += step[columns]
+
+        difference = iterate(perturbed,segment,state) - residuals
+
+        for j in columns:
+            rows = pattern[:,j]
+            J[rows,j] = difference[rows] / step[j]
+
+    return J
+
+
+# ----------------------------------------------------------------------
+#  Complex Step
+# ----------------------------------------------------------------------
+
+def complex_step(J,unknowns,segment,state,pattern,colors,step=1e-30):
+    """ Jacobian.complex_step(J,unknowns,segment,state,pattern,colors,step=1e-30)
+        fills the pattern entries of J with complex steps,
+        one complex residual evaluation per color
+
+        Inputs:
+            J        - [n_residuals,n_unknowns] jacobian, updated in place
+            unknowns - base point
+            pattern  - entries to fill
+            colors   - from color_columns(pattern)
+            step     - imaginary step, there is no subtractive cancellation
+                       so it can be far below the finite difference step
+
+        Assumptions:
+            the iterate steps are complex safe, see Complex_Step.check_steps().
+            the state is cast back to real afterwards, it then holds the
+            real part of the last evaluation, the base point.
+    """
+
+    Complex_Step.cast_state(state,complex)
+
+    try:
+        for c in range(colors.max()+1):
+            columns = np.where(colors == c)[0]
+
+            perturbed = unknowns + 0j
+            perturbed[columns] += 1j * step
+
+            derivative = np.imag( Complex_Step.iterate(perturbed,segment,state) ) / step
+
+            for j in columns:
+                rows = pattern[:,j]
+                J[rows,j] = derivative[rows]
+
+    finally:
+        Complex_Step.cast_state(state,float)
+
+    return J
+
+
+# ----------------------------------------------------------------------
+#  Publish Partials
+# ----------------------------------------------------------------------
+
+def publish_partial(state,residual,unknown,derivative):
+    """ Jacobian.publish_partial(state,residual,unknown,derivative)
+        lets an iterate step publish an analytic partial derivative,
+        read by solver_jacobian = "analytic"
+
+        Inputs:
+            state      - the segment state
+            residual   - key of the residual in state.residuals
+            unknown    - key of the unknown in state.unknowns
+            derivative - either a [N,n_residual_columns,n_unknown_columns] array,
+                         the derivative between entries at the same control point,
+                         or a dense [residual.size,unknown.size] array in packed
+                         (column-major) order
+
+        Outputs:
+            state.partials[residual][unknown]
+    """
+
+    if not state.has_key('partials'):
+        state.partials = Data()
+    if not state.partials.has_key(residual):
+        state.partials[residual] = Data()
+
+    state.partials[residual][unknown] = derivative
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Assemble Partials
+# ----------------------------------------------------------------------
+
+def assemble_partials(J,state,residuals_index,unknowns_index):
+    """ known = Jacobian.assemble_partials(J,state,residuals_index,unknowns_index)
+        copies published partials into J
+
+        Outputs:
+            known - boolean [n_residuals,n_unknowns], True where J came from a
+                    published partial
+    """
+
+    known = np.zeros(J.shape,dtype=bool)
+
+    unknown_leaves = {}
+    for sub_state,key,index,shape in unknowns_index.leaves:
+        unknown_leaves[(id(sub_state),key)] = (index,shape)
+
+    for sub_state,key,rows,r_shape in residuals_index.leaves:
+        if not sub_state.has_key('partials'): continue
+        if not sub_state.partials.has_key(key): continue
+
+        for unknown,derivative in sub_state.partials[key].items():
+            if not unknown_leaves.has_key((id(sub_state),unknown)): continue
+            cols,u_shape = unknown_leaves[(id(sub_state),unknown)]
+
+            derivative = np.asarray(derivative)
+
+            # same control point only
+            if np.ndim(derivative) == 3:
+                N = r_shape[0]
+                i_r = np.arange(rows.start,rows.stop).reshape(r_shape,order='F')
+                i_u = np.arange(cols.start,cols.stop).reshape(u_shape,order='F')
+                block = np.zeros([rows.stop-rows.start,cols.stop-cols.start])
+                for i in range(N):
+                    r = i_r[i,:] - rows.start
+                    u = i_u[i,:] - cols.start
+                    block[np.ix_(r,u)] = derivative[i]
+                J[rows,cols] = block
+
+            # dense
+            else:
+                J[rows,cols] = derivative
+
+            known[rows,cols] = True
+
+    return known
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def iterate(unknowns,segment,state):
+
+    state.unknowns.unpack_vector(unknowns)
+
+    segment.process.iterate(segment,state)
+
+    residuals = state.residuals.pack_vector()
+
+    return residuals
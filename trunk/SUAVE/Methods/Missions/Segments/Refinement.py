@@ -0,0 +1,136 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, chebyshev_coefficients, chebyshev_resample
+
+
+# ----------------------------------------------------------------------
+#  Refine
+# ----------------------------------------------------------------------
+
+def refine(segment,state,adaptive=False):
+    """ refined = Refinement.refine(segment,state)
+        checks the truncation error of a converged segment, and if it is
+        too large, moves the segment to more control points
+
+        Inputs:
+            state.numerics.adaptive_control_points  - on or off, for a container
+                of segments this turns it on for every sub segment
+            state.numerics.tolerance_control_points - largest accepted truncation_error()
+            state.numerics.maximum_control_points   - upper limit on number_control_points
+
+        Outputs:
+            refined - True if the segment, or any of its sub segments, was moved
+                      to more control points and needs to be converged again
+
+        Assumptions:
+            N control points go to 2N-1, which keeps the old points.
+            the unknowns are interpolated through their chebyshev series to
+            warm start the next solve, and the segment is initialized again.
+            the sub segments of a container that converges all at once are
+            checked one by one, and only the ones that need it are refined.
+            only for chebyshev_data().
+    """
+
+    numerics = state.numerics
+    adaptive = adaptive or numerics.adaptive_control_points
+
+    # containers, each sub segment on its own
+    if state.has_key('segments'):
+        refined = False
+        for tag,sub_segment in segment.segments.items():
+            refined = refine(sub_segment,state.segments[tag],adaptive) or refined
+        return refined
+
+    if not adaptive:
+        return False
+    if not numerics.discretization_method is chebyshev_data:
+        raise ValueError , 'adaptive_control_points needs discretization_method = chebyshev_data'
+
+    N = numerics.number_control_points
+    if N >= numerics.maximum_control_points:
+        return False
+    if truncation_error(state) <= numerics.tolerance_control_points:
+        return False
+
+    N_new = min( 2*N-1 , numerics.maximum_control_points )
+
+    # warm start from the coarse solution
+    resample_rows(state.unknowns,N,N_new)
+
+    numerics.number_control_points = N_new
+    segment.initialize(state)
+
+    return True
+
+
+# ----------------------------------------------------------------------
+#  Truncation Error
+# ----------------------------------------------------------------------
+
+def truncation_error(state):
+    """ error = Refinement.truncation_error(state)
+        estimates the spectral truncation error of a converged segment
+
+        Inputs:
+            state.unknowns - the solution at the control points
+
+        Outputs:
+            error - largest ratio of the last two chebyshev coefficients
+                    to the largest coefficient, over all columns
+
+        Assumptions:
+            only the unknowns are checked, the conditions follow from them and
+            many are residual balances that converge to noise around zero.
+            columns no larger than tolerance_solution are skipped for the same
+            reason, and tolerance_control_points should be well above it.
+    """
+
+    N = state.numerics.number_control_points
+    floor = state.numerics.tolerance_solution
+
+    error = 0.
+    for value in row_arrays(state.unknowns,N):
+        a = np.abs( chebyshev_coefficients(value) )
+
+        scale = np.max(a,axis=0)
+        tail  = np.max(a[-2:,:],axis=0)
+
+        keep = scale > floor
+        if not np.any(keep): continue
+
+        error = max( error , np.max( tail[keep] / scale[keep] ) )
+
+    return error
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def row_arrays(data,N):
+    """ yields the 2-d arrays with N rows in data, recursively
+    """
+    for key,value in data.iteritems():
+        if isinstance(value,Data):
+            for array in row_arrays(value,N):
+                yield array
+        elif isinstance(value,np.ndarray) and value.ndim == 2 and value.shape[0] == N:
+            yield value
+
+
+def resample_rows(data,N,N_new):
+    """ interpolates the 2-d arrays with N rows in data
+        to N_new control points, recursively
+    """
+    for key,value in data.items():
+        if isinstance(value,Data):
+            resample_rows(value,N,N_new)
+        elif isinstance(value,np.ndarray) and value.ndim == 2 and value.shape[0] == N:
+            data[key] = chebyshev_resample(value,N_new)
+
+    return
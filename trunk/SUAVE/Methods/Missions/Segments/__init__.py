@@ -2,6 +2,10 @@
 from converge_root import converge_root
 from expand_state  import expand_state
 
+import Jacobian
+import Refinement
+import Complex_Step
+
 import Common
 import Cruise
 import Climb
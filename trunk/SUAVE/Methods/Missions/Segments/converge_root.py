@@ -9,23 +9,43 @@ import scipy.optimize
 
 from SUAVE.Plugins.VyPy.tools import array_type
 
+import Jacobian
+import Refinement
+
 # ----------------------------------------------------------------------
 #  Converge Root
 # ----------------------------------------------------------------------
 
 def converge_root(segment,state):
     
-    unknowns = state.unknowns.pack_array()
+    # the unknowns and residuals are views into one vector each during
+    # the solve, sub segments are linked in after expand_rows so allocate here
+    unknowns = state.unknowns.allocate_vector().copy()
+    state.residuals.allocate_vector()
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
-    unknowns = root_finder( iterate,
-                            unknowns,
-                            args = [segment,state],
-                            xtol = state.numerics.tolerance_solution)
+    # see Numerics.solver_jacobian
+    jacobian = Jacobian.setup_jacobian(segment,state)
+    
+    if jacobian is None:
+        unknowns = root_finder( iterate,
+                                unknowns,
+                                args = [segment,state],
+                                xtol = state.numerics.tolerance_solution)
+    else:
+        unknowns = root_finder( iterate,
+                                unknowns,
+                                args   = [segment,state],
+                                fprime = jacobian,
+                                xtol   = state.numerics.tolerance_solution)
+    
+    # see Numerics.adaptive_control_points
+    if Refinement.refine(segment,state):
+        converge_root(segment,state)
     
     return
 
@@ -37,13 +57,13 @@ def converge_root(segment,state):
 def iterate(unknowns,(segment,state)):
 
     if isinstance(unknowns,array_type):
-        state.unknowns.unpack_array(unknowns)
+        state.unknowns.unpack_vector(unknowns)
     else:
         state.unknowns = unknowns
         
     segment.process.iterate(segment,state)
     
-    residuals = state.residuals.pack_array()
+    residuals = state.residuals.pack_vector()
         
     return residuals 
 
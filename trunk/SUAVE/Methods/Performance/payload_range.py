@@ -107,35 +107,34 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     if iprint:
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
-    # loop for each point of Payload Range Diagram
+    # one case for each point of Payload Range Diagram, solved together
+    batch = SUAVE.Analyses.Mission.Batch()
     for i in range(len(TOW)):
-##    for i in [2]:
-        if iprint:
-            print('   EVALUATING POINT : ' + str(i+1))
+        batch.append_case(mission,'point_%i' % (i+1),TOW[i])
 
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
+    # Evaluate missions with current TOW
+    results = batch.evaluate()
 
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[segmentNum]
+    # Distance convergency in order to have total fuel equal to target fuel
+    #
+    # User don't have the option of run a mission for a given fuel. So, we
+    # have to iterate distance in order to have total fuel equal to target fuel
+    #
 
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
+    maxIter = 10 # maximum iteration limit
+    tol = 1.     # fuel convergency tolerance
+    err = [9999.] * len(TOW) # error to be minimized
+    iter = 0     # iteration count
 
-        maxIter = 10 # maximum iteration limit
-        tol = 1.     # fuel convergency tolerance
-        err = 9999.  # error to be minimized
-        iter = 0     # iteration count
+    while max(np.abs(err)) > tol and iter < maxIter:
+        iter = iter + 1
 
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
+        for i,case in enumerate(batch.segments.values()):
+            segments = results.segments[i].segments
+            segment  = segments[segmentNum]
 
             # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
+            TotalFuel  = TOW[i] - segments[-1].conditions.weights.total_mass[-1,0]
 
             # Difference between burned fuel and target fuel
             missingFuel = FUEL[i] - TotalFuel - reserves
@@ -148,22 +147,25 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
 
             # Estimated distance that will result in total fuel burn = target fuel
             DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[segmentNum].distance = (CruiseDist + DeltaDist)
+            case.segments[segmentNum].distance = (CruiseDist + DeltaDist)
 
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[segmentNum]
+        # running missions with new distance
+        results = batch.evaluate()
+
+        for i in range(len(TOW)):
+            segments = results.segments[i].segments
 
             # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+            err[i] = ( TOW[i] - segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
 
             if iprint:
-                print('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
+                print('     point: ' + str(i+1) + ' | iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
                   + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
-                  + str('%8.0F' % (err+FUEL[i]+reserves))+' (kg) | Error : '+str('%8.0F' % err))
+                  + str('%8.0F' % (err[i]+FUEL[i]+reserves))+' (kg) | Error : '+str('%8.0F' % err[i]))
 
-        # Allocating resulting range in ouput array.
-        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+    # Allocating resulting range in ouput array.
+    for i in range(len(TOW)):
+        R[i] = ( results.segments[i].segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
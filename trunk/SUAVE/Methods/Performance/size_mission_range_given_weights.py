@@ -90,42 +90,41 @@ def size_mission_range_given_weights(vehicle,mission,cruise_segment_tag,mission_
         if mission.segments[i].tag.upper() == cruise_segment_tag.upper() :
             segmentNum = i
             break
-    print mission.segments
-    TOW_ref = mission.segments[0].analyses.weights.mass_properties.takeoff 
-    
-    # Loop for range calculation of each input case
+
+    # one case for each input, solved together
+    batch = SUAVE.Analyses.Mission.Batch()
     for id,TOW in enumerate(takeoff_weight):
-        PLD     =  mission_payload[id]
-        FUEL    =  TOW - OEW - PLD - reserve_fuel[id]
+        batch.append_case(mission,'case_%i' % id,TOW)
+
+    PLD     =  mission_payload
+    FUEL    =  takeoff_weight - OEW - PLD - reserve_fuel
 
-        # Update mission takeoff weight
-##        mission.segments[0].config.mass_properties.takeoff = TOW
-        vehicle.mass_properties.takeoff = TOW
-##        analyses.weights.mass_properties.takeoff
-        mission.segments[0].analyses.weights.mass_properties.takeoff = TOW
+    # Evaluate missions with current TOW
+    results = batch.evaluate()
 
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[segmentNum]
+    # Distance convergency in order to have total fuel equal to target fuel
 
-        # Distance convergency in order to have total fuel equal to target fuel
+    # User don't have the option of run a mission for a given fuel. So, we
+    # have to iterate distance in order to have total fuel equal to target fuel
 
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
+    maxIter = 10     # maximum iteration limit
+    tol = 1.         # fuel convergency tolerance
+    residual = 9999. * np.ones_like(takeoff_weight) # residual to be minimized
+    iter = 0         # iteration count
 
-        maxIter = 10     # maximum iteration limit
-        tol = 1.         # fuel convergency tolerance
-        residual = 9999. # residual to be minimized
-        iter = 0         # iteration count
+    while np.max(np.abs(residual)) > tol and iter < maxIter:
+        iter = iter + 1
 
-        while abs(residual) > tol and iter < maxIter:
-            iter = iter + 1
+        for id,case in enumerate(batch.segments.values()):
+            TOW      = takeoff_weight[id]
+            segments = results.segments[id].segments
+            segment  = segments[segmentNum]
 
             # Current total fuel burned in mission
-            TotalFuel  = TOW - results.segments[-1].conditions.weights.total_mass[-1]
+            TotalFuel  = TOW - segments[-1].conditions.weights.total_mass[-1]
 
             # Difference between burned fuel and target fuel
-            missingFuel = FUEL - TotalFuel
+            missingFuel = FUEL[id] - TotalFuel
 
             # Current distance and fuel consuption in the cruise segment
             CruiseDist = segment.conditions.frames.inertial.position_vector[-1,0] - segment.conditions.frames.inertial.position_vector[0,0]                # Distance [m]
@@ -135,20 +134,22 @@ def size_mission_range_given_weights(vehicle,mission,cruise_segment_tag,mission_
 
             # Estimated distance that will result in total fuel burn = target fuel
             DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[segmentNum].distance = (CruiseDist + DeltaDist)
+            case.segments[segmentNum].distance = (CruiseDist + DeltaDist)
+
+        # running missions with new distance
+        results = batch.evaluate()
 
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[segmentNum]
+        for id,TOW in enumerate(takeoff_weight):
+            segments = results.segments[id].segments
 
             # Difference between burned fuel and target fuel
-            residual = ( TOW- results.segments[-1].conditions.weights.total_mass[-1] ) - FUEL
+            residual[id] = ( TOW- segments[-1].conditions.weights.total_mass[-1] ) - FUEL[id]
 
-        # Allocating resulting range in ouput array.
-        distance[id] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) #Distance [m]
-        fuel[id] = FUEL
+    # Allocating resulting range in ouput array.
+    for id in range(len(takeoff_weight)):
+        distance[id] = ( results.segments[id].segments[-1].conditions.frames.inertial.position_vector[-1,0] ) #Distance [m]
+        fuel[id] = FUEL[id]
 
-    mission.segments[0].analyses.weights.mass_properties.takeoff = TOW_ref
     # packing results
     return distance,fuel
 
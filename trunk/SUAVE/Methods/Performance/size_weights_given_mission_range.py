@@ -88,25 +88,26 @@ def size_weights_given_mission_range(vehicle,mission,cruise_segment_tag,mission_
             segmentNum = i
             break
 
-    for id,range_id in enumerate(target_range):
-        payload = mission_payload[id]
-        reserve  = reserve_fuel[id]
+    # all missions are sized together, see size_mission_range_given_weights
+    residual = vehicle.mass_properties.max_takeoff * np.ones(len(target_range))
+    tol = 5. # kg
+    takeoff_weight = np.zeros(len(target_range))
+    iter = 0
 
-        residual = vehicle.mass_properties.max_takeoff
-        tol = 5. # kg
-        takeoff_weight = 0.
-        iter = 0
+    while np.max(np.abs(residual)) > tol and iter < 10:
 
-        while abs(residual) > tol and iter < 10:
+        iter = iter + 1
 
-            iter = iter + 1
-            takeoff_weight = takeoff_weight + residual
-            dist_id,fuel_id = size_mission_range_given_weights(vehicle,mission,cruise_segment_tag,payload,takeoff_weight,reserve)
-            residual = (range_id - dist_id) * float(fuel_id)/float(dist_id)
+        # only the missions not yet converged
+        active = np.abs(residual) > tol
+        takeoff_weight[active] = takeoff_weight[active] + residual[active]
+        dist_id,fuel_id = size_mission_range_given_weights(vehicle,mission,cruise_segment_tag,mission_payload[active],takeoff_weight[active],reserve_fuel[active])
+        residual[active] = (target_range[active] - dist_id) * fuel_id / dist_id
 
-        distance[id] = dist_id
-        fuel[id]     = fuel_id
-        tow[id]      = takeoff_weight
+        distance[active] = dist_id
+        fuel[active]     = fuel_id
+
+    tow[:] = takeoff_weight
 
     # packing results
     return distance,fuel,tow
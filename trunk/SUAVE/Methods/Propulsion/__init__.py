@@ -11,4 +11,8 @@ from engine_sizing_pass import engine_sizing_pass
 from evaluate import evaluate
 from fm_id import fm_id
 from initialize import initialize
-from propeller_design import propeller_design
\ No newline at end of file
+from propeller_design import propeller_design
+from engine_deck import engine_deck, save_engine_deck, load_engine_deck
+from compiled_turbofan import compile_turbofan
+from propeller_map import propeller_map, save_propeller_map, load_propeller_map
+from motor_propeller_operating_point import motor_propeller_operating_point
\ No newline at end of file
@@ -0,0 +1,526 @@
+# compiled_turbofan.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from warnings import warn
+
+
+# working fluid of the network, same as the Ram component
+gamma = 1.4
+R     = 287.87
+Cp    = 1.4*287.87/(1.4-1)
+
+# stations of the turbofan, one row of the buffers each.  the compressor
+# exits, the turbine exits and the nozzles are next to each other, so
+# the kernels work on them together
+stations = ['freestream','inlet_nozzle','low_pressure_compressor','high_pressure_compressor','combustor',
+            'high_pressure_turbine','low_pressure_turbine','fan','core_nozzle','fan_nozzle']
+
+
+# ----------------------------------------------------------------------
+#  Compile
+# ----------------------------------------------------------------------
+
+def compile_turbofan(turbofan):
+    """ chain = compile_turbofan(turbofan)
+        resolves the components of a Networks.Turbofan, linked as in
+        Turbofan.evaluate_thrust(), into an ordered list of array kernels
+
+        Inputs:
+            turbofan - the network, its component settings are read once,
+                       compile again after changing them
+
+        Outputs:
+            chain - Compiled_Turbofan, see Compiled_Turbofan.evaluate()
+
+        Assumptions:
+            the working fluid properties are those of the Ram component,
+            so the temperature and pressure ratios across the compressors
+            and nozzles fold into constants of the chain
+    """
+
+    i = dict( (tag,index) for index,tag in enumerate(stations) )
+
+    kernels = []
+
+    # freestream stagnation quantities
+    kernels.append( (ram_kernel,()) )
+
+    # inlet
+    nozzle = turbofan.inlet_nozzle
+    kernels.append( (compression_nozzle_kernel,
+                     (i['freestream'],i['inlet_nozzle'],nozzle.pressure_ratio,compression_ratio(nozzle))) )
+
+    # compressors and fan, all from the inlet exit
+    lpc = turbofan.low_pressure_compressor
+    hpc = turbofan.high_pressure_compressor
+    fan = turbofan.fan
+
+    r_lpc = compression_ratio(lpc)
+    r_hpc = compression_ratio(hpc)
+    r_fan = compression_ratio(fan)
+
+    pressure_ratios    = np.array([ lpc.pressure_ratio , lpc.pressure_ratio*hpc.pressure_ratio ])[:,None,None]
+    temperature_ratios = np.array([ r_lpc , r_lpc*r_hpc ])[:,None,None]
+    work_factors       = np.array([ Cp*(r_lpc-1.) , Cp*r_lpc*(r_hpc-1.) , Cp*(r_fan-1.) ])[:,None,None]
+
+    kernels.append( (compressors_kernel,
+                     (i['inlet_nozzle'],i['low_pressure_compressor'],i['fan'],pressure_ratios,temperature_ratios,
+                      fan.pressure_ratio,r_fan,work_factors)) )
+
+    # combustor
+    combustor = turbofan.combustor
+    kernels.append( (combustor_kernel,
+                     (i['high_pressure_compressor'],i['combustor'],combustor.turbine_inlet_temperature,
+                      combustor.pressure_ratio,combustor.efficiency*combustor.fuel_data.specific_energy)) )
+
+    # turbines, work rows are lpc, hpc, fan.  the fan is on the low pressure spool
+    for tag,source,i_work,bypass_ratio in [ ('high_pressure_turbine','combustor',1,0.0),
+                                            ('low_pressure_turbine','high_pressure_turbine',0,turbofan.thrust.bypass_ratio) ]:
+        turbine = turbofan[tag]
+        kernels.append( (turbine_kernel,
+                         (i[source],i[tag],i_work,bypass_ratio,turbine.mechanical_efficiency,
+                          gamma/((gamma-1)*turbine.polytropic_efficiency))) )
+
+    # core and fan nozzles, from the low pressure turbine and the fan
+    core_nozzle = turbofan.core_nozzle
+    fan_nozzle  = turbofan.fan_nozzle
+
+    pressure_ratios    = np.array([ n.pressure_ratio for n in [core_nozzle,fan_nozzle] ])[:,None,None]
+    temperature_ratios = np.array([ n.pressure_ratio**((gamma-1)/(gamma)*n.polytropic_efficiency)
+                                    for n in [core_nozzle,fan_nozzle] ])[:,None,None]
+
+    kernels.append( (expansion_nozzles_kernel,
+                     (i['low_pressure_turbine'],i['core_nozzle'],pressure_ratios,temperature_ratios)) )
+
+    # thrust, from the nozzles and the low pressure compressor
+    thrust = turbofan.thrust
+    bypass_ratio = thrust.bypass_ratio
+    thrust_parameters = ( i['low_pressure_compressor'], bypass_ratio,
+                          np.array([ 1/(1+bypass_ratio) , bypass_ratio/(1+bypass_ratio) ])[:,None,None],
+                          thrust.compressor_nondimensional_massflow, thrust.reference_temperature,
+                          thrust.reference_pressure, thrust.number_of_engines )
+
+    return Compiled_Turbofan(kernels,thrust_parameters)
+
+
+def compression_ratio(component):
+    """ stagnation temperature ratio of a compressor, fan or compression nozzle """
+    return component.pressure_ratio**((gamma-1)/(gamma*component.polytropic_efficiency))
+
+
+# ----------------------------------------------------------------------
+#  Compiled Turbofan
+# ----------------------------------------------------------------------
+
+class Compiled_Turbofan(object):
+    """ chain = Compiled_Turbofan(kernels,thrust_parameters)
+        the turbofan cycle as a list of kernels, see compile_turbofan()
+
+        the kernels work in place on buffers with one row per station of
+        stagnation temperature, pressure and enthalpy, by control point.
+        the buffers are kept by number of control points and type, and
+        reused between calls.  only the quantities that lead to the
+        thrust, fuel flow, core mass flow and specific impulse are
+        computed, the component outputs are not updated, evaluate the
+        network with compiled off to inspect them.
+    """
+
+    def __init__(self,kernels,thrust_parameters):
+        self.kernels = kernels
+        self.thrust_parameters = thrust_parameters
+        self.buffers = {}
+
+    def evaluate(self,conditions):
+        """ thrust, mdot, mdot_core, Isp = chain.evaluate(conditions)
+            thrust, fuel mass flow rate, core mass flow rate of one engine
+            and specific impulse, [N,1] each, same as the Thrust component
+            in Turbofan.evaluate_thrust(), and the ram quantities in
+            conditions.freestream
+        """
+
+        buffers = self.run(conditions)
+        return thrust_kernel(buffers,conditions,*self.thrust_parameters)
+
+    def size(self,conditions,design_thrust):
+        """ mass_flow_rate_design, compressor_nondimensional_massflow = chain.size(conditions,design_thrust)
+            same as Thrust.size() at the end of Turbofan.size()
+        """
+
+        buffers = self.run(conditions)
+        return sizing_kernel(buffers,conditions,design_thrust,*self.thrust_parameters)
+
+    def run(self,conditions):
+
+        freestream = conditions.freestream
+        dtype = np.result_type(freestream.temperature,freestream.pressure,freestream.mach_number,
+                               freestream.velocity,conditions.propulsion.throttle)
+        N = freestream.temperature.shape[0]
+
+        buffers = self.buffers.get((N,dtype))
+        if buffers is None:
+            buffers = allocate_buffers(N,dtype)
+            self.buffers[(N,dtype)] = buffers
+
+        for kernel,parameters in self.kernels:
+            kernel(buffers,conditions,*parameters)
+
+        return buffers
+
+    def __getstate__(self):
+        # the buffers are scratch space
+        state = self.__dict__.copy()
+        state['buffers'] = {}
+        return state
+
+    def __deepcopy__(self,memo):
+        return Compiled_Turbofan(self.kernels,self.thrust_parameters)
+
+
+class Buffers(object):
+    """ the arrays of a chain, for a number of control points and type """
+    pass
+
+
+def allocate_buffers(N,dtype):
+
+    n = len(stations)
+
+    buffers = Buffers()
+
+    # stagnation temperature, pressure and enthalpy by station
+    buffers.Tt = np.zeros([n,N,1],dtype=dtype)
+    buffers.Pt = np.zeros([n,N,1],dtype=dtype)
+    buffers.ht = np.zeros([n,N,1],dtype=dtype)
+
+    # work of the low and high pressure compressors and the fan
+    buffers.work = np.zeros([3,N,1],dtype=dtype)
+
+    # core and fan nozzle exits
+    buffers.mach       = np.zeros([2,N,1],dtype=dtype)
+    buffers.pressure   = np.zeros([2,N,1],dtype=dtype)
+    buffers.velocity   = np.zeros([2,N,1],dtype=dtype)
+    buffers.area_ratio = np.zeros([2,N,1],dtype=dtype)
+
+    buffers.fuel_to_air_ratio = np.zeros([N,1],dtype=dtype)
+    buffers.fm_freestream     = np.zeros([N,1],dtype=dtype)
+    buffers.Fsp               = np.zeros([N,1],dtype=dtype)
+    buffers.mdot_core         = np.zeros([N,1],dtype=dtype)
+
+    # scratch
+    buffers.a      = np.zeros([N,1],dtype=dtype)
+    buffers.b      = np.zeros([N,1],dtype=dtype)
+    buffers.A      = np.zeros([2,N,1],dtype=dtype)
+    buffers.mask   = np.zeros([N,1],dtype=bool)
+    buffers.masks  = np.zeros([2,N,1],dtype=bool)
+
+    return buffers
+
+
+# ----------------------------------------------------------------------
+#  Kernels
+# ----------------------------------------------------------------------
+
+def ram_kernel(buffers,conditions):
+    """ freestream stagnation quantities, as the Ram component """
+
+    freestream = conditions.freestream
+    To = freestream.temperature
+    Po = freestream.pressure
+    M  = freestream.mach_number
+
+    a = buffers.a
+
+    # 1 + (gamma-1)/2 M^2
+    np.multiply(M,M,out=a)
+    a *= (gamma-1)/2
+    a += 1
+
+    np.multiply(To,a,out=buffers.Tt[0])
+    np.power(a,3.5,out=buffers.Pt[0])
+    buffers.Pt[0] *= Po
+
+    fm_id(M,buffers.fm_freestream,buffers.b)
+
+    # the same freestream outputs as the Ram component
+    freestream.stagnation_temperature             = buffers.Tt[0].copy()
+    freestream.stagnation_pressure                = buffers.Pt[0].copy()
+    freestream.isentropic_expansion_factor        = gamma
+    freestream.specific_heat_at_constant_pressure = Cp
+    freestream.universal_gas_constant             = R
+    freestream.speed_of_sound                     = np.sqrt(Cp/(Cp-R)*R*To)
+
+    return
+
+
+def compression_nozzle_kernel(buffers,conditions,i_in,i_out,pressure_ratio,temperature_ratio):
+    """ stagnation quantities at the exit of a Compression_Nozzle """
+
+    Po = conditions.freestream.pressure
+    Pt = buffers.Pt[i_out]
+
+    np.multiply(buffers.Pt[i_in],pressure_ratio,out=Pt)
+    np.multiply(buffers.Tt[i_in],temperature_ratio,out=buffers.Tt[i_out])
+
+    # in case pressures go too low
+    mask = buffers.mask
+    np.less(np.real(Pt),np.real(Po),out=mask)
+    if np.any(mask):
+        warn('Pt_out goes too low',RuntimeWarning)
+        Pt[mask] = Po[mask]
+
+    return
+
+
+def compressors_kernel(buffers,conditions,i_in,i_lpc,i_fan,pressure_ratios,temperature_ratios,
+                       fan_pressure_ratio,fan_temperature_ratio,work_factors):
+    """ stagnation quantities at the exits of the low and high pressure
+        Compressors and the Fan, and their work
+    """
+
+    Tt = buffers.Tt
+    Pt = buffers.Pt
+
+    # the compressors in series
+    np.multiply(Tt[i_in],temperature_ratios,out=Tt[i_lpc:i_lpc+2])
+    np.multiply(Pt[i_in],pressure_ratios,out=Pt[i_lpc:i_lpc+2])
+
+    # the fan, next to them
+    np.multiply(Tt[i_in],fan_temperature_ratio,out=Tt[i_fan])
+    np.multiply(Pt[i_in],fan_pressure_ratio,out=Pt[i_fan])
+
+    np.multiply(Tt[i_in],work_factors,out=buffers.work)
+
+    np.multiply(Cp,Tt[:i_lpc+2],out=buffers.ht[:i_lpc+2])
+    np.multiply(Cp,Tt[i_fan],out=buffers.ht[i_fan])
+
+    return
+
+
+def combustor_kernel(buffers,conditions,i_in,i_out,turbine_inlet_temperature,pressure_ratio,fuel_energy):
+    """ stagnation quantities at the exit of the Combustor, and the fuel to air ratio """
+
+    ht4 = Cp*turbine_inlet_temperature
+    f   = buffers.fuel_to_air_ratio
+
+    np.subtract(ht4,buffers.ht[i_in],out=f)
+    f /= fuel_energy - ht4
+
+    buffers.Tt[i_out] = turbine_inlet_temperature
+    buffers.ht[i_out] = ht4
+    np.multiply(buffers.Pt[i_in],pressure_ratio,out=buffers.Pt[i_out])
+
+    return
+
+
+def turbine_kernel(buffers,conditions,i_in,i_out,i_work,bypass_ratio,mechanical_efficiency,pressure_exponent):
+    """ stagnation quantities at the exit of a Turbine, matched to the work
+        of its compressor and the fan
+    """
+
+    a  = buffers.a
+    b  = buffers.b
+    Tt = buffers.Tt
+
+    # the enthalpy drop across the turbine
+    np.add(1.,buffers.fuel_to_air_ratio,out=a)
+    np.divide(-1.,a,out=a)
+    a /= mechanical_efficiency
+    np.multiply(bypass_ratio,buffers.work[2],out=b)
+    b += buffers.work[i_work]
+    a *= b
+
+    a /= Cp
+    np.add(Tt[i_in],a,out=Tt[i_out])
+
+    np.divide(Tt[i_out],Tt[i_in],out=a)
+    np.power(a,pressure_exponent,out=a)
+    np.multiply(buffers.Pt[i_in],a,out=buffers.Pt[i_out])
+
+    np.multiply(Cp,Tt[i_out],out=buffers.ht[i_out])
+
+    return
+
+
+def expansion_nozzles_kernel(buffers,conditions,i_in,i_out,pressure_ratios,temperature_ratios):
+    """ exit conditions of the core and fan Expansion_Nozzles, together """
+
+    freestream = conditions.freestream
+    Po = freestream.pressure
+
+    A    = buffers.A
+    mask = buffers.masks
+
+    Tt   = buffers.Tt[i_out:i_out+2]
+    Pt   = buffers.Pt[i_out:i_out+2]
+    ht   = buffers.ht[i_out:i_out+2]
+    Mach = buffers.mach
+    P    = buffers.pressure
+
+    np.multiply(buffers.Pt[i_in:i_in+2],pressure_ratios,out=Pt)
+    np.multiply(buffers.Tt[i_in:i_in+2],temperature_ratios,out=Tt)
+    np.multiply(Cp,Tt,out=ht)
+
+    # exit mach number, expanded to the freestream pressure
+    np.divide(Pt,Po,out=A)
+    np.power(A,(gamma-1)/gamma,out=A)
+    A -= 1
+    A *= 2
+    A /= gamma-1
+    np.sqrt(A,out=Mach)
+
+    # choked nozzles, the rest keeps the freestream pressure
+    P.fill(np.nan)
+    np.less(np.real(Mach),1.0,out=mask)
+    np.copyto(P,Po,where=mask)
+    np.greater_equal(np.real(Mach),1.0,out=mask)
+    np.copyto(Mach,1.0,where=mask)
+    np.divide(Pt,(1+(gamma-1)/2*1.0**2)**(gamma/(gamma-1)),out=A)
+    np.copyto(P,A,where=mask)
+
+    # exit velocity, from the static enthalpy
+    np.multiply(Mach,Mach,out=A)
+    A *= (gamma-1)/2
+    A += 1
+    np.divide(Tt,A,out=A)
+    A *= Cp
+    np.subtract(ht,A,out=A)
+    A *= 2
+    np.sqrt(A,out=buffers.velocity)
+
+    # freestream to nozzle area ratio
+    area_ratio = buffers.area_ratio
+    fm_id(Mach,area_ratio,A)
+    np.divide(buffers.fm_freestream,area_ratio,out=area_ratio)
+    np.divide(freestream.stagnation_pressure,Pt,out=A)
+    area_ratio *= A
+    np.divide(Tt,freestream.stagnation_temperature,out=A)
+    np.sqrt(A,out=A)
+    area_ratio *= A
+
+    return
+
+
+def thrust_kernel(buffers,conditions,i_lpc,bypass_ratio,stream_ratios,mdhc,Tref,Pref,no_eng):
+    """ thrust, fuel mass flow rate, core mass flow rate of one engine and
+        specific impulse, as the Thrust component
+    """
+
+    Fsp = specific_thrust(buffers,conditions,stream_ratios)
+
+    freestream = conditions.freestream
+    a = buffers.a
+    b = buffers.b
+
+    # thrust per unit core mass flow
+    np.multiply(Fsp,freestream.speed_of_sound,out=a)
+    a *= 1+bypass_ratio
+
+    # the specific impulse, and the thrust specific fuel consumption
+    Isp = a / buffers.fuel_to_air_ratio
+    Isp /= freestream.gravity
+    np.divide(3600.0,Isp,out=b)
+
+    # dimensional outputs, new arrays, they go to the results
+    mdot_core = core_mass_flow(buffers,i_lpc,mdhc,Tref,Pref).copy()
+
+    a *= mdot_core
+    thrust = a * no_eng
+    thrust *= conditions.propulsion.throttle
+
+    mdot = 0.1019715 * thrust
+    mdot *= b
+    mdot /= 3600
+
+    return thrust, mdot, mdot_core, Isp
+
+
+def sizing_kernel(buffers,conditions,design_thrust,i_lpc,bypass_ratio,stream_ratios,mdhc,Tref,Pref,no_eng):
+    """ core mass flow at the design thrust, as Thrust.size() """
+
+    Fsp = specific_thrust(buffers,conditions,stream_ratios)
+    a0  = conditions.freestream.speed_of_sound
+
+    mdot_core = design_thrust/(Fsp*a0*(1+bypass_ratio)*no_eng*conditions.propulsion.throttle)
+    mdhc      = mdot_core/(np.sqrt(Tref/buffers.Tt[i_lpc])*(buffers.Pt[i_lpc]/Pref))
+
+    return mdot_core, mdhc
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def specific_thrust(buffers,conditions,stream_ratios):
+    """ the nondimensional specific thrust, into buffers.Fsp,
+        stream_ratios are the core and fan shares of the air mass flow
+    """
+
+    freestream = conditions.freestream
+    M0 = freestream.mach_number
+
+    A = buffers.A
+    a = buffers.a
+
+    Fsp = buffers.Fsp
+
+    # momentum terms, of both streams
+    np.divide(buffers.velocity,freestream.velocity,out=A)
+    A -= 1
+    A *= stream_ratios
+    np.sum(A,axis=0,out=a)
+
+    np.multiply(M0,M0,out=Fsp)
+    Fsp *= gamma
+    Fsp *= a
+
+    # pressure terms
+    np.divide(buffers.pressure,freestream.pressure,out=A)
+    A -= 1
+    A *= buffers.area_ratio
+    A *= stream_ratios
+    np.sum(A,axis=0,out=a)
+    Fsp += a
+
+    np.multiply(gamma,M0,out=a)
+    Fsp /= a
+
+    return Fsp
+
+
+def core_mass_flow(buffers,i_lpc,mdhc,Tref,Pref):
+    """ the core mass flow, from the low pressure compressor exit
+        stagnation conditions, into buffers.mdot_core
+    """
+
+    mdot = buffers.mdot_core
+
+    np.divide(Tref,buffers.Tt[i_lpc],out=mdot)
+    np.sqrt(mdot,out=mdot)
+    mdot *= mdhc
+    mdot *= buffers.Pt[i_lpc]
+    mdot /= Pref
+
+    return mdot
+
+
+def fm_id(M,out,scratch):
+    """ the isentropic mass flow function of Methods.Propulsion.fm_id, into out """
+
+    m0 = (gamma+1)/(2*(gamma-1))
+    m1 = ((gamma+1)/2)**m0
+
+    np.multiply(M,M,out=scratch)
+    scratch *= (gamma-1)/2
+    scratch += 1
+    np.power(scratch,m0,out=scratch)
+
+    np.multiply(m1,M,out=out)
+    out /= scratch
+
+    return out
@@ -0,0 +1,152 @@
+# engine_deck.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.gridded_table import save_gridded_table, load_gridded_table
+
+
+# the deck outputs, in the order of the last dimension of the table
+deck_outputs = ['thrust','fuel_flow_rate','core_mass_flow_rate','specific_impulse']
+
+
+# ----------------------------------------------------------------------
+#  Engine Deck
+# ----------------------------------------------------------------------
+
+def engine_deck(network,mach_number,altitude,throttle,atmosphere=None,gravity=None):
+    """ deck = engine_deck(network,mach_number,altitude,throttle)
+        runs a gas turbine network, such as Networks.Turbofan, once over
+        a grid of flight conditions and tabulates its outputs
+
+        Inputs:
+            network     - the network, sized, its results with the
+                          core_mass_flow_rate and specific_impulse
+            mach_number - 1D array, increasing
+            altitude    - 1D array, increasing, in meters
+            throttle    - 1D array, increasing
+            atmosphere  - of the flight conditions, default US_Standard_1976
+            gravity     - for the fuel flow, default the sea level gravity
+                          of Earth, same as the mission segments
+
+        Outputs:
+            deck.mach_number, deck.altitude, deck.throttle - the grid
+            deck.outputs - names of the outputs, see deck_outputs
+            deck.table   - [mach,altitude,throttle,output] array of
+                           thrust           - total of all engines, N
+                           fuel_flow_rate   - total of all engines, kg/s
+                           core_mass_flow_rate - of one engine, kg/s
+                           specific_impulse - s
+
+        Assumptions:
+            the network is evaluated in the freestream of the atmosphere at
+            each altitude.  missions in another atmosphere need a deck
+            made in the same atmosphere.
+    """
+
+    if atmosphere is None:
+        atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    if gravity is None:
+        gravity = SUAVE.Attributes.Planets.Earth().sea_level_gravity
+
+    mach_number = np.array(mach_number,dtype=float)
+    altitude    = np.array(altitude,dtype=float)
+    throttle    = np.array(throttle,dtype=float)
+
+    shape = [len(mach_number),len(altitude),len(throttle)]
+    M, h, eta = np.meshgrid(mach_number,altitude,throttle,indexing='ij')
+
+    # one row per grid point, the network is vectorized along the rows
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(M.size)
+
+    conditions = state.conditions
+    freestream = conditions.freestream
+
+    freestream.mach_number = M.reshape([-1,1])
+    freestream.altitude    = h.reshape([-1,1])
+
+    atmo_data = atmosphere.compute_values(freestream.altitude)
+    freestream.pressure          = atmo_data.pressure
+    freestream.temperature       = atmo_data.temperature
+    freestream.density           = atmo_data.density
+    freestream.speed_of_sound    = atmo_data.speed_of_sound
+    freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    freestream.velocity          = freestream.mach_number * freestream.speed_of_sound
+    freestream.gravity           = freestream.altitude * 0. + gravity
+
+    conditions.propulsion.throttle = eta.reshape([-1,1])
+
+    # the full cycle analysis, once
+    results = network.evaluate_thrust(state)
+
+    for key in deck_outputs[2:]:
+        if not results.has_key(key):
+            raise AttributeError , 'network %s does not return %s for an engine deck' % (network.tag,key)
+
+    table = np.zeros([M.size,len(deck_outputs)])
+    table[:,0] = results.thrust_force_vector[:,0]
+    table[:,1] = results.vehicle_mass_rate[:,0]
+    table[:,2] = np.ravel( results.core_mass_flow_rate * np.ones([M.size,1]) )
+    table[:,3] = np.ravel( results.specific_impulse    * np.ones([M.size,1]) )
+
+    deck = Data()
+    deck.mach_number = mach_number
+    deck.altitude    = altitude
+    deck.throttle    = throttle
+    deck.outputs     = list(deck_outputs)
+    deck.table       = table.reshape( shape + [len(deck_outputs)] )
+
+    return deck
+
+
+# ----------------------------------------------------------------------
+#  Deck Files
+# ----------------------------------------------------------------------
+#
+# a deck is kept in one .npy file, see Methods.Utilities.gridded_table,
+# on the grid of mach number, altitude and throttle, with the outputs in
+# the order of deck_outputs
+
+def save_engine_deck(deck,filename):
+    """ save_engine_deck(deck,filename)
+        writes a deck from engine_deck() to a .npy file, filename
+        includes the extension
+    """
+
+    if np.shape(deck.table)[-1] != len(deck_outputs):
+        raise ValueError , 'engine deck table does not have the outputs %s' % deck_outputs
+
+    save_gridded_table(filename,[deck.mach_number,deck.altitude,deck.throttle],deck.table)
+
+    return
+
+
+def load_engine_deck(filename):
+    """ deck = load_engine_deck(filename)
+        memory maps a deck saved by save_engine_deck(), the table is a
+        read only view of the file
+    """
+
+    grid, table, key = load_gridded_table(filename)
+
+    if len(grid) != 3 or table.shape[-1] != len(deck_outputs):
+        raise ValueError , 'engine deck %s has %i inputs and %i outputs, expected 3 and %i' % (filename,len(grid),table.shape[-1],len(deck_outputs))
+
+    deck = Data()
+    deck.mach_number = grid[0]
+    deck.altitude    = grid[1]
+    deck.throttle    = grid[2]
+    deck.outputs     = list(deck_outputs)
+    deck.table       = table
+
+    return deck
@@ -0,0 +1,174 @@
+# motor_propeller_operating_point.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from warnings import warn
+
+from SUAVE.Core import Data
+from SUAVE.Components.Energy.Converters.Propeller import \
+     blade_element_inputs, blade_element_flow, blade_element_loads, circulation_residual_derivative, \
+     limit_inflow_angle_step, zero_induction_inflow_angle
+from SUAVE.Components.Energy.Converters.Propeller_Map import Propeller_Map
+
+
+# ----------------------------------------------------------------------
+#  Motor Propeller Operating Point
+# ----------------------------------------------------------------------
+
+def motor_propeller_operating_point(motor,propeller,conditions,tolerance=1e-6,maximum_iterations=200,coupling=1e-2):
+    """ F, Q, P, Cp, iterations = motor_propeller_operating_point(motor,propeller,conditions)
+        the rotation rate at which a Motor and a Propeller agree on the
+        propeller power coefficient, and the inflow angles of the
+        propeller at it, in one iteration for all control points
+
+        each iteration runs the motor at the power coefficient, Motor.omega(),
+        takes one Newton step of the inflow angles of the propeller at
+        that rotation rate, as in Propeller.spin(), and takes the power
+        coefficient of the blades as the next one.  a control point drops
+        out once its inflow angles and power coefficient have converged.
+        the propeller is spun once more at the operating point, from the
+        inflow angles found, for its outputs.
+
+        a Propeller_Map has no inflow angles, the motor and the map are
+        iterated on the power coefficient alone, see map_operating_point()
+
+        Inputs:
+            motor, propeller - motor.inputs.voltage set, motor.propeller_Cp
+                               is the start, and propeller.inflow_angle
+                               with propeller.warm_start on
+            conditions       - of the segment
+            tolerance        - on the power coefficient, the inflow
+                               angles use propeller.tolerance
+            maximum_iterations
+
+        Outputs:
+            F, Q, P, Cp - of Propeller.spin(), at the operating point
+            iterations  - Data of
+                operating_point - the number of iterations
+                evaluations     - the number of station residual evaluations,
+                                  with the last spin
+    """
+
+    if isinstance(propeller,Propeller_Map):
+        return map_operating_point(motor,propeller,conditions,tolerance,maximum_iterations)
+
+    prop_attributes = propeller.prop_attributes
+
+    B     = prop_attributes.number_blades
+    R     = prop_attributes.tip_radius
+    beta  = prop_attributes.twist_distribution
+    c     = prop_attributes.chord_distribution
+    rho   = conditions.freestream.density[:,0,None]
+    mu    = conditions.freestream.dynamic_viscosity[:,0,None]
+    V     = conditions.freestream.velocity[:,0,None]
+    a     = conditions.freestream.speed_of_sound[:,0,None]
+    T     = conditions.freestream.temperature[:,0,None]
+    nu    = mu/rho
+
+    n     = V.shape[0]
+    N     = len(c)
+    dtype = np.result_type(motor.propeller_Cp,motor.inputs.voltage,rho,mu,V,a,T,beta,c)
+
+    # the start, from the last operating point
+    Cp_motor = np.zeros([n,1],dtype=dtype) + motor.propeller_Cp
+
+    psi = np.ones([n,N],dtype=dtype)
+    if propeller.warm_start and np.shape(propeller.inflow_angle) == psi.shape:
+        psi[:,:] = propeller.inflow_angle
+    else:
+        motor.propeller_Cp = Cp_motor
+        Ua, Ut, U, r = blade_element_inputs(prop_attributes,motor.omega(conditions),V)
+        psi[:,:] = zero_induction_inflow_angle(Ua,Ut)
+    psi_last = psi.copy()
+
+    active = np.arange(n)
+
+    iterations = Data()
+    iterations.operating_point = 0
+    iterations.evaluations     = 0
+
+    while active.size and iterations.operating_point < maximum_iterations:
+
+        # the motor
+        motor.propeller_Cp = Cp_motor
+        omega = motor.omega(conditions)[active]
+
+        # one step of the inflow angles, at the rotation rate of the motor
+        Ua, Ut, U, r = blade_element_inputs(prop_attributes,omega,V[active])
+        psi_ = psi[active]
+
+        Wa, Wt, W, Gamma, Cl, Re, Ma = blade_element_flow(psi_,Ua,Ut,U,r,c,beta,nu[active],a[active],B,R)
+
+        Rsquiggly = Gamma - 0.5*W*c*Cl
+        dR_dpsi   = circulation_residual_derivative(psi_,Ua,Ut,U,r,c,beta,a[active],B,R)
+        dpsi      = limit_inflow_angle_step(-Rsquiggly/dR_dpsi)
+
+        psi_last[active] = psi_
+        psi[active]      = psi_ + dpsi
+
+        # the power coefficient of the blades
+        thrust, torque = blade_element_loads(Wa,Wt,Gamma,Cl,Re,Ma,r,rho[active],T[active],B)
+        Cp = torque*omega/(rho[active]*((omega/(2.*np.pi))**3)*((2*R)**5))
+
+        iterations.operating_point += 1
+        iterations.evaluations     += psi_.size
+
+        # keep the control points that are still moving
+        step   = np.max(np.abs(dpsi),axis=1)
+        moving = (step > propeller.tolerance) | (np.abs(Cp[:,0] - Cp_motor[active,0]) > tolerance)
+
+        # the motor follows the blades once the inflow angles have settled
+        coupled = moving & (step < coupling)
+        Cp_motor[active[coupled]] = Cp[coupled]
+        active = active[moving]
+
+    if active.size:
+        warn('Motor and propeller did not converge in %i iterations at %i control points.' % (iterations.operating_point,active.size), Warning)
+
+    # the propeller at the operating point
+    motor.propeller_Cp = Cp_motor
+    motor.omega(conditions)
+    propeller.inputs.omega = motor.outputs.omega
+
+    F, Q, P, Cp = propeller.spin(conditions,psi_last)
+
+    iterations.evaluations += propeller.outputs.evaluations
+
+    return F, Q, P, Cp, iterations
+
+
+def map_operating_point(motor,propeller,conditions,tolerance=1e-6,maximum_iterations=200):
+    """ F, Q, P, Cp, iterations = map_operating_point(motor,propeller,conditions)
+        the operating point of a Motor and a Propeller_Map, the motor is
+        run at the power coefficient of the map until they agree, as
+        motor_propeller_operating_point() with the same outputs, the
+        evaluations are of the map
+    """
+
+    iterations = Data()
+    iterations.operating_point = 0
+    iterations.evaluations     = 0
+
+    diff = np.inf
+
+    while np.any(diff > tolerance) and iterations.operating_point < maximum_iterations:
+
+        motor.omega(conditions)
+        propeller.inputs.omega = motor.outputs.omega
+        F, Q, P, Cp = propeller.spin(conditions)
+
+        diff = np.abs(Cp - motor.propeller_Cp)
+        motor.propeller_Cp = Cp
+
+        iterations.operating_point += 1
+        iterations.evaluations     += Cp.shape[0]
+
+    if np.any(diff > tolerance):
+        warn('Motor and propeller map did not converge in %i iterations at %i control points.' % (iterations.operating_point,np.sum(diff > tolerance)), Warning)
+
+    return F, Q, P, Cp, iterations
@@ -0,0 +1,201 @@
+# propeller_map.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+
+import numpy as np
+import hashlib
+from warnings import warn
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.gridded_table import save_gridded_table, load_gridded_table
+from SUAVE.Components.Energy.Converters.Propeller import blade_element_inputs, blade_element_flow, \
+     blade_element_loads, solve_inflow_angle, zero_induction_inflow_angle
+
+
+# the map outputs, in the order of the last dimension of the table
+map_outputs = ['thrust_coefficient','power_coefficient','efficiency']
+
+
+# ----------------------------------------------------------------------
+#  Propeller Map
+# ----------------------------------------------------------------------
+
+def propeller_map(prop_attributes,advance_ratio,tip_mach_number,reynolds_number,temperature=288.15,tolerance=1e-10,maximum_iterations=50):
+    """ prop_map = propeller_map(prop_attributes,advance_ratio,tip_mach_number,reynolds_number)
+        the blade element analysis of Propeller.spin() for a propeller,
+        as designed by propeller_design(), once over a grid of
+        nondimensional operating points, with its coefficients tabulated
+
+        Inputs:
+            prop_attributes - of the propeller, see Converters.Propeller
+            advance_ratio   - 1D array, increasing, J = V/(n*D)
+            tip_mach_number - 1D array, increasing, omega*R/a
+            reynolds_number - 1D array, increasing, of the tip speed and
+                              the tip radius, omega*R*R/nu
+            temperature     - of the freestream, K
+            tolerance, maximum_iterations - of the inflow angle solve
+
+        Outputs:
+            prop_map.advance_ratio, prop_map.tip_mach_number,
+            prop_map.reynolds_number - the grid
+            prop_map.temperature     - K
+            prop_map.geometry_hash   - see propeller_geometry_hash()
+            prop_map.outputs - names of the outputs, see map_outputs
+            prop_map.table   - [J,tip mach,reynolds,output] array of
+                               thrust_coefficient - T/(rho*n^2*D^4)
+                               power_coefficient  - P/(rho*n^3*D^5)
+                               efficiency         - J*CT/CP
+
+        Assumptions:
+            the inflow angles depend on the advance ratio and the tip mach
+            number only, the Reynolds number scales the drag of the
+            blades by Re^-0.2, so the coefficients are linear in Re^-0.2.
+            the drag of the blades also depends a little on the freestream
+            temperature, which is held at one value.
+    """
+
+    advance_ratio   = np.array(advance_ratio,dtype=float)
+    tip_mach_number = np.array(tip_mach_number,dtype=float)
+    reynolds_number = np.array(reynolds_number,dtype=float)
+
+    shape = [len(advance_ratio),len(tip_mach_number),len(reynolds_number)]
+    J, Mt = np.meshgrid(advance_ratio,tip_mach_number,indexing='ij')
+    J  = J.reshape([-1,1])
+    Mt = Mt.reshape([-1,1])
+
+    B    = prop_attributes.number_blades
+    R    = prop_attributes.tip_radius
+    beta = prop_attributes.twist_distribution
+    c    = prop_attributes.chord_distribution
+    D    = 2.*R
+
+    # the freestream of each advance ratio and tip mach number, the
+    # coefficients do not depend on the density
+    gas = SUAVE.Attributes.Gases.Air()
+    a   = gas.compute_speed_of_sound(temperature)
+    rho = 1.
+
+    omega = Mt*a/R
+    n     = omega/(2.*np.pi)
+    V     = J*n*D
+
+    Ua, Ut, U, r = blade_element_inputs(prop_attributes,omega,V)
+
+    # the inflow angles, as Propeller.spin(), do not depend on the Reynolds number
+    nu = rho*omega*R*R/reynolds_number[0]
+    psi = zero_induction_inflow_angle(Ua,Ut)
+    psi, flow, iterations, evaluations, unsolved = solve_inflow_angle(psi,Ua,Ut,U,r,c,beta,nu,a,B,R,tolerance,maximum_iterations)
+
+    # a control point without a solution stops too, with nans
+    unsolved = np.union1d(unsolved,np.nonzero(~np.all(np.isfinite(psi),axis=1))[0])
+    if unsolved.size:
+        warn('Propeller map has no solution at %i of %i advance ratios and tip mach numbers.' % (unsolved.size,J.size), Warning)
+
+    # the loads at each Reynolds number
+    table = np.zeros([J.size,len(reynolds_number),len(map_outputs)])
+    for i,reynolds in enumerate(reynolds_number):
+        nu = rho*omega*R*R/reynolds
+        Wa, Wt, W, Gamma, Cl, Re, Ma = blade_element_flow(psi,Ua,Ut,U,r,c,beta,nu,a,B,R)
+        thrust, torque = blade_element_loads(Wa,Wt,Gamma,Cl,Re,Ma,r,rho,temperature,B)
+        power = torque*omega
+
+        CT = thrust/(rho*(n**2)*(D**4))
+        CP = power/(rho*(n**3)*(D**5))
+
+        table[:,i,0] = CT[:,0]
+        table[:,i,1] = CP[:,0]
+        table[:,i,2] = J[:,0]*CT[:,0]/CP[:,0]
+
+    prop_map = Data()
+    prop_map.advance_ratio   = advance_ratio
+    prop_map.tip_mach_number = tip_mach_number
+    prop_map.reynolds_number = reynolds_number
+    prop_map.temperature     = float(temperature)
+    prop_map.geometry_hash   = propeller_geometry_hash(prop_attributes)
+    prop_map.outputs         = list(map_outputs)
+    prop_map.table           = table.reshape( shape + [len(map_outputs)] )
+
+    return prop_map
+
+
+def propeller_geometry_hash(prop_attributes):
+    """ key = propeller_geometry_hash(prop_attributes)
+        a hash of what the coefficients of a propeller depend on, the
+        number of blades, the tip and hub radii, and the twist and chord
+        distributions.  the first 12 hex digits of a sha1, so the key
+        fits exactly in a float of a map file
+    """
+
+    # analyses import the components
+    from SUAVE.Analyses.Surrogate import hash_data
+
+    geometry = [ prop_attributes.number_blades,
+                 prop_attributes.tip_radius,
+                 prop_attributes.hub_radius,
+                 prop_attributes.twist_distribution,
+                 prop_attributes.chord_distribution ]
+
+    h = hashlib.sha1()
+    hash_data([ np.array(x,dtype=float) for x in geometry ],h)
+
+    return h.hexdigest()[:12]
+
+
+# ----------------------------------------------------------------------
+#  Map Files
+# ----------------------------------------------------------------------
+#
+# a map is kept in one .npy file, see Methods.Utilities.gridded_table, on
+# the grid of advance ratio, tip mach number and Reynolds number, with the
+# outputs in the order of map_outputs, and a key of the 48 bit geometry
+# hash as a whole number and the temperature
+
+def save_propeller_map(prop_map,filename):
+    """ save_propeller_map(prop_map,filename)
+        writes a map from propeller_map() to a .npy file, filename
+        includes the extension
+    """
+
+    if np.shape(prop_map.table)[-1] != len(map_outputs):
+        raise ValueError , 'propeller map table does not have the outputs %s' % map_outputs
+
+    grid = [ prop_map.advance_ratio , prop_map.tip_mach_number , prop_map.reynolds_number ]
+    key  = [ int(prop_map.geometry_hash,16) , prop_map.temperature ]
+
+    save_gridded_table(filename,grid,prop_map.table,key)
+
+    return
+
+
+def load_propeller_map(filename,prop_attributes=None):
+    """ prop_map = load_propeller_map(filename,prop_attributes=None)
+        memory maps a map saved by save_propeller_map(), the table is a
+        read only view of the file.  with prop_attributes, checks the
+        map was made for the same geometry
+    """
+
+    grid, table, key = load_gridded_table(filename)
+
+    if len(grid) != 3 or len(key) != 2 or table.shape[-1] != len(map_outputs):
+        raise ValueError , 'propeller map %s has %i inputs and %i outputs, expected 3 and %i' % (filename,len(grid),table.shape[-1],len(map_outputs))
+
+    geometry_hash = '%012x' % int(key[0])
+    if not prop_attributes is None and geometry_hash != propeller_geometry_hash(prop_attributes):
+        raise ValueError , 'propeller map %s was made for another propeller geometry' % filename
+
+    prop_map = Data()
+    prop_map.advance_ratio   = grid[0]
+    prop_map.tip_mach_number = grid[1]
+    prop_map.reynolds_number = grid[2]
+    prop_map.temperature     = float(key[1])
+    prop_map.geometry_hash   = geometry_hash
+    prop_map.outputs         = list(map_outputs)
+    prop_map.table           = table
+
+    return prop_map
@@ -1,5 +1,6 @@
 
 from chebyshev_basis_function import chebyshev_basis_function
+from chebyshev_coefficients import chebyshev_coefficients, chebyshev_resample
 from chebyshev_data import chebyshev_data
 from chebyshev_fit import chebyshev_fit
 from chebyshev_interpolate import chebyshev_interpolate
@@ -0,0 +1,101 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Methods
+# ----------------------------------------------------------------------
+
+def chebyshev_coefficients(f):
+    """ a = chebyshev_coefficients(f)
+        calculates the chebyshev series coefficients of values sampled
+        at the control points of chebyshev_data()
+
+        Inputs:
+            f - values at the N control points, 1-d vector or
+                2-d array with one column per function
+
+        Outputs:
+            a - N coefficients for each column, f = sum_j a_j*T_j(2x-1)
+
+        Usage Notes -
+            the last coefficients measure the truncation error
+                of the discretization
+            chebyshev_fit() is the equivalent for the gauss points
+    """
+
+    f = np.asarray(f,dtype=float)
+    N = f.shape[0]
+    n = N-1
+
+    T = basis(N,N)
+
+    # the end points have half weight
+    w = np.ones(N)
+    w[[0,-1]] = 0.5
+
+    a = 2./n * np.dot( T.T * w , f )
+
+    a[0]  = 0.5 * a[0]
+    a[-1] = 0.5 * a[-1]
+
+    return a
+
+
+def chebyshev_resample(f,M):
+    """ g = chebyshev_resample(f,M)
+        interpolates values at the N control points of chebyshev_data(N)
+        to the M control points of chebyshev_data(M), through the
+        chebyshev series
+
+        Inputs:
+            f - values at the N control points, 1-d vector or 2-d array
+            M - new number of control points
+
+        Outputs:
+            g - values at the M control points, with M rows
+
+        Usage Notes -
+            exact for polynomials up to order N-1
+    """
+
+    a = chebyshev_coefficients(f)
+    T = basis(M,a.shape[0])
+
+    g = np.dot(T,a)
+
+    return g
+
+
+def basis(M,N):
+    """ T = basis(M,N)
+        the first N chebyshev polynomials, T[m,j] = T_j(2x_m-1),
+        at the M control points x_m of chebyshev_data(M)
+    """
+
+    m = np.arange(M)[:,None]
+    j = np.arange(N)[None,:]
+
+    # x_m = 0.5*(1-cos(pi*m/(M-1))), so T_j = (-1)^j cos(pi*j*m/(M-1))
+    T = (-1.)**j * np.cos( np.pi * j * m / (M-1.) )
+
+    return T
+
+
+# ----------------------------------------------------------------------
+#   Module Tests
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    from chebyshev_data import chebyshev_data
+
+    x,D,I = chebyshev_data(8)
+    f = x ** 5. + 1.
+
+    print 'coefficients:', chebyshev_coefficients(f)
+
+    y,D,I = chebyshev_data(13)
+    print 'resample error:', np.max( np.abs( chebyshev_resample(f,13) - (y**5.+1.) ) )
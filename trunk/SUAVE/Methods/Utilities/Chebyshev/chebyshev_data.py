@@ -4,6 +4,9 @@
 
 import numpy as np
 
+# operators by (N,integration), see chebyshev_data()
+_operators = {}
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
@@ -27,6 +30,9 @@ def chebyshev_data(N = 16, integration = True, **options):
             
         Usage Notes - 
             D and I are not symmetric
+            x, D and I are computed once for each N and kept, 
+                they are shared and read only, scaling them 
+                as below makes new arrays
             get derivatives with df_dy = np.dot(D,f)
             get integral with    int_f = np.dot(I,f)
                 where f is either a 1-d vector or 2-d column array
@@ -76,6 +82,12 @@ def chebyshev_data(N = 16, integration = True, **options):
     # setup
     N = int(N)
     if N <= 0: raise RuntimeError , "N = %i, must be > 0" % N
+    integration = bool(integration)
+    
+    # already computed
+    key = (N,integration)
+    if key in _operators:
+        return _operators[key]
     
     
     # --- X vector
@@ -89,17 +101,11 @@ def chebyshev_data(N = 16, integration = True, **options):
     # coefficients
     c = np.array( [2.] + [1.]*(N-2) + [2.] )
     c = c * ( (-1.) ** np.arange(0,N) )
-    A = np.tile( x, (N,1) ).T
-    dA = A - A.T + np.eye( N )
+    dA = x[:,None] - x[None,:] + np.eye( N )
     cinv = 1./c; 
 
     # build operator
-    D = np.zeros( (N,N) );
-    
-    # math
-    for i in range(N):
-        for j in range(N):
-            D[i][j] = c[i]*cinv[j]/dA[i][j]
+    D = c[:,None] * cinv[None,:] / dA
 
     # more math
     D = D - np.diag( np.sum( D.T, axis=0 ) );
@@ -116,6 +122,12 @@ def chebyshev_data(N = 16, integration = True, **options):
         
     else:
         I = None
+    
+    # share read only
+    for operator in [x,D,I]:
+        if not operator is None:
+            operator.flags.writeable = False
+    _operators[key] = x, D, I
         
     # done!
     return x, D, I
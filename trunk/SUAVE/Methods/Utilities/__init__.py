@@ -1,7 +1,11 @@
 
 from switch import switch
 from atleast_2d_col import atleast_2d_col
+from legendre_gauss_lobatto_data import legendre_gauss_lobatto_data
+from finite_difference_data import finite_difference_data
+from gridded_table import save_gridded_table, load_gridded_table, gridded_surrogate
 #from Plot_Dock import Plot_Dock
 
 import Chebyshev
+import complex_step
 
@@ -0,0 +1,98 @@
+# complex_step.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#  Complex Safe Functions
+# ----------------------------------------------------------------------
+#
+# numpy versions of these functions either refuse complex inputs or
+# lose the imaginary part.  the versions here branch on the real part
+# only, and carry the imaginary part through as a derivative, so a
+# complex step through them gives the derivative of the real function.
+# real inputs go straight to numpy and give the same results.
+
+def cs_abs(x):
+    """ y = cs_abs(x)
+        absolute value, on the sign of the real part
+    """
+    if not np.iscomplexobj(x):
+        return np.abs(x)
+    return np.where( np.real(x) < 0. , -x , x )
+
+
+def cs_arctan2(y,x):
+    """ a = cs_arctan2(y,x)
+        four quadrant arc tangent, the imaginary part is the
+        first order derivative
+    """
+    if not ( np.iscomplexobj(y) or np.iscomplexobj(x) ):
+        return np.arctan2(y,x)
+
+    x_r = np.real(x)
+    y_r = np.real(y)
+
+    a = np.arctan2(y_r,x_r) + 1j * ( x_r*np.imag(y) - y_r*np.imag(x) ) / ( x_r**2. + y_r**2. )
+
+    return a
+
+
+def cs_maximum(a,b):
+    """ c = cs_maximum(a,b)
+        element-wise maximum, on the real part
+    """
+    if not ( np.iscomplexobj(a) or np.iscomplexobj(b) ):
+        return np.maximum(a,b)
+    return np.where( np.real(a) >= np.real(b) , a , b )
+
+
+def cs_minimum(a,b):
+    """ c = cs_minimum(a,b)
+        element-wise minimum, on the real part
+    """
+    if not ( np.iscomplexobj(a) or np.iscomplexobj(b) ):
+        return np.minimum(a,b)
+    return np.where( np.real(a) <= np.real(b) , a , b )
+
+
+def cs_amax(a,axis=None):
+    """ c = cs_amax(a,axis=None)
+        maximum along an axis, on the real part
+    """
+    if not np.iscomplexobj(a):
+        return np.amax(a,axis=axis)
+    return take_along(a,np.argmax,axis)
+
+
+def cs_amin(a,axis=None):
+    """ c = cs_amin(a,axis=None)
+        minimum along an axis, on the real part
+    """
+    if not np.iscomplexobj(a):
+        return np.amin(a,axis=axis)
+    return take_along(a,np.argmin,axis)
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def take_along(a,arg,axis):
+    """ the entries of a at arg() of its real part, along an axis """
+
+    if axis is None:
+        return np.ravel(a)[ arg(np.real(a)) ]
+
+    # the axis last, one row per remaining index
+    a_t  = np.rollaxis(a,axis,a.ndim)
+    flat = np.reshape(a_t,[-1,a_t.shape[-1]])
+    i    = arg(np.real(flat),axis=1)
+
+    return np.reshape( flat[np.arange(flat.shape[0]),i] , a_t.shape[:-1] )
@@ -0,0 +1,106 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# operators by (N,integration), see finite_difference_data()
+_operators = {}
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+def finite_difference_data(N = 16, integration = True, **options):
+    """ x, D, I = finite_difference_data(N,integration=True)
+        calculates differentiation and integration matricies
+        with second order finite differences and the trapezoid rule,
+        based on evenly spaced samples in x.
+        a drop in replacement for chebyshev_data() for large N,
+        see Numerics.discretization_method
+
+        Inputs:
+            N - number of control points, >= 3
+            integration - optional, if false, skips the calculation of I,
+                and returns None
+
+        Outputs:
+            x - N-number of evenly spaced control points, in range [0,1]
+            D - differentiation operation matrix, dense [N,N], of a
+                three point stencil: central differences inside, one
+                sided at the ends
+            I - integration operation matrix, dense [N,N], lower
+                triangular, or None if integration=False
+
+        Usage Notes -
+            same as chebyshev_data()
+            x, D and I are computed once for each N and kept,
+                they are shared and read only
+            accuracy is second order in 1/N, so it takes many more
+                points than chebyshev_data() for the same error
+            D and I are dense like the operators of chebyshev_data(),
+                the segments apply them with np.dot(), so a product
+                costs the same as with the other discretizations
+    """
+
+    # setup
+    N = int(N)
+    if N <= 2: raise RuntimeError , "N = %i, must be > 2" % N
+    integration = bool(integration)
+
+    # already computed
+    key = (N,integration)
+    if key in _operators:
+        return _operators[key]
+
+
+    # --- X vector
+
+    x = np.linspace(0.,1.,N)
+    h = 1./(N-1)
+
+
+    # --- Differentiation Operator
+
+    # central differences
+    D = ( np.eye(N,k=1) - np.eye(N,k=-1) ) / (2.*h)
+
+    # one sided at the ends
+    D[0,:3]  = np.array([-3., 4.,-1.]) / (2.*h)
+    D[-1,-3:] = np.array([ 1.,-4., 3.]) / (2.*h)
+
+
+    # --- Integratin operator
+
+    if integration:
+        # trapezoid rule, from the first point
+        I = np.tril( np.ones((N,N)) ) * h
+        I[:,0] = 0.5*h
+        I[np.diag_indices(N)] = 0.5*h
+        I[0,:] = 0.
+
+    else:
+        I = None
+
+    # share read only
+    for operator in [x,D,I]:
+        if not operator is None:
+            operator.flags.writeable = False
+    _operators[key] = x, D, I
+
+    # done!
+    return x, D, I
+
+
+# ----------------------------------------------------------------------
+#   Module Tests
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    x,D,I = finite_difference_data(128)
+
+    f = x ** 2. + 1.
+
+    print 'derivative error:', np.max( np.abs( np.dot(D,f) - 2.*x ) )
+    print 'integral error:  ', np.max( np.abs( np.dot(I,f) - (x**3./3. + x) ) )
@@ -0,0 +1,98 @@
+# gridded_table.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import os
+
+
+# ----------------------------------------------------------------------
+#  Table Files
+# ----------------------------------------------------------------------
+#
+# a table on a tensor product grid is kept in one .npy file of floats, so
+# it can be memory mapped,
+#   [ n_inputs, n_key, n_1, ..., n_inputs, n_outputs,
+#     key..., grid_1..., ..., grid_n_inputs..., table... ]
+# the key holds what the table was made for, as floats
+
+def save_gridded_table(filename,grid,table,key=()):
+    """ save_gridded_table(filename,grid,table,key=())
+        writes a table of outputs on a grid to a .npy file, filename
+        includes the extension
+
+        Inputs:
+            grid  - list of 1D arrays, one per input
+            table - [n_1,...,n_inputs,outputs] array
+            key   - floats kept with the table, see load_gridded_table()
+    """
+
+    grid  = [ np.array(x,dtype=float) for x in grid ]
+    table = np.asarray(table,dtype=float)
+    key   = np.array(key,dtype=float)
+
+    if table.ndim != len(grid)+1 or table.shape[:-1] != tuple([ len(x) for x in grid ]):
+        raise ValueError , 'table of shape %s does not match its grid' % (table.shape,)
+
+    header = np.array( [ len(grid) , len(key) ] + list(table.shape) , dtype=float )
+
+    # written beside the file and moved over it, so memory maps of an
+    # older table in the same file stay valid
+    temporary = filename + '.tmp'
+    with open(temporary,'wb') as f:
+        np.save( f , np.hstack( [header,key] + grid + [np.ravel(table)] ) )
+    os.rename(temporary,filename)
+
+    return
+
+
+def load_gridded_table(filename):
+    """ grid, table, key = load_gridded_table(filename)
+        memory maps a table saved by save_gridded_table(), the table is
+        a read only view of the file, the grid and key are copies
+    """
+
+    data = np.load(filename,mmap_mode='r')
+
+    n_inputs = int(data[0])
+    n_key    = int(data[1])
+    shape    = [ int(n) for n in data[2:3+n_inputs] ]
+
+    i   = 3 + n_inputs
+    key = np.array(data[i:i+n_key])
+    i  += n_key
+
+    grid = []
+    for n in shape[:-1]:
+        grid.append( np.array(data[i:i+n]) )
+        i += n
+
+    table = data[i:].reshape(shape)
+
+    return grid, table, key
+
+
+# ----------------------------------------------------------------------
+#  Surrogate
+# ----------------------------------------------------------------------
+
+def gridded_surrogate(component,grid,table):
+    """ model = gridded_surrogate(component,grid,table)
+        the Gridded_Model of a component that interpolates a table,
+        kept in component.surrogate and fit on the first call after the
+        component resets it to None
+    """
+
+    if component.surrogate is None:
+        if table is None:
+            raise AttributeError , '%s %s has no table, see build() and load()' % (component.__class__.__name__,component.tag)
+
+        # analyses import the components
+        from SUAVE.Analyses.Surrogate import Gridded_Model
+        component.surrogate = Gridded_Model(grid,table)
+
+    return component.surrogate
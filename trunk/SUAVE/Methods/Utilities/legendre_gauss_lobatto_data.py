@@ -0,0 +1,122 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# operators by (N,integration), see legendre_gauss_lobatto_data()
+_operators = {}
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+def legendre_gauss_lobatto_data(N = 16, integration = True, **options):
+    """ x, D, I = legendre_gauss_lobatto_data(N,integration=True)
+        calculates differentiation and integration matricies
+        using a Legendre pseudospectral algorithm, based on
+        Legendre-Gauss-Lobatto samples in x.
+        a drop in replacement for chebyshev_data(),
+        see Numerics.discretization_method
+
+        Inputs:
+            N - number of control points, >= 2
+            integration - optional, if false, skips the calculation of I,
+                and returns None
+
+        Outputs:
+            x - N-number of Legendre-Gauss-Lobatto points, in range [0,1]
+            D - differentiation operation matrix
+            I - integration operation matrix, or None if integration=False
+
+        Usage Notes -
+            same as chebyshev_data()
+            x, D and I are computed once for each N and kept,
+                they are shared and read only
+    """
+
+    # setup
+    N = int(N)
+    if N <= 1: raise RuntimeError , "N = %i, must be > 1" % N
+    integration = bool(integration)
+
+    # already computed
+    key = (N,integration)
+    if key in _operators:
+        return _operators[key]
+
+
+    # --- X vector
+
+    # Newton iteration on the roots of (1-x^2)*P'_n(x),
+    # from the Chebyshev-Gauss-Lobatto points
+    n = N-1
+    x = np.cos(np.pi*np.arange(0,N)/n)
+    P = np.zeros( (N,N) )
+
+    for iteration in range(100):
+        x_last = x
+
+        # Legendre polynomials by recursion
+        P[:,0] = 1.
+        P[:,1] = x
+        for k in range(2,N):
+            P[:,k] = ( (2.*k-1.)*x*P[:,k-1] - (k-1.)*P[:,k-2] ) / k
+
+        x = x_last - ( x*P[:,n] - P[:,n-1] ) / ( N*P[:,n] )
+        if np.max( np.abs(x-x_last) ) < 1e-15: break
+
+    # ascending, in range [-1,1]
+    x = x[::-1]
+    L = P[::-1,n]
+
+
+    # --- Differentiation Operator
+
+    dx = x[:,None] - x[None,:] + np.eye( N )
+    D = L[:,None] / L[None,:] / dx
+    D[np.diag_indices(N)] = 0.
+    D[0,0]   = -n*(n+1.)/4.
+    D[-1,-1] =  n*(n+1.)/4.
+
+    # scale to range [0,1]
+    x = 0.5*(x + 1.)
+    D = 2.*D
+    x[0], x[-1] = 0., 1.
+
+
+    # --- Integratin operator
+
+    if integration:
+        # invert D except first row and column
+        I = np.linalg.inv(D[1:,1:]);
+
+        # repack missing columns with zeros
+        I = np.append(np.zeros((1,N-1)),I,axis=0)
+        I = np.append(np.zeros((N,1)),I,axis=1)
+
+    else:
+        I = None
+
+    # share read only
+    for operator in [x,D,I]:
+        if not operator is None:
+            operator.flags.writeable = False
+    _operators[key] = x, D, I
+
+    # done!
+    return x, D, I
+
+
+# ----------------------------------------------------------------------
+#   Module Tests
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    x,D,I = legendre_gauss_lobatto_data(16)
+
+    f = x ** 5. + 1.
+
+    print 'derivative error:', np.max( np.abs( np.dot(D,f) - 5.*x**4. ) )
+    print 'integral error:  ', np.max( np.abs( np.dot(I,f) - (x**6./6. + x) ) )
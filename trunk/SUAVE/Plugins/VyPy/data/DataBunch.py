@@ -5,6 +5,7 @@
 
 from IndexableBunch import IndexableBunch 
 #from OrderedBunch import OrderedBunch 
+from clone import clone
 
 import types
 from copy            import deepcopy
@@ -13,6 +14,9 @@ from warnings        import warn
 import numpy as np
 from VyPy.tools.arrays import atleast_2d_col, array_type, matrix_type
 
+# templates of the defaults, by class
+_templates = {}
+
 
 # ----------------------------------------------------------------------
 #   Data Dictionary
@@ -29,15 +33,34 @@ class DataBunch(IndexableBunch):
         Methods:
             __defaults__(self)      : sets the defaults of 
             find_instances(datatype)
+            clone(share_arrays)     : structural copy
     """
     
+    # copy new instances from a template of the defaults, 
+    # see __new__(). set True on a class with defaults that 
+    # can be copied and don't change between instances, 
+    # subclasses don't inherit it
+    _cache_defaults = False
+    
     def __defaults__(self):
         pass
     
     def __new__(cls,*args,**kwarg):
         """ supress use of args or kwarg for defaulting
+            
+            with _cache_defaults set on the class, the defaults are 
+            filled in for its first instance, and a clone() of them 
+            is kept as a template for the next instances, without 
+            calling __defaults__() again
         """
         
+        # copy the template
+        cache = cls.__dict__.get('_cache_defaults',False)
+        if cache:
+            template = _templates.get(cls)
+            if not template is None:
+                return clone(template,share_private=False)
+        
         # initialize data, no inputs
         self = super(DataBunch,cls).__new__(cls)
         super(DataBunch,self).__init__()
@@ -49,9 +72,9 @@ class DataBunch(IndexableBunch):
         for klass in klasses[::-1]:
             klass.__defaults__(self)
         
-        ## ensure local copies
-        #for k,v in self.iteritems():
-            #self[k] = deepcopy(v)
+        # keep a template
+        if cache:
+            _templates[cls] = clone(self,share_private=False)
             
         return self
     
@@ -60,10 +83,11 @@ class DataBunch(IndexableBunch):
         """
         
         # handle input data (ala class factory)
-        input_data = DataBunch.__base__(*args,**kwarg)
-        
-        # update this data with inputs
-        self.update(input_data)
+        if args or kwarg:
+            input_data = DataBunch.__base__(*args,**kwarg)
+            
+            # update this data with inputs
+            self.update(input_data)
         
         # call over-ridable post-initialition setup
         self.__check__()
@@ -97,6 +121,13 @@ class DataBunch(IndexableBunch):
         if key in self: raise KeyError, 'key "%s" already exists' % key
         self[key] = value    
     
+    def clone(self,share_arrays=False):
+        """ DataBunch.clone(share_arrays=False)
+            structural copy of the data, without re-running __defaults__(), 
+            see VyPy.data.clone()
+        """
+        return clone(self,share_arrays)
+    
     def find_instances(self,data_type):
         """ DataBunch.find_instances(data_type)
             
@@ -230,5 +261,42 @@ if __name__ == '__main__':
     t2 = time()-t0
     
     print 'Bunch:       %.6f' % (t1)
-    print 'SimpleBunch: %.6f' % (t2)    
+    print 'SimpleBunch: %.6f' % (t2)
+    
+    # item access, setting and iterating
+    def timeit(function,n=100000):
+        t0 = time()
+        for i in range(n):
+            function()
+        return time()-t0
+    
+    def get_item():
+        v = d['options']['half']
+    def get_index():
+        v = d[2][1]
+    def set_attribute():
+        d.options.half = 0.5
+    def set_item():
+        d['options']['half'] = 0.5
+    def iterate():
+        for k,v in m.iteritems(): pass
+    
+    def simple_get():
+        v = z.t.i
+    def simple_set():
+        z.t.i = 0
+    def simple_iterate():
+        for k,v in z.__dict__.iteritems(): pass
+    
+    t_call = timeit(simple_get)
+    
+    print ''
+    print 'Bunch get item:      %.6f' % (timeit(get_item))
+    print 'Bunch get index:     %.6f' % (timeit(get_index))
+    print 'SimpleBunch get:     %.6f' % (t_call)
+    print 'Bunch set attribute: %.6f' % (timeit(set_attribute))
+    print 'Bunch set item:      %.6f' % (timeit(set_item))
+    print 'SimpleBunch set:     %.6f' % (timeit(simple_set))
+    print 'Bunch iterate:       %.6f' % (timeit(iterate))
+    print 'SimpleBunch iterate: %.6f' % (timeit(simple_iterate))    
     
\ No newline at end of file
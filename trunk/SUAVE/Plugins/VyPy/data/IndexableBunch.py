@@ -14,7 +14,43 @@ from IndexableDict import IndexableDict
 class IndexableBunch(IndexableDict,OrderedBunch):
     """ An ordered indexable dictionary that provides attribute-style access.
     """
-    pass
+    
+    # item access reads the instance dictionary directly, 
+    # and falls back to the indexed access of IndexableDict
+    
+    def __getitem__(self,k):
+        try:
+            return self.__dict__[k]
+        except (KeyError,TypeError):
+            if isinstance(k,int):
+                return self.__dict__[self._index_key(k)]
+            return IndexableDict.__getitem__(self,k)
+    
+    def __setitem__(self,k,v):
+        if isinstance(k,int):
+            k = self._index_key(k)
+        self.__setattr__(k,v)
+    
+    def _index_key(self,index):
+        """ key = IndexableBunch._index_key(index)
+            walks the linked list to the key at an integer index, 
+            from the front for positive and the back for negative indeces
+        """
+        root = self._root
+        if index >= 0:
+            step = 1
+            curr = root[1]
+        else:
+            step = 0
+            curr = root[0]
+            index = -index-1
+        for i in xrange(index):
+            if curr is root: break
+            curr = curr[step]
+        if curr is root:
+            raise IndexError('index out of range')
+        return curr[2]
+    
     # ballin
 
 # ----------------------------------------------------------------------
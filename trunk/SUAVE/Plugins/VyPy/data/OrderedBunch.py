@@ -25,9 +25,7 @@ class OrderedBunch(Bunch,OrderedDict):
         
         #if len(args) > 1:
             #raise TypeError('expected at most 1 arguments, got %d' % len(args))
-        try:
-            self._root
-        except:
+        if not dict.__contains__(self,'_root'):
             root = [] # sentinel node
             root[:] = [root, root, None]
             dict.__setitem__(self,'_root',root)
@@ -39,12 +37,19 @@ class OrderedBunch(Bunch,OrderedDict):
         """od.__setitem__(i, y) <==> od[i]=y"""
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
+        
+        # class attributes and descriptors are not items
+        if key in class_attributes(self.__class__):
+            Bunch.__setattr__(self,key, value)
+            return
+        
+        values = self.__dict__
+        if not key in values:
             root = dict.__getitem__(self,'_root')
             last = root[0]
             map  = dict.__getitem__(self,'_map')
             last[1] = root[0] = map[key] = [last, root, key]
-        Bunch.__setattr__(self,key, value)
+        values[key] = value
 
     def __delattr__(self, key):
         """od.__delitem__(y) <==> del od[y]"""
@@ -168,13 +173,18 @@ class OrderedBunch(Bunch,OrderedDict):
         """OrderedDict.keys() -> list of keys in the dictionary"""
         return list(self.__iter())
     
+    # values are read from the instance dictionary, 
+    # skipping the item access of subclasses
+    
     def values(self):
         """OrderedDict.values() -> list of values in the dictionary"""
-        return [self[key] for key in self.__iter()]
+        values = self.__dict__
+        return [values[key] for key in self.__iter()]
     
     def items(self):
         """OrderedDict.items() -> list of (key, value) pairs in the dictionary"""
-        return [(key, self[key]) for key in self.__iter()]
+        values = self.__dict__
+        return [(key, values[key]) for key in self.__iter()]
     
     def iterkeys(self):
         """OrderedDict.iterkeys() -> an iterator over the keys in the dictionary"""
@@ -182,15 +192,37 @@ class OrderedBunch(Bunch,OrderedDict):
     
     def itervalues(self):
         """OrderedDict.itervalues -> an iterator over the values in the dictionary"""
+        values = self.__dict__
         for k in self.__iter():
-            yield self[k]
+            yield values[k]
     
     def iteritems(self):
         """od.iteritems -> an iterator over the (key, value) items in the dictionary"""
+        values = self.__dict__
         for k in self.__iter():
-            yield (k, self[k])    
+            yield (k, values[k])
 
     
+# names of the attributes of a class, by class
+_class_attributes = {}
+
+def class_attributes(klass):
+    """ names = class_attributes(klass)
+        the attribute names of a class and its bases, as a set, 
+        found once per class. replaces hasattr(klass,key), which 
+        raises and catches an exception for every new item.
+        
+        Assumptions:
+            attributes added to a class after its first item was 
+            set are treated as items
+    """
+    try:
+        return _class_attributes[klass]
+    except KeyError:
+        names = frozenset( dir(klass) + dir(type(klass)) )
+        _class_attributes[klass] = names
+        return names
+
 # for rebuilding dictionaries with attributes
 def _reconstructor(klass,items):
     self = OrderedBunch.__new__(klass)
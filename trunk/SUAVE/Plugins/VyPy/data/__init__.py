@@ -5,6 +5,7 @@ from input_output import save_data as save
 from filelock import filelock
 
 from make_hashable import make_hashable
+from clone        import clone
 
 from Object         import Object
 from Descriptor     import Descriptor
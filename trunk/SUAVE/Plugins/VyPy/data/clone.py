@@ -0,0 +1,153 @@
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import types
+from copy import deepcopy
+
+from OrderedBunch import OrderedBunch
+
+from VyPy.tools.arrays import numpy_isloaded, array_type
+
+if numpy_isloaded:
+    import numpy as np
+    scalar_types = (np.generic,)
+else:
+    scalar_types = ()
+
+
+# ----------------------------------------------------------------------
+#   Clone
+# ----------------------------------------------------------------------
+
+# values that are never copied
+immutable_types = ( int, long, float, complex, bool, str, unicode,
+                    types.NoneType, types.FunctionType, types.BuiltinFunctionType,
+                    types.MethodType, type, types.ClassType, types.ModuleType,
+                    ) + scalar_types
+immutable_set = frozenset(immutable_types)
+
+def clone(value,share_arrays=False,share_private=True,memo=None):
+    """ VyPy.data.clone(value,share_arrays=False,share_private=True,memo=None)
+        structural copy of a data tree, for use in place of deepcopy()
+
+        Inputs:
+            value        - any object, typically an OrderedBunch() or DataBunch()
+            share_arrays - False (default) copies array leaves
+                           True shares array leaves as read only views,
+                           so a value that needs to change must be rebound
+            share_private - True (default) shares the private attributes 
+                           of a bunch (leading underscore, not keys), 
+                           False copies them as well
+            memo         - optional dictionary of already copied objects,
+                           by id(), as for deepcopy()
+
+        Outputs:
+            a copy of value
+
+        Assumptions:
+            bunches are rebuilt in place, without calling __new__() or
+            __defaults__() of their class. 
+            objects seen twice are copied once, as with deepcopy().
+            other types are passed to deepcopy()
+    """
+
+    if memo is None:
+        memo = {}
+
+    return do_clone(value,share_arrays,share_private,memo)
+
+
+def do_clone(value,share_arrays,share_private,memo):
+
+    # exact types first, subclasses below
+    if type(value) in immutable_set:
+        return value
+
+    key = id(value)
+    if key in memo:
+        return memo[key]
+
+    # bunches
+    if isinstance(value,OrderedBunch):
+
+        result = OrderedBunch.__new__(value.__class__)
+        memo[key] = result
+
+        source = value.__dict__
+        target = result.__dict__
+
+        root = dict.__getitem__(result,'_root')
+        link = dict.__getitem__(result,'_map')
+
+        # keys, in order of the linked list
+        source_root = dict.__getitem__(value,'_root')
+        curr = source_root[1]
+        while curr is not source_root:
+            k = curr[2]
+            target[k] = do_clone(source[k],share_arrays,share_private,memo)
+            last = root[0]
+            last[1] = root[0] = link[k] = [last, root, k]
+            curr = curr[1]
+
+        # private attributes
+        for k,v in source.iteritems():
+            if not k in link:
+                if not share_private:
+                    v = do_clone(v,share_arrays,share_private,memo)
+                target[k] = v
+
+    # arrays
+    elif numpy_isloaded and isinstance(value,array_type):
+        if share_arrays:
+            result = value.view()
+            result.flags.writeable = False
+        else:
+            result = value.copy()
+        memo[key] = result
+
+    # containers
+    elif type(value) is list:
+        result = []
+        memo[key] = result
+        result.extend([ do_clone(v,share_arrays,share_private,memo) for v in value ])
+
+    elif type(value) is tuple:
+        result = tuple([ do_clone(v,share_arrays,share_private,memo) for v in value ])
+        memo[key] = result
+
+    elif type(value) is dict:
+        result = {}
+        memo[key] = result
+        for k,v in value.iteritems():
+            result[k] = do_clone(v,share_arrays,share_private,memo)
+
+    elif isinstance(value,immutable_types):
+        result = value
+
+    # everything else
+    else:
+        result = deepcopy(value,memo)
+
+    return result
+
+
+# ----------------------------------------------------------------------
+#   Module Tests
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    from DataBunch import DataBunch
+
+    o = DataBunch()
+    o.x = [1,2,3]
+    o.t = DataBunch()
+    o.t.h = 20
+    o.s = o.t
+
+    p = clone(o)
+
+    print p
+    print 'should be True:'  , p.s is p.t
+    print 'should be False:' , p.t is o.t
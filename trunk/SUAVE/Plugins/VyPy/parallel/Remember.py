@@ -1,10 +1,9 @@
 
 from VyPy.data import load as load_data
 from VyPy.data import save as save_data
-from VyPy.data import HashedDict, make_hashable
+from VyPy.data import HashedDict, make_hashable, clone
 
 import os, sys, time
-from copy import deepcopy
 
 # ----------------------------------------------------------------------
 #   Remember
@@ -48,12 +47,12 @@ class Remember(object):
         # check cache
         if self.__cache__.has_key(_inputs): 
             #print 'PULLED FROM CACHE'
-            outputs = deepcopy( self.__cache__[_inputs] )
+            outputs = clone( self.__cache__[_inputs] )
         
         # evalute function
         else:
             outputs = self.__func__(inputs)
-            self.__cache__[_inputs] = deepcopy(outputs)
+            self.__cache__[_inputs] = clone(outputs)
         
         #: if cached
         